@@ -0,0 +1,129 @@
+import asyncio
+import inspect
+import random
+import time
+import weakref
+from functools import partial
+from typing import Any, Awaitable, Callable, TypeVar
+
+from loguru import logger
+
+from aws.core.helpers.utils import is_throttling_exception
+
+T = TypeVar("T")
+
+# Concurrent API calls allowed per (account, region, service) client. Organizations
+# is a global, low-rate API; S3 and SQS tolerate far more parallel reads.
+SERVICE_CONCURRENCY_LIMITS: dict[str, int] = {
+    "s3": 20,
+    "sqs": 20,
+    "ec2": 10,
+    "ecs": 10,
+    "rds": 10,
+    "lambda": 10,
+    "eks": 5,
+    "organizations": 2,
+}
+DEFAULT_CONCURRENCY_LIMIT = 10
+
+
+class ClientCallLimiter:
+    """
+    Bounds the concurrent calls made through one AWS client and shares throttling
+    backoff between them.
+
+    When any call is throttled, every call through the limiter pauses until the
+    backoff elapses, instead of each call retrying on its own schedule and keeping
+    the account over its request rate.
+    """
+
+    MAX_ATTEMPTS = 5
+    BASE_BACKOFF_SECONDS = 0.5
+    MAX_BACKOFF_SECONDS = 20.0
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._resume_at = 0.0
+        self._throttle_streak = 0
+
+    async def call(
+        self, operation: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            async with self._semaphore:
+                await self._wait_for_backoff()
+                try:
+                    result = await operation(*args, **kwargs)
+                except Exception as e:
+                    if not is_throttling_exception(e) or attempt == self.MAX_ATTEMPTS:
+                        raise
+                    self._register_throttle(operation, attempt)
+                    continue
+                self._throttle_streak = 0
+                return result
+        raise RuntimeError("unreachable")
+
+    async def _wait_for_backoff(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _register_throttle(self, operation: Callable[..., Any], attempt: int) -> None:
+        self._throttle_streak += 1
+        backoff = min(
+            self.MAX_BACKOFF_SECONDS,
+            self.BASE_BACKOFF_SECONDS * 2 ** (self._throttle_streak - 1),
+        )
+        backoff *= random.uniform(0.5, 1.0)
+        self._resume_at = max(self._resume_at, time.monotonic() + backoff)
+        logger.warning(
+            f"{getattr(operation, '__name__', 'AWS call')} was throttled "
+            f"(attempt {attempt}/{self.MAX_ATTEMPTS}), pausing calls for {backoff:.2f}s"
+        )
+
+
+class LimitedClient:
+    """Routes a client's API calls through its `ClientCallLimiter`.
+
+    Everything that is not an API call (`exceptions`, `meta`, `get_paginator`) is
+    returned from the wrapped client as is.
+    """
+
+    def __init__(self, client: Any, limiter: ClientCallLimiter) -> None:
+        self._client = client
+        self._limiter = limiter
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name.startswith("_") or not inspect.iscoroutinefunction(attribute):
+            return attribute
+        return partial(self._limiter.call, attribute)
+
+
+_limiters: "weakref.WeakKeyDictionary[Any, ClientCallLimiter]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client_limiter(client: Any) -> ClientCallLimiter:
+    """Return the limiter shared by every action using `client`.
+
+    Pooled clients are shared by every exporter of an (account, region, service), so
+    the limit and backoff apply across kinds and pages, not only within one page.
+    """
+    limiter = _limiters.get(client)
+    if limiter is None:
+        limiter = ClientCallLimiter(_get_concurrency_limit(client))
+        _limiters[client] = limiter
+    return limiter
+
+
+def _get_concurrency_limit(client: Any) -> int:
+    try:
+        service_name = client.meta.service_model.service_name
+    except AttributeError:
+        return DEFAULT_CONCURRENCY_LIMIT
+    if not isinstance(service_name, str):
+        return DEFAULT_CONCURRENCY_LIMIT
+    return SERVICE_CONCURRENCY_LIMITS.get(service_name, DEFAULT_CONCURRENCY_LIMIT)
@@ -0,0 +1,155 @@
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from aiobotocore.client import AioBaseClient
+from aiobotocore.session import AioSession
+from loguru import logger
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import (
+    MetricPhase,
+    MetricResourceKind,
+    MetricType,
+)
+
+from aws.core.helpers.types import SupportedServices
+
+ClientPoolKey = tuple[str, str, SupportedServices]
+
+
+class ClientPoolMetric:
+    SIZE = "aws_client_pool_size"
+    CREATED = "aws_client_pool_created"
+    REUSED = "aws_client_pool_reused"
+
+
+@dataclass(eq=False)
+class PooledClient:
+    key: ClientPoolKey
+    client: AioBaseClient
+    client_cm: Any
+    credentials: Any
+    references: int = 0
+    retired: bool = False
+
+
+class AioClientPool:
+    """
+    A resync-scoped pool of aiobotocore clients keyed by (account, region, service).
+
+    Clients are reference counted: a client is only closed once it has been retired
+    and the last borrower released it. A client is retired when the pool closes or
+    when the credentials of its account's session are replaced (for example when a
+    role is assumed again), so borrowers never receive a client signed with stale
+    credentials. Refreshable AssumeRole credentials keep refreshing in place, so a
+    client created from them stays valid for the whole resync.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[ClientPoolKey, PooledClient] = {}
+        self._leases: dict[int, PooledClient] = {}
+        self._locks: defaultdict[ClientPoolKey, asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+        self._is_open = False
+        self.created = 0
+        self.reused = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._is_open
+
+    @property
+    def size(self) -> int:
+        return len(self._clients)
+
+    def open(self) -> None:
+        self._is_open = True
+        self.created = 0
+        self.reused = 0
+
+    async def acquire(
+        self,
+        session: AioSession,
+        account_id: str,
+        region: str,
+        service_name: SupportedServices,
+    ) -> AioBaseClient:
+        key: ClientPoolKey = (account_id, region, service_name)
+        credentials = getattr(session, "_credentials", None)
+
+        async with self._locks[key]:
+            pooled = self._clients.get(key)
+            if pooled is not None and pooled.credentials is not credentials:
+                logger.debug(
+                    f"Credentials of account {account_id} changed, replacing its pooled {service_name} client in {region}"
+                )
+                await self._retire(pooled)
+                pooled = None
+
+            if pooled is None:
+                client_cm = session.create_client(
+                    service_name=service_name, region_name=region
+                )
+                client = await client_cm.__aenter__()
+                pooled = PooledClient(key, client, client_cm, credentials)
+                self._clients[key] = pooled
+                self.created += 1
+                self._report(ClientPoolMetric.CREATED, self.created)
+            else:
+                self.reused += 1
+                self._report(ClientPoolMetric.REUSED, self.reused)
+
+            pooled.references += 1
+            self._leases[id(pooled.client)] = pooled
+            self._report(ClientPoolMetric.SIZE, self.size)
+            return pooled.client
+
+    async def release(self, client: AioBaseClient) -> None:
+        pooled = self._leases.get(id(client))
+        if pooled is None:
+            return
+
+        pooled.references -= 1
+        if pooled.references <= 0:
+            del self._leases[id(client)]
+            if pooled.retired:
+                await self._close_client(pooled)
+
+    async def close(self) -> None:
+        """Retire every pooled client; clients still in use close on release."""
+        self._is_open = False
+        logger.info(
+            f"Closing AWS client pool of {self.size} clients, "
+            f"{self.created} created and {self.reused} reused during the resync"
+        )
+        for pooled in list(self._clients.values()):
+            await self._retire(pooled)
+        self._report(ClientPoolMetric.SIZE, self.size)
+
+    async def _retire(self, pooled: PooledClient) -> None:
+        pooled.retired = True
+        if self._clients.get(pooled.key) is pooled:
+            del self._clients[pooled.key]
+        if pooled.references <= 0:
+            await self._close_client(pooled)
+
+    async def _close_client(self, pooled: PooledClient) -> None:
+        try:
+            await pooled.client_cm.__aexit__(None, None, None)
+        except Exception as e:
+            account_id, region, service_name = pooled.key
+            logger.warning(
+                f"Failed to close {service_name} client of account {account_id} in {region}: {e}"
+            )
+
+    def _report(self, metric: str, value: float) -> None:
+        ocean.metrics.set_metric(
+            name=MetricType.OBJECT_COUNT_NAME,
+            labels=[MetricResourceKind.RESYNC, MetricPhase.EXTRACT, metric],
+            value=value,
+        )
+
+
+client_pool = AioClientPool()
@@ -3,17 +3,30 @@ from aiobotocore.session import AioSession
 from aiobotocore.client import AioBaseClient
 from aws.core.helpers.types import SupportedServices
 from aws.core.client.paginator import AsyncPaginator
+from aws.core.client.pool import client_pool
 
 
 class AioBaseClientProxy:
+    """
+    Provides an aiobotocore client for the duration of an `async with` block.
+
+    During a resync, clients of accounts identified by `account_id` are borrowed
+    from the resync-scoped client pool instead of being created for every call.
+    """
 
     def __init__(
-        self, session: AioSession, region: str, service_name: SupportedServices
+        self,
+        session: AioSession,
+        region: str,
+        service_name: SupportedServices,
+        account_id: str | None = None,
     ) -> None:
         self.session = session
         self.region = region
         self.service_name: SupportedServices = service_name
+        self.account_id = account_id
         self._base_client: AioBaseClient | None = None
+        self._is_pooled = False
 
     @property
     def client(self) -> AioBaseClient:
@@ -22,6 +35,13 @@ class AioBaseClientProxy:
         return self._base_client
 
     async def __aenter__(self) -> Self:
+        if self.account_id and client_pool.is_open:
+            self._base_client = await client_pool.acquire(
+                self.session, self.account_id, self.region, self.service_name
+            )
+            self._is_pooled = True
+            return self
+
         self._client_cm = self.session.create_client(
             service_name=self.service_name, region_name=self.region
         )
@@ -29,7 +49,9 @@ class AioBaseClientProxy:
         return self
 
     async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-        if self._base_client:
+        if self._base_client and self._is_pooled:
+            await client_pool.release(self._base_client)
+        elif self._base_client:
             await self._base_client.__aexit__(exc_type, exc, tb)
 
     def get_paginator(self, operation_name: str, list_param: str) -> AsyncPaginator:
@@ -16,6 +16,8 @@ class ListFunctionsAction(Action):
 class ListTagsAction(Action):
     """Fetches tags for Lambda functions."""
 
+    output_properties = frozenset({"Tags"})
+
     async def _execute(self, functions: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Fetch detailed tag information for the Lambda functions."""
 
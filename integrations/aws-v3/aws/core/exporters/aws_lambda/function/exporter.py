@@ -23,7 +23,7 @@ class LambdaFunctionExporter(IResourceExporter):
         """Fetch detailed attributes of a single Lambda function."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -50,7 +50,7 @@ class LambdaFunctionExporter(IResourceExporter):
         """Fetch all Lambda functions in the region."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
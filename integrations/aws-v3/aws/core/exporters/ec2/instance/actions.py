@@ -8,6 +8,19 @@ import asyncio
 
 
 class DescribeInstanceStatusAction(Action):
+    output_properties = frozenset(
+        {
+            "AvailabilityZone",
+            "OutpostArn",
+            "Operator",
+            "Events",
+            "InstanceState",
+            "InstanceStatus",
+            "SystemStatus",
+            "AttachedEbsStatus",
+        }
+    )
+
     async def _execute(self, instances: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Fetch detailed status information for the EC2 instances."""
 
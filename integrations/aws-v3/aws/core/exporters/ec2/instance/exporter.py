@@ -24,7 +24,7 @@ class EC2InstanceExporter(IResourceExporter):
         """Fetch detailed attributes of a single EC2 instance."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
 
             inspector = ResourceInspector(
@@ -42,7 +42,7 @@ class EC2InstanceExporter(IResourceExporter):
         """Yield pages of EC2 instance information, fetched using pagination."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -21,7 +21,7 @@ class EcsClusterExporter(IResourceExporter):
         """Fetch detailed attributes of a single ECS cluster."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
 
             inspector = ResourceInspector(
@@ -39,7 +39,7 @@ class EcsClusterExporter(IResourceExporter):
         """Fetch all ECS clusters in the region."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -21,7 +21,7 @@ class EksClusterExporter(IResourceExporter):
         """Fetch detailed attributes of a single EKS cluster."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
 
             inspector = ResourceInspector(
@@ -37,7 +37,7 @@ class EksClusterExporter(IResourceExporter):
         """Fetch all EKS clusters in the region."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
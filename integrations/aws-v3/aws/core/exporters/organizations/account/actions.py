@@ -17,6 +17,8 @@ class ListAccountsAction(Action):
 
 
 class ListParentsAction(Action):
+    output_properties = frozenset({"Parents"})
+
     async def _execute(self, accounts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         For each account, fetch all parent IDs using the Organizations paginator.
@@ -56,6 +58,8 @@ class ListParentsAction(Action):
 
 
 class ListTagsForResourceAction(Action):
+    output_properties = frozenset({"Tags"})
+
     async def _execute(self, accounts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         tags_results = await asyncio.gather(
             *(self._fetch_tags(acc) for acc in accounts), return_exceptions=True
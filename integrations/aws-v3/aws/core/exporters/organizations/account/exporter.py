@@ -21,7 +21,7 @@ class OrganizationsAccountExporter(IResourceExporter):
 
     async def get_resource(self, options: SingleAccountRequest) -> dict[str, Any]:
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -35,7 +35,7 @@ class OrganizationsAccountExporter(IResourceExporter):
         self, options: PaginatedAccountRequest
     ) -> AsyncGenerator[list[dict[str, Any]], None]:
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -18,6 +18,8 @@ class DescribeDBInstancesAction(Action):
 class ListTagsForResourceAction(Action):
     """Fetches tags for RDS DB instances."""
 
+    output_properties = frozenset({"Tags"})
+
     async def _execute(
         self, db_instances: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
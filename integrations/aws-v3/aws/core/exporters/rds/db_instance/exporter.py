@@ -21,7 +21,7 @@ class RdsDbInstanceExporter(IResourceExporter):
         """Fetch detailed attributes of a single RDS DB instance."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -48,7 +48,7 @@ class RdsDbInstanceExporter(IResourceExporter):
         """Fetch all RDS DB instances in the region."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
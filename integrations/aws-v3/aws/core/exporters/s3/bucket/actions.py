@@ -7,6 +7,8 @@ import asyncio
 
 
 class GetPublicAccessBlockAction(Action):
+    output_properties = frozenset({"PublicAccessBlockConfiguration"})
+
     async def _execute(self, buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         public_access_blocks = await asyncio.gather(
             *(self._fetch_public_access_block(bucket) for bucket in buckets),
@@ -37,6 +39,7 @@ class GetPublicAccessBlockAction(Action):
 
 
 class GetBucketOwnershipControlsAction(Action):
+    output_properties = frozenset({"OwnershipControls"})
 
     async def _execute(self, buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         ownership_controls = await asyncio.gather(
@@ -66,6 +69,8 @@ class GetBucketOwnershipControlsAction(Action):
 
 
 class GetBucketEncryptionAction(Action):
+    output_properties = frozenset({"BucketEncryption"})
+
     async def _execute(self, buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         encryptions = await asyncio.gather(
             *(self._fetch_encryption(bucket) for bucket in buckets),
@@ -92,6 +97,8 @@ class GetBucketEncryptionAction(Action):
 
 
 class GetBucketLocationAction(Action):
+    output_properties = frozenset({"LocationConstraint"})
+
     async def _execute(self, buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
         locations = await asyncio.gather(
@@ -132,6 +139,8 @@ class ListBucketsAction(Action):
 
 
 class GetBucketTaggingAction(Action):
+    output_properties = frozenset({"Tags"})
+
     async def _execute(self, buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
         tagging_results = await asyncio.gather(
@@ -21,7 +21,7 @@ class S3BucketExporter(IResourceExporter):
         """Fetch detailed attributes of a single S3 bucket."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
 
             inspector = ResourceInspector(
@@ -39,7 +39,7 @@ class S3BucketExporter(IResourceExporter):
         """Yield pages of S3 bucket information, fetched using pagination."""
 
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -45,6 +45,8 @@ class GetQueueAttributesAction(Action):
 class ListQueueTagsAction(Action):
     """Lists tags for SQS queues."""
 
+    output_properties = frozenset({"Tags"})
+
     async def _execute(self, queues: list[str]) -> list[dict[str, Any]]:
         if not queues:
             return []
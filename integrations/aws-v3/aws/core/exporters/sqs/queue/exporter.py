@@ -19,7 +19,7 @@ class SqsQueueExporter(IResourceExporter):
     async def get_resource(self, options: SingleQueueRequest) -> dict[str, Any]:
         """Fetch detailed attributes of a single SQS queue."""
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -39,7 +39,7 @@ class SqsQueueExporter(IResourceExporter):
     ) -> AsyncGenerator[list[dict[str, Any]], None]:
         """Fetch all SQS queues in a region."""
         async with AioBaseClientProxy(
-            self.session, options.region, self._service_name
+            self.session, options.region, self._service_name, options.account_id
         ) as proxy:
             inspector = ResourceInspector(
                 proxy.client, self._actions_map(), lambda: self._model_cls()
@@ -29,6 +29,25 @@ def is_resource_not_found_exception(e: Exception) -> bool:
     return False
 
 
+def is_throttling_exception(e: Exception) -> bool:
+    throttling_error_codes = [
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "SlowDown",
+        "EC2ThrottledException",
+    ]
+    response = getattr(e, "response", None)
+    if isinstance(response, dict):
+        error_code = response.get("Error", {}).get("Code")
+        return error_code in throttling_error_codes
+    return False
+
+
 def is_recoverable_aws_exception(exception: Exception) -> bool:
     """
     Check if an AWS exception is recoverable and the action can continue.
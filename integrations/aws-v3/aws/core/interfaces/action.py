@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import ClassVar, Dict, Any, FrozenSet, List
 from abc import ABC, abstractmethod
 from aiobotocore.client import AioBaseClient
 from typing import Type, Protocol
@@ -6,6 +6,9 @@ from loguru import logger
 
 
 class Action(ABC):
+    # Properties the action adds to a resource. Actions that declare them are skipped
+    # when the mapping references none of them; `None` means the action always runs.
+    output_properties: ClassVar[FrozenSet[str] | None] = None
 
     def __init__(self, client: AioBaseClient) -> None:
         """aiobotocore's concrete clients provide methods like `get_bucket_tagging`
@@ -1,11 +1,102 @@
-from typing import List, Dict, Any, Callable, cast
+from typing import Iterator, List, Dict, Any, Callable, Set, cast
 from loguru import logger
 import asyncio
+import re
+from port_ocean.context.event import event
+from port_ocean.core.handlers.port_app_config.models import (
+    IngestSearchQuery,
+    ResourceConfig,
+    Rule,
+)
+from port_ocean.exceptions.context import EventContextNotFoundError
+from aws.core.client.limiter import LimitedClient, get_client_limiter
 from aws.core.interfaces.action import Action, ActionMap
 from aws.core.modeling.resource_builder import ResourceBuilder
 from aws.core.modeling.resource_models import ResourceModel
 from collections import defaultdict
 
+# A path of field, index and slice accesses following a field access, e.g. `.Tags[0].Key`
+_ACCESS_SUFFIX = (
+    r'(?:\s*\??\s*(?:\.\s*[A-Za-z_]\w*|\[\s*(?:"[^"\\]*"|[-\d\s:]*)\s*\]))*\??'
+)
+PROPERTY_ACCESS_PATTERN = re.compile(
+    r'\.Properties\??\s*(?:\.\s*([A-Za-z_][A-Za-z0-9_]*)|\[\s*"([^"]+)"\s*\])'
+    + _ACCESS_SUFFIX
+)
+# Fields of the item that are not produced by actions, e.g. `.Type` or `.__ExtraContext.AccountId`
+CONTEXT_ACCESS_PATTERN = re.compile(
+    r"\.\s*(?:Type|__[A-Za-z0-9_]+)(?![A-Za-z0-9_])" + _ACCESS_SUFFIX
+)
+STRING_LITERAL_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"')
+NUMBER_LITERAL_PATTERN = re.compile(r"(?<![\w$])\d*\.?\d+(?:[eE][-+]?\d+)?")
+IDENTIFIER_PATTERN = re.compile(r"(?<![\w$])[A-Za-z_]\w*")
+# Identifiers that never read the item, any other one may be a builtin applied to it
+JQ_KEYWORDS = frozenset(
+    {"true", "false", "null", "and", "or", "if", "then", "elif", "else", "end"}
+)
+
+
+def _iter_jq_expressions(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, Rule):
+        yield value.value
+    elif isinstance(value, IngestSearchQuery):
+        for rule in value.rules:
+            yield from _iter_jq_expressions(rule)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_jq_expressions(item)
+
+
+def _get_expression_referenced_properties(expression: str) -> Set[str] | None:
+    if "\\(" in expression:
+        # String interpolation can read anything
+        return None
+
+    referenced = {
+        match.group(1) or match.group(2)
+        for match in PROPERTY_ACCESS_PATTERN.finditer(expression)
+    }
+    remainder = PROPERTY_ACCESS_PATTERN.sub(" ", expression)
+    remainder = CONTEXT_ACCESS_PATTERN.sub(" ", remainder)
+    remainder = STRING_LITERAL_PATTERN.sub(" ", remainder)
+    remainder = NUMBER_LITERAL_PATTERN.sub(" ", remainder)
+    if "." in remainder:
+        # The identity, recursive descent or a path that is not `.Properties.X`
+        return None
+    if any(
+        identifier not in JQ_KEYWORDS
+        for identifier in IDENTIFIER_PATTERN.findall(remainder)
+    ):
+        return None
+    return referenced
+
+
+def get_referenced_properties(resource_config: ResourceConfig) -> Set[str] | None:
+    """
+    Collect the resource properties a resource config's jq expressions read.
+
+    Returns `None` unless every expression provably reads the item only through
+    `.Properties.X` accesses (and fields that actions do not produce, such as `.Type`),
+    in which case every action must run. Whole-item expressions such as `.`, `tojson`
+    or `to_entries`, `.Properties` as a whole, and pipes into builtins all fall back
+    to `None`.
+    """
+    expressions = [resource_config.selector.query]
+    if resource_config.port.items_to_parse:
+        expressions.append(resource_config.port.items_to_parse)
+    for _, value in resource_config.port.entity.mappings:
+        expressions.extend(_iter_jq_expressions(value))
+
+    referenced: Set[str] = set()
+    for expression in expressions:
+        expression_properties = _get_expression_referenced_properties(expression)
+        if expression_properties is None:
+            return None
+        referenced |= expression_properties
+    return referenced
+
 
 class ResourceInspector[ResourceModelT: ResourceModel[Any]]:
     """
@@ -46,6 +137,9 @@ class ResourceInspector[ResourceModelT: ResourceModel[Any]]:
         self.client = client
         self.actions_map = actions_map
         self.model_factory = model_factory
+        # Every action of every page shares the client's concurrency limit and
+        # throttling backoff
+        self._limited_client = LimitedClient(client, get_client_limiter(client))
 
     async def inspect(
         self,
@@ -64,8 +158,8 @@ class ResourceInspector[ResourceModelT: ResourceModel[Any]]:
         Returns:
             List[Dict[str, Any]]: List of constructed resource models with aggregated data.
         """
-        action_classes = self.actions_map.merge(include)
-        actions = [cls(self.client) for cls in action_classes]
+        action_classes = self._select_actions(self.actions_map.merge(include))
+        actions = [cls(self._limited_client) for cls in action_classes]
         type = self.model_factory().Type
         action_results = await asyncio.gather(
             *(self._run_action(action, identifiers) for action in actions),
@@ -100,6 +194,30 @@ class ResourceInspector[ResourceModelT: ResourceModel[Any]]:
         )
         return resources
 
+    def _select_actions(self, action_classes: List[type[Action]]) -> List[type[Action]]:
+        """Drop actions whose output properties the current mapping never reads."""
+        try:
+            resource_config = event.resource_config
+        except EventContextNotFoundError:
+            return action_classes
+        if not isinstance(resource_config, ResourceConfig):
+            return action_classes
+
+        referenced = get_referenced_properties(resource_config)
+        if referenced is None:
+            return action_classes
+
+        selected = []
+        for action_cls in action_classes:
+            outputs = action_cls.output_properties
+            if outputs is not None and not outputs & referenced:
+                logger.debug(
+                    f"Skipping {action_cls.__name__}, the mapping of {resource_config.kind} does not reference {', '.join(sorted(outputs))}"
+                )
+                continue
+            selected.append(action_cls)
+        return selected
+
     async def _run_action(
         self, action: "Action", identifiers: Any
     ) -> List[Dict[str, Any]]:
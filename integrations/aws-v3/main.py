@@ -27,11 +27,24 @@ from aws.core.exporters.aws_lambda.function.models import PaginatedLambdaFunctio
 from aws.core.exporters.sqs import SqsQueueExporter
 from aws.core.exporters.sqs.queue.models import PaginatedQueueRequest
 from aws.core.helpers.utils import is_access_denied_exception
+from aws.core.client.pool import client_pool
 
 from loguru import logger
 from resync import ResyncAWSService
 
 
+@ocean.on_resync_start()
+async def open_client_pool() -> None:
+    # Close clients left over from a resync that did not complete
+    await client_pool.close()
+    client_pool.open()
+
+
+@ocean.on_resync_complete()
+async def close_client_pool() -> None:
+    await client_pool.close()
+
+
 @ocean.on_resync(ObjectKind.S3_BUCKET)
 async def resync_s3_bucket(kind: str) -> ASYNC_GENERATOR_RESYNC_TYPE:
     service = ResyncAWSService(
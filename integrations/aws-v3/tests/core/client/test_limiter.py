@@ -0,0 +1,102 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from aws.core.client.limiter import (
+    DEFAULT_CONCURRENCY_LIMIT,
+    ClientCallLimiter,
+    LimitedClient,
+    get_client_limiter,
+)
+
+
+def _throttling_error() -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "GetBucketTagging",
+    )
+
+
+class TestClientCallLimiter:
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_calls(self) -> None:
+        """Test that no more than max_concurrency calls run at the same time."""
+        limiter = ClientCallLimiter(max_concurrency=3)
+        running = 0
+        peak = 0
+
+        async def operation() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(limiter.call(operation) for _ in range(10)))
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_throttled_call_is_retried_after_shared_backoff(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a throttled call pauses every call and is then retried."""
+        limiter = ClientCallLimiter(max_concurrency=2)
+        monkeypatch.setattr(limiter, "BASE_BACKOFF_SECONDS", 0.05)
+        throttled = AsyncMock(side_effect=[_throttling_error(), {"TagSet": []}])
+
+        result = await limiter.call(throttled, Bucket="bucket")
+
+        assert result == {"TagSet": []}
+        assert throttled.await_count == 2
+        assert limiter._resume_at > 0
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self) -> None:
+        """Test that only throttling errors are retried."""
+        limiter = ClientCallLimiter(max_concurrency=2)
+        failing = AsyncMock(side_effect=ValueError("boom"))
+
+        with pytest.raises(ValueError):
+            await limiter.call(failing)
+
+        failing.assert_awaited_once()
+
+
+class TestLimitedClient:
+
+    @pytest.mark.asyncio
+    async def test_routes_api_calls_through_limiter(self) -> None:
+        """Test that coroutine methods go through the limiter while other attributes pass through."""
+        client = MagicMock()
+        client.get_bucket_tagging = AsyncMock(return_value={"TagSet": []})
+        limiter = MagicMock()
+        limiter.call = AsyncMock(return_value={"TagSet": [{"Key": "a"}]})
+
+        limited_client: Any = LimitedClient(client, limiter)
+
+        result = await limited_client.get_bucket_tagging(Bucket="bucket")
+
+        assert result == {"TagSet": [{"Key": "a"}]}
+        limiter.call.assert_awaited_once_with(
+            client.get_bucket_tagging, Bucket="bucket"
+        )
+        assert limited_client.exceptions is client.exceptions
+
+    def test_limiter_is_shared_per_client(self) -> None:
+        """Test that every inspector of a client shares one limiter."""
+        client = MagicMock()
+        client.meta.service_model.service_name = "organizations"
+
+        limiter = get_client_limiter(client)
+
+        assert get_client_limiter(client) is limiter
+        assert get_client_limiter(MagicMock()) is not limiter
+        assert limiter.max_concurrency == 2
+        assert get_client_limiter(
+            object.__new__(type("C", (), {}))
+        ).max_concurrency == (DEFAULT_CONCURRENCY_LIMIT)
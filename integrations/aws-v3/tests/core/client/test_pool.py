@@ -0,0 +1,125 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aws.core.client.pool import AioClientPool, client_pool
+from aws.core.client.proxy import AioBaseClientProxy
+
+
+def _create_session(credentials: Any = None) -> MagicMock:
+    """Create a mock session whose create_client returns a fresh client each call."""
+    session = MagicMock()
+    session._credentials = credentials or object()
+
+    def create_client(service_name: str, region_name: str) -> AsyncMock:
+        client_cm = AsyncMock()
+        client_cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+        client_cm.__aexit__ = AsyncMock()
+        return client_cm
+
+    session.create_client = MagicMock(side_effect=create_client)
+    return session
+
+
+class TestAioClientPool:
+
+    @pytest.fixture
+    def pool(self) -> AioClientPool:
+        pool = AioClientPool()
+        pool.open()
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_account_region_and_service(
+        self, pool: AioClientPool
+    ) -> None:
+        """Test that the same key shares a client while other keys get their own."""
+        session = _create_session()
+
+        first = await pool.acquire(session, "123456789012", "us-east-1", "ec2")
+        second = await pool.acquire(session, "123456789012", "us-east-1", "ec2")
+        other_region = await pool.acquire(session, "123456789012", "eu-west-1", "ec2")
+        other_service = await pool.acquire(session, "123456789012", "us-east-1", "s3")
+
+        assert first is second
+        assert other_region is not first
+        assert other_service is not first
+        assert session.create_client.call_count == 3
+        assert pool.size == 3
+        assert pool.created == 3
+        assert pool.reused == 1
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_borrowed_clients(self, pool: AioClientPool) -> None:
+        """Test that clients are only closed once the last borrower releases them."""
+        session = _create_session()
+        client = await pool.acquire(session, "123456789012", "us-east-1", "ec2")
+        await pool.acquire(session, "123456789012", "us-east-1", "ec2")
+        pooled = pool._leases[id(client)]
+
+        await pool.close()
+        assert not pool.is_open
+        assert pool.size == 0
+        pooled.client_cm.__aexit__.assert_not_called()
+
+        await pool.release(client)
+        pooled.client_cm.__aexit__.assert_not_called()
+
+        await pool.release(client)
+        pooled.client_cm.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_replaces_client_when_credentials_change(
+        self, pool: AioClientPool
+    ) -> None:
+        """Test that a new session for an account retires its previous clients."""
+        old_session = _create_session()
+        old_client = await pool.acquire(old_session, "123456789012", "us-east-1", "ec2")
+        old_pooled = pool._leases[id(old_client)]
+        await pool.release(old_client)
+
+        new_session = _create_session()
+        new_client = await pool.acquire(new_session, "123456789012", "us-east-1", "ec2")
+
+        assert new_client is not old_client
+        old_pooled.client_cm.__aexit__.assert_awaited_once()
+        assert pool.size == 1
+
+
+class TestAioBaseClientProxyPooling:
+
+    @pytest.mark.asyncio
+    async def test_proxy_borrows_from_open_pool(self) -> None:
+        """Test that proxies with an account id share pooled clients during a resync."""
+        session = _create_session()
+        client_pool.open()
+        try:
+            async with AioBaseClientProxy(
+                session, "us-east-1", "sqs", "123456789012"
+            ) as first:
+                first_client = first.client
+            async with AioBaseClientProxy(
+                session, "us-east-1", "sqs", "123456789012"
+            ) as second:
+                assert second.client is first_client
+
+            session.create_client.assert_called_once_with(
+                service_name="sqs", region_name="us-east-1"
+            )
+            first_client.__aexit__.assert_not_called()
+        finally:
+            await client_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_proxy_creates_client_when_pool_is_closed(self) -> None:
+        """Test that proxies fall back to a dedicated client outside of a resync."""
+        session = _create_session()
+
+        async with AioBaseClientProxy(
+            session, "us-east-1", "sqs", "123456789012"
+        ) as proxy:
+            client = proxy.client
+
+        client.__aexit__.assert_awaited_once()
+        assert client_pool.size == 0
@@ -87,7 +87,7 @@ class TestLambdaFunctionExporter:
 
         assert result == lambda_function.dict(exclude_none=True)
         mock_proxy_class.assert_called_once_with(
-            exporter.session, "us-east-1", "lambda"
+            exporter.session, "us-east-1", "lambda", options.account_id
         )
         mock_inspector_class.assert_called_once()
         mock_inspector.inspect.assert_called_once()
@@ -189,7 +189,7 @@ class TestLambdaFunctionExporter:
         assert collected[2] == func3.dict(exclude_none=True)
 
         mock_proxy_class.assert_called_once_with(
-            exporter.session, "us-east-1", "lambda"
+            exporter.session, "us-east-1", "lambda", options.account_id
         )
         mock_proxy.get_paginator.assert_called_once_with("list_functions", "Functions")
         assert mock_inspector.inspect.call_count == 2
@@ -300,7 +300,7 @@ class TestLambdaFunctionExporter:
         assert call_kwargs["extra_context"]["Region"] == "us-west-2"
 
         mock_proxy_class.assert_called_once_with(
-            exporter.session, "us-west-2", "lambda"
+            exporter.session, "us-west-2", "lambda", options.account_id
         )
         mock_proxy_class.return_value.__aenter__.assert_called_once()
         mock_proxy_class.return_value.__aexit__.assert_called_once()
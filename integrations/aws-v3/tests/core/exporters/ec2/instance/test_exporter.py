@@ -65,7 +65,9 @@ class TestEC2InstanceExporter:
         result = await exporter.get_resource(options)
 
         assert result == instance.dict(exclude_none=True)
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "ec2")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "ec2", options.account_id
+        )
         mock_inspector_class.assert_called_once()
         mock_inspector.inspect.assert_called_once_with(
             ["i-1234567890abcdef0"], ["GetInstanceStatusAction"]
@@ -166,7 +168,9 @@ class TestEC2InstanceExporter:
         assert collected[1] == inst2.dict(exclude_none=True)
         assert collected[2] == inst3.dict(exclude_none=True)
 
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-east-1", "ec2")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-east-1", "ec2", options.account_id
+        )
         mock_proxy.get_paginator.assert_called_once_with(
             "describe_instances", "Reservations"
         )
@@ -271,6 +275,8 @@ class TestEC2InstanceExporter:
         assert result["Type"] == "AWS::EC2::Instance"
 
         mock_inspector.inspect.assert_called_once_with(["i-55"], [])
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "ec2")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "ec2", options.account_id
+        )
         mock_proxy_class.return_value.__aenter__.assert_called_once()
         mock_proxy_class.return_value.__aexit__.assert_called_once()
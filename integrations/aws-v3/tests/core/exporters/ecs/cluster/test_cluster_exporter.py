@@ -80,7 +80,9 @@ class TestEcsClusterExporter:
 
         # Verify
         assert result == expected_cluster.dict(exclude_none=True)
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "ecs")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "ecs", options.account_id
+        )
         # ResourceInspector was called correctly
         mock_inspector_class.assert_called_once()
         mock_inspector.inspect.assert_called_once_with(
@@ -132,7 +134,9 @@ class TestEcsClusterExporter:
 
         # Verify
         assert result == expected_cluster.dict(exclude_none=True)
-        mock_proxy_class.assert_called_once_with(exporter.session, "eu-west-1", "ecs")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "eu-west-1", "ecs", options.account_id
+        )
         # ResourceInspector was called correctly
         mock_inspector_class.assert_called_once()
         mock_inspector.inspect.assert_called_once_with(
@@ -244,7 +248,9 @@ class TestEcsClusterExporter:
         assert all(result["Type"] == "AWS::ECS::Cluster" for result in results)
 
         # Verify mock calls
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-east-1", "ecs")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-east-1", "ecs", options.account_id
+        )
         mock_proxy.get_paginator.assert_called_once_with("list_clusters", "clusterArns")
 
         # Verify describe_clusters was called for each page
@@ -390,6 +396,8 @@ class TestEcsClusterExporter:
         )
 
         # Verify the context manager was used correctly (__aenter__ and __aexit__ were called)
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "ecs")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "ecs", options.account_id
+        )
         mock_proxy_class.return_value.__aenter__.assert_called_once()
         mock_proxy_class.return_value.__aexit__.assert_called_once()
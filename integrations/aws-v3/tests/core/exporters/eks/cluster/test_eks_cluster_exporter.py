@@ -76,7 +76,9 @@ class TestEksClusterExporter:
 
         # Verify
         assert result == expected_cluster.dict(exclude_none=True)
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "eks")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "eks", options.account_id
+        )
         mock_inspector.inspect.assert_called_once_with(["test-cluster"], [])
 
     @pytest.mark.asyncio
@@ -140,7 +142,9 @@ class TestEksClusterExporter:
         assert all(result["Type"] == "AWS::EKS::Cluster" for result in results)
 
         # Verify mock calls
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "eks")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "eks", options.account_id
+        )
         mock_proxy.get_paginator.assert_called_once_with("list_clusters", "clusters")
         assert mock_client.describe_cluster.call_count == 3
 
@@ -67,7 +67,7 @@ class TestOrganizationsAccountExporter:
 
         assert result == expected.dict(exclude_none=True)
         mock_proxy_class.assert_called_once_with(
-            exporter.session, "us-east-1", "organizations"
+            exporter.session, "us-east-1", "organizations", options.account_id
         )
         mock_inspector_class.assert_called_once()
         mock_inspector.inspect.assert_called_once_with(
@@ -125,7 +125,7 @@ class TestOrganizationsAccountExporter:
         assert results[2] == acc3.dict(exclude_none=True)
 
         mock_proxy_class.assert_called_once_with(
-            exporter.session, "us-east-1", "organizations"
+            exporter.session, "us-east-1", "organizations", options.account_id
         )
         mock_proxy.get_paginator.assert_called_once_with("list_accounts", "Accounts")
         assert mock_inspector.inspect.call_count == 2
@@ -80,7 +80,9 @@ class TestRdsDbInstanceExporter:
         result = await exporter.get_resource(options)
 
         assert result == db_instance.dict(exclude_none=True)
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "rds")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "rds", options.account_id
+        )
         mock_inspector_class.assert_called_once()
         # The actual call will be with the mock client result, not the string directly
         mock_inspector.inspect.assert_called_once()
@@ -214,7 +216,9 @@ class TestRdsDbInstanceExporter:
         assert collected[1] == db2.dict(exclude_none=True)
         assert collected[2] == db3.dict(exclude_none=True)
 
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-east-1", "rds")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-east-1", "rds", options.account_id
+        )
         mock_proxy.get_paginator.assert_called_once_with(
             "describe_db_instances", "DBInstances"
         )
@@ -332,6 +336,8 @@ class TestRdsDbInstanceExporter:
         assert call_kwargs["extra_context"]["AccountId"] == "123456789012"
         assert call_kwargs["extra_context"]["Region"] == "us-west-2"
 
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "rds")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "rds", options.account_id
+        )
         mock_proxy_class.return_value.__aenter__.assert_called_once()
         mock_proxy_class.return_value.__aexit__.assert_called_once()
@@ -74,7 +74,9 @@ class TestS3BucketExporter:
 
         # Verify
         assert result == expected_bucket.dict(exclude_none=True)
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "s3")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "s3", options.account_id
+        )
         # ResourceInspector was called correctly
         mock_inspector_class.assert_called_once()
         mock_inspector.inspect.assert_called_once_with(
@@ -122,7 +124,9 @@ class TestS3BucketExporter:
 
         # Verify
         assert result == expected_bucket.dict(exclude_none=True)
-        mock_proxy_class.assert_called_once_with(exporter.session, "eu-west-1", "s3")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "eu-west-1", "s3", options.account_id
+        )
         # ResourceInspector was called correctly
         mock_inspector_class.assert_called_once()
         mock_inspector.inspect.assert_called_once_with(
@@ -194,7 +198,9 @@ class TestS3BucketExporter:
         assert results[2] == bucket3.dict(exclude_none=True)
 
         # Verify mock calls
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-east-1", "s3")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-east-1", "s3", options.account_id
+        )
         mock_proxy.get_paginator.assert_called_once_with("list_buckets", "Buckets")
         # ResourceInspector was called
         mock_inspector_class.assert_called_once()
@@ -340,6 +346,8 @@ class TestS3BucketExporter:
         mock_inspector.inspect.assert_called_once_with([{"Name": "test-bucket"}], [])
 
         # Verify the context manager was used correctly (__aenter__ and __aexit__ were called)
-        mock_proxy_class.assert_called_once_with(exporter.session, "us-west-2", "s3")
+        mock_proxy_class.assert_called_once_with(
+            exporter.session, "us-west-2", "s3", options.account_id
+        )
         mock_proxy_class.return_value.__aenter__.assert_called_once()
         mock_proxy_class.return_value.__aexit__.assert_called_once()
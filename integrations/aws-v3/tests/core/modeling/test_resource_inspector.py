@@ -0,0 +1,115 @@
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from port_ocean.core.handlers.port_app_config.models import (
+    EntityMapping,
+    MappingsConfig,
+    PortResourceConfig,
+    ResourceConfig,
+    Selector,
+)
+
+from aws.core.exporters.s3.bucket.actions import (
+    GetBucketTaggingAction,
+    ListBucketsAction,
+)
+from aws.core.exporters.s3.bucket.models import Bucket
+from aws.core.interfaces.action import Action, ActionMap
+from aws.core.modeling.resource_inspector import (
+    ResourceInspector,
+    get_referenced_properties,
+)
+
+
+def _resource_config(properties: Dict[str, str]) -> ResourceConfig:
+    return ResourceConfig(
+        kind="AWS::S3::Bucket",
+        selector=Selector(query="true"),
+        port=PortResourceConfig(
+            entity=MappingsConfig(
+                mappings=EntityMapping(
+                    identifier=".Properties.Arn",
+                    title='.Properties["BucketName"]',
+                    blueprint='"s3Bucket"',
+                    properties=properties,
+                )
+            )
+        ),
+    )
+
+
+class TestGetReferencedProperties:
+
+    def test_collects_property_accessors(self) -> None:
+        config = _resource_config(
+            {
+                "tags": ".Properties?.Tags",
+                "firstTagKey": ".Properties.Tags[0].Key",
+                "arn": '"arn:aws:s3:::" + .Properties.Name // null',
+                "account": ".__ExtraContext.AccountId",
+                "type": ".Type",
+            }
+        )
+
+        assert get_referenced_properties(config) == {
+            "Arn",
+            "BucketName",
+            "Name",
+            "Tags",
+        }
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            ".",
+            "tojson",
+            "to_entries",
+            "keys",
+            ".Properties",
+            ".Properties | keys",
+            ".Properties | .. | strings",
+            ".Properties.Tags | map(.Key)",
+            '"\\(.Properties)"',
+            ".Metadata.Properties.Name",
+        ],
+    )
+    def test_whole_properties_disable_skipping(self, expression: str) -> None:
+        config = _resource_config({"raw": expression})
+
+        assert get_referenced_properties(config) is None
+
+
+class _LocationAction(Action):
+    output_properties = frozenset({"LocationConstraint"})
+
+    async def _execute(self, buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [{"LocationConstraint": "eu-west-1"} for _ in buckets]
+
+
+class _ActionsMap(ActionMap):
+    defaults = [ListBucketsAction, GetBucketTaggingAction]
+    options = [_LocationAction]
+
+
+class TestResourceInspectorActionSelection:
+
+    @pytest.mark.asyncio
+    async def test_skips_actions_the_mapping_does_not_reference(self) -> None:
+        """Test that tagging is skipped while referenced and identity actions run."""
+        client = MagicMock()
+        config = _resource_config({"location": ".Properties.LocationConstraint"})
+        inspector = ResourceInspector(client, _ActionsMap(), lambda: Bucket())
+
+        with patch(
+            "aws.core.modeling.resource_inspector.event",
+            MagicMock(resource_config=config),
+        ):
+            resources = await inspector.inspect(
+                [{"Name": "bucket", "CreationDate": "2024-01-01T00:00:00Z"}],
+                ["_LocationAction"],
+            )
+
+        client.get_bucket_tagging.assert_not_called()
+        assert resources[0]["Properties"]["LocationConstraint"] == "eu-west-1"
+        assert resources[0]["Properties"]["BucketName"] == "bucket"
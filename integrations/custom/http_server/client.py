@@ -6,7 +6,6 @@ Uses Ocean's built-in HTTP client with caching and rate limiting.
 """
 
 import asyncio
-import functools
 from typing import AsyncGenerator, List, Dict, Any, Optional
 from urllib.parse import urljoin
 import httpx
@@ -162,13 +161,10 @@ class HttpServerClient:
     ) -> AsyncGenerator[List[Dict[str, Any]], None]:
         """Fetch multiple endpoints in parallel with concurrency control"""
 
+        # fetch_paginated_data acquires the semaphore itself; acquiring it here as
+        # well would deadlock once more endpoints than permits are in flight
         tasks = [
-            semaphore_async_iterator(
-                self.semaphore,
-                functools.partial(
-                    self.fetch_paginated_data, endpoint, method, query_params, headers
-                ),
-            )
+            self.fetch_paginated_data(endpoint, method, query_params, headers)
             for endpoint in endpoints
         ]
 
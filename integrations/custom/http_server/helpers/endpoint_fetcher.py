@@ -0,0 +1,143 @@
+"""
+Endpoint Fetching Module
+
+Fetches resolved endpoints concurrently and extracts records with the selector's data_path.
+"""
+
+import asyncio
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.utils.async_iterators import stream_async_iterators_tasks
+from http_server.client import HttpServerClient
+
+
+def _extract_with_compiled_path(
+    compiled_path: Any, batch: List[Any], data_path: str
+) -> List[Any]:
+    """Run a compiled JQ program over every response of a batch
+
+    Mirrors the entity processor's search: the first result of the program is kept,
+    lists are flattened into the batch and empty results are dropped.
+    """
+    extracted_items: List[Any] = []
+    for item in batch:
+        try:
+            extracted_data = compiled_path.input_value(item).first()
+        except StopIteration:
+            continue
+        except Exception as e:
+            logger.error(f"Error extracting data with JQ path '{data_path}': {e}")
+            continue
+
+        if isinstance(extracted_data, list):
+            extracted_items.extend(extracted_data)
+        elif extracted_data is not None:
+            extracted_items.append(extracted_data)
+    return extracted_items
+
+
+async def extract_data_path(batch: List[Any], data_path: str) -> List[Any]:
+    """Extract the records found at data_path from a batch of responses
+
+    The JQ program is compiled once (and cached by Ocean's entity processor) and the
+    whole batch is processed in a single executor call instead of one per response.
+
+    Args:
+        batch: Raw responses returned by the API
+        data_path: JQ path to the records (e.g., ".data", ".tickets")
+
+    Returns:
+        Flat list of extracted records
+    """
+    compiled_path = ocean.app.integration.entity_processor._compile(data_path)  # type: ignore[attr-defined]
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, _extract_with_compiled_path, compiled_path, batch, data_path
+    )
+
+
+async def fetch_endpoint(
+    http_client: HttpServerClient,
+    endpoint: str,
+    path_params: Dict[str, str],
+    method: str,
+    query_params: Dict[str, Any],
+    headers: Dict[str, str],
+    data_path: Optional[str],
+) -> AsyncGenerator[List[Any], None]:
+    """Fetch every page of a single resolved endpoint
+
+    Path parameter values are injected into extracted records as `__<param_name>`.
+    Errors are logged and end this endpoint only, so other endpoints keep streaming.
+    """
+    logger.info(f"Fetching data from: {method} {endpoint}")
+
+    try:
+        async for batch in http_client.fetch_paginated_data(
+            endpoint=endpoint,
+            method=method,
+            query_params=query_params,
+            headers=headers,
+        ):
+            logger.info(f"Received {len(batch)} records from {endpoint}")
+
+            if not data_path:
+                yield batch
+                continue
+
+            processed_batch = await extract_data_path(batch, data_path)
+            if path_params:
+                for entity in processed_batch:
+                    if isinstance(entity, dict):
+                        for param_name, param_value in path_params.items():
+                            entity[f"__{param_name}"] = param_value
+
+            if processed_batch:
+                logger.info(
+                    f"Extracted {len(processed_batch)} items using data_path: {data_path}"
+                )
+                yield processed_batch
+
+    except Exception as e:
+        logger.error(f"Error fetching data from {endpoint}: {str(e)}")
+
+
+async def fetch_resolved_endpoints(
+    http_client: HttpServerClient,
+    endpoints: List[tuple[str, Dict[str, str]]],
+    method: str,
+    query_params: Dict[str, Any],
+    headers: Dict[str, str],
+    data_path: Optional[str],
+) -> AsyncGenerator[List[Any], None]:
+    """Fetch resolved endpoints concurrently, yielding batches as they arrive
+
+    Concurrency is bounded by the client's semaphore, which every paginated fetch
+    acquires for its whole duration.
+
+    Args:
+        http_client: Client used for every endpoint
+        endpoints: List of tuples: (endpoint_url, {param_name: param_value})
+        method: HTTP method
+        query_params: Query parameters sent to every endpoint
+        headers: Headers sent to every endpoint
+        data_path: Optional JQ path to the records in each response
+    """
+    tasks = [
+        fetch_endpoint(
+            http_client,
+            endpoint,
+            path_params,
+            method,
+            query_params,
+            headers,
+            data_path,
+        )
+        for endpoint, path_params in endpoints
+    ]
+
+    async for batch in stream_async_iterators_tasks(*tasks):
+        yield batch
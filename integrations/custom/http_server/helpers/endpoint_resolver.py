@@ -9,7 +9,9 @@ from typing import List, Dict, Any
 from loguru import logger
 
 from port_ocean.context.ocean import ocean
+from port_ocean.utils.cache import cache_coroutine_result
 from http_server.overrides import HttpServerSelector, ApiPathParameter
+from http_server.helpers.endpoint_fetcher import extract_data_path
 from initialize_client import init_client
 
 
@@ -60,9 +62,13 @@ def generate_resolved_endpoints(
     return resolved_endpoints
 
 
+@cache_coroutine_result()
 async def query_api_for_parameters(param_config: ApiPathParameter) -> List[str]:
     """Query an API to get values for a path parameter
 
+    Results are cached for the duration of the resync, so kinds sharing the same
+    parameter configuration only discover its values once.
+
     Args:
         param_config: Configuration for fetching parameter values
 
@@ -81,48 +87,32 @@ async def query_api_for_parameters(param_config: ApiPathParameter) -> List[str]:
             query_params=param_config.query_params,
             headers=param_config.headers,
         ):
-            # Process each raw response in the batch
-            for response_item in batch:
-                # If data_path is specified, extract the array first
-                items_to_process = []
-                if param_config.data_path:
-                    try:
-                        extracted_data = await ocean.app.integration.entity_processor._search(  # type: ignore[attr-defined]
-                            response_item, param_config.data_path
-                        )
-                        if isinstance(extracted_data, list):
-                            items_to_process = extracted_data
-                        elif extracted_data is not None:
-                            items_to_process = [extracted_data]
-                    except Exception as e:
-                        logger.error(
-                            f"Error extracting data with path '{param_config.data_path}': {e}"
-                        )
-                        continue
-                else:
-                    # No data_path, process the response directly
-                    items_to_process = [response_item]
-
-                # Extract field values from each item
-                for item in items_to_process:
-                    try:
-                        # Use Ocean's built-in JQ processor
-                        extracted_value = await ocean.app.integration.entity_processor._search(  # type: ignore[attr-defined]
-                            item, param_config.field
-                        )
-                        if extracted_value is not None:
-                            # Apply optional filter
-                            if param_config.filter:
-                                filter_result = await ocean.app.integration.entity_processor._search(  # type: ignore[attr-defined]
-                                    item, param_config.filter
-                                )
-                                if filter_result is True:
-                                    all_values.append(str(extracted_value))
-                            else:
+            # If data_path is specified, extract the arrays of the whole batch first
+            items_to_process: List[Any] = batch
+            if param_config.data_path:
+                items_to_process = await extract_data_path(
+                    batch, param_config.data_path
+                )
+
+            for item in items_to_process:
+                try:
+                    # Use Ocean's built-in JQ processor
+                    extracted_value = await ocean.app.integration.entity_processor._search(  # type: ignore[attr-defined]
+                        item, param_config.field
+                    )
+                    if extracted_value is not None:
+                        # Apply optional filter
+                        if param_config.filter:
+                            filter_result = await ocean.app.integration.entity_processor._search(  # type: ignore[attr-defined]
+                                item, param_config.filter
+                            )
+                            if filter_result is True:
                                 all_values.append(str(extracted_value))
-                    except Exception as e:
-                        logger.warning(f"Error extracting value from item: {e}")
-                        continue
+                        else:
+                            all_values.append(str(extracted_value))
+                except Exception as e:
+                    logger.warning(f"Error extracting value from item: {e}")
+                    continue
 
         logger.info(
             f"Collected {len(all_values)} parameter values from {param_config.endpoint}"
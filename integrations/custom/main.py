@@ -14,6 +14,7 @@ from port_ocean.core.ocean_types import ASYNC_GENERATOR_RESYNC_TYPE
 from initialize_client import init_client
 from http_server.overrides import HttpServerResourceConfig
 from http_server.helpers.endpoint_resolver import resolve_dynamic_endpoints
+from http_server.helpers.endpoint_fetcher import fetch_resolved_endpoints
 
 
 @ocean.on_resync()
@@ -38,58 +39,13 @@ async def resync_resources(kind: str) -> ASYNC_GENERATOR_RESYNC_TYPE:
     headers = getattr(selector, "headers", None) or {}
     data_path = getattr(selector, "data_path", None)
 
-    # Call each resolved endpoint
-    for endpoint, path_params in endpoints:
-        logger.info(f"Fetching data from: {method} {endpoint}")
-
-        try:
-            async for batch in http_client.fetch_paginated_data(
-                endpoint=endpoint,
-                method=method,
-                query_params=query_params,
-                headers=headers,
-            ):
-                logger.info(f"Received {len(batch)} records from {endpoint}")
-
-                # If data_path is specified, extract the array from each response
-                if data_path:
-                    processed_batch = []
-                    for item in batch:
-                        try:
-                            # Use Ocean's built-in JQ processor
-                            extracted_data = await ocean.app.integration.entity_processor._search(  # type: ignore[attr-defined]
-                                item, data_path
-                            )
-                            if isinstance(extracted_data, list):
-                                # Inject path parameters into each extracted item
-                                for entity in extracted_data:
-                                    if isinstance(entity, dict) and path_params:
-                                        for (
-                                            param_name,
-                                            param_value,
-                                        ) in path_params.items():
-                                            entity[f"__{param_name}"] = param_value
-                                processed_batch.extend(extracted_data)
-                            elif extracted_data is not None:
-                                # Inject path parameters for single item
-                                if isinstance(extracted_data, dict) and path_params:
-                                    for param_name, param_value in path_params.items():
-                                        extracted_data[f"__{param_name}"] = param_value
-                                processed_batch.append(extracted_data)
-                        except Exception as e:
-                            logger.error(
-                                f"Error extracting data with JQ path '{data_path}': {e}"
-                            )
-                            continue
-
-                    if processed_batch:
-                        logger.info(
-                            f"Extracted {len(processed_batch)} items using data_path: {data_path}"
-                        )
-                        yield processed_batch
-                else:
-                    yield batch
-
-        except Exception as e:
-            logger.error(f"Error fetching data from {endpoint}: {str(e)}")
-            continue
+    # Fetch the resolved endpoints concurrently, bounded by the client's semaphore
+    async for batch in fetch_resolved_endpoints(
+        http_client,
+        endpoints,
+        method=method,
+        query_params=query_params,
+        headers=headers,
+        data_path=data_path,
+    ):
+        yield batch
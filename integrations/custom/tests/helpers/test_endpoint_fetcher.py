@@ -0,0 +1,137 @@
+"""Tests for concurrent endpoint fetching"""
+
+import asyncio
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+import jq  # type: ignore
+import pytest
+
+from http_server.client import HttpServerClient
+from http_server.helpers.endpoint_fetcher import (
+    extract_data_path,
+    fetch_resolved_endpoints,
+)
+
+
+@pytest.fixture
+def mock_jq_compile() -> Any:
+    with patch("http_server.helpers.endpoint_fetcher.ocean") as mock_ocean:
+        mock_ocean.app.integration.entity_processor._compile = MagicMock(
+            side_effect=jq.compile
+        )
+        yield mock_ocean.app.integration.entity_processor._compile
+
+
+def _create_client(max_concurrent_requests: int) -> HttpServerClient:
+    return HttpServerClient(
+        base_url="https://api.example.com",
+        auth_type="none",
+        auth_config={},
+        pagination_config={"pagination_type": "none"},
+        max_concurrent_requests=max_concurrent_requests,
+    )
+
+
+@pytest.mark.asyncio
+class TestExtractDataPath:
+    """Test batch extraction with a compiled data_path"""
+
+    async def test_extracts_and_flattens_batch(self, mock_jq_compile: Any) -> None:
+        """Test that lists are flattened, single items kept and empty results dropped"""
+        batch = [
+            {"data": [{"id": 1}, {"id": 2}]},
+            {"data": {"id": 3}},
+            {"data": None},
+            {"other": "value"},
+        ]
+
+        result = await extract_data_path(batch, ".data")
+
+        assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+        mock_jq_compile.assert_called_once_with(".data")
+
+    async def test_skips_items_that_fail_extraction(self, mock_jq_compile: Any) -> None:
+        """Test that an item failing the JQ program does not drop the whole batch"""
+        batch: List[Any] = ["not-an-object", {"data": [{"id": 1}]}]
+
+        result = await extract_data_path(batch, ".data")
+
+        assert result == [{"id": 1}]
+
+
+@pytest.mark.asyncio
+class TestFetchResolvedEndpoints:
+    """Test concurrent fan-out over resolved endpoints"""
+
+    async def test_fetches_endpoints_concurrently_within_limit(self) -> None:
+        """Test that endpoints run in parallel without exceeding the client's limit"""
+        client = _create_client(max_concurrent_requests=3)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def mock_pagination(
+            endpoint: str,
+            method: str,
+            query_params: Optional[Dict[str, Any]],
+            headers: Optional[Dict[str, str]],
+        ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            yield [{"endpoint": endpoint}]
+
+        endpoints = [
+            (f"/teams/team-{i}/members", {"team_id": f"team-{i}"}) for i in range(10)
+        ]
+
+        with patch.object(client, "_fetch_with_pagination", mock_pagination):
+            batches = [
+                batch
+                async for batch in fetch_resolved_endpoints(
+                    client, endpoints, "GET", {}, {}, None
+                )
+            ]
+
+        assert sorted(batch[0]["endpoint"] for batch in batches) == sorted(
+            endpoint for endpoint, _ in endpoints
+        )
+        assert max_in_flight == 3
+
+    async def test_injects_path_params_and_isolates_failures(
+        self, mock_jq_compile: Any
+    ) -> None:
+        """Test that extracted records get path params and a failing endpoint is skipped"""
+        client = _create_client(max_concurrent_requests=10)
+
+        async def mock_pagination(
+            endpoint: str,
+            method: str,
+            query_params: Optional[Dict[str, Any]],
+            headers: Optional[Dict[str, str]],
+        ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+            if endpoint.endswith("broken/members"):
+                raise RuntimeError("boom")
+            yield [{"members": [{"name": "alice"}, {"name": "bob"}]}]
+
+        endpoints = [
+            ("/teams/team-1/members", {"team_id": "team-1"}),
+            ("/teams/broken/members", {"team_id": "broken"}),
+        ]
+
+        with patch.object(client, "_fetch_with_pagination", mock_pagination):
+            batches = [
+                batch
+                async for batch in fetch_resolved_endpoints(
+                    client, endpoints, "GET", {}, {}, ".members"
+                )
+            ]
+
+        assert batches == [
+            [
+                {"name": "alice", "__team_id": "team-1"},
+                {"name": "bob", "__team_id": "team-1"},
+            ]
+        ]
@@ -4,7 +4,8 @@ import http
 import json
 import re
 import time
-from typing import Any, AsyncGenerator, Optional
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Generator, Optional
 from urllib.parse import urlparse, urlunparse
 
 import httpx
@@ -23,6 +24,11 @@ DEFAULT_SLEEP_TIME = 0.1
 FETCH_WINDOW_TIME_IN_MINUTES = 10
 FETCH_WINDOW_TIME_IN_SECONDS = 3600
 
+# Services per grouped metric query once a query has to be split by service
+MAX_SERVICES_PER_GROUPED_METRIC_QUERY = 100
+# Error messages of metric queries that may succeed once split into smaller queries
+SPLITTABLE_METRIC_QUERY_ERRORS = ("too many", "too large", "timeout", "timed out")
+
 SERVICE_KEY = "__service"
 QUERY_ID_KEY = "__query_id"
 QUERY_KEY = "__query"
@@ -68,6 +74,89 @@ def embed_credentials_in_url(url: str, username: str, token: str) -> str:
     return modified_url
 
 
+@dataclass
+class GroupedMetricQuery:
+    """
+    A single metrics query grouped by service and environment tags.
+
+    `envs` and `services` narrow the query's scope; `None` means every value of
+    the tag. A query that Datadog rejects is split by environment first, then
+    into halves of its services, down to a single (service, environment) pair.
+    """
+
+    envs: list[str] | None
+    services: list[str] | None
+
+    def scope(self, env_tag: str, service_tag: str) -> str:
+        filters = []
+        if self.envs is not None:
+            filters.append(_tag_filter(env_tag, self.envs))
+        if self.services is not None:
+            filters.append(_tag_filter(service_tag, self.services))
+        return " AND ".join(filters) or "*"
+
+    def split(self, all_services: list[str]) -> list["GroupedMetricQuery"]:
+        if self.envs is not None and len(self.envs) > 1:
+            return [GroupedMetricQuery([env], self.services) for env in self.envs]
+
+        services = self.services if self.services is not None else all_services
+        if len(services) > MAX_SERVICES_PER_GROUPED_METRIC_QUERY:
+            return [
+                GroupedMetricQuery(self.envs, chunk)
+                for chunk in turn_sequence_to_chunks(
+                    services, MAX_SERVICES_PER_GROUPED_METRIC_QUERY
+                )
+            ]
+        if len(services) > 1:
+            middle = len(services) // 2
+            return [
+                GroupedMetricQuery(self.envs, services[:middle]),
+                GroupedMetricQuery(self.envs, services[middle:]),
+            ]
+        return []
+
+
+def _is_splittable_metric_query_error(status_code: int | None, error: str) -> bool:
+    """
+    Whether a grouped metric query failed because of its size, in which case
+    smaller queries may succeed. `status_code` is None when no response was received.
+    Other failures, such as a malformed query or missing permissions, would fail
+    the same way for every split query.
+    """
+    if status_code is None or status_code >= 500:
+        return True
+    if status_code in (
+        http.HTTPStatus.REQUEST_TIMEOUT,
+        http.HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+    ):
+        return True
+    error = error.lower()
+    return any(marker in error for marker in SPLITTABLE_METRIC_QUERY_ERRORS)
+
+
+def _tag_filter(tag: str, values: list[str]) -> str:
+    if len(values) == 1:
+        return f"{tag}:{values[0]}"
+    return f"{tag} IN ({','.join(values)})"
+
+
+def _parse_series_scope(scope: str) -> dict[str, str]:
+    """Parse a series scope such as `env:prod,service:web` into its tags."""
+    tags = {}
+    for tag in scope.split(","):
+        name, _, value = tag.partition(":")
+        if value:
+            tags[name] = value
+    return tags
+
+
+def turn_sequence_to_chunks(
+    sequence: list[Any], chunk_size: int
+) -> Generator[list[Any], None, None]:
+    for start in range(0, len(sequence), chunk_size):
+        yield sequence[start : start + chunk_size]
+
+
 class DatadogClient:
     def __init__(
         self,
@@ -133,6 +222,19 @@ class DatadogClient:
         method: str = "GET",
         semaphore: Optional[asyncio.Semaphore] = None,
     ) -> Any:
+        response = await self._request_with_rate_limit_handling(
+            url, params, json_data, method, semaphore
+        )
+        return response.json()
+
+    async def _request_with_rate_limit_handling(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json_data: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> httpx.Response:
         if semaphore is None:
             semaphore = self._default_semaphore
 
@@ -167,7 +269,7 @@ class DatadogClient:
             except Exception as e:
                 logger.error(f"Error while making request to url: {url} - {str(e)}")
                 raise
-            return response.json()
+            return response
 
     async def get_team_members(
         self, team_id: str, page_size: int = MAX_PAGE_SIZE
@@ -536,6 +638,50 @@ class DatadogClient:
             )
             return
 
+        if "$" in metric_query:
+            # Template variables are substituted per service and environment, so
+            # the query cannot be grouped
+            async for metrics in self._fetch_metrics_per_service(
+                metric_query,
+                envs_to_fetch,
+                service_value,
+                time_window_in_minutes,
+                env_tag,
+                service_tag,
+            ):
+                yield metrics
+            return
+
+        if service_value == "*":
+            service_ids = [
+                service["attributes"]["schema"]["dd-service"]
+                async for services in self.get_services()
+                for service in services
+            ]
+        else:
+            result = await self.get_single_service(service_value)
+            service_ids = [result["data"]["attributes"]["schema"]["dd-service"]]
+
+        async for metrics in self._fetch_grouped_metrics_for_services(
+            metric_query,
+            envs_to_fetch,
+            service_ids,
+            time_window_in_minutes,
+            env_tag,
+            service_tag,
+            all_envs=env_value == "*",
+        ):
+            yield metrics
+
+    async def _fetch_metrics_per_service(
+        self,
+        metric_query: str,
+        envs_to_fetch: list[str],
+        service_value: str,
+        time_window_in_minutes: int,
+        env_tag: str,
+        service_tag: str,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
         if service_value == "*":
             async for service_list in self.get_services():
                 async for metrics in self._fetch_metrics_for_services(
@@ -560,6 +706,153 @@ class DatadogClient:
             ):
                 yield metrics
 
+    async def _fetch_grouped_metrics_for_services(
+        self,
+        query: str,
+        envs_to_fetch: list[str],
+        service_ids: list[str],
+        timeframe: int,
+        env_tag: str = "env",
+        service_tag: str = "service",
+        all_envs: bool = False,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Fetch a metric for many services and environments with grouped queries.
+
+        A single `by {service,env}` query is sent for the metric and time window,
+        and only split when Datadog rejects it. The returned series are then fanned
+        out into one raw item per (service, environment) pair, shaped like the
+        response of the per-service query `_fetch_metrics_for_services` sends.
+        """
+        if not service_ids:
+            return
+
+        logger.info(
+            f"Fetching metric {query} for {len(service_ids)} services and {len(envs_to_fetch)} environments with grouped queries. "
+            f"env_tag: {env_tag}, service_tag: {service_tag}"
+        )
+        end_time = int(time.time())
+        start_time = end_time - (timeframe * 60)
+
+        root_query = GroupedMetricQuery(
+            envs=None if all_envs else envs_to_fetch,
+            services=None if len(service_ids) > 1 else service_ids,
+        )
+        responses = await self._run_grouped_metric_query(
+            query, root_query, service_ids, start_time, end_time, env_tag, service_tag
+        )
+
+        series_by_scope: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        template: dict[str, Any] = {}
+        for response in responses:
+            template = template or response
+            for series in response.get("series", []):
+                tags = _parse_series_scope(series.get("scope", ""))
+                key = (tags.get(service_tag, ""), tags.get(env_tag, ""))
+                series_by_scope.setdefault(key, []).append(series)
+
+        for service_chunk in turn_sequence_to_chunks(service_ids, MAX_PAGE_SIZE):
+            metrics = []
+            for service_id in service_chunk:
+                for env_to_fetch in envs_to_fetch:
+                    metrics.append(
+                        {
+                            "status": template.get("status", "ok"),
+                            "res_type": template.get("res_type", "time_series"),
+                            "resp_version": template.get("resp_version"),
+                            "message": template.get("message", ""),
+                            "from_date": template.get("from_date", start_time * 1000),
+                            "to_date": template.get("to_date", end_time * 1000),
+                            "group_by": [],
+                            "query": self._create_query_with_values(
+                                f"{query}{{{service_tag}:{service_id}, {env_tag}:{env_to_fetch}}}",
+                                {service_tag: service_id, env_tag: env_to_fetch},
+                            ),
+                            "series": series_by_scope.get(
+                                (service_id, env_to_fetch), []
+                            ),
+                            SERVICE_KEY: service_id,
+                            QUERY_ID_KEY: (
+                                f"{query}/{service_tag}:{service_id}/{env_tag}:{env_to_fetch}"
+                            ),
+                            QUERY_KEY: query,
+                            ENV_KEY: env_to_fetch,
+                        }
+                    )
+            yield metrics
+
+    async def _run_grouped_metric_query(
+        self,
+        query: str,
+        grouped_query: GroupedMetricQuery,
+        all_services: list[str],
+        start_time: int,
+        end_time: int,
+        env_tag: str,
+        service_tag: str,
+    ) -> list[dict[str, Any]]:
+        query_string = (
+            f"{query}{{{grouped_query.scope(env_tag, service_tag)}}}"
+            f" by {{{service_tag},{env_tag}}}"
+        )
+        status_code: int | None = None
+        try:
+            response = await self._request_with_rate_limit_handling(
+                f"{self.api_url}/api/v1/query",
+                params={"from": start_time, "to": end_time, "query": query_string},
+                semaphore=self._metrics_semaphore,
+            )
+        except httpx.TimeoutException as e:
+            result = {"errors": [f"Request timed out: {e}"]}
+        except httpx.HTTPError as e:
+            logger.warning(f"Metric query {query_string} failed: {e}")
+            return []
+        else:
+            status_code = response.status_code
+            try:
+                result = response.json()
+            except ValueError:
+                result = {"errors": [response.text or response.reason_phrase]}
+
+        if (
+            status_code is not None
+            and status_code < 400
+            and result.get("status") != "error"
+            and not result.get("errors")
+        ):
+            return [result]
+
+        error = result.get("errors") or result.get("error")
+        if not _is_splittable_metric_query_error(status_code, str(error)):
+            logger.warning(f"Metric query {query_string} failed: {error}")
+            return []
+
+        sub_queries = grouped_query.split(all_services)
+        if not sub_queries:
+            logger.warning(
+                f"Metric query {query_string} failed and cannot be split further: {result}"
+            )
+            return []
+
+        logger.info(
+            f"Metric query {query_string} failed, splitting it into {len(sub_queries)} queries: {error}"
+        )
+        responses = await asyncio.gather(
+            *(
+                self._run_grouped_metric_query(
+                    query,
+                    sub_query,
+                    all_services,
+                    start_time,
+                    end_time,
+                    env_tag,
+                    service_tag,
+                )
+                for sub_query in sub_queries
+            )
+        )
+        return [result for group in responses for result in group]
+
     async def get_single_monitor(self, monitor_id: str) -> dict[str, Any] | None:
         if not monitor_id:
             return None
@@ -1,5 +1,6 @@
 import time
 
+import httpx
 import pytest
 from typing import Any
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -288,3 +289,185 @@ async def test_get_service_dependencies(
                 "end": end_time,
             },
         )
+
+
+def _metrics_response(series_scopes: list[str]) -> dict[str, Any]:
+    return {
+        "status": "ok",
+        "res_type": "time_series",
+        "from_date": 1000,
+        "to_date": 2000,
+        "series": [
+            {"scope": scope, "metric": "avg:system.cpu.user", "pointlist": [[1, 2]]}
+            for scope in series_scopes
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_groups_services_in_a_single_query(
+    mock_datadog_client: DatadogClient,
+) -> None:
+    services = [
+        {"attributes": {"schema": {"dd-service": "web"}}},
+        {"attributes": {"schema": {"dd-service": "api"}}},
+    ]
+
+    async def get_services() -> Any:
+        yield services
+
+    with (
+        patch.object(mock_datadog_client, "get_services", get_services),
+        patch.object(
+            mock_datadog_client,
+            "_request_with_rate_limit_handling",
+            new_callable=AsyncMock,
+        ) as mock_fetch,
+    ):
+        mock_fetch.return_value = httpx.Response(
+            200,
+            json=_metrics_response(["env:prod,service:web", "env:prod,service:api"]),
+        )
+        results = [
+            metrics
+            async for batch in mock_datadog_client.get_metrics(
+                "avg:system.cpu.user", "env", "prod", "service", "*", 60
+            )
+            for metrics in batch
+        ]
+
+    mock_fetch.assert_awaited_once()
+    assert (
+        mock_fetch.call_args.kwargs["params"]["query"]
+        == "avg:system.cpu.user{env:prod} by {service,env}"
+    )
+    assert [(result["__service"], result["__env"]) for result in results] == [
+        ("web", "prod"),
+        ("api", "prod"),
+    ]
+    assert results[0]["series"][0]["scope"] == "env:prod,service:web"
+    assert results[0]["__query_id"] == "avg:system.cpu.user/service:web/env:prod"
+    assert results[1]["query"] == "avg:system.cpu.user{service:api, env:prod}"
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_splits_rejected_grouped_query(
+    mock_datadog_client: DatadogClient,
+) -> None:
+    async def get_services() -> Any:
+        yield [
+            {"attributes": {"schema": {"dd-service": "web"}}},
+            {"attributes": {"schema": {"dd-service": "api"}}},
+        ]
+
+    async def fetch(url: str, **kwargs: Any) -> httpx.Response:
+        query = kwargs["params"]["query"]
+        if "service:" not in query:
+            return httpx.Response(
+                400, json={"status": "error", "errors": ["Query is too large"]}
+            )
+        service = "web" if "service:web" in query else "api"
+        return httpx.Response(
+            200, json=_metrics_response([f"env:staging,service:{service}"])
+        )
+
+    with (
+        patch.object(mock_datadog_client, "get_services", get_services),
+        patch.object(
+            mock_datadog_client,
+            "_request_with_rate_limit_handling",
+            side_effect=fetch,
+        ) as mock_fetch,
+    ):
+        results = [
+            metrics
+            async for batch in mock_datadog_client.get_metrics(
+                "avg:system.cpu.user", "env", "staging", "service", "*", 60
+            )
+            for metrics in batch
+        ]
+
+    queries = [call.kwargs["params"]["query"] for call in mock_fetch.call_args_list]
+    assert queries == [
+        "avg:system.cpu.user{env:staging} by {service,env}",
+        "avg:system.cpu.user{env:staging AND service:web} by {service,env}",
+        "avg:system.cpu.user{env:staging AND service:api} by {service,env}",
+    ]
+    assert all(len(result["series"]) == 1 for result in results)
+    assert [result["__service"] for result in results] == ["web", "api"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(503, text="Service Unavailable"),
+        httpx.Response(200, json={"status": "error", "error": "Query timed out"}),
+    ],
+)
+async def test_get_metrics_splits_grouped_query_on_server_errors_and_timeouts(
+    mock_datadog_client: DatadogClient, response: httpx.Response
+) -> None:
+    async def get_services() -> Any:
+        yield [
+            {"attributes": {"schema": {"dd-service": "web"}}},
+            {"attributes": {"schema": {"dd-service": "api"}}},
+        ]
+
+    async def fetch(url: str, **kwargs: Any) -> httpx.Response:
+        if "service:" not in kwargs["params"]["query"]:
+            return response
+        return httpx.Response(200, json=_metrics_response(["env:staging"]))
+
+    with (
+        patch.object(mock_datadog_client, "get_services", get_services),
+        patch.object(
+            mock_datadog_client,
+            "_request_with_rate_limit_handling",
+            side_effect=fetch,
+        ) as mock_fetch,
+    ):
+        results = [
+            metrics
+            async for batch in mock_datadog_client.get_metrics(
+                "avg:system.cpu.user", "env", "staging", "service", "*", 60
+            )
+            for metrics in batch
+        ]
+
+    assert mock_fetch.await_count == 3
+    assert [result["__service"] for result in results] == ["web", "api"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [400, 403])
+async def test_get_metrics_does_not_split_grouped_query_on_other_errors(
+    mock_datadog_client: DatadogClient, status_code: int
+) -> None:
+    async def get_services() -> Any:
+        yield [
+            {"attributes": {"schema": {"dd-service": "web"}}},
+            {"attributes": {"schema": {"dd-service": "api"}}},
+        ]
+
+    with (
+        patch.object(mock_datadog_client, "get_services", get_services),
+        patch.object(
+            mock_datadog_client,
+            "_request_with_rate_limit_handling",
+            new_callable=AsyncMock,
+        ) as mock_fetch,
+    ):
+        mock_fetch.return_value = httpx.Response(
+            status_code, json={"errors": ["Error parsing query"]}
+        )
+        results = [
+            metrics
+            async for batch in mock_datadog_client.get_metrics(
+                "avg:system.cpu.user", "env", "staging", "service", "*", 60
+            )
+            for metrics in batch
+        ]
+
+    mock_fetch.assert_awaited_once()
+    assert all(result["series"] == [] for result in results)
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import Any
 import typing
 
@@ -108,6 +109,95 @@ async def search_all_resources_in_project(
                 )
 
 
+async def get_projects_by_name() -> dict[str, dict[str, Any]]:
+    """
+    Index every accessible project by its resource name (``projects/{number}``) from a single
+    ``search_projects`` pass, which is cached for the rest of the resync.
+    """
+    projects_by_name: dict[str, dict[str, Any]] = {}
+    async for projects in search_all_projects():
+        for project in projects:
+            projects_by_name[project["name"]] = project
+    return projects_by_name
+
+
+async def search_all_resources_in_scope(
+    scope: str,
+    asset_types: list[str],
+    asset_name: str | None = None,
+    **kwargs: Any,
+) -> ASYNC_GENERATOR_RESYNC_TYPE:
+    """
+    Search for resources of several asset types at once across an organization or folder scope
+    (e.g. ``organizations/123`` or ``folders/456``), instead of once per project and asset type.
+
+    Each page is partitioned by project locally and the project's metadata is attached from a
+    single ``search_projects`` pass. Resources of projects that are not accessible to the service
+    account are skipped, same as when searching project by project.
+    """
+
+    def parse_asset_response(response: Any) -> list[dict[Any, Any]]:
+        return parse_protobuf_messages(response.results)
+
+    projects_by_name = await get_projects_by_name()
+    logger.info(
+        f"Searching all {asset_types} in {scope} across {len(projects_by_name)} projects"
+    )
+
+    search_all_resources_request: dict[str, Any] = {
+        "scope": scope,
+        "asset_types": asset_types,
+        "read_mask": "*",
+    }
+    if asset_name:
+        search_all_resources_request["query"] = f"name={asset_name}"
+
+    async with AssetServiceAsyncClient() as async_assets_client:
+        try:
+            async for assets in paginated_query(
+                async_assets_client,
+                "search_all_resources",
+                search_all_resources_request,
+                parse_asset_response,
+                kwargs.get("rate_limiter"),
+            ):
+                resources_by_project: defaultdict[str, list[dict[Any, Any]]] = (
+                    defaultdict(list)
+                )
+                skipped_assets = 0
+                for asset in assets:
+                    project = projects_by_name.get(asset.get("project", ""))
+                    if project is None:
+                        skipped_assets += 1
+                        continue
+                    resources_by_project[project["name"]].append(
+                        {
+                            **parse_latest_resource_from_asset(
+                                typing.cast(AssetData, asset)
+                            ),
+                            EXTRA_PROJECT_FIELD: project,
+                        }
+                    )
+
+                if skipped_assets:
+                    logger.debug(
+                        f"Skipped {skipped_assets} assets in {scope} that don't belong to an accessible project"
+                    )
+                for resources in resources_by_project.values():
+                    yield resources
+
+        except PermissionDenied as e:
+            logger.error(
+                f"Service account doesn't have permissions to search all resources within {scope} for kinds {asset_types}. Error: {str(e.message)}"
+            )
+        except NotFound as e:
+            logger.info(
+                f"Couldn't perform search_all_resources on {scope} since it doesn't exist. Error: {str(e)}"
+            )
+        else:
+            logger.info(f"Successfully searched all resources within {scope}")
+
+
 async def list_all_topics_per_project(
     project: dict[str, Any], **kwargs: Any
 ) -> ASYNC_GENERATOR_RESYNC_TYPE:
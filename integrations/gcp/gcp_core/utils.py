@@ -144,6 +144,14 @@ def get_current_resource_config() -> (
     )
 
 
+def get_search_all_resources_scope() -> Optional[str]:
+    """
+    Returns the organization or folder (e.g. ``organizations/123``) to search resources in at once,
+    or None to search project by project
+    """
+    return ocean.integration_config.get("search_all_resources_scope") or None
+
+
 def get_credentials_json() -> str:
     credentials_json = ""
     if ocean.integration_config.get("encoded_adc_configuration"):
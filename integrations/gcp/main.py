@@ -32,11 +32,13 @@ from gcp_core.search.resource_searches import (
     search_all_organizations,
     search_all_projects,
     search_all_resources,
+    search_all_resources_in_scope,
 )
 from gcp_core.utils import (
     AssetTypesWithSpecialHandling,
     get_current_resource_config,
     get_credentials_json,
+    get_search_all_resources_scope,
     resolve_request_controllers,
     get_initial_quota_for_project_via_rest,
 )
@@ -71,15 +73,34 @@ async def _resolve_resync_method_for_resource(
         case AssetTypesWithSpecialHandling.PROJECT:
             return search_all_projects()
         case _:
-            asset_rate_limiter, asset_semaphore = await resolve_request_controllers(
-                kind
-            )
-            return iterate_per_available_project(
-                search_all_resources,
-                asset_type=kind,
-                rate_limiter=asset_rate_limiter,
-                semaphore=asset_semaphore,
-            )
+            return _search_asset_resources([kind])
+
+
+async def _search_asset_resources(
+    asset_types: list[str],
+) -> ASYNC_GENERATOR_RESYNC_TYPE:
+    """
+    Searches the asset inventory for the given asset types. When an organization or folder scope is
+    configured, every asset type is searched in a single scoped query instead of once per project and type.
+    """
+    asset_rate_limiter, asset_semaphore = await resolve_request_controllers(
+        asset_types[0]
+    )
+    if scope := get_search_all_resources_scope():
+        async for batch in search_all_resources_in_scope(
+            scope, asset_types, rate_limiter=asset_rate_limiter
+        ):
+            yield batch
+        return
+
+    for asset_type in asset_types:
+        async for batch in iterate_per_available_project(
+            search_all_resources,
+            asset_type=asset_type,
+            rate_limiter=asset_rate_limiter,
+            semaphore=asset_semaphore,
+        ):
+            yield batch
 
 
 @ocean.on_start()
@@ -162,13 +183,7 @@ async def resync_resources(kind: str) -> ASYNC_GENERATOR_RESYNC_TYPE:
     if kind in iter(AssetTypesWithSpecialHandling):
         logger.debug("Kind already has a specific handling, skipping")
         return
-    asset_rate_limiter, asset_semaphore = await resolve_request_controllers(kind)
-    async for batch in iterate_per_available_project(
-        search_all_resources,
-        asset_type=kind,
-        rate_limiter=asset_rate_limiter,
-        semaphore=asset_semaphore,
-    ):
+    async for batch in _search_asset_resources([kind]):
         yield batch
 
 
@@ -177,6 +192,23 @@ async def resync_cloud_resources(kind: str) -> ASYNC_GENERATOR_RESYNC_TYPE:
     resource_kinds = typing.cast(
         GCPCloudResourceSelector, get_current_resource_config().selector
     ).resource_kinds
+    if get_search_all_resources_scope():
+        asset_kinds = [
+            resource_kind
+            for resource_kind in resource_kinds
+            if resource_kind not in set(AssetTypesWithSpecialHandling)
+        ]
+        if asset_kinds:
+            logger.info(
+                f"Searching Cloud Resource kinds {asset_kinds} in a single scoped query"
+            )
+            async for resources_batch in _search_asset_resources(asset_kinds):
+                yield resources_batch
+        resource_kinds = [
+            resource_kind
+            for resource_kind in resource_kinds
+            if resource_kind not in asset_kinds
+        ]
     for resource_kind in resource_kinds:
         logger.info(
             f"Found Cloud Resource kind {resource_kind}, finding relevant resources.."
@@ -290,3 +290,76 @@ async def test_preserve_case_style_combined(
 
     # Assert for preserve_case_style = False
     assert actual_subscription_false == expected_subscription_false
+
+
+@pytest.mark.asyncio
+async def test_search_all_resources_in_scope_partitions_by_project(
+    monkeypatch: Any,
+) -> None:
+    # Arrange
+    from gcp_core.search import resource_searches
+
+    projects = [
+        {"name": "projects/1", "project_id": "first"},
+        {"name": "projects/2", "project_id": "second"},
+    ]
+
+    async def mock_search_all_projects() -> ASYNC_GENERATOR_RESYNC_TYPE:
+        yield projects
+
+    def asset(name: str, project: str) -> dict[str, Any]:
+        return {
+            "name": name,
+            "project": project,
+            "versioned_resources": [
+                {"version": 1, "resource": {"name": f"{name}-old"}},
+                {"version": 2, "resource": {"name": name}},
+            ],
+        }
+
+    requests = []
+
+    async def mock_paginated_query(
+        client: Any, method: str, request: dict[str, Any], *args: Any
+    ) -> ASYNC_GENERATOR_RESYNC_TYPE:
+        requests.append(request)
+        yield [
+            asset("bucket-1", "projects/1"),
+            asset("topic-2", "projects/2"),
+            asset("bucket-3", "projects/1"),
+            asset("orphan", "projects/3"),
+        ]
+
+    monkeypatch.setattr(
+        resource_searches, "search_all_projects", mock_search_all_projects
+    )
+    monkeypatch.setattr(resource_searches, "paginated_query", mock_paginated_query)
+    monkeypatch.setattr(resource_searches, "AssetServiceAsyncClient", MagicMock())
+
+    # Act
+    batches = [
+        batch
+        async for batch in resource_searches.search_all_resources_in_scope(
+            "organizations/123",
+            ["storage.googleapis.com/Bucket", "pubsub.googleapis.com/Topic"],
+        )
+    ]
+
+    # Assert
+    assert requests == [
+        {
+            "scope": "organizations/123",
+            "asset_types": [
+                "storage.googleapis.com/Bucket",
+                "pubsub.googleapis.com/Topic",
+            ],
+            "read_mask": "*",
+        }
+    ]
+    assert batches == [
+        [
+            {"name": "bucket-1", "__project": projects[0]},
+            {"name": "bucket-3", "__project": projects[0]},
+        ],
+        [{"name": "topic-2", "__project": projects[1]}],
+    ]
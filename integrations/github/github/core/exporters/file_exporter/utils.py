@@ -10,6 +10,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     TypedDict,
     TYPE_CHECKING,
@@ -248,6 +249,43 @@ def build_batch_file_query(
     return {"query": query}
 
 
+def build_batch_file_reference_query(
+    references: Sequence[Tuple[str, str, str, str]],
+) -> Dict[str, Any]:
+    """
+    Build a GraphQL query to fetch files from several repositories at once.
+
+    Each reference is an (owner, repo_name, branch, file_path) tuple. Files are
+    aliased as `file_<index>` using their position in `references`, nested under a
+    `repo_<index>` alias per distinct repository.
+    """
+    repositories: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+    for file_index, (owner, repo_name, branch, path) in enumerate(references):
+        expression = json.dumps(f"{branch}:{path}")
+        repositories[(owner, repo_name)].append(
+            f"""
+            file_{file_index}: object(expression: {expression}) {{
+                ... on Blob {{
+                    text
+                    byteSize
+                    isTruncated
+                }}
+            }}
+            """
+        )
+
+    repository_queries = "\n".join(
+        f"""
+        repo_{repo_index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo_name)}) {{
+            {"".join(objects)}
+        }}
+        """
+        for repo_index, ((owner, repo_name), objects) in enumerate(repositories.items())
+    )
+
+    return {"query": f"query {{ {repository_queries} }}"}
+
+
 def get_matching_files(
     files_to_process: List[Dict[str, Any]], matching_patterns: List["GithubFilePattern"]
 ) -> List[Dict[str, Any]]:
@@ -1,6 +1,7 @@
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 from github.helpers.utils import (
+    ObjectKind,
     enrich_with_organization,
     enrich_with_repository,
     parse_github_options,
@@ -8,6 +9,12 @@ from github.helpers.utils import (
 from port_ocean.core.ocean_types import ASYNC_GENERATOR_RESYNC_TYPE, RAW_ITEM
 from loguru import logger
 from github.core.options import SinglePullRequestOptions, ListPullRequestOptions
+from github.helpers.incremental_sync import (
+    DEFAULT_FULL_SYNC_INTERVAL_HOURS,
+    INCREMENTAL_BATCH_SIZE,
+    IncrementalSyncStore,
+    RepositorySyncSnapshot,
+)
 from github.core.exporters.abstract_exporter import AbstractGithubExporter
 from github.clients.http.rest_client import GithubRestClient
 
@@ -47,18 +54,147 @@ class RestPullRequestExporter(AbstractGithubExporter[GithubRestClient]):
             f"Starting pull request export for repository {repo_name} from {organization}"
         )
 
+        if extras.get("incremental"):
+            async for batch in self._fetch_pull_requests_incrementally(
+                organization,
+                cast(str, repo_name),
+                states,
+                max_results,
+                since,
+                extras.get(
+                    "full_sync_interval_hours", DEFAULT_FULL_SYNC_INTERVAL_HOURS
+                ),
+            ):
+                yield batch
+            return
+
+        async for batch in self._fetch_pull_requests(
+            organization, cast(str, repo_name), states, max_results, since
+        ):
+            yield batch
+
+    async def _fetch_pull_requests(
+        self,
+        organization: str,
+        repo_name: str,
+        states: list[str],
+        max_results: int,
+        since: int,
+    ) -> ASYNC_GENERATOR_RESYNC_TYPE:
         if "open" in states:
             async for open_batch in self._fetch_open_pull_requests(
-                organization, cast(str, repo_name), {"state": "open"}
+                organization, repo_name, {"state": "open"}
             ):
                 yield open_batch
 
         if "closed" in states:
             async for closed_batch in self._fetch_closed_pull_requests(
-                organization, cast(str, repo_name), max_results, since
+                organization, repo_name, max_results, since
             ):
                 yield closed_batch
 
+    async def _fetch_pull_requests_incrementally(
+        self,
+        organization: str,
+        repo_name: str,
+        states: list[str],
+        max_results: int,
+        since: int,
+        full_sync_interval_hours: int,
+    ) -> ASYNC_GENERATOR_RESYNC_TYPE:
+        """
+        Export the pull requests of a repository using the previous resync as a base.
+
+        Only pull requests updated after the stored high-water mark are requested;
+        the rest are replayed from the stored snapshot so reconciliation still sees
+        the complete set. Every `full_sync_interval_hours` the repository is listed
+        in full again, which is what catches deleted or transferred pull requests.
+        """
+        store = IncrementalSyncStore(ObjectKind.PULL_REQUEST)
+        scope = {"states": sorted(states), "max_results": max_results, "since": since}
+        snapshot = await store.load(organization, repo_name, scope)
+
+        if (
+            snapshot is None
+            or snapshot.high_water_mark is None
+            or snapshot.is_full_sync_due(full_sync_interval_hours)
+        ):
+            logger.info(
+                f"Running a full pull request sync of repository {repo_name} from {organization}"
+            )
+            exported: list[dict[str, Any]] = []
+            async for batch in self._fetch_pull_requests(
+                organization, repo_name, states, max_results, since
+            ):
+                exported.extend(batch)
+                yield batch
+            await store.save(
+                organization,
+                repo_name,
+                scope,
+                RepositorySyncSnapshot.from_full_sync(exported),
+            )
+            return
+
+        changed = await self._fetch_pull_requests_updated_after(
+            organization, repo_name, snapshot.high_water_mark
+        )
+        logger.info(
+            f"Fetched {len(changed)} pull requests updated since {snapshot.high_water_mark} "
+            f"from repository {repo_name} from {organization}"
+        )
+        snapshot.update(changed)
+        selected = self._select_pull_requests(
+            list(snapshot.items.values()), states, max_results, since
+        )
+        snapshot.retain(selected)
+        await store.save(organization, repo_name, scope, snapshot)
+
+        for start in range(0, len(selected), INCREMENTAL_BATCH_SIZE):
+            yield selected[start : start + INCREMENTAL_BATCH_SIZE]
+
+    async def _fetch_pull_requests_updated_after(
+        self, organization: str, repo_name: str, high_water_mark: str
+    ) -> list[dict[str, Any]]:
+        endpoint = self._build_pull_request_paginated_endpoint(organization, repo_name)
+        params = {"state": "all", "sort": "updated", "direction": "desc"}
+
+        changed: list[dict[str, Any]] = []
+        async for pull_requests in self.client.send_paginated_request(endpoint, params):
+            recent = [pr for pr in pull_requests if pr["updated_at"] >= high_water_mark]
+            changed.extend(
+                enrich_with_organization(
+                    enrich_with_repository(pr, repo_name), organization
+                )
+                for pr in recent
+            )
+            # Results are sorted by last update, so older pages are unchanged
+            if len(recent) < len(pull_requests):
+                break
+        return changed
+
+    def _select_pull_requests(
+        self,
+        pull_requests: list[dict[str, Any]],
+        states: list[str],
+        max_results: int,
+        since: int,
+    ) -> list[dict[str, Any]]:
+        """Apply the selector to a merged set, as the full listing would."""
+        open_prs = [pr for pr in pull_requests if pr["state"] == "open"]
+        closed_prs = sorted(
+            (pr for pr in pull_requests if pr["state"] == "closed"),
+            key=lambda pr: pr["updated_at"],
+            reverse=True,
+        )
+
+        selected = open_prs if "open" in states else []
+        if "closed" in states:
+            selected = selected + self._filter_prs_by_updated_at(
+                closed_prs[:max_results], since
+            )
+        return selected
+
     def _build_pull_request_paginated_endpoint(
         self, organization: str, repo_name: str
     ) -> str:
@@ -45,6 +45,8 @@ class ListPullRequestOptions(RepositoryIdentifier):
     states: Required[list[str]]
     max_results: Required[int]
     since: Required[int]
+    incremental: NotRequired[bool]
+    full_sync_interval_hours: NotRequired[int]
 
 
 class SingleIssueOptions(RepositoryIdentifier):
@@ -57,6 +59,8 @@ class ListIssueOptions(RepositoryIdentifier):
     """Options for listing issues."""
 
     state: Required[str]
+    incremental: NotRequired[bool]
+    full_sync_interval_hours: NotRequired[int]
 
 
 class SingleUserOptions(SingleOrganizationOptions):
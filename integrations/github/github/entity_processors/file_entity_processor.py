@@ -1,18 +1,97 @@
+import asyncio
+import hashlib
 import os
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
 from loguru import logger
+from port_ocean.cache.errors import FailedToReadCacheError, FailedToWriteCacheError
+from port_ocean.context.event import EventType, event
+from port_ocean.context.ocean import ocean
 from port_ocean.core.handlers import JQEntityProcessor
+from port_ocean.core.handlers.port_app_config.models import ResourceConfig
+from port_ocean.core.ocean_types import RAW_ITEM
+from port_ocean.exceptions.context import EventContextNotFoundError
 from github.clients.client_factory import create_github_client
 from github.core.options import FileContentOptions
 from github.core.exporters.file_exporter.core import RestFileExporter
+from github.core.exporters.file_exporter.utils import (
+    MAX_FILE_SIZE,
+    build_batch_file_reference_query,
+    extract_file_index,
+)
+from github.helpers.utils import GithubClientType
 
 
 FILE_PROPERTY_PREFIX = "file://"
+# file:// properties usually point at small manifests (README, catalog files),
+# so a GraphQL request can carry far more of them than a file kind batch.
+FILE_REFERENCE_BATCH_SIZE = 25
+FILE_REFERENCE_CACHE_KEY_PREFIX = "github_file_reference"
+
+
+class FileReference(NamedTuple):
+    organization: str
+    repo_name: str
+    file_path: str
+    branch: Optional[str]
+
+
+def get_file_reference_cache_key(reference: FileReference) -> str:
+    digest = hashlib.sha256(repr(tuple(reference)).encode()).hexdigest()[:16]
+    return f"{FILE_REFERENCE_CACHE_KEY_PREFIX}_{digest}"
+
+
+def is_resync_event() -> bool:
+    """
+    File references are keyed by branch, so they are only cached within a resync.
+    Live events must read the content the branch points at now.
+    """
+    try:
+        return event.event_type == EventType.RESYNC
+    except EventContextNotFoundError:
+        return False
+
+
+def collect_file_patterns(mappings: Any) -> Set[str]:
+    """Collect every file:// pattern used anywhere in an entity mapping."""
+    if isinstance(mappings, str):
+        return {mappings} if mappings.startswith(FILE_PROPERTY_PREFIX) else set()
+    if isinstance(mappings, dict):
+        values: Iterable[Any] = mappings.values()
+    elif isinstance(mappings, list):
+        values = mappings
+    else:
+        return set()
+
+    patterns: Set[str] = set()
+    for value in values:
+        patterns |= collect_file_patterns(value)
+    return patterns
 
 
 class FileEntityProcessor(JQEntityProcessor):
     prefix = FILE_PROPERTY_PREFIX
 
+    async def _get_cached_file_content(
+        self, reference: FileReference
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return await ocean.app.cache_provider.get(
+                get_file_reference_cache_key(reference)
+            )
+        except FailedToReadCacheError as e:
+            logger.warning(f"Failed to read cached file {reference.file_path}: {e}")
+            return None
+
+    async def _cache_file_content(
+        self, reference: FileReference, content: Optional[str]
+    ) -> None:
+        try:
+            await ocean.app.cache_provider.set(
+                get_file_reference_cache_key(reference), {"content": content}
+            )
+        except FailedToWriteCacheError as e:
+            logger.warning(f"Failed to cache file {reference.file_path}: {e}")
+
     async def _get_file_content(
         self,
         organization: str,
@@ -22,6 +101,16 @@ class FileEntityProcessor(JQEntityProcessor):
     ) -> Optional[Any]:
         """Helper method to fetch and process file content."""
 
+        if is_resync_event():
+            cached = await self._get_cached_file_content(
+                FileReference(organization, repo_name, file_path, branch)
+            )
+            if cached is not None:
+                logger.debug(
+                    f"Using prefetched content of {file_path} from {repo_name}"
+                )
+                return cached["content"]
+
         rest_client = create_github_client()
         exporter = RestFileExporter(rest_client)
 
@@ -43,6 +132,26 @@ class FileEntityProcessor(JQEntityProcessor):
         )
         return decoded_content
 
+    def _resolve_file_reference(
+        self, data: dict[str, Any], pattern: str
+    ) -> FileReference:
+        repo_data = data.get("repository", data)
+        is_monorepo = "repository" in data
+
+        repo_name = repo_data["name"]
+        organization = repo_data["owner"]["login"]
+        ref = data["branch"] if is_monorepo else repo_data.get("default_branch")
+
+        base_pattern = pattern.replace(self.prefix, "")
+        file_path = (
+            os.path.join(
+                os.path.dirname(data["metadata"]["path"]), base_pattern
+            ).replace(os.sep, "/")
+            if is_monorepo
+            else base_pattern
+        )
+        return FileReference(organization, repo_name, file_path, ref)
+
     async def _search(self, data: dict[str, Any], pattern: str) -> Any:
         """
         Search for a file in the repository and return its content.
@@ -58,20 +167,8 @@ class FileEntityProcessor(JQEntityProcessor):
             Any: The raw or parsed content of the file
         """
 
-        repo_data = data.get("repository", data)
-        is_monorepo = "repository" in data
-
-        repo_name = repo_data["name"]
-        organization = repo_data["owner"]["login"]
-        ref = data["branch"] if is_monorepo else repo_data.get("default_branch")
-
-        base_pattern = pattern.replace(self.prefix, "")
-        file_path = (
-            os.path.join(
-                os.path.dirname(data["metadata"]["path"]), base_pattern
-            ).replace(os.sep, "/")
-            if is_monorepo
-            else base_pattern
+        organization, repo_name, file_path, ref = self._resolve_file_reference(
+            data, pattern
         )
 
         logger.info(
@@ -79,3 +176,100 @@ class FileEntityProcessor(JQEntityProcessor):
         )
 
         return await self._get_file_content(organization, repo_name, file_path, ref)
+
+    async def prefetch_file_references(
+        self, mapping: ResourceConfig, raw_items: List[RAW_ITEM]
+    ) -> None:
+        """
+        Resolve every file:// reference of a batch of raw items up front.
+
+        References are de-duplicated by (repository, ref, path) and fetched with
+        batched GraphQL queries. The results are stored in the resync cache, so
+        `_search` only falls back to the REST contents API for files GraphQL could
+        not return (binary or truncated blobs, failed batches).
+
+        Only done during a resync, the cache is cleared when it starts and ends.
+        """
+        if not is_resync_event():
+            return
+
+        patterns = collect_file_patterns(
+            mapping.port.entity.mappings.dict(exclude_unset=True)
+        )
+        if not patterns:
+            return
+
+        references: Set[FileReference] = set()
+        for item in raw_items:
+            for pattern in patterns:
+                try:
+                    reference = self._resolve_file_reference(item, pattern)
+                except (KeyError, TypeError, AttributeError):
+                    # Left to `_search`, which reports the malformed item as before
+                    continue
+                if reference.branch:
+                    references.add(reference)
+
+        # Sorted so that files of the same repository share GraphQL requests
+        pending = [
+            reference
+            for reference in sorted(references)
+            if await self._get_cached_file_content(reference) is None
+        ]
+        if not pending:
+            return
+
+        logger.info(
+            f"Prefetching {len(pending)} file references for kind {mapping.kind} "
+            f"in batches of {FILE_REFERENCE_BATCH_SIZE}"
+        )
+        await asyncio.gather(
+            *(
+                self._fetch_file_references_batch(
+                    pending[i : i + FILE_REFERENCE_BATCH_SIZE]
+                )
+                for i in range(0, len(pending), FILE_REFERENCE_BATCH_SIZE)
+            )
+        )
+
+    async def _fetch_file_references_batch(
+        self, references: List[FileReference]
+    ) -> None:
+        client = create_github_client(client_type=GithubClientType.GRAPHQL)
+        query_payload = build_batch_file_reference_query(
+            [
+                (ref.organization, ref.repo_name, str(ref.branch), ref.file_path)
+                for ref in references
+            ]
+        )
+        try:
+            response = await client.send_api_request(
+                client.base_url, method="POST", json_data=query_payload
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to prefetch {len(references)} file references, "
+                f"falling back to the contents API: {e}"
+            )
+            return
+
+        if not response:
+            return
+
+        for repository in response["data"].values():
+            if not repository:
+                continue
+            for field_name, blob in repository.items():
+                file_index = extract_file_index(field_name)
+                if file_index is None or file_index >= len(references):
+                    continue
+                reference = references[file_index]
+
+                if blob is None:
+                    # The path does not exist on the requested ref
+                    await self._cache_file_content(reference, None)
+                elif blob.get("byteSize", 0) > MAX_FILE_SIZE:
+                    logger.info(f"File too large, size - {blob['byteSize']} bytes")
+                    await self._cache_file_content(reference, None)
+                elif blob.get("text") is not None and not blob.get("isTruncated"):
+                    await self._cache_file_content(reference, blob["text"])
@@ -0,0 +1,105 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+from port_ocean.cache.disk import DiskCacheProvider
+from port_ocean.cache.errors import FailedToReadCacheError, FailedToWriteCacheError
+
+# Kept apart from the resync cache directory, which is cleared on every resync
+INCREMENTAL_SYNC_STATE_DIR = "/tmp/ocean/.github_incremental_sync"
+GITHUB_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+DEFAULT_FULL_SYNC_INTERVAL_HOURS = 24
+INCREMENTAL_BATCH_SIZE = 100
+
+
+def parse_github_timestamp(timestamp: str) -> datetime:
+    return datetime.strptime(timestamp, GITHUB_TIMESTAMP_FORMAT).replace(tzinfo=UTC)
+
+
+@dataclass
+class RepositorySyncSnapshot:
+    """Items exported for a repository on the previous resync.
+
+    `high_water_mark` is the latest `updated_at` seen among the items and is used as
+    the cursor of the next incremental resync. `full_synced_at` records the last time
+    the repository was listed in full, which is the only way deletions are noticed.
+    """
+
+    full_synced_at: str
+    high_water_mark: Optional[str] = None
+    items: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_full_sync(
+        cls, items: Iterable[Dict[str, Any]]
+    ) -> "RepositorySyncSnapshot":
+        snapshot = cls(
+            full_synced_at=datetime.now(UTC).strftime(GITHUB_TIMESTAMP_FORMAT)
+        )
+        snapshot.update(items)
+        return snapshot
+
+    def is_full_sync_due(self, full_sync_interval_hours: int) -> bool:
+        return datetime.now(UTC) - parse_github_timestamp(
+            self.full_synced_at
+        ) >= timedelta(hours=full_sync_interval_hours)
+
+    def update(self, items: Iterable[Dict[str, Any]]) -> None:
+        for item in items:
+            self.items[str(item["id"])] = item
+            updated_at = item["updated_at"]
+            if self.high_water_mark is None or updated_at > self.high_water_mark:
+                self.high_water_mark = updated_at
+
+    def retain(self, items: List[Dict[str, Any]]) -> None:
+        """Drop every stored item that is no longer part of the exported set."""
+        self.items = {str(item["id"]): item for item in items}
+
+
+class IncrementalSyncStore:
+    """Persists per-repository snapshots of a kind between resyncs.
+
+    Snapshots are keyed by the selector values that shape the exported set, so
+    changing the mapping's selector falls back to a full listing.
+    """
+
+    def __init__(self, kind: str, state_dir: Optional[str] = None) -> None:
+        self.kind = kind
+        self._storage = DiskCacheProvider(state_dir or INCREMENTAL_SYNC_STATE_DIR)
+
+    def _key(self, organization: str, repo_name: str, scope: Dict[str, Any]) -> str:
+        raw_key = json.dumps(
+            [self.kind, organization, repo_name, scope], sort_keys=True
+        ).encode()
+        return (
+            f"{self.kind.replace('-', '_')}_{hashlib.sha256(raw_key).hexdigest()[:24]}"
+        )
+
+    async def load(
+        self, organization: str, repo_name: str, scope: Dict[str, Any]
+    ) -> Optional[RepositorySyncSnapshot]:
+        try:
+            return await self._storage.get(self._key(organization, repo_name, scope))
+        except FailedToReadCacheError as e:
+            logger.warning(
+                f"Failed to read the {self.kind} sync state of {repo_name} from {organization}, "
+                f"falling back to a full sync: {e}"
+            )
+            return None
+
+    async def save(
+        self,
+        organization: str,
+        repo_name: str,
+        scope: Dict[str, Any],
+        snapshot: RepositorySyncSnapshot,
+    ) -> None:
+        try:
+            await self._storage.set(self._key(organization, repo_name, scope), snapshot)
+        except FailedToWriteCacheError as e:
+            logger.warning(
+                f"Failed to persist the {self.kind} sync state of {repo_name} from {organization}: {e}"
+            )
@@ -16,6 +16,7 @@ from port_ocean.core.handlers.webhook.webhook_event import (
     WebhookEvent,
 )
 from port_ocean.core.integrations.base import BaseIntegration
+from port_ocean.core.ocean_types import RAW_ITEM, CalculationResult
 from port_ocean.core.handlers.entity_processor.jq_entity_processor import (
     JQEntityProcessor,
 )
@@ -109,6 +110,16 @@ class GithubPullRequestSelector(RepoSearchSelector):
         le=90,
         description="Only fetch pull requests created within the last N days (1-90 days)",
     )
+    incremental: bool = Field(
+        default=False,
+        description="Only request pull requests updated since the previous resync and reuse the previous results for the rest",
+    )
+    full_sync_interval_hours: int = Field(
+        alias="fullSyncIntervalHours",
+        default=24,
+        ge=1,
+        description="How often an incremental sync lists all pull requests again to catch deletions",
+    )
 
 
 class GithubPullRequestConfig(ResourceConfig):
@@ -121,6 +132,16 @@ class GithubIssueSelector(RepoSearchSelector):
         default="open",
         description="Filter by issue state (open, closed, all)",
     )
+    incremental: bool = Field(
+        default=False,
+        description="Only request issues updated since the previous resync and reuse the previous results for the rest",
+    )
+    full_sync_interval_hours: int = Field(
+        alias="fullSyncIntervalHours",
+        default=24,
+        ge=1,
+        description="How often an incremental sync lists all issues again to catch deletions",
+    )
 
 
 class GithubIssueConfig(ResourceConfig):
@@ -266,6 +287,20 @@ class GitManipulationHandler(JQEntityProcessor):
             entity_processor = JQEntityProcessor
         return await entity_processor(self.context)._search(data, pattern)
 
+    async def _parse_items(
+        self,
+        mapping: ResourceConfig,
+        raw_results: list[RAW_ITEM],
+        parse_all: bool = False,
+        send_raw_data_examples_amount: int = 0,
+    ) -> CalculationResult:
+        await FileEntityProcessor(self.context).prefetch_file_references(
+            mapping, raw_results
+        )
+        return await super()._parse_items(
+            mapping, raw_results, parse_all, send_raw_data_examples_amount
+        )
+
 
 class GithubHandlerMixin(HandlerMixin):
     EntityProcessorClass = GitManipulationHandler
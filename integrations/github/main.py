@@ -376,6 +376,8 @@ async def resync_pull_requests(kind: str) -> ASYNC_GENERATOR_RESYNC_TYPE:
                                 states=list(config.selector.states),
                                 max_results=config.selector.max_results,
                                 since=config.selector.since,
+                                incremental=config.selector.incremental,
+                                full_sync_interval_hours=config.selector.full_sync_interval_hours,
                             )
                         )
                     )
@@ -420,6 +422,8 @@ async def resync_issues(kind: str) -> ASYNC_GENERATOR_RESYNC_TYPE:
                                 organization=org_name,
                                 repo_name=repo["name"],
                                 state=config.selector.state,
+                                incremental=config.selector.incremental,
+                                full_sync_interval_hours=config.selector.full_sync_interval_hours,
                             )
                         )
                     )
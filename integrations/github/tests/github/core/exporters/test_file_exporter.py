@@ -11,6 +11,7 @@ from github.core.exporters.file_exporter.utils import (
     determine_api_client_type_by_file_size,
     get_graphql_file_metadata,
     build_batch_file_query,
+    build_batch_file_reference_query,
     match_file_path_against_glob_pattern,
     MAX_FILE_SIZE,
     GRAPHQL_MAX_FILE_SIZE,
@@ -766,6 +767,22 @@ class TestFileExporterUtils:
         assert 'file_0: object(expression: "main:test1.txt")' in query["query"]
         assert 'file_1: object(expression: "main:test2.txt")' in query["query"]
 
+    def test_build_batch_file_reference_query(self) -> None:
+        query = build_batch_file_reference_query(
+            [
+                ("test-org", "repo1", "main", "README.md"),
+                ("test-org", "repo1", "main", "port.yml"),
+                ("test-org", "repo2", "dev", "README.md"),
+            ]
+        )
+
+        assert 'repo_0: repository(owner: "test-org", name: "repo1")' in query["query"]
+        assert 'repo_1: repository(owner: "test-org", name: "repo2")' in query["query"]
+        assert 'file_0: object(expression: "main:README.md")' in query["query"]
+        assert 'file_1: object(expression: "main:port.yml")' in query["query"]
+        assert 'file_2: object(expression: "dev:README.md")' in query["query"]
+        assert query["query"].count("repository(") == 2
+
     def test_build_batch_file_query_empty_list(self) -> None:
         query = build_batch_file_query(
             "repo1",
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any, AsyncGenerator
 import pytest
 from unittest.mock import patch, AsyncMock
@@ -119,3 +120,64 @@ class TestIssueExporter:
                 f"{rest_client.base_url}/repos/test-org/repo1/issues",
                 {"state": "closed"},
             )
+
+    async def test_get_paginated_resources_incremental(
+        self,
+        rest_client: GithubRestClient,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(
+            "github.helpers.incremental_sync.INCREMENTAL_SYNC_STATE_DIR", str(tmp_path)
+        )
+        exporter = RestIssueExporter(rest_client)
+        options = ListIssueOptions(
+            organization="test-org",
+            repo_name="repo1",
+            state="open",
+            incremental=True,
+            full_sync_interval_hours=24,
+        )
+        issues = [
+            {**issue, "updated_at": "2025-08-15T15:08:15Z"} for issue in TEST_ISSUES
+        ]
+
+        async def full_listing(
+            *args: Any, **kwargs: Any
+        ) -> AsyncGenerator[list[dict[str, Any]], None]:
+            yield [dict(issue) for issue in issues]
+
+        async def updated_listing(
+            *args: Any, **kwargs: Any
+        ) -> AsyncGenerator[list[dict[str, Any]], None]:
+            yield [
+                {**issues[0], "state": "closed", "updated_at": "2025-08-16T00:00:00Z"}
+            ]
+
+        with patch.object(
+            rest_client, "send_paginated_request", side_effect=full_listing
+        ) as mock_paginated:
+            first = [
+                issue
+                async for batch in exporter.get_paginated_resources(options)
+                for issue in batch
+            ]
+            mock_paginated.assert_called_once_with(
+                f"{rest_client.base_url}/repos/test-org/repo1/issues",
+                {"state": "open"},
+            )
+        assert [issue["id"] for issue in first] == [1, 2]
+
+        with patch.object(
+            rest_client, "send_paginated_request", side_effect=updated_listing
+        ) as mock_paginated:
+            second = [
+                issue
+                async for batch in exporter.get_paginated_resources(options)
+                for issue in batch
+            ]
+            mock_paginated.assert_called_once_with(
+                f"{rest_client.base_url}/repos/test-org/repo1/issues",
+                {"state": "all", "since": "2025-08-15T15:08:15Z"},
+            )
+        assert [issue["id"] for issue in second] == [2]
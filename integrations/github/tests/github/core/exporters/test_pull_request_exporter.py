@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any, AsyncGenerator, Generator
 import pytest
 from unittest.mock import patch, AsyncMock
@@ -319,3 +320,124 @@ class TestPullRequestExporter:
         assert flat_results[0]["id"] == 1  # First recent PR
         assert flat_results[1]["id"] == 3  # Second recent PR
         assert flat_results[2]["id"] == 4  # Third recent PR
+
+    async def test_incremental_sync_requests_only_updated_pull_requests(
+        self,
+        rest_client: GithubRestClient,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(
+            "github.helpers.incremental_sync.INCREMENTAL_SYNC_STATE_DIR", str(tmp_path)
+        )
+        exporter = RestPullRequestExporter(rest_client)
+        options = ListPullRequestOptions(
+            organization="test-org",
+            states=["open"],
+            repo_name="repo1",
+            max_results=10,
+            since=60,
+            incremental=True,
+            full_sync_interval_hours=24,
+        )
+        closed_pr = {
+            **TEST_PULL_REQUESTS[0],
+            "state": "closed",
+            "updated_at": "2025-08-16T10:00:00Z",
+        }
+        new_pr = {
+            **TEST_PULL_REQUESTS[1],
+            "id": 3,
+            "number": 103,
+            "updated_at": "2025-08-16T09:00:00Z",
+        }
+
+        async def full_listing(
+            *args: Any, **kwargs: Any
+        ) -> AsyncGenerator[list[dict[str, Any]], None]:
+            yield [dict(pr) for pr in TEST_PULL_REQUESTS]
+
+        async def updated_listing(
+            *args: Any, **kwargs: Any
+        ) -> AsyncGenerator[list[dict[str, Any]], None]:
+            yield [
+                dict(closed_pr),
+                dict(new_pr),
+                {**TEST_PULL_REQUESTS[1], "updated_at": "2025-08-01T00:00:00Z"},
+            ]
+            pytest.fail("Pages older than the high-water mark must not be fetched")
+
+        with patch.object(
+            rest_client, "send_paginated_request", side_effect=full_listing
+        ):
+            async with event_context("test_event"):
+                first = [
+                    pr
+                    async for batch in exporter.get_paginated_resources(options)
+                    for pr in batch
+                ]
+        assert [pr["id"] for pr in first] == [1, 2]
+
+        with patch.object(
+            rest_client, "send_paginated_request", side_effect=updated_listing
+        ) as mock_paginated:
+            async with event_context("test_event"):
+                second = [
+                    pr
+                    async for batch in exporter.get_paginated_resources(options)
+                    for pr in batch
+                ]
+
+        mock_paginated.assert_called_once_with(
+            f"{rest_client.base_url}/repos/test-org/repo1/pulls",
+            {"state": "all", "sort": "updated", "direction": "desc"},
+        )
+        # The closed PR leaves the open set, the new one joins it
+        assert sorted(pr["id"] for pr in second) == [2, 3]
+        assert all(pr["__organization"] == "test-org" for pr in second)
+
+    async def test_incremental_sync_runs_full_sync_when_due(
+        self,
+        rest_client: GithubRestClient,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(
+            "github.helpers.incremental_sync.INCREMENTAL_SYNC_STATE_DIR", str(tmp_path)
+        )
+        exporter = RestPullRequestExporter(rest_client)
+        options = ListPullRequestOptions(
+            organization="test-org",
+            states=["open"],
+            repo_name="repo1",
+            max_results=10,
+            since=60,
+            incremental=True,
+            full_sync_interval_hours=1,
+        )
+
+        async def full_listing(
+            *args: Any, **kwargs: Any
+        ) -> AsyncGenerator[list[dict[str, Any]], None]:
+            yield [dict(pr) for pr in TEST_PULL_REQUESTS]
+
+        with patch.object(
+            rest_client, "send_paginated_request", side_effect=full_listing
+        ) as mock_paginated:
+            async with event_context("test_event"):
+                async for _ in exporter.get_paginated_resources(options):
+                    pass
+                with patch(
+                    "github.helpers.incremental_sync.datetime"
+                ) as mock_incremental_datetime:
+                    mock_incremental_datetime.now.return_value = datetime.now(
+                        UTC
+                    ) + timedelta(hours=2)
+                    mock_incremental_datetime.strptime = datetime.strptime
+                    async for _ in exporter.get_paginated_resources(options):
+                        pass
+
+        assert [call.args[1] for call in mock_paginated.call_args_list] == [
+            {"state": "open"},
+            {"state": "open"},
+        ]
@@ -1,6 +1,22 @@
+from typing import Any
+
 import pytest
 from unittest.mock import patch, AsyncMock
-from github.entity_processors.file_entity_processor import FileEntityProcessor
+from port_ocean.context.event import EventType, event_context
+from port_ocean.context.ocean import ocean
+from port_ocean.core.handlers.port_app_config.models import (
+    EntityMapping,
+    MappingsConfig,
+    PortResourceConfig,
+    ResourceConfig,
+    Selector,
+)
+from github.core.exporters.file_exporter.utils import build_batch_file_reference_query
+from github.entity_processors.file_entity_processor import (
+    FileEntityProcessor,
+    FileReference,
+    get_file_reference_cache_key,
+)
 
 MOCK_PORT_OCEAN_CONTEXT = AsyncMock()
 
@@ -348,3 +364,172 @@ async def test_file_entity_processor_get_file_content_error() -> None:
     ):
         with pytest.raises(Exception, match="API error"):
             await processor._get_file_content("test-repo", "config.json", "main")
+
+
+def _file_reference_resource_config(properties: dict[str, str]) -> ResourceConfig:
+    return ResourceConfig(
+        kind="repository",
+        selector=Selector(query="true"),
+        port=PortResourceConfig(
+            entity=MappingsConfig(
+                mappings=EntityMapping(
+                    identifier=".name",
+                    title=".name",
+                    blueprint='"service"',
+                    properties=properties,
+                )
+            )
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_file_entity_processor_prefetch_deduplicates_and_caches() -> None:
+    raw_items = [
+        {"name": "repo-a", "default_branch": "main", "owner": {"login": "org"}},
+        {"name": "repo-a", "default_branch": "main", "owner": {"login": "org"}},
+        {"name": "repo-b", "default_branch": "dev", "owner": {"login": "org"}},
+    ]
+    mapping = _file_reference_resource_config(
+        {"readme": "file://README.md", "url": ".html_url"}
+    )
+
+    graphql_client = AsyncMock()
+    graphql_client.base_url = "https://api.github.com/graphql"
+    graphql_client.send_api_request.return_value = {
+        "data": {
+            "repo_0": {"file_0": {"text": "# A", "byteSize": 3, "isTruncated": False}},
+            "repo_1": {"file_1": None},
+        }
+    }
+    cache: dict[str, Any] = {}
+
+    async def cache_get(key: str) -> Any:
+        return cache.get(key)
+
+    async def cache_set(key: str, value: Any) -> None:
+        cache[key] = value
+
+    async with event_context(EventType.RESYNC):
+        with (
+            patch(
+                "github.entity_processors.file_entity_processor.create_github_client",
+                return_value=graphql_client,
+            ),
+            patch(
+                "github.entity_processors.file_entity_processor.build_batch_file_reference_query",
+                wraps=build_batch_file_reference_query,
+            ) as query_builder,
+            patch.object(ocean.app.cache_provider, "get", side_effect=cache_get),
+            patch.object(ocean.app.cache_provider, "set", side_effect=cache_set),
+        ):
+            processor = FileEntityProcessor(context=MOCK_PORT_OCEAN_CONTEXT)
+            await processor.prefetch_file_references(mapping, raw_items)
+
+            graphql_client.send_api_request.assert_called_once()
+            query_builder.assert_called_once_with(
+                [
+                    ("org", "repo-a", "main", "README.md"),
+                    ("org", "repo-b", "dev", "README.md"),
+                ]
+            )
+            assert cache[
+                get_file_reference_cache_key(
+                    FileReference("org", "repo-a", "README.md", "main")
+                )
+            ] == {"content": "# A"}
+            assert cache[
+                get_file_reference_cache_key(
+                    FileReference("org", "repo-b", "README.md", "dev")
+                )
+            ] == {"content": None}
+
+            # Lookups during the transform are served from the resync cache
+            assert await processor._search(raw_items[0], "file://README.md") == "# A"
+            assert await processor._search(raw_items[2], "file://README.md") is None
+            graphql_client.send_api_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_file_entity_processor_prefetch_falls_back_to_rest_for_truncated() -> (
+    None
+):
+    raw_items = [
+        {"name": "repo-a", "default_branch": "main", "owner": {"login": "org"}},
+    ]
+    mapping = _file_reference_resource_config({"readme": "file://README.md"})
+
+    graphql_client = AsyncMock()
+    graphql_client.send_api_request.return_value = {
+        "data": {
+            "repo_0": {
+                "file_0": {"text": "partial", "byteSize": 900, "isTruncated": True}
+            }
+        }
+    }
+    mock_exporter = AsyncMock()
+    mock_exporter.get_resource.return_value = {"content": "full", "size": 900}
+
+    async with event_context(EventType.RESYNC):
+        with (
+            patch(
+                "github.entity_processors.file_entity_processor.create_github_client",
+                return_value=graphql_client,
+            ),
+            patch(
+                "github.entity_processors.file_entity_processor.RestFileExporter",
+                return_value=mock_exporter,
+            ),
+            patch.object(ocean.app.cache_provider, "set") as cache_set,
+        ):
+            processor = FileEntityProcessor(context=MOCK_PORT_OCEAN_CONTEXT)
+            await processor.prefetch_file_references(mapping, raw_items)
+            cache_set.assert_not_called()
+
+            result = await processor._search(raw_items[0], "file://README.md")
+            assert result == "full"
+            mock_exporter.get_resource.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_file_entity_processor_prefetch_skips_mappings_without_files() -> None:
+    mapping = _file_reference_resource_config({"url": ".html_url"})
+
+    with patch(
+        "github.entity_processors.file_entity_processor.create_github_client"
+    ) as client_factory:
+        processor = FileEntityProcessor(context=MOCK_PORT_OCEAN_CONTEXT)
+        await processor.prefetch_file_references(
+            mapping,
+            [{"name": "repo", "default_branch": "main", "owner": {"login": "org"}}],
+        )
+        client_factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_file_entity_processor_live_events_do_not_use_the_resync_cache() -> None:
+    raw_item = {"name": "repo-a", "default_branch": "main", "owner": {"login": "org"}}
+    mapping = _file_reference_resource_config({"readme": "file://README.md"})
+    mock_exporter = AsyncMock()
+    mock_exporter.get_resource.return_value = {"content": "# New", "size": 5}
+
+    with (
+        patch(
+            "github.entity_processors.file_entity_processor.create_github_client"
+        ) as client_factory,
+        patch(
+            "github.entity_processors.file_entity_processor.RestFileExporter",
+            return_value=mock_exporter,
+        ),
+        patch.object(
+            ocean.app.cache_provider, "get", return_value={"content": "# Old"}
+        ) as cache_get,
+    ):
+        async with event_context("push"):
+            processor = FileEntityProcessor(context=MOCK_PORT_OCEAN_CONTEXT)
+            await processor.prefetch_file_references(mapping, [raw_item])
+            result = await processor._search(raw_item, "file://README.md")
+
+        client_factory.assert_called_once_with()
+        cache_get.assert_not_called()
+        assert result == "# New"
@@ -42,7 +42,40 @@ class HTTPBaseClient:
         params: Optional[dict[str, Any]] = None,
         data: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        url = f"{self.base_url}/{path}"
+        response = await self._send_request(method, path, params, data)
+        if response is None:
+            return {}
+        return response.json()
+
+    async def send_paginated_api_request(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> tuple[list[dict[str, Any]], httpx.Headers]:
+        """Fetch a single page of a list endpoint along with its pagination headers.
+
+        `path` may also be an absolute URL, as returned in keyset `Link` headers.
+        """
+        response = await self._send_request("GET", path, params)
+        if response is None:
+            # Inaccessible resources have no pages
+            return [], httpx.Headers()
+
+        body = response.json()
+        return (body if isinstance(body, list) else []), response.headers
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response | None:
+        """Send a request, retrying it once with a refreshed token on 401.
+
+        Returns None for resources the token can't access (403/404).
+        """
+        url = path if httpx.URL(path).is_absolute_url else f"{self.base_url}/{path}"
         logger.debug(f"Sending {method} request to {url}")
 
         try:
@@ -54,19 +87,40 @@ class HTTPBaseClient:
                 json=data,
             )
             response.raise_for_status()
-            return response.json()
+            return response
 
         except httpx.HTTPStatusError as e:
-            result = await self._handle_status_code_error(
+            return await self._handle_status_code_error(
                 method, path, url, params, data, e
             )
-            if result is not None:
-                return result
-            raise
         except httpx.HTTPError as e:
             logger.error(f"HTTP error for {method} request to {path}: {e}")
             raise
 
+    async def _retry_with_refreshed_token(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+    ) -> httpx.Response | None:
+        """Refresh the token and retry the request, returns None if either fails."""
+        if not await self._refresh_token():
+            return None
+        try:
+            response = await self._client.request(
+                method=method,
+                url=url,
+                headers=self._headers,
+                params=params,
+                json=data,
+            )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError:
+            # If retry also fails, fall through to original error handling
+            return None
+
     async def _handle_status_code_error(
         self,
         method: str,
@@ -75,32 +129,24 @@ class HTTPBaseClient:
         params: dict[str, Any] | None,
         data: dict[str, Any] | None,
         e: httpx.HTTPStatusError,
-    ) -> dict[str, Any] | None:
+    ) -> httpx.Response | None:
+        """Retry a 401 once with a refreshed token, and return None on 403/404.
+
+        Any other error, or a 401 that the retry doesn't recover from, is raised.
+        """
         status_code = e.response.status_code
         if status_code == 401:
-            # Try to refresh token and retry the request
-            if await self._refresh_token():
-                try:
-                    response = await self._client.request(
-                        method=method,
-                        url=url,
-                        headers=self._headers,
-                        params=params,
-                        json=data,
-                    )
-                    response.raise_for_status()
-                    return response.json()
-                except httpx.HTTPStatusError:
-                    # If retry also fails, fall through to original error handling
-                    pass
-            return None
-        if status_code in (403, 404):
+            response = await self._retry_with_refreshed_token(method, url, params, data)
+            if response is not None:
+                return response
+        elif status_code in (403, 404):
             logger.warning(
                 f"Resource access error at {url} (status {status_code}): {e.response.text}"
             )
-            return {}
-        logger.error(f"HTTP status error for {method} request to {path}: {e}")
-        return None
+            return None
+        else:
+            logger.error(f"HTTP status error for {method} request to {path}: {e}")
+        raise e
 
     async def download_decoded_content(
         self,
@@ -135,12 +181,10 @@ class HTTPBaseClient:
                         os.unlink(out_path)
                     raise
         except httpx.HTTPStatusError as e:
-            result = await self._handle_status_code_error(
-                "GET", path, url, None, None, e
+            response = await self._handle_status_code_error(
+                "GET", path, url, params, None, e
             )
-            if result is not None:
-                return result
-            raise
+            return response.json() if response is not None else {}
 
         except httpx.HTTPError as e:
             logger.error(f"HTTP error for GET request to {path}: {e}")
@@ -1,16 +1,26 @@
+import asyncio
 import base64
+import re
 from typing import Any, AsyncIterator, Optional
 from urllib.parse import quote
 import codecs
 import io
+
+import httpx
 from loguru import logger
 
 from gitlab.clients.base_client import HTTPBaseClient
 
+NEXT_LINK_PATTERN = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
 
 class RestClient(HTTPBaseClient):
     DEFAULT_PAGE_SIZE = 100
     VALID_GROUP_RESOURCES = ["issues", "merge_requests", "labels", "search"]
+    # Endpoints that accept `pagination=keyset`, mapped to the only `order_by` they
+    # support in that mode
+    KEYSET_PAGINATED_RESOURCES = {"projects": "id"}
+    MAX_CONCURRENT_PAGE_REQUESTS = 5
 
     async def get_paginated_resource(
         self, resource_type: str, params: Optional[dict[str, Any]] = None
@@ -99,32 +109,116 @@ class RestClient(HTTPBaseClient):
             response["content"] = buf.getvalue()
         return response["content"]
 
+    def _supports_keyset_pagination(self, path: str, params: dict[str, Any]) -> bool:
+        keyset_order_by = self.KEYSET_PAGINATED_RESOURCES.get(path)
+        return (
+            keyset_order_by is not None
+            and params.get("order_by", keyset_order_by) == keyset_order_by
+        )
+
     async def _make_paginated_request(
         self,
         path: str,
         params: Optional[dict[str, Any]] = None,
         page_size: int = DEFAULT_PAGE_SIZE,
     ) -> AsyncIterator[list[dict[str, Any]]]:
-        page = 1
-        params_dict: dict[str, Any] = params or {}
-        if "per_page" not in params_dict:
-            params_dict["per_page"] = page_size
-
-        while True:
-            request_params = {**params_dict, "page": page}
-            logger.debug(f"Fetching page {page} from {path}")
+        params_dict: dict[str, Any] = {"per_page": page_size, **(params or {})}
 
-            response = await self.send_api_request("GET", path, params=request_params)
-            # HTTP API returns a list directly, or empty dict for 404
-            batch: list[dict[str, Any]] = response if isinstance(response, list) else []
+        if self._supports_keyset_pagination(path, params_dict):
+            async for batch in self._make_keyset_paginated_request(path, params_dict):
+                yield batch
+        else:
+            async for batch in self._make_offset_paginated_request(path, params_dict):
+                yield batch
 
+    async def _make_keyset_paginated_request(
+        self, path: str, params: dict[str, Any]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Follow the `Link` header cursors, which GitLab serves in constant time
+        regardless of how deep into the collection the page is."""
+        next_url: Optional[str] = path
+        request_params: Optional[dict[str, Any]] = {
+            **params,
+            "pagination": "keyset",
+            "order_by": self.KEYSET_PAGINATED_RESOURCES[path],
+            "sort": params.get("sort", "asc"),
+        }
+
+        while next_url:
+            logger.debug(f"Fetching keyset page from {next_url}")
+            batch, headers = await self.send_paginated_api_request(
+                next_url, params=request_params
+            )
             if not batch:
                 break
 
             yield batch
 
-            if len(batch) < page_size:
-                logger.debug(f"Last page reached for {path}, no more data.")
-                break
+            next_url = get_next_page_url(headers)
+            # The next link already carries every query parameter
+            request_params = None
+
+    async def _make_offset_paginated_request(
+        self, path: str, params: dict[str, Any]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Fetch the first page, then the following pages concurrently in windows.
+
+        When GitLab reports `X-Total-Pages` the windows stop at the last page.
+        Collections above 10,000 items omit the header, so the windows keep going
+        until a short or empty page is returned.
+        """
+        page_size = int(params["per_page"])
+
+        logger.debug(f"Fetching page 1 from {path}")
+        batch, headers = await self.send_paginated_api_request(
+            path, params={**params, "page": 1}
+        )
+        if not batch:
+            return
+
+        yield batch
+
+        if len(batch) < page_size:
+            logger.debug(f"Last page reached for {path}, no more data.")
+            return
+
+        total_pages_header = headers.get("x-total-pages")
+        total_pages = int(total_pages_header) if total_pages_header else None
+
+        next_page = 2
+        while total_pages is None or next_page <= total_pages:
+            last_page_in_window = next_page + self.MAX_CONCURRENT_PAGE_REQUESTS - 1
+            if total_pages is not None:
+                last_page_in_window = min(last_page_in_window, total_pages)
+            pages = range(next_page, last_page_in_window + 1)
+
+            logger.debug(
+                f"Fetching pages {pages.start}-{pages.stop - 1} from {path}"
+                + (f" out of {total_pages}" if total_pages else "")
+            )
+            responses = await asyncio.gather(
+                *(
+                    self.send_paginated_api_request(
+                        path, params={**params, "page": page}
+                    )
+                    for page in pages
+                )
+            )
+
+            for batch, _ in responses:
+                if batch:
+                    yield batch
+                if len(batch) < page_size:
+                    logger.debug(f"Last page reached for {path}, no more data.")
+                    return
+
+            next_page = pages.stop
+
 
-            page += 1
+def get_next_page_url(headers: httpx.Headers) -> Optional[str]:
+    """Extract the `rel="next"` URL from a `Link` response header."""
+    for link in headers.get("link", "").split(","):
+        match = NEXT_LINK_PATTERN.search(link)
+        if match:
+            return match.group(1)
+    return None
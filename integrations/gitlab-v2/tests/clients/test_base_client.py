@@ -282,6 +282,57 @@ class TestHTTPBaseClient:
             assert mock_request.call_count == 2
             mock_refresh.assert_called_once()
 
+    async def test_send_paginated_api_request_401_keeps_retried_page_headers(
+        self, client: HTTPBaseClient
+    ) -> None:
+        """Test that a page retried after a token refresh keeps its pagination headers"""
+        # Arrange
+        mock_401_response = MagicMock()
+        mock_401_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Unauthorized", request=MagicMock(), response=MagicMock(status_code=401)
+        )
+        next_link = f'<{client.base_url}/projects?cursor=next>; rel="next"'
+        mock_success_response = MagicMock()
+        mock_success_response.json.return_value = [{"id": 1}]
+        mock_success_response.raise_for_status = MagicMock()
+        mock_success_response.headers = httpx.Headers({"Link": next_link})
+
+        with (
+            patch.object(
+                client._client,
+                "request",
+                AsyncMock(side_effect=[mock_401_response, mock_success_response]),
+            ),
+            patch.object(client, "_refresh_token", AsyncMock(return_value=True)),
+        ):
+            # Act
+            batch, headers = await client.send_paginated_api_request("projects")
+
+            # Assert
+            assert batch == [{"id": 1}]
+            assert headers["Link"] == next_link
+
+    async def test_send_paginated_api_request_keeps_absolute_urls_of_other_hosts(
+        self, client: HTTPBaseClient
+    ) -> None:
+        """Test that keyset links built with another scheme or host are requested as is"""
+        # Arrange
+        next_url = "http://gitlab.internal/api/v4/projects?cursor=next"
+        mock_response = MagicMock()
+        mock_response.json.return_value = [{"id": 2}]
+        mock_response.raise_for_status = MagicMock()
+        mock_response.headers = httpx.Headers()
+
+        with patch.object(
+            client._client, "request", AsyncMock(return_value=mock_response)
+        ) as mock_request:
+            # Act
+            batch, _ = await client.send_paginated_api_request(next_url)
+
+            # Assert
+            assert batch == [{"id": 2}]
+            assert mock_request.call_args.kwargs["url"] == next_url
+
     async def test_refresh_token_success(self, client: HTTPBaseClient) -> None:
         """Test successful token refresh"""
         # Arrange
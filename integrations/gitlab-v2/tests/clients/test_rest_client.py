@@ -0,0 +1,182 @@
+from typing import Any, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from port_ocean.context.ocean import initialize_port_ocean_context
+from port_ocean.exceptions.context import PortOceanContextAlreadyInitializedError
+
+from gitlab.clients.rest_client import RestClient, get_next_page_url
+
+
+@pytest.fixture(autouse=True)
+def mock_ocean_context() -> None:
+    """Initialize mock Ocean context for all tests"""
+    try:
+        mock_app = MagicMock()
+        mock_app.config.integration.config = {
+            "gitlab_host": "https://gitlab.example.com",
+            "gitlab_token": "test-token",
+        }
+        mock_app.cache_provider = AsyncMock()
+        mock_app.cache_provider.get.return_value = None
+        initialize_port_ocean_context(mock_app)
+    except PortOceanContextAlreadyInitializedError:
+        pass
+
+
+def _page(start: int, size: int) -> list[dict[str, Any]]:
+    return [{"id": i} for i in range(start, start + size)]
+
+
+@pytest.mark.asyncio
+class TestRestClientPagination:
+    @pytest.fixture
+    def client(self) -> RestClient:
+        return RestClient("https://gitlab.example.com", "test-token", endpoint="api/v4")
+
+    async def test_projects_use_keyset_pagination(self, client: RestClient) -> None:
+        """Test that projects follow the keyset `Link` header until it is gone"""
+        # Arrange
+        next_url = (
+            f"{client.base_url}/projects?id_after=2&order_by=id&pagination=keyset"
+        )
+        responses = [
+            (
+                _page(1, 2),
+                httpx.Headers({"link": f'<{next_url}>; rel="next"'}),
+            ),
+            (_page(3, 1), httpx.Headers()),
+        ]
+
+        with patch.object(
+            client, "send_paginated_api_request", AsyncMock(side_effect=responses)
+        ) as mock_request:
+            # Act
+            results = [
+                batch
+                async for batch in client.get_paginated_resource(
+                    "projects", params={"membership": True}
+                )
+            ]
+
+            # Assert
+            assert results == [_page(1, 2), _page(3, 1)]
+            first_call, second_call = mock_request.call_args_list
+            assert first_call.args == ("projects",)
+            assert first_call.kwargs["params"] == {
+                "per_page": 100,
+                "membership": True,
+                "pagination": "keyset",
+                "order_by": "id",
+                "sort": "asc",
+            }
+            assert second_call.args == (next_url,)
+            assert second_call.kwargs["params"] is None
+
+    async def test_projects_with_custom_order_use_offset_pagination(
+        self, client: RestClient
+    ) -> None:
+        """Test that an order keyset pagination does not support falls back to pages"""
+        # Arrange
+        with patch.object(
+            client,
+            "send_paginated_api_request",
+            AsyncMock(return_value=(_page(1, 1), httpx.Headers())),
+        ) as mock_request:
+            # Act
+            results = [
+                batch
+                async for batch in client.get_paginated_resource(
+                    "projects", params={"order_by": "last_activity_at"}
+                )
+            ]
+
+            # Assert
+            assert results == [_page(1, 1)]
+            params = mock_request.call_args.kwargs["params"]
+            assert params["page"] == 1
+            assert "pagination" not in params
+
+    async def test_offset_pages_are_fetched_up_to_total_pages(
+        self, client: RestClient
+    ) -> None:
+        """Test that pages after the first are requested concurrently in order"""
+        # Arrange
+        total_pages = 7
+
+        async def send_page(
+            path: str, params: Optional[dict[str, Any]] = None
+        ) -> tuple[list[dict[str, Any]], httpx.Headers]:
+            assert params is not None
+            page = params["page"]
+            return _page((page - 1) * 2, 2), httpx.Headers(
+                {"x-total-pages": str(total_pages)}
+            )
+
+        with patch.object(
+            client, "send_paginated_api_request", AsyncMock(side_effect=send_page)
+        ) as mock_request:
+            # Act
+            results = [
+                batch
+                async for batch in client.get_paginated_resource(
+                    "groups", params={"per_page": 2}
+                )
+            ]
+
+            # Assert
+            assert results == [
+                _page((page - 1) * 2, 2) for page in range(1, total_pages + 1)
+            ]
+            requested_pages = [
+                call.kwargs["params"]["page"] for call in mock_request.call_args_list
+            ]
+            assert requested_pages == list(range(1, total_pages + 1))
+
+    async def test_offset_pages_without_total_stop_at_short_page(
+        self, client: RestClient
+    ) -> None:
+        """Test that windows stop once a short page is found when the total is unknown"""
+
+        # Arrange
+        async def send_page(
+            path: str, params: Optional[dict[str, Any]] = None
+        ) -> tuple[list[dict[str, Any]], httpx.Headers]:
+            assert params is not None
+            page = params["page"]
+            if page < 4:
+                return _page((page - 1) * 2, 2), httpx.Headers()
+            if page == 4:
+                return _page(6, 1), httpx.Headers()
+            return [], httpx.Headers()
+
+        with patch.object(
+            client, "send_paginated_api_request", AsyncMock(side_effect=send_page)
+        ) as mock_request:
+            # Act
+            results = [
+                batch
+                async for batch in client.get_paginated_resource(
+                    "groups", params={"per_page": 2}
+                )
+            ]
+
+            # Assert
+            assert results == [_page(0, 2), _page(2, 2), _page(4, 2), _page(6, 1)]
+            # A single window of concurrent requests follows the first page
+            assert mock_request.call_count == 1 + client.MAX_CONCURRENT_PAGE_REQUESTS
+
+
+def test_get_next_page_url() -> None:
+    headers = httpx.Headers(
+        {
+            "link": '<https://gitlab.example.com/api/v4/projects?id_after=5>; rel="next", '
+            '<https://gitlab.example.com/api/v4/projects?page=1>; rel="first"'
+        }
+    )
+    assert (
+        get_next_page_url(headers)
+        == "https://gitlab.example.com/api/v4/projects?id_after=5"
+    )
+    assert get_next_page_url(httpx.Headers()) is None
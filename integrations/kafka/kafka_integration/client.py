@@ -1,16 +1,46 @@
-from typing import Any, AsyncIterator
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Iterable
 from itertools import islice
 import asyncio
-from anyio import to_thread
 
 import confluent_kafka  # type: ignore
-from confluent_kafka.admin import AdminClient, ConfigResource  # type: ignore
+from confluent_kafka import ConsumerGroupTopicPartitions, TopicPartition
+from confluent_kafka.admin import AdminClient, ConfigResource, OffsetSpec  # type: ignore
 from loguru import logger
 
 
 DEFAULT_BATCH_SIZE = 50
 
 
+def to_asyncio_future(future: Future[Any]) -> asyncio.Future[Any]:
+    """
+    Bridge a future returned by the confluent-kafka admin client into the event loop.
+
+    The admin client resolves its futures from librdkafka's background thread, so the
+    result is handed back to the loop with `call_soon_threadsafe` instead of parking a
+    worker thread on a blocking `future.result()` call per topic or group.
+    """
+    loop = asyncio.get_running_loop()
+    aio_future: asyncio.Future[Any] = loop.create_future()
+
+    def _copy_state(source: Future[Any]) -> None:
+        if aio_future.done():
+            return
+        if source.cancelled():
+            aio_future.cancel()
+        elif (exception := source.exception()) is not None:
+            aio_future.set_exception(exception)
+        else:
+            aio_future.set_result(source.result())
+
+    def _on_done(source: Future[Any]) -> None:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(_copy_state, source)
+
+    future.add_done_callback(_on_done)
+    return aio_future
+
+
 class KafkaClient:
     def __init__(self, cluster_name: str, conf: dict[str, Any]):
         self.cluster_name = cluster_name
@@ -47,14 +77,13 @@ class KafkaClient:
 
     async def _process_broker(self, broker: Any) -> dict[str, Any] | None:  # type: ignore[return]
         try:
-            brokers_configs = await to_thread.run_sync(
-                self.kafka_admin_client.describe_configs,
+            brokers_configs = self.kafka_admin_client.describe_configs(
                 [ConfigResource(confluent_kafka.admin.RESOURCE_BROKER, str(broker.id))],
             )
             for broker_config_resource, future in brokers_configs.items():
                 broker_config = {
                     key: value.value
-                    for key, value in (await to_thread.run_sync(future.result)).items()
+                    for key, value in (await to_asyncio_future(future)).items()
                 }
                 return {
                     "id": broker.id,
@@ -87,8 +116,8 @@ class KafkaClient:
                 )
                 topics_metadata_dict[topic.topic] = topic
 
-            topics_configs = await to_thread.run_sync(
-                self.kafka_admin_client.describe_configs, topics_config_resources
+            topics_configs = self.kafka_admin_client.describe_configs(
+                topics_config_resources
             )
 
             for topic_config_resource, future in topics_configs.items():
@@ -115,7 +144,7 @@ class KafkaClient:
         try:
             topic_config = {
                 key: value.value
-                for key, value in (await to_thread.run_sync(future.result)).items()
+                for key, value in (await to_asyncio_future(future)).items()
             }
             partitions = [
                 {
@@ -140,10 +169,9 @@ class KafkaClient:
         self, batch_size: int = DEFAULT_BATCH_SIZE
     ) -> AsyncIterator[list[dict[str, Any]]]:
         """Describe all consumer groups in the cluster."""
-        groups_metadata = await to_thread.run_sync(
-            self.kafka_admin_client.list_consumer_groups
+        groups_result = await to_asyncio_future(
+            self.kafka_admin_client.list_consumer_groups()
         )
-        groups_result = await to_thread.run_sync(groups_metadata.result)
         group_ids = [group.group_id for group in groups_result.valid]
 
         logger.info(f"Found {len(group_ids)} consumer groups")
@@ -153,8 +181,8 @@ class KafkaClient:
         # Process group_ids in batches
         group_ids_iter = iter(group_ids)
         while current_batch_ids := list(islice(group_ids_iter, batch_size)):
-            groups_description = await to_thread.run_sync(
-                self.kafka_admin_client.describe_consumer_groups, current_batch_ids
+            groups_description = self.kafka_admin_client.describe_consumer_groups(
+                current_batch_ids
             )
 
             # Process all groups in the current batch concurrently
@@ -163,8 +191,11 @@ class KafkaClient:
                 tasks.append(self._process_consumer_group(group_id, future))
 
             try:
-                current_batch = await asyncio.gather(*tasks)
-                yield [group for group in current_batch if group is not None]
+                current_batch = [
+                    group for group in await asyncio.gather(*tasks) if group is not None
+                ]
+                await self._enrich_consumer_groups_with_lag(current_batch)
+                yield current_batch
             except Exception as e:
                 logger.error(f"Failed to process batch of consumer groups: {e}")
                 raise e
@@ -174,7 +205,7 @@ class KafkaClient:
     ) -> dict[str, Any] | None:
         """Process a single consumer group and return its description."""
         try:
-            group_info = await to_thread.run_sync(future.result)
+            group_info = await to_asyncio_future(future)
             members = [
                 {
                     "id": member.member_id,
@@ -203,3 +234,101 @@ class KafkaClient:
         except Exception as e:
             logger.error(f"Failed to describe consumer group {group_id}: {e}")
             return None
+
+    async def _enrich_consumer_groups_with_lag(
+        self, consumer_groups: list[dict[str, Any]]
+    ) -> None:
+        """
+        Add the committed offsets and lag of every group in a batch.
+
+        Committed offsets are requested for all groups at once (the admin API takes a
+        single group per request, so these run concurrently) and the end offsets of
+        every partition they consume are then fetched with one `list_offsets` call.
+        """
+        if not consumer_groups:
+            return
+
+        committed_offsets = await asyncio.gather(
+            *(
+                self._get_committed_offsets(group["group_id"])
+                for group in consumer_groups
+            )
+        )
+        partitions = {
+            (partition.topic, partition.partition)
+            for group_offsets in committed_offsets
+            for partition in group_offsets
+        }
+        try:
+            end_offsets = await self._get_end_offsets(partitions)
+        except Exception as e:
+            logger.warning(
+                f"Failed to list end offsets of {len(partitions)} partitions: {e}"
+            )
+            end_offsets = {}
+
+        for group, group_offsets in zip(consumer_groups, committed_offsets):
+            offsets = []
+            for partition in group_offsets:
+                end_offset = end_offsets.get((partition.topic, partition.partition))
+                # A negative offset means the group has no committed offset yet
+                lag = (
+                    max(end_offset - partition.offset, 0)
+                    if end_offset is not None and partition.offset >= 0
+                    else None
+                )
+                offsets.append(
+                    {
+                        "topic": partition.topic,
+                        "partition": partition.partition,
+                        "committed_offset": partition.offset,
+                        "end_offset": end_offset,
+                        "lag": lag,
+                    }
+                )
+            group["offsets"] = offsets
+            partition_lags = [
+                offset["lag"] for offset in offsets if offset["lag"] is not None
+            ]
+            group["lag"] = sum(partition_lags) if partition_lags else None
+
+    async def _get_committed_offsets(self, group_id: str) -> list[Any]:
+        try:
+            futures = self.kafka_admin_client.list_consumer_group_offsets(
+                [ConsumerGroupTopicPartitions(group_id)]
+            )
+            group_offsets = await to_asyncio_future(futures[group_id])
+            return list(group_offsets.topic_partitions or [])
+        except Exception as e:
+            logger.warning(
+                f"Failed to list committed offsets of consumer group {group_id}: {e}"
+            )
+            return []
+
+    async def _get_end_offsets(
+        self, partitions: Iterable[tuple[str, int]]
+    ) -> dict[tuple[str, int], int]:
+        requests = {
+            TopicPartition(topic, partition): OffsetSpec.latest()
+            for topic, partition in partitions
+        }
+        if not requests:
+            return {}
+
+        futures = self.kafka_admin_client.list_offsets(requests)
+        topic_partitions = list(futures.keys())
+        results = await asyncio.gather(
+            *(to_asyncio_future(futures[tp]) for tp in topic_partitions),
+            return_exceptions=True,
+        )
+        end_offsets = {}
+        for topic_partition, result in zip(topic_partitions, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"Failed to list end offset of {topic_partition.topic} partition {topic_partition.partition}: {result}"
+                )
+                continue
+            end_offsets[(topic_partition.topic, topic_partition.partition)] = (
+                result.offset
+            )
+        return end_offsets
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from confluent_kafka import ConsumerGroupTopicPartitions, TopicPartition
+
+from kafka_integration.client import KafkaClient, to_asyncio_future
+
+
+def _resolved(result: Any) -> Future[Any]:
+    future: Future[Any] = Future()
+    future.set_result(result)
+    return future
+
+
+@pytest.fixture
+def admin_client() -> MagicMock:
+    admin_client = MagicMock()
+    admin_client.list_topics.return_value = MagicMock()
+    return admin_client
+
+
+@pytest.fixture
+def kafka_client(admin_client: MagicMock) -> KafkaClient:
+    with patch("kafka_integration.client.AdminClient", return_value=admin_client):
+        return KafkaClient("local-cluster", {})
+
+
+@pytest.mark.asyncio
+async def test_to_asyncio_future_resolves_from_another_thread() -> None:
+    future: Future[Any] = Future()
+    threading.Timer(0.01, future.set_result, args=("done",)).start()
+
+    assert await asyncio.wait_for(to_asyncio_future(future), timeout=1) == "done"
+
+
+@pytest.mark.asyncio
+async def test_to_asyncio_future_propagates_exceptions() -> None:
+    future: Future[Any] = Future()
+    future.set_exception(RuntimeError("broker unavailable"))
+
+    with pytest.raises(RuntimeError, match="broker unavailable"):
+        await to_asyncio_future(future)
+
+
+@pytest.mark.asyncio
+async def test_consumer_groups_are_enriched_with_lag(
+    kafka_client: KafkaClient, admin_client: MagicMock
+) -> None:
+    committed = {
+        "group-a": [TopicPartition("orders", 0, 40), TopicPartition("orders", 1, 10)],
+        "group-b": [TopicPartition("orders", 0, -1001)],
+    }
+    admin_client.list_consumer_group_offsets.side_effect = lambda requests: {
+        request.group_id: _resolved(
+            ConsumerGroupTopicPartitions(request.group_id, committed[request.group_id])
+        )
+        for request in requests
+    }
+    end_offsets = {("orders", 0): 50, ("orders", 1): 10}
+    admin_client.list_offsets.side_effect = lambda requests: {
+        tp: _resolved(MagicMock(offset=end_offsets[(tp.topic, tp.partition)]))
+        for tp in requests
+    }
+    groups: list[dict[str, Any]] = [{"group_id": "group-a"}, {"group_id": "group-b"}]
+
+    await kafka_client._enrich_consumer_groups_with_lag(groups)
+
+    admin_client.list_offsets.assert_called_once()
+    assert len(admin_client.list_offsets.call_args.args[0]) == 2
+    assert groups[0]["lag"] == 10
+    assert groups[0]["offsets"][0] == {
+        "topic": "orders",
+        "partition": 0,
+        "committed_offset": 40,
+        "end_offset": 50,
+        "lag": 10,
+    }
+    assert groups[1]["lag"] is None
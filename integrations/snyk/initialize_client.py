@@ -1,7 +1,7 @@
 from typing import Optional
 
 from aiolimiter import AsyncLimiter
-from snyk.client import SnykClient
+from snyk.client import DEFAULT_ORGANIZATION_CONCURRENCY, SnykClient
 from port_ocean.context.ocean import ocean
 
 SNYK_MAX_REQUESTS_LIMIT_PER_HOUR = 1320
@@ -20,4 +20,9 @@ def init_client() -> SnykClient:
         parse_list(ocean.integration_config.get("groups", "")),
         ocean.integration_config.get("webhook_secret"),
         RATELIMITER,
+        int(
+            ocean.integration_config.get(
+                "organization_concurrency", DEFAULT_ORGANIZATION_CONCURRENCY
+            )
+        ),
     )
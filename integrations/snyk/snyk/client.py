@@ -1,13 +1,24 @@
+import asyncio
+import functools
+import time
 from enum import StrEnum
-from typing import Any, Optional, AsyncGenerator
+from typing import Any, Callable, Optional, AsyncGenerator
 
 import httpx
 from httpx import URL, Timeout
 from loguru import logger
 from port_ocean.context.event import event
 from port_ocean.utils import http_async_client
+from port_ocean.utils.async_iterators import (
+    semaphore_async_iterator,
+    stream_async_iterators_tasks,
+)
 from aiolimiter import AsyncLimiter
-from snyk.utils import enrich_batch_with_org
+from snyk.utils import (
+    enrich_batch_with_org,
+    get_project_target_id,
+    index_projects_by_target,
+)
 
 
 class CacheKeys(StrEnum):
@@ -19,6 +30,17 @@ class CacheKeys(StrEnum):
 
 
 PAGE_SIZE = 100
+DEFAULT_ORGANIZATION_CONCURRENCY = 10
+RATE_LIMIT_MAX_RETRIES = 3
+DEFAULT_RATE_LIMIT_BACKOFF_SECONDS = 10.0
+MAX_RATE_LIMIT_BACKOFF_SECONDS = 300.0
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
 
 
 class SnykClient:
@@ -27,6 +49,9 @@ class SnykClient:
         403: "Request forbidden",
         401: "Request unauthorized",
     }
+    # Shared by every client instance, so a rate limited request pauses all the
+    # organizations being fetched concurrently instead of only its own pagination
+    _rate_limited_until = 0.0
 
     def __init__(
         self,
@@ -37,6 +62,7 @@ class SnykClient:
         group_ids: list[str] | None,
         webhook_secret: str | None,
         rate_limiter: AsyncLimiter,
+        organization_concurrency: int = DEFAULT_ORGANIZATION_CONCURRENCY,
     ):
         self.token = token
         self.api_url = f"{api_url}/v1"
@@ -50,6 +76,7 @@ class SnykClient:
         self.http_client.timeout = Timeout(30)
         self.snyk_api_version = "2024-06-21"
         self.rate_limiter = rate_limiter
+        self.organization_concurrency = organization_concurrency
 
     @property
     def api_auth_header(self) -> dict[str, Any]:
@@ -67,28 +94,73 @@ class SnykClient:
             **(query_params or {}),
             **({"version": version} if version is not None else {}),
         }
-        async with self.rate_limiter:
-            try:
-                response = await self.http_client.request(
-                    method=method, url=url, params=query_params, json=json_data
-                )
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.HTTPStatusError as e:
-                response_status = e.response.status_code
-                if response_status in self._IGNORED_ERRORS:
-                    log_message = self._IGNORED_ERRORS[response_status]
-                    logger.warning(
-                        f"{log_message}: {e.response.url}; Error message: {e.response.text}"
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await self._wait_for_rate_limit_reset()
+            async with self.rate_limiter:
+                try:
+                    response = await self.http_client.request(
+                        method=method, url=url, params=query_params, json=json_data
                     )
-                    return {}
-                logger.error(
-                    f"Encountered an error while sending a request to {method} {url} with query_params: {query_params}, "
-                    f"version: {version}, json: {json_data}. "
-                    f"Got HTTP error with status code: {e.response.status_code} and response: {e.response.text}"
-                )
-                raise
+                    response.raise_for_status()
+                    return response.json()
+
+                except httpx.HTTPStatusError as e:
+                    response_status = e.response.status_code
+                    if (
+                        response_status == httpx.codes.TOO_MANY_REQUESTS
+                        and attempt < RATE_LIMIT_MAX_RETRIES
+                    ):
+                        self._register_rate_limit(e.response, attempt)
+                        continue
+                    if response_status in self._IGNORED_ERRORS:
+                        log_message = self._IGNORED_ERRORS[response_status]
+                        logger.warning(
+                            f"{log_message}: {e.response.url}; Error message: {e.response.text}"
+                        )
+                        return {}
+                    logger.error(
+                        f"Encountered an error while sending a request to {method} {url} with query_params: {query_params}, "
+                        f"version: {version}, json: {json_data}. "
+                        f"Got HTTP error with status code: {e.response.status_code} and response: {e.response.text}"
+                    )
+                    raise
+        raise RuntimeError("unreachable")
+
+    async def _wait_for_rate_limit_reset(self) -> None:
+        delay = SnykClient._rate_limited_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _register_rate_limit(self, response: httpx.Response, attempt: int) -> None:
+        backoff = _parse_retry_after(response.headers.get("Retry-After"))
+        if backoff is None:
+            backoff = DEFAULT_RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+        backoff = min(backoff, MAX_RATE_LIMIT_BACKOFF_SECONDS)
+        SnykClient._rate_limited_until = max(
+            SnykClient._rate_limited_until, time.monotonic() + backoff
+        )
+        logger.warning(
+            f"Snyk rate limit reached for {response.request.method} {response.url} "
+            f"(attempt {attempt + 1}/{RATE_LIMIT_MAX_RETRIES}), pausing requests for {backoff:.1f}s"
+        )
+
+    async def _stream_per_organization(
+        self,
+        fetch_organization: Callable[
+            [dict[str, Any]], AsyncGenerator[list[dict[str, Any]], None]
+        ],
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Streams the batches of every organization, fetching up to `organization_concurrency` of them at a time"""
+        all_organizations = await self.get_organizations_in_groups()
+        semaphore = asyncio.BoundedSemaphore(self.organization_concurrency)
+        tasks = [
+            semaphore_async_iterator(
+                semaphore, functools.partial(fetch_organization, org)
+            )
+            for org in all_organizations
+        ]
+        async for batch in stream_async_iterators_tasks(*tasks):
+            yield batch
 
     async def _get_paginated_resources(
         self,
@@ -139,17 +211,23 @@ class SnykClient:
         event.attributes[cache_key] = issues
         return issues
 
-    async def get_paginated_issues(self) -> AsyncGenerator[list[dict[str, Any]], None]:
-        all_organizations = await self.get_organizations_in_groups()
-        for org in all_organizations:
-            logger.info(f"Fetching paginated issues for organization: {org['id']}")
-            url = f"/orgs/{org['id']}/issues"
-            query_params = {"version": self.snyk_api_version}
+    async def _get_paginated_organization_issues(
+        self, org: dict[str, Any]
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        logger.info(f"Fetching paginated issues for organization: {org['id']}")
+        url = f"/orgs/{org['id']}/issues"
+        query_params = {"version": self.snyk_api_version}
 
-            async for issues in self._get_paginated_resources(
-                url_path=url, query_params=query_params
-            ):
-                yield enrich_batch_with_org(issues, org)
+        async for issues in self._get_paginated_resources(
+            url_path=url, query_params=query_params
+        ):
+            yield enrich_batch_with_org(issues, org)
+
+    async def get_paginated_issues(self) -> AsyncGenerator[list[dict[str, Any]], None]:
+        async for issues in self._stream_per_organization(
+            self._get_paginated_organization_issues
+        ):
+            yield issues
 
     def _get_projects_by_target(
         self,
@@ -160,7 +238,7 @@ class SnykClient:
             [
                 project
                 for project in all_projects
-                if project.get("__target", {}).get("data", {}).get("id") == target_id
+                if get_project_target_id(project) == target_id
             ]
             if target_id
             else all_projects
@@ -170,33 +248,50 @@ class SnykClient:
         self,
         target_id: Optional[str] = None,
     ) -> AsyncGenerator[list[dict[str, Any]], None]:
-        if CacheKeys.PROJECT in event.attributes:
-            all_projects = event.attributes[CacheKeys.PROJECT]
-            projects_to_yield = self._get_projects_by_target(
-                all_projects, target_id=target_id
-            )
-            yield projects_to_yield
+        async for projects in self._stream_per_organization(
+            self._get_paginated_organization_projects
+        ):
+            yield self._get_projects_by_target(projects, target_id=target_id)
+
+    async def _get_paginated_organization_projects(
+        self, org: dict[str, Any]
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Yields the projects of an organization, listing them only once per resync
+
+        The projects are cached in the event attributes once fully listed, so the
+        issues, projects and targets kinds share a single listing per organization.
+        """
+        cache_key = f"{CacheKeys.PROJECT}-{org['id']}"
+        if (cache := event.attributes.get(cache_key)) is not None:
+            for start in range(0, len(cache), PAGE_SIZE):
+                yield cache[start : start + PAGE_SIZE]
             return
 
-        all_organizations = await self.get_organizations_in_groups()
-        for org in all_organizations:
-            logger.info(f"Fetching paginated projects for organization: {org['id']}")
-            url = f"/orgs/{org['id']}/projects"
-            query_params = {
-                "version": self.snyk_api_version,
-                "meta.latest_issue_counts": "true",
-                "expand": "target",
-            }
-
-            async for projects in self._get_paginated_resources(
-                url_path=url, query_params=query_params
-            ):
-                event.attributes.setdefault(CacheKeys.PROJECT, []).extend(projects)
-
-                projects_to_yield = self._get_projects_by_target(
-                    projects, target_id=target_id
-                )
-                yield enrich_batch_with_org(projects_to_yield, org)
+        logger.info(f"Fetching paginated projects for organization: {org['id']}")
+        url = f"/orgs/{org['id']}/projects"
+        query_params = {
+            "version": self.snyk_api_version,
+            "meta.latest_issue_counts": "true",
+            "expand": "target",
+        }
+        organization_projects: list[dict[str, Any]] = []
+        async for projects in self._get_paginated_resources(
+            url_path=url, query_params=query_params
+        ):
+            projects = enrich_batch_with_org(projects, org)
+            organization_projects.extend(projects)
+            yield projects
+
+        event.attributes[cache_key] = organization_projects
+
+    async def get_organization_projects(
+        self, org: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        return [
+            project
+            async for projects in self._get_paginated_organization_projects(org)
+            for project in projects
+        ]
 
     async def get_single_target_by_project_id(
         self, org_id: str, project_id: str
@@ -220,36 +315,43 @@ class SnykClient:
             target.setdefault("__projects", []).extend(projects_data_of_target)
         return target
 
+    async def _get_paginated_organization_targets(
+        self, org: dict[str, Any]
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        # The projects of the organization are listed once and joined to its targets
+        # locally, instead of listing them again for every target
+        projects_by_target = index_projects_by_target(
+            await self.get_organization_projects(org)
+        )
+
+        logger.info(f"Fetching paginated targets for organization: {org['id']}")
+        url = f"/orgs/{org['id']}/targets"
+        query_params = {"version": self.snyk_api_version}
+        async for targets in self._get_paginated_resources(
+            url_path=url, query_params=query_params
+        ):
+            for target_data in targets:
+                target_data["__projects"] = projects_by_target.get(
+                    target_data["id"], []
+                )
+            yield targets
+
     async def get_paginated_targets(
         self,
     ) -> AsyncGenerator[list[dict[str, Any]], None]:
-        all_organizations = await self.get_organizations_in_groups()
-        for org in all_organizations:
-            logger.info(f"Fetching paginated targets for organization: {org['id']}")
-
-            url = f"/orgs/{org['id']}/targets"
-            query_params = {"version": self.snyk_api_version}
-            async for targets in self._get_paginated_resources(
-                url_path=url, query_params=query_params
-            ):
-                targets_with_project_data = []
-                for target_data in targets:
-                    async for projects_data_of_target in self.get_paginated_projects(
-                        target_data["id"]
-                    ):
-                        target_data.setdefault("__projects", []).extend(
-                            projects_data_of_target
-                        )
-                    targets_with_project_data.append(target_data)
-                yield targets_with_project_data
+        async for targets in self._stream_per_organization(
+            self._get_paginated_organization_targets
+        ):
+            yield targets
 
     async def get_single_project(self, org_id: str, project_id: str) -> dict[str, Any]:
-        if CacheKeys.PROJECT in event.attributes:
-            all_projects = event.attributes[CacheKeys.PROJECT]
+        if organization_projects := event.attributes.get(
+            f"{CacheKeys.PROJECT}-{org_id}"
+        ):
             project = next(
                 (
                     project
-                    for project in all_projects
+                    for project in organization_projects
                     if project.get("id") == project_id
                 ),
                 None,
@@ -268,10 +370,7 @@ class SnykClient:
             query_params=query_params,
             version=self.snyk_api_version,
         )
-        project = response.get("data", {})
-        event.attributes.setdefault(CacheKeys.PROJECT, []).append(project)
-
-        return project
+        return response.get("data", {})
 
     async def create_webhooks_if_not_exists(self) -> None:
         all_organizations = await self.get_organizations_in_groups()
@@ -20,3 +20,17 @@ def get_matching_organization(
             return org
 
     return None
+
+
+def get_project_target_id(project: dict[str, Any]) -> Optional[str]:
+    return project.get("relationships", {}).get("target", {}).get("data", {}).get("id")
+
+
+def index_projects_by_target(
+    projects: list[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    projects_by_target: dict[str, list[dict[str, Any]]] = {}
+    for project in projects:
+        if target_id := get_project_target_id(project):
+            projects_by_target.setdefault(target_id, []).append(project)
+    return projects_by_target
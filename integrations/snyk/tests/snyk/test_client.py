@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
-from typing import Any, Dict, List, Generator
+from typing import Any, AsyncGenerator, Dict, List, Generator
 from snyk.client import SnykClient
 from port_ocean.exceptions.context import PortOceanContextAlreadyInitializedError
 from port_ocean.context.ocean import initialize_port_ocean_context
@@ -8,6 +8,7 @@ from port_ocean.context.event import EventContext
 from aiolimiter import AsyncLimiter
 import time
 import asyncio
+import httpx
 
 MOCK_API_URL = "https://api.snyk.io/v1"
 MOCK_TOKEN = "dummy_token"
@@ -121,3 +122,156 @@ async def test_get_paginated_resources(
             resources.extend(resource_batch)
 
         assert resources == [{"id": "item1"}, {"id": "item2"}]
+
+
+@pytest.mark.asyncio
+async def test_get_paginated_targets_joins_projects_per_organization(
+    snyk_client: SnykClient, mock_event_context: MagicMock
+) -> None:
+    """Test that each organization's projects are listed once and joined to its targets."""
+    organizations = [{"id": "org1"}, {"id": "org2"}]
+    requested_paths: List[str] = []
+
+    def project(project_id: str, target_id: str) -> Dict[str, Any]:
+        return {
+            "id": project_id,
+            "relationships": {"target": {"data": {"id": target_id}}},
+        }
+
+    async def mock_get_paginated_resources(
+        url_path: str, **kwargs: Any
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        requested_paths.append(url_path)
+        pages = {
+            "/orgs/org1/projects": [
+                [project("p1", "t1"), project("p2", "t1")],
+                [project("p3", "t2")],
+            ],
+            "/orgs/org1/targets": [[{"id": "t1"}], [{"id": "t2"}, {"id": "t3"}]],
+            "/orgs/org2/projects": [[project("p4", "t4")]],
+            "/orgs/org2/targets": [[{"id": "t4"}]],
+        }
+        for page in pages[url_path]:
+            yield page
+
+    with (
+        patch("snyk.client.event", mock_event_context),
+        patch.object(
+            snyk_client,
+            "get_organizations_in_groups",
+            AsyncMock(return_value=organizations),
+        ),
+        patch.object(
+            snyk_client, "_get_paginated_resources", mock_get_paginated_resources
+        ),
+    ):
+        targets = [
+            target
+            async for targets_batch in snyk_client.get_paginated_targets()
+            for target in targets_batch
+        ]
+
+    projects_of_targets = {
+        target["id"]: [project["id"] for project in target["__projects"]]
+        for target in targets
+    }
+    assert projects_of_targets == {
+        "t1": ["p1", "p2"],
+        "t2": ["p3"],
+        "t3": [],
+        "t4": ["p4"],
+    }
+    assert sorted(requested_paths) == sorted(
+        [
+            "/orgs/org1/projects",
+            "/orgs/org1/targets",
+            "/orgs/org2/projects",
+            "/orgs/org2/targets",
+        ]
+    )
+    assert targets[0]["__projects"][0]["__organization"] in organizations
+
+
+@pytest.mark.asyncio
+async def test_send_api_request_respects_retry_after(snyk_client: SnykClient) -> None:
+    """Test that a 429 pauses requests for the Retry-After duration before retrying."""
+    request = httpx.Request("GET", f"{MOCK_API_URL}/test")
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0.2"}, request=request),
+        httpx.Response(200, json={"data": []}, request=request),
+    ]
+
+    with (
+        patch.object(
+            snyk_client.http_client,
+            "request",
+            new_callable=AsyncMock,
+            side_effect=responses,
+        ) as mock_request,
+        patch.object(SnykClient, "_rate_limited_until", 0.0),
+    ):
+        start_time = time.monotonic()
+        result = await snyk_client._send_api_request(url=f"{MOCK_API_URL}/test")
+        elapsed_time = time.monotonic() - start_time
+
+    assert result == {"data": []}
+    assert mock_request.call_count == 2
+    assert elapsed_time >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_projects_are_listed_once_across_kinds(
+    snyk_client: SnykClient, mock_event_context: MagicMock
+) -> None:
+    """Test that projects, targets and issues kinds share the organization project cache."""
+    organizations = [{"id": "org1"}, {"id": "org2"}]
+    requested_paths: List[str] = []
+
+    async def mock_get_paginated_resources(
+        url_path: str, **kwargs: Any
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        requested_paths.append(url_path)
+        org_id = url_path.split("/")[2]
+        if url_path.endswith("/projects"):
+            yield [
+                {
+                    "id": f"{org_id}-project",
+                    "relationships": {"target": {"data": {"id": f"{org_id}-target"}}},
+                }
+            ]
+        elif url_path.endswith("/targets"):
+            yield [{"id": f"{org_id}-target"}]
+
+    with (
+        patch("snyk.client.event", mock_event_context),
+        patch.object(
+            snyk_client,
+            "get_organizations_in_groups",
+            AsyncMock(return_value=organizations),
+        ),
+        patch.object(
+            snyk_client, "_get_paginated_resources", mock_get_paginated_resources
+        ),
+    ):
+        projects = [
+            project
+            async for batch in snyk_client.get_paginated_projects()
+            for project in batch
+        ]
+        targets = [
+            target
+            async for batch in snyk_client.get_paginated_targets()
+            for target in batch
+        ]
+        project = await snyk_client.get_single_project("org2", "org2-project")
+
+    assert sorted(project["id"] for project in projects) == [
+        "org1-project",
+        "org2-project",
+    ]
+    assert all(len(target["__projects"]) == 1 for target in targets)
+    assert project["__organization"] == {"id": "org2"}
+    assert sorted(path for path in requested_paths if path.endswith("/projects")) == [
+        "/orgs/org1/projects",
+        "/orgs/org2/projects",
+    ]
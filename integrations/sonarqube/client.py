@@ -1,13 +1,24 @@
 import asyncio
 import base64
+from datetime import datetime, timedelta, timezone
+from functools import partial
 import httpx
 from loguru import logger
 from typing import Any, AsyncGenerator, Generator, Optional, cast
 from port_ocean.context.ocean import ocean
 from port_ocean.utils import http_async_client
-from port_ocean.utils.async_iterators import stream_async_iterators_tasks
+from port_ocean.utils.async_iterators import (
+    semaphore_async_iterator,
+    stream_async_iterators_tasks,
+)
 from port_ocean.utils.cache import cache_iterator_result
 
+from incremental_sync import (
+    DEFAULT_FULL_SYNC_INTERVAL_HOURS,
+    ComponentIssuesSnapshot,
+    IssueSyncStore,
+)
+
 
 def turn_sequence_to_chunks(
     sequence: list[Any], chunk_size: int
@@ -27,6 +38,32 @@ def turn_sequence_to_chunks(
 
 MAX_PORTFOLIO_REQUESTS = 20
 MAX_ISSUES_REQUESTS = 10000
+MAX_CONCURRENT_ISSUE_COMPONENTS = 10
+MAX_ISSUE_QUERY_SPLIT_DEPTH = 24
+ISSUES_RESYNC_BATCH_SIZE = 100
+SONARQUBE_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+# Facets an issue query can be partitioned on when it exceeds MAX_ISSUES_REQUESTS
+ISSUE_QUERY_PARTITIONS: list[tuple[str, list[str]]] = [
+    ("types", ["BUG", "VULNERABILITY", "CODE_SMELL"]),
+    ("severities", ["BLOCKER", "CRITICAL", "MAJOR", "MINOR", "INFO"]),
+]
+
+
+def parse_sonarqube_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a SonarQube date (`2017-10-19`) or datetime (`2017-10-19T13:00:00+0200`)."""
+    if not value:
+        return None
+    for date_format in (SONARQUBE_DATETIME_FORMAT, "%Y-%m-%d"):
+        try:
+            parsed = datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return None
+
+
+def format_sonarqube_datetime(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime(SONARQUBE_DATETIME_FORMAT)
 
 
 class Endpoints:
@@ -342,21 +379,91 @@ class SonarQubeClient:
         self,
         query_params: dict[str, Any],
         project_query_params: dict[str, Any],
+        incremental: bool = False,
+        full_sync_interval_hours: int = DEFAULT_FULL_SYNC_INTERVAL_HOURS,
     ) -> AsyncGenerator[list[dict[str, Any]], None]:
         """
         Retrieve issues data across all components from SonarQube API  as an asynchronous generator.
 
+        Components are queried concurrently, at most `MAX_CONCURRENT_ISSUE_COMPONENTS`
+        at a time, and their issues are merged into batches of `ISSUES_RESYNC_BATCH_SIZE`.
+        In incremental mode, components that were not analyzed since the previous
+        resync are served from the stored snapshot of their issues.
+
         :return (list[Any]): A list containing issues data for all projects.
         """
-
-        async for components in self.get_custom_projects(
+        components: list[dict[str, Any]] = []
+        async for projects in self.get_custom_projects(
             params=project_query_params, enrich_project=False
         ):
-            for component in components:
-                async for responses in self.get_issues_by_component(
-                    component=component, query_params=query_params
-                ):
-                    yield responses
+            components.extend(projects)
+
+        logger.info(
+            f"Fetching issues of {len(components)} components with up to {MAX_CONCURRENT_ISSUE_COMPONENTS} concurrent components"
+        )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ISSUE_COMPONENTS)
+        store = IssueSyncStore() if incremental else None
+        tasks = [
+            semaphore_async_iterator(
+                semaphore,
+                (
+                    partial(
+                        self._get_component_issues_incrementally,
+                        component,
+                        query_params,
+                        store,
+                        full_sync_interval_hours,
+                    )
+                    if store
+                    else partial(
+                        self.get_issues_by_component, component, dict(query_params)
+                    )
+                ),
+            )
+            for component in components
+        ]
+
+        buffer: list[dict[str, Any]] = []
+        async for issues in stream_async_iterators_tasks(*tasks):
+            buffer.extend(issues)
+            if len(buffer) >= ISSUES_RESYNC_BATCH_SIZE:
+                yield buffer
+                buffer = []
+        if buffer:
+            yield buffer
+
+    async def _get_component_issues_incrementally(
+        self,
+        component: dict[str, Any],
+        query_params: dict[str, Any],
+        store: IssueSyncStore,
+        full_sync_interval_hours: int,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        component_key = cast(str, component.get("key"))
+        last_analysis_date = component.get("lastAnalysisDate")
+
+        snapshot = await store.load(component_key, query_params)
+        if snapshot and snapshot.is_reusable(
+            last_analysis_date, full_sync_interval_hours
+        ):
+            logger.debug(
+                f"Component {component_key} was not analyzed since {last_analysis_date}, reusing {len(snapshot.issues)} stored issues"
+            )
+            for chunk in turn_sequence_to_chunks(snapshot.issues, PAGE_SIZE):
+                yield chunk
+            return
+
+        synced_at = datetime.now(timezone.utc)
+        issues: list[dict[str, Any]] = []
+        async for batch in self.get_issues_by_component(component, dict(query_params)):
+            issues.extend(batch)
+            yield batch
+
+        await store.save(
+            component_key,
+            query_params,
+            ComponentIssuesSnapshot(synced_at, last_analysis_date, issues),
+        )
 
     async def get_issues_by_component(
         self,
@@ -371,16 +478,10 @@ class SonarQubeClient:
         :return (list[Any]): A list containing issues data for the specified component.
         """
         component_key = component.get("key")
+        component_param = "components" if self.is_onpremise else "componentKeys"
 
-        if self.is_onpremise:
-            query_params["components"] = component_key
-        else:
-            query_params["componentKeys"] = component_key
-
-        async for responses in self._send_paginated_request(
-            endpoint=Endpoints.ISSUES_SEARCH,
-            data_key="issues",
-            query_params=query_params,
+        async for responses in self._get_issues_within_cap(
+            {**query_params, component_param: component_key}
         ):
             yield [
                 {
@@ -390,6 +491,102 @@ class SonarQubeClient:
                 for issue in responses
             ]
 
+    async def _get_issues_within_cap(
+        self, query_params: dict[str, Any], depth: int = 0
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Page through an issue query, splitting it first when it matches more issues
+        than SonarQube returns for a single query (10,000).
+
+        Queries are split by type, then by severity when the user's filters leave
+        those open, and finally into creation date windows.
+        """
+        first_page = await self._send_api_request(
+            endpoint=Endpoints.ISSUES_SEARCH,
+            query_params={**query_params, "ps": PAGE_SIZE},
+        )
+        total = first_page.get("paging", {}).get("total", 0)
+
+        if total > MAX_ISSUES_REQUESTS and depth < MAX_ISSUE_QUERY_SPLIT_DEPTH:
+            partitions = await self._split_issue_query(query_params)
+            if partitions:
+                logger.info(
+                    f"Issue query {query_params} matches {total} issues, splitting it into {len(partitions)} queries"
+                )
+                for partition in partitions:
+                    async for issues in self._get_issues_within_cap(
+                        partition, depth + 1
+                    ):
+                        yield issues
+                return
+
+        yield first_page.get("issues", [])
+        if total <= PAGE_SIZE:
+            return
+
+        async for issues in self._send_paginated_request(
+            endpoint=Endpoints.ISSUES_SEARCH,
+            data_key="issues",
+            query_params={**query_params, "p": 2},
+        ):
+            yield issues
+
+    async def _split_issue_query(
+        self, query_params: dict[str, Any]
+    ) -> list[dict[str, Any]] | None:
+        for param, values in ISSUE_QUERY_PARTITIONS:
+            if param not in query_params:
+                return [{**query_params, param: value} for value in values]
+        return await self._split_issue_query_by_creation_date(query_params)
+
+    async def _split_issue_query_by_creation_date(
+        self, query_params: dict[str, Any]
+    ) -> list[dict[str, Any]] | None:
+        created_after = parse_sonarqube_datetime(query_params.get("createdAfter"))
+        if created_after is None:
+            oldest = await self._send_api_request(
+                endpoint=Endpoints.ISSUES_SEARCH,
+                query_params={
+                    **query_params,
+                    "s": "CREATION_DATE",
+                    "asc": "true",
+                    "ps": 1,
+                },
+            )
+            oldest_issues = oldest.get("issues", [])
+            if not oldest_issues:
+                return None
+            created_after = parse_sonarqube_datetime(
+                oldest_issues[0].get("creationDate")
+            )
+
+        created_before = parse_sonarqube_datetime(
+            query_params.get("createdBefore")
+        ) or datetime.now(timezone.utc) + timedelta(seconds=1)
+
+        if created_after is None or created_before - created_after < timedelta(
+            seconds=2
+        ):
+            logger.warning(
+                f"Issue query {query_params} cannot be split further, only the first {MAX_ISSUES_REQUESTS} issues will be returned"
+            )
+            return None
+
+        # createdAfter is inclusive and createdBefore exclusive, so windows don't overlap
+        middle = created_after + (created_before - created_after) / 2
+        return [
+            {
+                **query_params,
+                "createdAfter": format_sonarqube_datetime(created_after),
+                "createdBefore": format_sonarqube_datetime(middle),
+            },
+            {
+                **query_params,
+                "createdAfter": format_sonarqube_datetime(middle),
+                "createdBefore": format_sonarqube_datetime(created_before),
+            },
+        ]
+
     async def get_all_sonarcloud_analyses(
         self,
     ) -> AsyncGenerator[list[dict[str, Any]], None]:
@@ -0,0 +1,77 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from loguru import logger
+from port_ocean.cache.disk import DiskCacheProvider
+from port_ocean.cache.errors import FailedToReadCacheError, FailedToWriteCacheError
+
+# Issue snapshots are only useful if they survive to the next resync, so they live
+# outside the per-resync cache that Ocean wipes when a resync starts
+INCREMENTAL_SYNC_STATE_DIR = "/tmp/ocean/.sonarqube_incremental_sync"
+DEFAULT_FULL_SYNC_INTERVAL_HOURS = 24
+
+
+@dataclass
+class ComponentIssuesSnapshot:
+    """The issues of a SonarQube component as of its last analysis.
+
+    Issues only change through analyses or manual transitions, so while the
+    component reports the same `lastAnalysisDate` the stored issues stay valid.
+    `synced_at` bounds how long manual transitions can go unnoticed.
+    """
+
+    synced_at: datetime
+    last_analysis_date: Optional[str]
+    issues: list[dict[str, Any]] = field(default_factory=list)
+
+    def is_reusable(
+        self, last_analysis_date: Optional[str], full_sync_interval_hours: int
+    ) -> bool:
+        return (
+            last_analysis_date is not None
+            and self.last_analysis_date == last_analysis_date
+            and datetime.now(timezone.utc) - self.synced_at
+            < timedelta(hours=full_sync_interval_hours)
+        )
+
+
+class IssueSyncStore:
+    """Stores the issues fetched for each component, per issue search query.
+
+    The query is part of the key because the same component yields different
+    issues under different `apiFilters`.
+    """
+
+    def __init__(self, state_dir: Optional[str] = None) -> None:
+        self._storage = DiskCacheProvider(state_dir or INCREMENTAL_SYNC_STATE_DIR)
+
+    def _key(self, component_key: str, query_params: dict[str, Any]) -> str:
+        raw_key = json.dumps([component_key, query_params], sort_keys=True).encode()
+        return f"issues_{hashlib.sha256(raw_key).hexdigest()[:24]}"
+
+    async def load(
+        self, component_key: str, query_params: dict[str, Any]
+    ) -> Optional[ComponentIssuesSnapshot]:
+        try:
+            return await self._storage.get(self._key(component_key, query_params))
+        except FailedToReadCacheError as e:
+            logger.warning(
+                f"Failed to read the issue sync state of {component_key}, fetching its issues: {e}"
+            )
+            return None
+
+    async def save(
+        self,
+        component_key: str,
+        query_params: dict[str, Any],
+        snapshot: ComponentIssuesSnapshot,
+    ) -> None:
+        try:
+            await self._storage.set(self._key(component_key, query_params), snapshot)
+        except FailedToWriteCacheError as e:
+            logger.warning(
+                f"Failed to persist the issue sync state of {component_key}: {e}"
+            )
@@ -240,6 +240,16 @@ class SonarQubeIssueSelector(SelectorWithApiFilters):
         alias="projectApiFilters",
         description="Allows users to control which projects to query the issues for",
     )
+    incremental: bool = Field(
+        default=False,
+        description="Reuse the issues of projects that were not analyzed since the previous resync",
+    )
+    full_sync_interval_hours: int = Field(
+        alias="fullSyncIntervalHours",
+        default=24,
+        ge=1,
+        description="How often the issues of unchanged projects are fetched again in incremental mode",
+    )
 
 
 class SonarQubeIssueResourceConfig(CustomResourceConfig):
@@ -68,6 +68,8 @@ async def on_issues_resync(kind: str) -> ASYNC_GENERATOR_RESYNC_TYPE:
     async for issues_list in sonar_client.get_all_issues(
         query_params=query_params,
         project_query_params=project_query_params,
+        incremental=selector.incremental,
+        full_sync_interval_hours=selector.full_sync_interval_hours,
     ):
         logger.info(f"Received issues batch of size: {len(issues_list)}")
         yield issues_list
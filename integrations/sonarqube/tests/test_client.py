@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, AsyncGenerator, TypedDict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -6,7 +7,11 @@ import pytest
 from loguru import logger
 from port_ocean.context.event import event_context
 
-from client import SonarQubeClient, turn_sequence_to_chunks
+from client import (
+    MAX_CONCURRENT_ISSUE_COMPONENTS,
+    SonarQubeClient,
+    turn_sequence_to_chunks,
+)
 
 from .fixtures import PURE_PROJECTS
 
@@ -1055,10 +1060,19 @@ async def test_issues_pagination_limit(
 
     sonarqube_client.http_client = MockHttpxClient(mock_responses)  # type: ignore
 
-    # Test with issues endpoint
+    # Test with issues endpoint, on a query already narrowed to a window that
+    # cannot be split any further
     component = {"key": "test-project"}
+    query_params = {
+        "types": "BUG",
+        "severities": "MAJOR",
+        "createdAfter": "2024-01-01T00:00:00+0000",
+        "createdBefore": "2024-01-01T00:00:01+0000",
+    }
     issues = []
-    async for batch in sonarqube_client.get_issues_by_component(component):
+    async for batch in sonarqube_client.get_issues_by_component(
+        component, query_params
+    ):
         issues.extend(batch)
 
     # Verify we only got 10,000 issues and stopped pagination
@@ -1069,6 +1083,146 @@ async def test_issues_pagination_limit(
     )  # All issue numbers < 10000
 
 
+async def test_issues_query_above_limit_is_split_by_type(
+    mock_ocean_context: Any,
+    monkeypatch: Any,
+) -> None:
+    """Test that a component with more than 10,000 issues is queried per issue type"""
+    sonarqube_client = SonarQubeClient(
+        "https://sonarqube.com",
+        "token",
+        "organization_id",
+        "app_host",
+        False,
+    )
+
+    def page(index: int, total: int, keys: range) -> HttpxResponses:
+        return {
+            "status_code": 200,
+            "json": {
+                "paging": {"pageIndex": index, "pageSize": 100, "total": total},
+                "issues": [{"key": f"issue{key}"} for key in keys],
+            },
+        }
+
+    sonarqube_client.http_client = MockHttpxClient(  # type: ignore
+        [
+            page(1, 15000, range(0, 100)),
+            # BUG
+            page(1, 150, range(0, 100)),
+            page(2, 150, range(100, 150)),
+            # VULNERABILITY
+            page(1, 0, range(0)),
+            # CODE_SMELL
+            page(1, 50, range(150, 200)),
+        ]
+    )
+
+    issues = []
+    async for batch in sonarqube_client.get_issues_by_component({"key": "big"}):
+        issues.extend(batch)
+
+    assert [issue["key"] for issue in issues] == [f"issue{i}" for i in range(200)]
+
+
+async def test_get_all_issues_merges_components_concurrently(
+    mock_ocean_context: Any,
+    monkeypatch: Any,
+) -> None:
+    sonarqube_client = SonarQubeClient(
+        "https://sonarqube.com",
+        "token",
+        "organization_id",
+        "app_host",
+        False,
+    )
+    components = [{"key": f"project{i}"} for i in range(30)]
+    running = 0
+    peak = 0
+
+    async def get_custom_projects(
+        params: dict[str, Any], enrich_project: bool
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        yield components
+
+    async def get_issues_by_component(
+        component: dict[str, Any], query_params: dict[str, Any] = {}
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        yield [{"key": f"{component['key']}-issue{i}"} for i in range(5)]
+
+    monkeypatch.setattr(sonarqube_client, "get_custom_projects", get_custom_projects)
+    monkeypatch.setattr(
+        sonarqube_client, "get_issues_by_component", get_issues_by_component
+    )
+
+    batches = [batch async for batch in sonarqube_client.get_all_issues({}, {})]
+
+    assert 1 < peak <= MAX_CONCURRENT_ISSUE_COMPONENTS
+    assert [len(batch) for batch in batches] == [100, 50]
+
+
+async def test_get_all_issues_incremental_reuses_unchanged_components(
+    mock_ocean_context: Any,
+    monkeypatch: Any,
+    tmp_path: Any,
+) -> None:
+    monkeypatch.setattr("incremental_sync.INCREMENTAL_SYNC_STATE_DIR", str(tmp_path))
+    sonarqube_client = SonarQubeClient(
+        "https://sonarqube.com",
+        "token",
+        "organization_id",
+        "app_host",
+        False,
+    )
+    components = [
+        {"key": "unchanged", "lastAnalysisDate": "2024-01-01T00:00:00+0000"},
+        {"key": "reanalyzed", "lastAnalysisDate": "2024-01-01T00:00:00+0000"},
+    ]
+    fetched: list[str] = []
+
+    async def get_custom_projects(
+        params: dict[str, Any], enrich_project: bool
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        yield [dict(component) for component in components]
+
+    async def get_issues_by_component(
+        component: dict[str, Any], query_params: dict[str, Any] = {}
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        fetched.append(component["key"])
+        yield [{"key": f"{component['key']}-issue"}]
+
+    monkeypatch.setattr(sonarqube_client, "get_custom_projects", get_custom_projects)
+    monkeypatch.setattr(
+        sonarqube_client, "get_issues_by_component", get_issues_by_component
+    )
+
+    async def resync() -> list[dict[str, Any]]:
+        return [
+            issue
+            async for batch in sonarqube_client.get_all_issues(
+                {"resolved": "false"}, {}, incremental=True
+            )
+            for issue in batch
+        ]
+
+    first = await resync()
+    assert sorted(fetched) == ["reanalyzed", "unchanged"]
+
+    fetched.clear()
+    components[1]["lastAnalysisDate"] = "2024-02-01T00:00:00+0000"
+    second = await resync()
+
+    assert fetched == ["reanalyzed"]
+    assert sorted(issue["key"] for issue in second) == sorted(
+        issue["key"] for issue in first
+    )
+
+
 @pytest.mark.asyncio
 async def test_sonarqube_client_normalizes_trailing_slashes(
     mock_ocean_context: Any,
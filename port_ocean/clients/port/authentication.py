@@ -1,4 +1,6 @@
+import asyncio
 import re
+import time
 import jwt
 from typing import Any
 
@@ -8,8 +10,14 @@ from pydantic import BaseModel, Field, PrivateAttr
 
 from port_ocean.clients.port.types import UserAgentType
 from port_ocean.clients.port.utils import handle_port_status_code
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricType
 from port_ocean.utils.misc import get_time
 
+# Tokens are refreshed in the background once this fraction of their lifetime has passed,
+# so requests keep using a valid token instead of waiting for a new one when it expires.
+DEFAULT_TOKEN_REFRESH_FRACTION = 0.8
+
 
 class TokenResponse(BaseModel):
     access_token: str = Field(alias="accessToken")
@@ -21,6 +29,9 @@ class TokenResponse(BaseModel):
     def expired(self) -> bool:
         return self._retrieved_time + self.expires_in <= get_time()
 
+    def should_refresh(self, refresh_fraction: float) -> bool:
+        return self._retrieved_time + self.expires_in * refresh_fraction <= get_time()
+
     @property
     def full_token(self) -> str:
         return f"{self.token_type} {self.access_token}"
@@ -37,6 +48,7 @@ class PortAuthentication:
         integration_type: str,
         integration_version: str,
         ingest_url: str,
+        token_refresh_fraction: float = DEFAULT_TOKEN_REFRESH_FRACTION,
     ):
         self.client = client
         self.api_url = api_url
@@ -46,7 +58,10 @@ class PortAuthentication:
         self.integration_type = integration_type
         self.integration_version = integration_version
         self.ingest_url = ingest_url
+        self.token_refresh_fraction = token_refresh_fraction
         self.last_token_object: TokenResponse | None = None
+        self._token_lock = asyncio.Lock()
+        self._background_refresh_task: asyncio.Task[None] | None = None
 
     async def _get_token(self, client_id: str, client_secret: str) -> TokenResponse:
         logger.info(f"Fetching access token for clientId: {client_id}")
@@ -81,15 +96,84 @@ class PortAuthentication:
 
     @property
     async def token(self) -> str:
-        if not self.last_token_object or self.last_token_object.expired:
-            msg = "Token expired, fetching new token"
-            if not self.last_token_object:
-                msg = "No token found, fetching new token"
-            logger.info(msg)
-            self.last_token_object = await self._get_token(
-                self.client_id, self.client_secret
+        token_object = self.last_token_object
+        if token_object and not token_object.expired:
+            if token_object.should_refresh(self.token_refresh_fraction):
+                self._schedule_background_refresh(token_object)
+            return token_object.full_token
+
+        trigger = "expired" if token_object else "initial"
+        token_object = await self._refresh_token(token_object, trigger)
+        return token_object.full_token
+
+    async def refresh_rejected_token(self, rejected_token: str | None) -> str:
+        """
+        Return a token to retry a request that Port rejected with 401.
+
+        Only the first request rejected with the current token fetches a new one; the
+        others wait for it and reuse it.
+        """
+        token_object = self.last_token_object
+        if token_object is None or token_object.full_token != rejected_token:
+            return await self.token
+
+        token_object = await self._refresh_token(token_object, "unauthorized")
+        return token_object.full_token
+
+    async def _refresh_token(
+        self, stale_token_object: TokenResponse | None, trigger: str
+    ) -> TokenResponse:
+        """
+        Single-flight token fetch: concurrent callers that saw the same stale token wait for
+        one request to the auth endpoint instead of each sending their own.
+        """
+        async with self._token_lock:
+            token_object = self.last_token_object
+            if (
+                token_object is not None
+                and token_object is not stale_token_object
+                and not token_object.expired
+            ):
+                return token_object
+
+            if trigger == "initial":
+                logger.info("No token found, fetching new token")
+            elif trigger == "expired":
+                logger.info("Token expired, fetching new token")
+            else:
+                logger.info(f"Refreshing token ({trigger})")
+
+            started_at = time.monotonic()
+            token_object = await self._get_token(self.client_id, self.client_secret)
+            self._report_refresh_latency(trigger, time.monotonic() - started_at)
+            self.last_token_object = token_object
+            return token_object
+
+    def _schedule_background_refresh(self, token_object: TokenResponse) -> None:
+        if (
+            self._background_refresh_task is not None
+            and not self._background_refresh_task.done()
+        ):
+            return
+        self._background_refresh_task = asyncio.create_task(
+            self._background_refresh(token_object)
+        )
+
+    async def _background_refresh(self, token_object: TokenResponse) -> None:
+        try:
+            await self._refresh_token(token_object, "background")
+        except Exception as e:
+            # The current token is still valid, the next request past the refresh point retries
+            logger.warning(f"Failed to refresh the access token in the background: {e}")
+
+    @staticmethod
+    def _report_refresh_latency(trigger: str, latency: float) -> None:
+        if ocean.initialized:
+            ocean.metrics.set_metric(
+                name=MetricType.PORT_TOKEN_REFRESH_LATENCY_NAME,
+                labels=[trigger],
+                value=latency,
             )
-        return self.last_token_object.full_token
 
     async def is_machine_user(self) -> bool:
         # Ensure self.last_token_object is populated
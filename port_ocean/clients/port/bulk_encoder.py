@@ -0,0 +1,60 @@
+import gzip
+from typing import Any, Iterable, Iterator
+
+import orjson
+
+from port_ocean.core.models import Entity
+
+BULK_BODY_PREFIX = b'{"entities":['
+BULK_BODY_SUFFIX = b"]}"
+BULK_BODY_SEPARATOR = b","
+BULK_BODY_ENVELOPE_SIZE = len(BULK_BODY_PREFIX) + len(BULK_BODY_SUFFIX)
+GZIP_COMPRESSION_LEVEL = 5
+
+
+def dumps_json(data: Any) -> bytes:
+    """Compact JSON encoding, like httpx's `json=` encoding"""
+    return orjson.dumps(data)
+
+
+def encode_entity(entity: Entity) -> bytes:
+    return dumps_json(entity.dict(exclude_unset=True, by_alias=True))
+
+
+def iter_bulk_sizes(
+    encoded_entities: Iterable[bytes], max_length: int, max_size_in_bytes: int
+) -> Iterator[int]:
+    """
+    Greedily pack encoded entities into bulks, yielding the number of entities of each bulk.
+
+    A bulk is closed once adding the next entity would exceed either `max_length` entities or
+    `max_size_in_bytes` for the exact request body built by `build_bulk_body`. An entity that is
+    larger than the limit on its own is sent in a bulk of its own.
+    """
+    bulk_length = 0
+    bulk_size = BULK_BODY_ENVELOPE_SIZE
+    for encoded_entity in encoded_entities:
+        entity_size = len(encoded_entity) + (
+            len(BULK_BODY_SEPARATOR) if bulk_length else 0
+        )
+        if bulk_length and (
+            bulk_length >= max_length or bulk_size + entity_size > max_size_in_bytes
+        ):
+            yield bulk_length
+            bulk_length = 0
+            bulk_size = BULK_BODY_ENVELOPE_SIZE
+            entity_size = len(encoded_entity)
+        bulk_length += 1
+        bulk_size += entity_size
+    if bulk_length:
+        yield bulk_length
+
+
+def build_bulk_body(encoded_entities: list[bytes]) -> bytes:
+    return (
+        BULK_BODY_PREFIX + BULK_BODY_SEPARATOR.join(encoded_entities) + BULK_BODY_SUFFIX
+    )
+
+
+def compress_bulk_body(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=GZIP_COMPRESSION_LEVEL)
@@ -2,7 +2,10 @@ from typing import Any
 
 from loguru import logger
 
-from port_ocean.clients.port.authentication import PortAuthentication
+from port_ocean.clients.port.authentication import (
+    DEFAULT_TOKEN_REFRESH_FRACTION,
+    PortAuthentication,
+)
 from port_ocean.clients.port.mixins.actions import ActionsClientMixin
 from port_ocean.clients.port.mixins.blueprints import BlueprintClientMixin
 from port_ocean.clients.port.mixins.entities import EntityClientMixin
@@ -36,6 +39,7 @@ class PortClient(
         integration_type: str,
         integration_version: str,
         ingest_url: str,
+        token_refresh_fraction: float = DEFAULT_TOKEN_REFRESH_FRACTION,
     ):
         self.api_url = f"{base_url}/v1"
         self.client = get_internal_http_client(self)
@@ -48,6 +52,7 @@ class PortClient(
             integration_type,
             integration_version,
             ingest_url,
+            token_refresh_fraction,
         )
         EntityClientMixin.__init__(self, self.auth, self.client)
         IntegrationClientMixin.__init__(
@@ -0,0 +1,161 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable
+
+import httpx
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricType
+
+OVERLOAD_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Bounds the concurrent requests sent through it with an AIMD (additive increase,
+    multiplicative decrease) limit.
+
+    Every `window_size` completed requests, the limit grows by one if the window had no
+    overload errors, its p95 latency stayed under `latency_threshold_seconds` and requests
+    were actually queueing for a slot. A 429/5xx response, a transport error or a slow
+    window multiplies the limit by `decrease_factor` instead. Requests that started
+    before the last decrease do not decrease it again, so a burst of failures from the
+    same overloaded period only backs off once.
+
+    Waiting requests are served in FIFO order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_threshold_seconds: float,
+        window_size: int = 20,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.window_size = window_size
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._window_latencies: list[float] = []
+        self._window_had_errors = False
+        self._window_was_saturated = False
+        self._last_decrease_at = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def run(
+        self, send_request: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send a request once a slot is free and feed its outcome back into the limit"""
+        queued_at = time.monotonic()
+        await self._acquire()
+        started_at = time.monotonic()
+        self._report(MetricType.PORT_QUEUE_WAIT_NAME, started_at - queued_at)
+        try:
+            response = await send_request()
+        except (httpx.TransportError, asyncio.TimeoutError):
+            self._on_overload(started_at)
+            raise
+        finally:
+            self._release()
+
+        if response.status_code in OVERLOAD_STATUS_CODES:
+            self._on_overload(started_at)
+        else:
+            self._on_success(time.monotonic() - started_at, started_at)
+        return response
+
+    async def _acquire(self) -> None:
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return
+
+        self._window_was_saturated = True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right before the cancellation
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _on_success(self, latency: float, started_at: float) -> None:
+        self._window_latencies.append(latency)
+        if len(self._window_latencies) < self.window_size:
+            return
+
+        latencies = sorted(self._window_latencies)
+        p95_latency = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        if p95_latency > self.latency_threshold_seconds:
+            self._decrease(
+                started_at, f"p95 latency {p95_latency:.2f}s is above the threshold"
+            )
+        elif not self._window_had_errors and self._window_was_saturated:
+            self._set_limit(self._limit + 1)
+        self._reset_window()
+
+    def _on_overload(self, started_at: float) -> None:
+        self._window_had_errors = True
+        self._decrease(started_at, "Port is overloaded")
+
+    def _decrease(self, started_at: float, reason: str) -> None:
+        if started_at < self._last_decrease_at:
+            return
+        self._last_decrease_at = time.monotonic()
+        previous_limit = self.limit
+        self._set_limit(self._limit * self.decrease_factor)
+        self._reset_window()
+        if self.limit < previous_limit:
+            logger.warning(
+                f"{reason}, lowering the {self.name} concurrency limit "
+                f"from {previous_limit} to {self.limit}"
+            )
+
+    def _reset_window(self) -> None:
+        self._window_latencies = []
+        self._window_had_errors = False
+        self._window_was_saturated = bool(self._waiters)
+
+    def _set_limit(self, limit: float) -> None:
+        self._limit = min(max(limit, float(self.min_limit)), float(self.max_limit))
+        self._report(MetricType.PORT_CONCURRENCY_LIMIT_NAME, self.limit)
+        self._wake_waiters()
+
+    def _report(self, metric_name: str, value: float) -> None:
+        if ocean.initialized:
+            ocean.metrics.set_metric(name=metric_name, labels=[self.name], value=value)
@@ -29,16 +29,27 @@ class ActionsClientMixin:
         handle_port_status_code(response, should_log=should_log)
 
     async def claim_pending_runs(
-        self, limit: int, visibility_timeout_ms: int
+        self, limit: int, visibility_timeout_ms: int, wait_time_ms: int = 0
     ) -> list[ActionRun]:
+        body: dict[str, Any] = {
+            "installationId": self.auth.integration_identifier,
+            "limit": limit,
+            "visibilityTimeoutMs": visibility_timeout_ms,
+        }
+        timeout = self.client.timeout
+        if wait_time_ms:
+            # Port holds a long-poll request open until runs arrive or the wait time passes
+            body["waitTimeMs"] = wait_time_ms
+            if timeout.read is not None:
+                timeout = httpx.Timeout(
+                    timeout.connect, read=timeout.read + wait_time_ms / 1000
+                )
+
         response = await self.client.post(
             f"{self.auth.api_url}/actions/runs/claim-pending",
             headers={**(await self.auth.headers()), **INTERNAL_ACTIONS_CLIENT_HEADER},
-            json={
-                "installationId": self.auth.integration_identifier,
-                "limit": limit,
-                "visibilityTimeoutMs": visibility_timeout_ms,
-            },
+            json=body,
+            timeout=timeout,
         )
         if response.is_error:
             logger.error("Error claiming pending runs", error=response.text)
@@ -84,6 +95,21 @@ class ActionsClientMixin:
                 raise RunAlreadyAcknowledgedError()
             raise
 
+    async def extend_run_visibility(
+        self, run_id: str, visibility_timeout_ms: int
+    ) -> bool:
+        response = await self.client.patch(
+            f"{self.auth.api_url}/actions/runs/extend-visibility",
+            headers={**(await self.auth.headers()), **INTERNAL_ACTIONS_CLIENT_HEADER},
+            json={"runId": run_id, "visibilityTimeoutMs": visibility_timeout_ms},
+        )
+        if response.is_error:
+            logger.warning(
+                "Error extending run visibility", run_id=run_id, error=response.text
+            )
+            return False
+        return True
+
     async def post_run_log(self, run_id: str, message: str) -> None:
         response = await self.client.post(
             f"{self.auth.api_url}/actions/runs/{run_id}/logs",
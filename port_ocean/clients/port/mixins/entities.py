@@ -1,5 +1,5 @@
 import asyncio
-import json
+from itertools import zip_longest
 from typing import Any, Literal
 from urllib.parse import quote_plus
 
@@ -8,6 +8,13 @@ from loguru import logger
 from starlette import status
 
 from port_ocean.clients.port.authentication import PortAuthentication
+from port_ocean.clients.port.bulk_encoder import (
+    build_bulk_body,
+    compress_bulk_body,
+    encode_entity,
+    iter_bulk_sizes,
+)
+from port_ocean.clients.port.concurrency import AdaptiveConcurrencyLimiter
 from port_ocean.clients.port.types import RequestOptions, UserAgentType
 from port_ocean.clients.port.utils import (
     PORT_HTTP_MAX_CONNECTIONS_LIMIT,
@@ -21,58 +28,82 @@ from port_ocean.core.models import (
 )
 from port_ocean.helpers.metric.metric import MetricPhase, MetricType
 
-ENTITIES_BULK_SAMPLES_SIZE = 10
-ENTITIES_BULK_ESTIMATED_SIZE_MULTIPLIER = 1.5
 ENTITIES_BULK_MINIMUM_BATCH_SIZE = 1
-ENTITIES_BULK_UPSERT_CONCURRENCY = 5
+# Requests to Port start at a conservative limit and grow towards half of the max connections
+# limit while Port keeps up, leaving room for requests that are not related to entities.
+PORT_REQUESTS_INITIAL_CONCURRENCY = 10
+PORT_REQUESTS_MIN_CONCURRENCY = 1
+PORT_REQUESTS_MAX_CONCURRENCY = round(0.5 * PORT_HTTP_MAX_CONNECTIONS_LIMIT)
+PORT_REQUESTS_LATENCY_THRESHOLD_SECONDS = 10
 
 
 class EntityClientMixin:
     def __init__(self, auth: PortAuthentication, client: httpx.AsyncClient):
         self.auth = auth
         self.client = client
-        # Semaphore is used to limit the number of concurrent requests to port, to avoid overloading it.
-        # The number of concurrent requests is set to 90% of the max connections limit, to leave some room for other
-        # requests that are not related to entities.
-        self.semaphore = asyncio.Semaphore(
-            round(0.5 * PORT_HTTP_MAX_CONNECTIONS_LIMIT)
-        )  # 50% of the max connections limit in order to avoid overloading port
+        # Shared by every upsert, delete and search request, so the limit applies across kinds and
+        # batches and backs off as soon as Port starts throttling or slowing down.
+        self.limiter = AdaptiveConcurrencyLimiter(
+            name="entities",
+            initial_limit=PORT_REQUESTS_INITIAL_CONCURRENCY,
+            min_limit=PORT_REQUESTS_MIN_CONCURRENCY,
+            max_limit=PORT_REQUESTS_MAX_CONCURRENCY,
+            latency_threshold_seconds=PORT_REQUESTS_LATENCY_THRESHOLD_SECONDS,
+        )
 
     def calculate_entities_batch_size(self, entities: list[Entity]) -> int:
         """
-        Calculate the optimal batch size based on entity size and configured limits.
+        Calculate the batch size based on the encoded size of the entities and configured limits.
+
+        The entities are packed greedily by their exact encoded size, and the size of the first
+        packed batch is returned.
 
         Args:
             entities: List of entities to calculate batch size for
 
         Returns:
-            int: The optimal batch size to use
+            int: The batch size to use
         """
         if not entities:
             return ENTITIES_BULK_MINIMUM_BATCH_SIZE
 
-        # Calculate average entity size from a sample
-        SAMPLE_SIZE = min(ENTITIES_BULK_SAMPLES_SIZE, len(entities))
-        sample_entities = entities[:SAMPLE_SIZE]
-        average_entity_size = (
-            sum(
-                len(json.dumps(entity.dict(exclude_unset=True, by_alias=True)).encode())
-                for entity in sample_entities
-            )
-            / SAMPLE_SIZE
-        )
-
-        # Use a conservative estimate to ensure we stay under the limit
-        estimated_entity_size = int(
-            average_entity_size * ENTITIES_BULK_ESTIMATED_SIZE_MULTIPLIER
-        )
-        max_entities_per_batch = min(
+        bulk_sizes = iter_bulk_sizes(
+            (encode_entity(entity) for entity in entities),
             ocean.config.upsert_entities_batch_max_length,
-            ocean.config.upsert_entities_batch_max_size_in_bytes
-            // estimated_entity_size,
+            ocean.config.upsert_entities_batch_max_size_in_bytes,
         )
+        return max(ENTITIES_BULK_MINIMUM_BATCH_SIZE, next(bulk_sizes))
 
-        return max(ENTITIES_BULK_MINIMUM_BATCH_SIZE, max_entities_per_batch)
+    def _pack_entities_in_bulks(
+        self, entities: list[Entity]
+    ) -> list[tuple[list[Entity], list[bytes]]]:
+        """
+        Serialize each entity once and pack the entities greedily into bulks that fit the
+        configured entity count and request body size limits.
+        """
+        encoded_entities = [encode_entity(entity) for entity in entities]
+        bulks: list[tuple[list[Entity], list[bytes]]] = []
+        start = 0
+        for bulk_size in iter_bulk_sizes(
+            encoded_entities,
+            ocean.config.upsert_entities_batch_max_length,
+            ocean.config.upsert_entities_batch_max_size_in_bytes,
+        ):
+            end = start + bulk_size
+            bulks.append((entities[start:end], encoded_entities[start:end]))
+            start = end
+        return bulks
+
+    def _build_bulk_request_content(
+        self, encoded_entities: list[bytes]
+    ) -> tuple[bytes, dict[str, str]]:
+        body = build_bulk_body(encoded_entities)
+        headers = {"Content-Type": "application/json"}
+        gzip_min_size = ocean.config.upsert_entities_batch_gzip_min_size_in_bytes
+        if gzip_min_size is not None and len(body) >= gzip_min_size:
+            body = compress_bulk_body(body)
+            headers["Content-Encoding"] = "gzip"
+        return body, headers
 
     async def upsert_entity(
         self,
@@ -102,12 +133,12 @@ class EntityClientMixin:
         :return: [False] will be returned if upsert failed because of unmet dependency
         """
         validation_only = request_options["validation_only"]
-        async with self.semaphore:
-            logger.debug(
-                f"{'Validating' if validation_only else 'Upserting'} entity: {entity.identifier} of blueprint: {entity.blueprint}"
-            )
-            headers = await self.auth.headers(user_agent_type)
-            response = await self.client.post(
+        logger.debug(
+            f"{'Validating' if validation_only else 'Upserting'} entity: {entity.identifier} of blueprint: {entity.blueprint}"
+        )
+        headers = await self.auth.headers(user_agent_type)
+        response = await self.limiter.run(
+            lambda: self.client.post(
                 f"{self.auth.api_url}/blueprints/{entity.blueprint}/entities",
                 json=entity.dict(exclude_unset=True, by_alias=True),
                 headers=headers,
@@ -121,6 +152,7 @@ class EntityClientMixin:
                 },
                 extensions={"retryable": True},
             )
+        )
         if response.is_error:
             logger.error(
                 f"Error {'Validating' if validation_only else 'Upserting'} "
@@ -176,6 +208,7 @@ class EntityClientMixin:
         request_options: RequestOptions,
         user_agent_type: UserAgentType | None = None,
         should_raise: bool = True,
+        encoded_entities: list[bytes] | None = None,
     ) -> list[tuple[bool | None, Entity]] | httpx.HTTPStatusError:
         """
         This function upserts a list of entities into Port.
@@ -194,27 +227,25 @@ class EntityClientMixin:
         :param request_options: A dictionary specifying how to upsert the entity
         :param user_agent_type: a UserAgentType specifying who is preforming the action
         :param should_raise: A boolean specifying whether the error should be raised or handled silently
+        :param encoded_entities: The entities already encoded by `encode_entity`, to avoid serializing them again
         :return: A list of tuples where each tuple contains:
             - First value: True if entity was created successfully, False if there was an error, None if there was an error and the entity use search identifier
             - Second value: The original entity (if failed) or the reduced entity with updated identifier (if successful)
         :return: httpx.HTTPStatusError if there was an HTTP error and should_raise is False
         """
         validation_only = request_options["validation_only"]
-        bulk_semaphore = asyncio.Semaphore(ENTITIES_BULK_UPSERT_CONCURRENCY)
-        async with bulk_semaphore:
-            logger.debug(
-                f"{'Validating' if validation_only else 'Upserting'} {len(entities)} of blueprint: {blueprint}"
-            )
-            headers = await self.auth.headers(user_agent_type)
-            response = await self.client.post(
+        logger.debug(
+            f"{'Validating' if validation_only else 'Upserting'} {len(entities)} of blueprint: {blueprint}"
+        )
+        if encoded_entities is None:
+            encoded_entities = [encode_entity(entity) for entity in entities]
+        content, content_headers = self._build_bulk_request_content(encoded_entities)
+        headers = await self.auth.headers(user_agent_type)
+        response = await self.limiter.run(
+            lambda: self.client.post(
                 f"{self.auth.api_url}/blueprints/{blueprint}/entities/bulk",
-                json={
-                    "entities": [
-                        entity.dict(exclude_unset=True, by_alias=True)
-                        for entity in entities
-                    ]
-                },
-                headers=headers,
+                content=content,
+                headers={**headers, **content_headers},
                 params={
                     "upsert": "true",
                     "merge": str(request_options["merge"]).lower(),
@@ -225,6 +256,7 @@ class EntityClientMixin:
                 },
                 extensions={"retryable": True},
             )
+        )
         if response.is_error:
             logger.error(
                 f"Error {'Validating' if validation_only else 'Upserting'} "
@@ -341,8 +373,9 @@ class EntityClientMixin:
     ) -> list[tuple[bool, Entity]]:
         """
         This function upserts a list of entities into Port in batches.
-        The batch size is calculated based on both the number of entities and their size.
-        Batches are processed in parallel using asyncio.gather, with concurrency controlled by the semaphore.
+        Each entity is serialized once, and the entities are packed greedily into batches by their
+        count and exact encoded size. Batches are processed in parallel using asyncio.gather, with
+        concurrency controlled by the shared adaptive limiter.
 
         :param entities: A list of Entities to be upserted
         :param request_options: A dictionary specifying how to upsert the entity
@@ -352,13 +385,66 @@ class EntityClientMixin:
             - First value: True if entity was created successfully, False if there was an error
             - Second value: The reduced entity with updated identifier (if successful) or the original entity (if failed)
         """
-        entities_results: list[tuple[bool, Entity]] = []
         blueprint = entities[0].blueprint
+        scheduled_bulks = [
+            (blueprint, bulk, encoded_bulk)
+            for bulk, encoded_bulk in self._pack_entities_in_bulks(entities)
+        ]
+        return await self._upsert_scheduled_bulks(
+            scheduled_bulks, request_options, user_agent_type, should_raise
+        )
+
+    async def upsert_entities_by_blueprint(
+        self,
+        entities_by_blueprint: dict[str, list[Entity]],
+        request_options: RequestOptions,
+        user_agent_type: UserAgentType | None = None,
+        should_raise: bool = True,
+    ) -> list[tuple[bool, Entity]]:
+        """
+        This function upserts entities of several blueprints into Port concurrently.
+        Each blueprint group is packed into batches like `upsert_entities_in_batches`, and the
+        batches are scheduled round-robin across the blueprints (the first batch of every
+        blueprint, then the second, ...). As the shared limiter serves requests in FIFO order, a
+        large blueprint group does not hold back the batches of the smaller ones.
 
-        bulk_size = self.calculate_entities_batch_size(entities)
-        bulks = [
-            entities[i : i + bulk_size] for i in range(0, len(entities), bulk_size)
+        :param entities_by_blueprint: The entities to be upserted, grouped by their blueprint
+        :param request_options: A dictionary specifying how to upsert the entity
+        :param user_agent_type: a UserAgentType specifying who is preforming the action
+        :param should_raise: A boolean specifying whether the error should be raised or handled silently
+        :return: The same results as `upsert_entities_in_batches`, for every blueprint
+        """
+        bulks_by_blueprint = [
+            [
+                (blueprint, bulk, encoded_bulk)
+                for bulk, encoded_bulk in self._pack_entities_in_bulks(entities)
+            ]
+            for blueprint, entities in entities_by_blueprint.items()
+            if entities
+        ]
+        scheduled_bulks = [
+            scheduled_bulk
+            for bulks_round in zip_longest(*bulks_by_blueprint)
+            for scheduled_bulk in bulks_round
+            if scheduled_bulk is not None
         ]
+        return await self._upsert_scheduled_bulks(
+            scheduled_bulks, request_options, user_agent_type, should_raise
+        )
+
+    async def _upsert_scheduled_bulks(
+        self,
+        scheduled_bulks: list[tuple[str, list[Entity], list[bytes]]],
+        request_options: RequestOptions,
+        user_agent_type: UserAgentType | None,
+        should_raise: bool,
+    ) -> list[tuple[bool, Entity]]:
+        """
+        Send the bulks in the given order and collect the results of every entity. Bulks that
+        failed with 413 are retried entity by entity when should_raise is False.
+        """
+        entities_results: list[tuple[bool, Entity]] = []
+        bulks = [bulk for _, bulk, _ in scheduled_bulks]
 
         bulk_results = await asyncio.gather(
             *(
@@ -368,8 +454,9 @@ class EntityClientMixin:
                     request_options,
                     user_agent_type,
                     should_raise=should_raise,
+                    encoded_entities=encoded_bulk,
                 )
-                for bulk in bulks
+                for blueprint, bulk, encoded_bulk in scheduled_bulks
             ),
             return_exceptions=True,
         )
@@ -428,34 +515,36 @@ class EntityClientMixin:
         user_agent_type: UserAgentType | None = None,
         should_raise: bool = True,
     ) -> None:
-        async with self.semaphore:
-            logger.info(
-                f"Delete entity: {entity.identifier} of blueprint: {entity.blueprint}"
-            )
-            response = await self.client.delete(
+        logger.info(
+            f"Delete entity: {entity.identifier} of blueprint: {entity.blueprint}"
+        )
+        headers = await self.auth.headers(user_agent_type)
+        response = await self.limiter.run(
+            lambda: self.client.delete(
                 f"{self.auth.api_url}/blueprints/{entity.blueprint}/entities/{quote_plus(entity.identifier)}",
-                headers=await self.auth.headers(user_agent_type),
+                headers=headers,
                 params={
                     "delete_dependents": str(
                         request_options["delete_dependent_entities"]
                     ).lower()
                 },
             )
+        )
 
-            if response.is_error:
-                if response.status_code == 404:
-                    logger.info(
-                        f"Failed to delete entity: {entity.identifier} of blueprint: {entity.blueprint},"
-                        f" as it was already deleted from port"
-                    )
-                    return
-                logger.error(
-                    f"Error deleting "
-                    f"entity: {entity.identifier} of "
-                    f"blueprint: {entity.blueprint}"
+        if response.is_error:
+            if response.status_code == 404:
+                logger.info(
+                    f"Failed to delete entity: {entity.identifier} of blueprint: {entity.blueprint},"
+                    f" as it was already deleted from port"
                 )
+                return
+            logger.error(
+                f"Error deleting "
+                f"entity: {entity.identifier} of "
+                f"blueprint: {entity.blueprint}"
+            )
 
-            handle_port_status_code(response, should_raise)
+        handle_port_status_code(response, should_raise)
 
     async def batch_delete_entities(
         self,
@@ -514,11 +603,14 @@ class EntityClientMixin:
             if next_from:
                 request_body["from"] = next_from
 
-            response = await self.client.post(
-                f"{self.auth.api_url}/blueprints/entities/datasource-entities",
-                json=request_body,
-                headers=await self.auth.headers(user_agent_type),
-                extensions={"retryable": True},
+            headers = await self.auth.headers(user_agent_type)
+            response = await self.limiter.run(
+                lambda: self.client.post(
+                    f"{self.auth.api_url}/blueprints/entities/datasource-entities",
+                    json=request_body,
+                    headers=headers,
+                    extensions={"retryable": True},
+                )
             )
             handle_port_status_code(response)
             response_json = response.json()
@@ -557,15 +649,18 @@ class EntityClientMixin:
             query["rules"].extend(default_query["rules"])
 
         logger.info(f"Searching entities with custom query: {query}")
-        response = await self.client.post(
-            f"{self.auth.api_url}/entities/search",
-            json=query,
-            headers=await self.auth.headers(user_agent_type),
-            params={
-                "exclude_calculated_properties": "true",
-                "include": parameters_to_include or ["blueprint", "identifier"],
-            },
-            extensions={"retryable": True},
+        headers = await self.auth.headers(user_agent_type)
+        response = await self.limiter.run(
+            lambda: self.client.post(
+                f"{self.auth.api_url}/entities/search",
+                json=query,
+                headers=headers,
+                params={
+                    "exclude_calculated_properties": "true",
+                    "include": parameters_to_include or ["blueprint", "identifier"],
+                },
+                extensions={"retryable": True},
+            )
         )
 
         handle_port_status_code(response)
@@ -9,6 +9,8 @@ from port_ocean.helpers.retry import RetryTransport
 if TYPE_CHECKING:
     from port_ocean.clients.port.client import PortClient
 
+TOKEN_REFRESHED_EXTENSION = "port_token_refreshed"
+
 
 class TokenRetryTransport(RetryTransport):
     def __init__(self, port_client: "PortClient", **kwargs: Any) -> None:
@@ -16,15 +18,25 @@ class TokenRetryTransport(RetryTransport):
         self.port_client = port_client
 
     async def _handle_unauthorized(self, response: httpx.Response) -> None:
-        token = await self.port_client.auth.token
-        response.headers["Authorization"] = f"Bearer {token}"
+        # The retry reuses the same request object, so the new token goes on the request.
+        # Concurrent requests rejected with the same token share a single token fetch.
+        request = response.request
+        token = await self.port_client.auth.refresh_rejected_token(
+            request.headers.get("Authorization")
+        )
+        request.headers["Authorization"] = token
+        request.extensions = {**request.extensions, TOKEN_REFRESHED_EXTENSION: True}
 
     def is_token_error(self, response: httpx.Response) -> bool:
+        request = response.request
         return (
             response.status_code == HTTPStatus.UNAUTHORIZED
-            and "/auth/access_token" not in str(response.request.url)
+            and "/auth/access_token" not in str(request.url)
+            and "Authorization" in request.headers
             and self.port_client.auth.last_token_object is not None
-            and self.port_client.auth.last_token_object.expired
+            # A request is retried with a fresh token only once, so a token that
+            # lacks permissions does not trigger a token fetch on every attempt
+            and not request.extensions.get(TOKEN_REFRESHED_EXTENSION, False)
         )
 
     async def _should_retry_async(self, response: httpx.Response) -> bool:
@@ -43,6 +43,7 @@ def _get_http_client_context(port_client: "PortClient") -> httpx.AsyncClient:
             },
             timeout=PORT_HTTPX_TIMEOUT,
             limits=PORT_HTTPX_LIMITS,
+            trace_category="port",
         )
         _http_client.push(client)
 
@@ -18,6 +18,7 @@ from port_ocean.core.models import (
     EventListenerType,
     ProcessExecutionMode,
     Runtime,
+    TraceExportFormat,
 )
 from port_ocean.utils.misc import get_integration_name, get_spec_file
 
@@ -51,6 +52,8 @@ class PortSettings(BaseOceanModel, extra=Extra.allow):
     base_url: AnyHttpUrl = parse_obj_as(AnyHttpUrl, "https://api.getport.io")
     port_app_config_cache_ttl: int = 60
     ingest_url: AnyHttpUrl = parse_obj_as(AnyHttpUrl, "https://ingest.getport.io")
+    # Fraction of the access token's lifetime after which it is refreshed in the background
+    token_refresh_fraction: float = Field(default=0.8, gt=0, le=1)
 
 
 class IntegrationSettings(BaseOceanModel, extra=Extra.allow):
@@ -88,10 +91,42 @@ class ActionsProcessorSettings(BaseOceanModel, extra=Extra.allow):
     enabled: bool = Field(default=False)
     runs_buffer_high_watermark: int = Field(default=100)
     visibility_timeout_ms: int = Field(default=30000)
+    # The longest wait between polls, idle polling backs off up to it
     poll_check_interval_seconds: int = Field(default=10)
+    poll_idle_backoff_initial_seconds: float = Field(default=0.5)
+    # Have Port hold claim requests open until runs arrive, 0 disables long polling
+    long_poll_timeout_ms: int = Field(default=0)
+    # Extend the visibility timeout of executing runs at this interval so they aren't
+    # reclaimed, must be shorter than the visibility timeout. 0 disables lease extensions
+    lease_extension_interval_ms: int = Field(default=0)
     workers_count: int = Field(default=1)
 
 
+class ResyncCheckpointSettings(BaseOceanModel, extra=Extra.allow):
+    enabled: bool = Field(default=False)
+    # Point this at a persistent volume so checkpoints survive the pod being replaced
+    location: str = Field(default="/tmp/ocean/.resync_checkpoint")
+    save_interval_seconds: float = Field(default=30.0)
+    max_age_hours: float = Field(default=24.0)
+
+
+class TracingSettings(BaseOceanModel, extra=Extra.allow):
+    enabled: bool = Field(default=False)
+    location: str = Field(default="/tmp/ocean/traces")
+    export_format: TraceExportFormat = Field(default=TraceExportFormat.chrome)
+    # Spans beyond this amount are dropped, so a long resync can't exhaust the memory
+    max_spans: int = Field(default=500_000)
+
+
+class MemoryProfilingSettings(BaseOceanModel, extra=Extra.allow):
+    enabled: bool = Field(default=False)
+    # Tracing allocations finds the top allocators but slows the integration down noticeably
+    trace_allocations: bool = Field(default=False)
+    top_allocators_limit: int = Field(default=10)
+    snapshot_threshold_mb: int | None = Field(default=None)
+    snapshot_location: str = Field(default="/tmp/ocean/memory")
+
+
 class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
     _integration_config_model: BaseModel | None = None
 
@@ -131,6 +166,8 @@ class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
 
     upsert_entities_batch_max_length: int = 20
     upsert_entities_batch_max_size_in_bytes: int = 1024 * 1024
+    # Gzip compress bulk upsert bodies of at least this size, disabled when unset
+    upsert_entities_batch_gzip_min_size_in_bytes: Optional[int] = None
     lakehouse_enabled: bool = False
     yield_items_to_parse: bool = True
     yield_items_to_parse_batch_size: int = 10
@@ -139,6 +176,13 @@ class IntegrationConfiguration(BaseOceanSettings, extra=Extra.allow):
     actions_processor: ActionsProcessorSettings = Field(
         default_factory=lambda: ActionsProcessorSettings()
     )
+    resync_checkpoint: ResyncCheckpointSettings = Field(
+        default_factory=lambda: ResyncCheckpointSettings()
+    )
+    tracing: TracingSettings = Field(default_factory=lambda: TracingSettings())
+    memory_profiling: MemoryProfilingSettings = Field(
+        default_factory=lambda: MemoryProfilingSettings()
+    )
 
     @validator("process_execution_mode")
     def validate_process_execution_mode(
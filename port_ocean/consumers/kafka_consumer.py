@@ -1,9 +1,12 @@
+import asyncio
 import functools
 import signal
-from asyncio import get_running_loop, ensure_future
-from typing import Any, Callable, Awaitable
+import threading
+import time
+from asyncio import get_running_loop
+from typing import Any, Callable, Awaitable, Hashable
 
-from confluent_kafka import Consumer, KafkaException, Message  # type: ignore
+from confluent_kafka import Consumer, KafkaException, Message, TopicPartition  # type: ignore
 from loguru import logger
 from pydantic import BaseModel
 
@@ -17,6 +20,94 @@ class KafkaConsumerConfig(BaseModel):
     authentication_mechanism: str
     kafka_security_enabled: bool
     consumer_poll_timeout: int
+    consumer_batch_size: int = 100
+    consumer_max_concurrency: int = 10
+    consumer_commit_interval: float = 5.0
+
+
+PartitionKey = tuple[str, int]
+
+
+def _partition_key(msg: Message) -> PartitionKey:
+    topic, partition = msg.topic(), msg.partition()
+    if topic is None or partition is None:
+        raise ValueError("Consumed message has no topic partition")
+    return topic, partition
+
+
+def _offset(msg: Message) -> int:
+    offset = msg.offset()
+    if offset is None:
+        raise ValueError("Consumed message has no offset")
+    return offset
+
+
+class OffsetTracker:
+    """
+    Tracks the offsets in flight per partition and the position safe to commit.
+
+    Messages of a partition may finish out of order when they have different keys, so
+    the committed position of a partition is the lowest offset still in flight, or the
+    offset after the last handled message once nothing is in flight. A message is thus
+    never acknowledged before it and every message before it were handled.
+
+    The consumer's rebalance callbacks run on the polling thread, so the state is
+    guarded by a lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[PartitionKey, set[int]] = {}
+        self._handled_up_to: dict[PartitionKey, int] = {}
+        self._committed: dict[PartitionKey, int] = {}
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return sum(len(offsets) for offsets in self._in_flight.values())
+
+    def add(self, msg: Message) -> None:
+        with self._lock:
+            self._in_flight.setdefault(_partition_key(msg), set()).add(_offset(msg))
+
+    def done(self, msg: Message) -> None:
+        partition = _partition_key(msg)
+        offset = _offset(msg)
+        with self._lock:
+            in_flight = self._in_flight.get(partition)
+            if in_flight is None:
+                # The partition was revoked while the message was being handled
+                return
+            in_flight.discard(offset)
+            self._handled_up_to[partition] = max(
+                self._handled_up_to.get(partition, -1), offset + 1
+            )
+
+    def pop_commit_positions(
+        self, partitions: list[PartitionKey] | None = None
+    ) -> list[TopicPartition]:
+        """Return the positions that moved since the last commit, marking them committed."""
+        positions = []
+        with self._lock:
+            for partition in partitions or list(self._in_flight):
+                in_flight = self._in_flight.get(partition)
+                if in_flight:
+                    position = min(in_flight)
+                elif partition in self._handled_up_to:
+                    position = self._handled_up_to[partition]
+                else:
+                    continue
+                if position > self._committed.get(partition, -1):
+                    self._committed[partition] = position
+                    positions.append(TopicPartition(*partition, position))
+        return positions
+
+    def forget(self, partitions: list[PartitionKey]) -> None:
+        with self._lock:
+            for partition in partitions:
+                self._in_flight.pop(partition, None)
+                self._handled_up_to.pop(partition, None)
+                self._committed.pop(partition, None)
 
 
 class KafkaConsumer:
@@ -28,8 +119,14 @@ class KafkaConsumer:
     ) -> None:
         self.running = False
         self._assigned_partitions = False
+        self._closed = False
+        self._paused = False
         self.org_id = org_id
         self.config = config
+        self._offsets = OffsetTracker()
+        self._handler_semaphore = asyncio.Semaphore(config.consumer_max_concurrency)
+        self._key_tails: dict[Hashable, asyncio.Task[None]] = {}
+        self._last_commit_time = time.monotonic()
 
         self.msg_process = msg_process
         if config.kafka_security_enabled:
@@ -46,12 +143,14 @@ class KafkaConsumer:
                 # can be assigned to a partition at a time and we dont want a running instance to lose its partitions
                 # when a new instance starts and causes a rebalance.
                 "partition.assignment.strategy": "cooperative-sticky",
+                "on_commit": self._handle_commit,
             }
         else:
             kafka_config = {
                 "bootstrap.servers": config.brokers,
                 "group.id": "no-security",
                 "enable.auto.commit": "false",
+                "on_commit": self._handle_commit,
             }
 
         self.consumer = Consumer(kafka_config)
@@ -69,6 +168,102 @@ class KafkaConsumer:
         else:
             self._assigned_partitions = True
 
+    def _handle_partitions_revocation(
+        self, _: Any, partitions: list[TopicPartition]
+    ) -> None:
+        logger.info(f"Revoked partitions: {partitions}")
+        revoked = [(partition.topic, partition.partition) for partition in partitions]
+        # Handlers of revoked partitions keep running, but only offsets that were
+        # fully handled are committed before the partitions move to another consumer
+        self._commit(self._offsets.pop_commit_positions(revoked), asynchronous=False)
+        self._offsets.forget(revoked)
+
+    def _handle_commit(self, error: Any, partitions: list[TopicPartition]) -> None:
+        if error is not None:
+            logger.error(f"Failed to commit offsets {partitions}: {error}")
+
+    def _commit(
+        self, positions: list[TopicPartition], asynchronous: bool = True
+    ) -> None:
+        if not positions or self._closed:
+            return
+        try:
+            if asynchronous:
+                self.consumer.commit(offsets=positions, asynchronous=True)
+            else:
+                self.consumer.commit(offsets=positions, asynchronous=False)
+        except KafkaException as commit_error:
+            logger.error(f"Failed to commit offsets {positions}: {commit_error}")
+
+    def _commit_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._last_commit_time < self.config.consumer_commit_interval:
+            return
+        self._last_commit_time = now
+        self._commit(self._offsets.pop_commit_positions())
+
+    def _ordering_key(self, msg: Message) -> Hashable:
+        # Keyless messages keep their partition's order
+        key = msg.key()
+        return (msg.topic(), key) if key is not None else _partition_key(msg)
+
+    def _dispatch(self, msg: Message) -> None:
+        """Schedule a message after the previous message with the same key."""
+        key = self._ordering_key(msg)
+        previous = self._key_tails.get(key)
+        self._offsets.add(msg)
+        task = asyncio.create_task(self._process_in_order(msg, previous))
+        self._key_tails[key] = task
+        task.add_done_callback(functools.partial(self._release_key, key))
+
+    def _release_key(self, key: Hashable, task: asyncio.Task[None]) -> None:
+        if self._key_tails.get(key) is task:
+            del self._key_tails[key]
+
+    async def _process_in_order(
+        self, msg: Message, previous: asyncio.Task[None] | None
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+        async with self._handler_semaphore:
+            try:
+                logger.info(
+                    "Process message "
+                    f"from topic {msg.topic()}, partition {msg.partition()}, offset {msg.offset()}"
+                )
+                await self.msg_process(msg)
+            except Exception as process_error:
+                # The listener's handler catches resync failures itself, so a message
+                # that still raises, e.g. one that cannot be decoded, would fail the same
+                # way when redelivered. It is logged and counted as handled, rather than
+                # holding back the committed position of its partition forever.
+                logger.exception(
+                    "Failed process message"
+                    f" from topic {msg.topic()}, partition {msg.partition()}, offset {msg.offset()}: {str(process_error)}"
+                )
+            finally:
+                self._offsets.done(msg)
+
+    def _apply_backpressure(self) -> None:
+        """
+        Pause fetching while too many messages are in flight.
+
+        The consumer keeps calling `consume` while paused, so it stays in the group
+        even when handlers run longer than the max poll interval.
+        """
+        max_in_flight = (
+            self.config.consumer_max_concurrency + self.config.consumer_batch_size
+        )
+        in_flight = self._offsets.in_flight
+        if not self._paused and in_flight >= max_in_flight:
+            self.consumer.pause(self.consumer.assignment())
+            self._paused = True
+            logger.info(f"Pausing the kafka consumer, {in_flight} messages in flight")
+        elif self._paused and in_flight < max_in_flight:
+            self.consumer.resume(self.consumer.assignment())
+            self._paused = False
+            logger.info("Resuming the kafka consumer")
+
     async def start(self) -> None:
         self.running = True
         logger.info("Starting kafka consumer...")
@@ -76,36 +271,27 @@ class KafkaConsumer:
         self.consumer.subscribe(
             topics,
             on_assign=self._handle_partitions_assignment,
+            on_revoke=self._handle_partitions_revocation,
         )
         logger.info(f"Subscribed to topics: {topics}")
 
         loop = get_running_loop()
-        poll = functools.partial(
-            self.consumer.poll, timeout=self.config.consumer_poll_timeout
+        consume = functools.partial(
+            self.consumer.consume,
+            num_messages=self.config.consumer_batch_size,
+            timeout=self.config.consumer_poll_timeout,
         )
         try:
             while self.running:
                 try:
-                    msg = await loop.run_in_executor(None, poll)
-                    if msg is None:
-                        continue
-                    if msg.error():
-                        raise KafkaException(msg.error())
-                    else:
-                        try:
-                            logger.info(
-                                "Process message "
-                                f"from topic {msg.topic()}, partition {msg.partition()}, offset {msg.offset()}"
-                            )
-                            ensure_future(self.msg_process(msg))
-
-                        except Exception as process_error:
-                            logger.exception(
-                                "Failed process message"
-                                f" from topic {msg.topic()}, partition {msg.partition()}, offset {msg.offset()}: {str(process_error)}"
-                            )
-                        finally:
-                            self.consumer.commit(asynchronous=False)
+                    messages = await loop.run_in_executor(None, consume)
+                    for msg in messages:
+                        if msg.error():
+                            logger.error(str(KafkaException(msg.error())))
+                            continue
+                        self._dispatch(msg)
+                    self._apply_backpressure()
+                    self._commit_if_due()
                 except Exception as message_error:
                     logger.error(str(message_error))
         finally:
@@ -113,6 +299,11 @@ class KafkaConsumer:
             self.exit_gracefully()
 
     def exit_gracefully(self, *_: Any) -> None:
+        if self._closed:
+            return
         logger.info("Closing the kafka consumer gracefully...")
         self.running = False
+        # Messages still being handled are redelivered after a restart
+        self._commit(self._offsets.pop_commit_positions(), asynchronous=False)
+        self._closed = True
         self.consumer.close()
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from functools import partial
 from typing import TypedDict, Callable, Any, Awaitable
 
 from pydantic import Extra
@@ -62,10 +63,23 @@ class BaseEventListener:
     async def _resync(
         self,
         resync_args: dict[Any, Any],
+        trigger: str = "event_listener",
+        check_mapping: bool = False,
     ) -> None:
         """
-        Triggers the "on_resync" event.
+        Triggers the "on_resync" event through the resync coordinator.
+
+        A trigger that arrives while another resync is running is collapsed into a
+        single follow-up resync. Triggers that may carry a mapping change should set
+        `check_mapping`, so a running resync of an outdated mapping is restarted.
         """
+        await ocean.app.resync_coordinator.request(
+            partial(self._run_resync, resync_args),
+            trigger=trigger,
+            check_mapping=check_mapping,
+        )
+
+    async def _run_resync(self, resync_args: dict[Any, Any]) -> bool:
         await self._before_resync()
         try:
             resync_succeeded = await self.events["on_resync"](resync_args)
@@ -73,6 +87,7 @@ class BaseEventListener:
                 await self._after_resync()
             else:
                 await self._on_resync_failure(Exception("Resync failed"))
+            return resync_succeeded
         except Exception as e:
             await self._on_resync_failure(e)
             raise e
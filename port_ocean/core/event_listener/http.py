@@ -73,6 +73,6 @@ class HttpEventListener(BaseEventListener):
 
         @target_channel_router.post("/resync")
         async def resync() -> None:
-            await self._resync({})
+            await self._resync({}, trigger="http")
 
         ocean.app.fast_api_app.include_router(target_channel_router)
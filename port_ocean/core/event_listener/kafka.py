@@ -37,6 +37,12 @@ class KafkaEventListenerSettings(EventListenerSettings):
                                        The default value is True.
         consumer_poll_timeout (int): The maximum time in seconds to wait for messages during a poll.
                                      The default value is 1 second.
+        consumer_batch_size (int): The maximum number of messages fetched in a single consume call.
+                                   The default value is 100.
+        consumer_max_concurrency (int): The maximum number of messages handled concurrently. Messages with
+                                        the same key are always handled in order. The default value is 10.
+        consumer_commit_interval (float): The interval in seconds between asynchronous commits of handled offsets.
+                                          The default value is 5 seconds.
     """
 
     type: Literal[EventListenerType.KAFKA]
@@ -47,6 +53,9 @@ class KafkaEventListenerSettings(EventListenerSettings):
     authentication_mechanism: str = "SCRAM-SHA-512"
     kafka_security_enabled: bool = True
     consumer_poll_timeout: int = 1
+    consumer_batch_size: int = 100
+    consumer_max_concurrency: int = 10
+    consumer_commit_interval: float = 5.0
 
     @validator("brokers")
     @classmethod
@@ -154,7 +163,7 @@ class KafkaEventListener(BaseEventListener):
 
         if "change.log" in topic and message is not None:
             try:
-                await self._resync(message)
+                await self._resync(message, trigger="kafka", check_mapping=True)
             except Exception as e:
                 _type, _, tb = sys.exc_info()
                 logger.opt(exception=(_type, None, tb)).error(
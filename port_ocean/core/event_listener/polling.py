@@ -1,5 +1,4 @@
-from asyncio import Task, get_event_loop
-from typing import Any, Literal
+from typing import Literal
 
 from loguru import logger
 
@@ -11,7 +10,6 @@ from port_ocean.core.event_listener.base import (
 )
 from port_ocean.core.models import EventListenerType
 from port_ocean.utils.repeat import repeat_every
-from port_ocean.utils.signal import signal_handler
 
 
 class PollingEventListenerSettings(EventListenerSettings):
@@ -81,10 +79,7 @@ class PollingEventListener(BaseEventListener):
                 ocean.app.resync_state_updater.last_integration_state_updated_at = (
                     last_updated_at
                 )
-                running_task: Task[Any] = get_event_loop().create_task(self._resync({}))
-                signal_handler.register(running_task.cancel)
-
-                await running_task
+                await self._resync({}, trigger="polling", check_mapping=True)
 
         # Execute resync repeatedly task
         await resync()
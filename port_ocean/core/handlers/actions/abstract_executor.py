@@ -21,6 +21,10 @@ class AbstractExecutor(ABC):
             in the integration's `.port/spec.yaml` file.
         PARTITION_KEY (str): The key used to partition action runs for concurrent execution.
             If provided, runs with the same partition key value will be executed sequentially.
+        PARTITION_CONCURRENCY (int): How many runs of the same partition may execute at once,
+            defaults to 1 for sequential execution.
+        PARTITION_WEIGHT (int): How many runs a partition of this action gets to start in
+            its turn of the round-robin across partitions, relative to other partitions.
         WEBHOOK_PROCESSOR_CLASS (Optional[Type[AbstractWebhookProcessor]]): The webhook processor
             class used to handle asynchronous action status updates.
         WEBHOOK_PATH (str): The URL path where webhook events for this action should be sent.
@@ -53,6 +57,8 @@ class AbstractExecutor(ABC):
     """
 
     ACTION_NAME: str
+    PARTITION_CONCURRENCY: int = 1
+    PARTITION_WEIGHT: int = 1
     WEBHOOK_PROCESSOR_CLASS: Optional[Type[AbstractWebhookProcessor]]
     WEBHOOK_PATH: str
 
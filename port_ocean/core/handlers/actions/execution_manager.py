@@ -7,13 +7,13 @@ from port_ocean.core.models import (
 )
 import asyncio
 from port_ocean.core.handlers.actions.abstract_executor import AbstractExecutor
-from port_ocean.core.handlers.queue.abstract_queue import AbstractQueue
-from port_ocean.core.handlers.queue.local_queue import LocalQueue
+from port_ocean.core.handlers.actions.partition_scheduler import PartitionScheduler
 from port_ocean.core.handlers.webhook.processor_manager import (
     LiveEventsProcessorManager,
 )
 from port_ocean.context.ocean import ocean
 from port_ocean.core.models import IntegrationFeatureFlag
+from port_ocean.helpers.metric.metric import MetricType
 from port_ocean.exceptions.execution_manager import (
     DuplicateActionExecutorError,
     PartitionKeyNotFoundError,
@@ -22,8 +22,8 @@ from port_ocean.exceptions.execution_manager import (
 from port_ocean.utils.signal import SignalHandler
 
 RATE_LIMIT_MAX_BACKOFF_SECONDS = 10
-QUEUE_GET_TIMEOUT_SECONDS = 1
 GLOBAL_SOURCE = "__global__"
+MAX_IDLE_BACKOFF_EXPONENT = 16
 
 
 class ExecutionManager:
@@ -32,10 +32,13 @@ class ExecutionManager:
 
     The manager uses a queue-based system with support for:
     - Global queue for non-partitioned actions
-    - Partition-specific queues for actions requiring sequential execution
-    - Round-robin worker distribution
+    - Partition-specific queues for actions requiring sequential execution, or a limited
+      concurrency, dropped once idle
+    - Weighted round-robin worker distribution
     - Deduplication of runs
     - High watermark-based flow control
+    - Adaptive polling, re-polling at once while runs keep arriving and backing off exponentially when idle
+    - Optional lease extensions that keep a run from being reclaimed while it waits on rate limits or executes
 
     Attributes:
         _webhook_manager (LiveEventsProcessorManager): Manages webhook processors for async updates
@@ -43,15 +46,17 @@ class ExecutionManager:
         _workers_pool (set[asyncio.Task[None]]): Pool of worker tasks processing runs
         _actions_executors (Dict[str, AbstractExecutor]): Registered action executors
         _is_shutting_down (asyncio.Event): Event flag for graceful shutdown
-        _global_queue (LocalQueue[ActionRun]): Queue for non-partitioned actions
-        _partition_queues (Dict[str, AbstractQueue[ActionRun]]): Queues for partitioned actions
-        _deduplication_set (Set[str]): Set of run IDs for deduplication
-        _queues_locks (Dict[str, asyncio.Lock]): Locks for queue access synchronization
-        _active_sources (AbstractQueue[str]): Queue of active sources (global or partition-specific) used for round-robin distribution of work among workers
+        _scheduler (PartitionScheduler): Queues runs in the global queue and in partitions, and schedules them across workers
+        _deduplication_set (Set[str]): Set of queued and executing run IDs for deduplication
         _workers_count (int): Number of workers to start
         _high_watermark (int): Maximum total runs in all queues
-        _poll_check_interval_seconds (int): Seconds between polling attempts
+        _poll_check_interval_seconds (int): Longest wait between polling attempts
+        _poll_idle_backoff_initial_seconds (float): Wait after the first poll that returned no runs
+        _long_poll_timeout_ms (int): How long Port may hold a claim request open, 0 disables long polling
         _visibility_timeout_ms (int): Visibility timeout for runs
+        _lease_extension_interval_seconds (float | None): Seconds between lease extensions of a run, None disables them
+        _runs_claimed_at (Dict[str, float]): Monotonic claim time of queued runs, for the claim-to-start latency
+        _capacity_available (asyncio.Event): Set when a worker takes a run, to re-poll once the buffer drains
         _max_wait_seconds_before_shutdown (float): Maximum wait time during shutdown
 
     Example:
@@ -84,22 +89,31 @@ class ExecutionManager:
         poll_check_interval_seconds: int,
         visibility_timeout_ms: int,
         max_wait_seconds_before_shutdown: float,
+        poll_idle_backoff_initial_seconds: float = 0.5,
+        long_poll_timeout_ms: int = 0,
+        lease_extension_interval_ms: int = 0,
     ):
         self._webhook_manager = webhook_manager
         self._polling_task: asyncio.Task[None] | None = None
         self._workers_pool: set[asyncio.Task[None]] = set[asyncio.Task[None]]()
         self._actions_executors: Dict[str, AbstractExecutor] = {}
         self._is_shutting_down = asyncio.Event()
-        self._global_queue = LocalQueue[ActionRun]()
-        self._partition_queues: Dict[str, AbstractQueue[ActionRun]] = {}
+        self._scheduler = PartitionScheduler()
         self._deduplication_set: Set[str] = set[str]()
-        self._queues_locks: Dict[str, asyncio.Lock] = {GLOBAL_SOURCE: asyncio.Lock()}
-        self._active_sources: AbstractQueue[str] = LocalQueue[str]()
         self._workers_count: int = workers_count
         self._high_watermark: int = runs_buffer_high_watermark
         self._poll_check_interval_seconds: int = poll_check_interval_seconds
         self._visibility_timeout_ms: int = visibility_timeout_ms
         self._max_wait_seconds_before_shutdown: float = max_wait_seconds_before_shutdown
+        self._poll_idle_backoff_initial_seconds: float = (
+            poll_idle_backoff_initial_seconds
+        )
+        self._long_poll_timeout_ms: int = long_poll_timeout_ms
+        self._lease_extension_interval_seconds: float | None = (
+            lease_extension_interval_ms / 1000 if lease_extension_interval_ms else None
+        )
+        self._runs_claimed_at: Dict[str, float] = {}
+        self._capacity_available = asyncio.Event()
 
         signal_handler.register(self.shutdown)
 
@@ -156,38 +170,35 @@ class ExecutionManager:
     async def _poll_action_runs(self) -> None:
         """
         Poll action runs for all registered actions.
-        Respects high watermark for queue size management.
+        Respects high watermark for queue size management, re-polls at once while runs keep
+        arriving and backs off exponentially while there are none.
         """
+        idle_polls = 0
         while True:
             try:
                 # Yield control to the event loop to handle any pending cancellation requests.
                 await asyncio.sleep(0)
-                queues_size = await self._get_queues_size()
+                self._capacity_available.clear()
+                queues_size = self._scheduler.size
                 if queues_size >= self._high_watermark:
                     logger.info(
                         "Queue size at high watermark, waiting for processing to catch up",
                         current_size=queues_size,
                         high_watermark=self._high_watermark,
                     )
-                    await asyncio.sleep(self._poll_check_interval_seconds)
+                    await self._wait_for_capacity()
                     continue
 
                 poll_limit = self._high_watermark - queues_size
-                runs: list[ActionRun] = await ocean.port_client.claim_pending_runs(
-                    limit=poll_limit,
-                    visibility_timeout_ms=self._visibility_timeout_ms,
-                )
+                poll_started_at = time.monotonic()
+                runs = await self._claim_pending_runs(poll_limit)
 
-                if not runs:
-                    logger.debug(
-                        "No runs to process, waiting for next poll",
-                        current_size=queues_size,
-                        high_watermark=self._high_watermark,
+                claimed_at = time.monotonic()
+                queued_runs_count = 0
+                if runs:
+                    logger.info(
+                        f"Adding {len(runs)} runs to queues", runs_count=len(runs)
                     )
-                    await asyncio.sleep(self._poll_check_interval_seconds)
-                    continue
-
-                logger.info(f"Adding {len(runs)} runs to queues", runs_count=len(runs))
                 for run in runs:
                     try:
                         action_type = run.payload.integrationActionType
@@ -215,7 +226,9 @@ class ExecutionManager:
                             if not partition_key
                             else f"{action_type}:{partition_key}"
                         )
-                        await self._add_run_to_queue(run, queue_name)
+                        self._add_run_to_queue(run, queue_name)
+                        self._runs_claimed_at[run.id] = claimed_at
+                        queued_runs_count += 1
                     except PartitionKeyNotFoundError as e:
                         logger.warning(
                             "Partition key not found in invocation payload, skipping run...",
@@ -230,212 +243,249 @@ class ExecutionManager:
                             action_type=action_type,
                             error=e,
                         )
+
+                if queued_runs_count:
+                    idle_polls = 0
+                    continue
+
+                # Back off as well when all claimed runs were skipped, e.g. runs already being processed
+                idle_polls += 1
+                backoff_seconds = self._get_idle_backoff_seconds(idle_polls)
+                logger.debug(
+                    "No runs to process, waiting for next poll",
+                    current_size=queues_size,
+                    high_watermark=self._high_watermark,
+                    backoff_seconds=backoff_seconds,
+                )
+                # A long poll has already waited for part of the backoff
+                await asyncio.sleep(
+                    max(0, backoff_seconds - (claimed_at - poll_started_at))
+                )
             except Exception as e:
                 logger.exception(
                     "Unexpected error in poll action runs, will attempt to re-poll",
                     error=e,
                 )
+                idle_polls += 1
+                await asyncio.sleep(self._get_idle_backoff_seconds(idle_polls))
+
+    async def _claim_pending_runs(self, limit: int) -> list[ActionRun]:
+        if not self._long_poll_timeout_ms:
+            return await ocean.port_client.claim_pending_runs(
+                limit=limit,
+                visibility_timeout_ms=self._visibility_timeout_ms,
+            )
+        return await ocean.port_client.claim_pending_runs(
+            limit=limit,
+            visibility_timeout_ms=self._visibility_timeout_ms,
+            wait_time_ms=self._long_poll_timeout_ms,
+        )
 
-    async def _get_queues_size(self) -> int:
+    def _get_idle_backoff_seconds(self, idle_polls: int) -> float:
         """
-        Get the total size of all queues (global and partition queues).
+        Exponential backoff after consecutive polls that returned no runs, capped at the poll
+        check interval.
         """
-        global_size = await self._global_queue.size()
-        partition_sizes = []
-        for queue in self._partition_queues.values():
-            partition_sizes.append(await queue.size())
-        return global_size + sum(partition_sizes)
+        exponent = min(idle_polls - 1, MAX_IDLE_BACKOFF_EXPONENT)
+        return min(
+            self._poll_check_interval_seconds,
+            self._poll_idle_backoff_initial_seconds * 2**exponent,
+        )
 
-    async def _add_run_to_queue(
-        self,
-        run: ActionRun,
-        queue_name: str,
-    ) -> None:
+    async def _wait_for_capacity(self) -> None:
         """
-        Add a run to the queue, if the queue is empty, add the source to the active sources.
+        Wait until a worker takes a run off the queues, or for the poll check interval.
         """
-        if queue_name != GLOBAL_SOURCE and queue_name not in self._partition_queues:
-            self._partition_queues[queue_name] = LocalQueue[ActionRun]()
-            self._queues_locks[queue_name] = asyncio.Lock()
-
-        queue = (
-            self._global_queue
-            if queue_name == GLOBAL_SOURCE
-            else self._partition_queues[queue_name]
-        )
-        async with self._queues_locks[queue_name]:
-            if await queue.size() == 0:
-                await self._active_sources.put(queue_name)
-                self._deduplication_set.add(run.id)
-            logger.info(
-                f"Adding run to queue {queue_name}",
-                run_id=run.id,
-                queue_name=queue_name,
+        try:
+            await asyncio.wait_for(
+                self._capacity_available.wait(),
+                timeout=self._poll_check_interval_seconds,
             )
-            await queue.put(run)
+        except asyncio.TimeoutError:
+            pass
 
-    async def _add_source_if_not_empty(self, source_name: str) -> None:
+    def _add_run_to_queue(self, run: ActionRun, queue_name: str) -> None:
         """
-        Add a source back to the active sources if the queue is not empty.
+        Queue a run in its partition, with the weight and concurrency limit of its executor.
+        Runs of the global queue execute concurrently.
         """
-        async with self._queues_locks[source_name]:
-            queue = (
-                self._global_queue
-                if source_name == GLOBAL_SOURCE
-                else self._partition_queues[source_name]
-            )
-
-            queue_size = await queue.size()
-            if queue_size > 0:
-                logger.debug(
-                    f"Adding source {source_name} back to active sources as it's not empty",
-                    source_name=source_name,
-                    queue_size=queue_size,
-                )
-                await self._active_sources.put(source_name)
+        if queue_name == GLOBAL_SOURCE:
+            weight, concurrency_limit = 1, None
+        else:
+            executor = self._actions_executors[run.payload.integrationActionType]
+            weight = executor.PARTITION_WEIGHT
+            concurrency_limit = executor.PARTITION_CONCURRENCY
+
+        logger.info(
+            f"Adding run to queue {queue_name}",
+            run_id=run.id,
+            queue_name=queue_name,
+        )
+        self._scheduler.put(queue_name, run, weight, concurrency_limit)
+        self._deduplication_set.add(run.id)
 
     async def _process_actions_runs(self) -> None:
         """
-        Round-robin worker across global and partitions queues.
+        Worker taking runs from the partition scheduler, in weighted round-robin across the
+        global and partitions queues.
         """
         while not self._is_shutting_down.is_set():
             try:
-                # Enable graceful worker shutdown when there are no active sources to process
-                # Using asyncio.Queue.get without a timeout would block indefinitely if active sources are empty
-                try:
-                    source = await asyncio.wait_for(
-                        self._active_sources.get(),
-                        timeout=self._max_wait_seconds_before_shutdown / 3,
-                    )
-                    logger.debug(
-                        f"Processing run from {source} queue",
-                        queue_size=await self._get_queues_size(),
-                    )
-                except asyncio.TimeoutError:
-                    continue
+                # Enable graceful worker shutdown when there are no runs to process
+                await asyncio.wait_for(
+                    self._scheduler.wait_until_ready(),
+                    timeout=self._max_wait_seconds_before_shutdown / 3,
+                )
+            except asyncio.TimeoutError:
+                continue
 
-                if source == GLOBAL_SOURCE:
-                    await self._handle_global_queue_once()
-                else:
-                    await self._handle_partition_queue_once(source)
+            try:
+                await self._process_next_run()
             except Exception as e:
-                logger.exception("Worker processing error", source=source, error=e)
-
-    async def _handle_global_queue_once(self) -> None:
-        """
-        Try to process a single run from the global queue.
-        """
-        try:
-            async with self._queues_locks[GLOBAL_SOURCE]:
-                try:
-                    logger.debug("Handling run from global queue")
-                    run = await asyncio.wait_for(
-                        self._global_queue.get(), timeout=QUEUE_GET_TIMEOUT_SECONDS
-                    )
-                except asyncio.TimeoutError:
-                    logger.debug("Global queue is empty, skipping")
-                    return
-
-                if run.id in self._deduplication_set:
-                    self._deduplication_set.remove(run.id)
-
-            await self._add_source_if_not_empty(GLOBAL_SOURCE)
-            await self._execute_run(run)
-        finally:
-            await self._global_queue.commit()
+                logger.exception("Worker processing error", error=e)
 
-    async def _handle_partition_queue_once(self, partition_name: str) -> None:
+    async def _process_next_run(self) -> bool:
         """
-        Try to process a single run from the given partition queue.
+        Take the next scheduled run and execute it, returns False if no run was ready.
         """
-        queue = self._partition_queues[partition_name]
+        scheduled = self._scheduler.take()
+        if scheduled is None:
+            return False
+
+        partition_name, run = scheduled
+        logger.debug(
+            f"Processing run from {partition_name} queue",
+            queue_size=self._scheduler.size,
+            partitions_count=self._scheduler.partitions_count,
+        )
+        self._capacity_available.set()
         try:
-            async with self._queues_locks[partition_name]:
-                try:
-                    logger.debug(f"Handling run from {partition_name} queue")
-                    run = await asyncio.wait_for(
-                        queue.get(), timeout=QUEUE_GET_TIMEOUT_SECONDS
-                    )
-                    if run.id in self._deduplication_set:
-                        self._deduplication_set.remove(run.id)
-                except asyncio.TimeoutError:
-                    logger.debug(f"Partition queue {partition_name} is empty, skipping")
-                    return
-
             await self._execute_run(run)
         finally:
-            await queue.commit()
-            await self._add_source_if_not_empty(partition_name)
+            self._deduplication_set.discard(run.id)
+            self._scheduler.done(partition_name)
+        return True
 
     async def _execute_run(self, run: ActionRun) -> None:
         """
-        Execute a run using its registered executor.
+        Execute a run using its registered executor, extending its lease meanwhile.
         """
         with logger.contextualize(
             run_id=run.id, action=run.payload.integrationActionType
         ):
-            error_summary: str | None = None
+            # Started before the rate limit wait, which can outlast the visibility timeout
+            lease_extension_task = (
+                asyncio.create_task(self._extend_lease_periodically(run))
+                if self._lease_extension_interval_seconds is not None
+                else None
+            )
             try:
-                executor = self._actions_executors[run.payload.integrationActionType]
-                while (
-                    await executor.is_close_to_rate_limit()
-                    and not self._is_shutting_down.is_set()
-                ):
-                    backoff_seconds = min(
-                        RATE_LIMIT_MAX_BACKOFF_SECONDS,
-                        await executor.get_remaining_seconds_until_rate_limit(),
-                    )
-                    logger.info(
-                        "Encountered rate limit, will attempt to re-run in {backoff_seconds} seconds",
-                        backoff_seconds=backoff_seconds,
-                    )
-                    await ocean.port_client.post_run_log(
-                        run.id,
-                        f"Delayed due to low remaining rate limit. Will attempt to re-run in {backoff_seconds} seconds",
-                    )
-                    await asyncio.sleep(backoff_seconds)
+                await self._acknowledge_and_execute_run(run)
+            finally:
+                await self._gracefully_cancel_task(lease_extension_task)
 
-                if self._is_shutting_down.is_set():
-                    logger.warning(
-                        "Shutting down execution manager, skipping execution"
-                    )
-                    return
-
-                await ocean.port_client.acknowledge_run(run.id)
-                logger.info("Run acknowledged successfully")
-            except RunAlreadyAcknowledgedError:
-                logger.warning(
-                    "Run already being processed by another worker, skipping execution",
+    async def _acknowledge_and_execute_run(self, run: ActionRun) -> None:
+        error_summary: str | None = None
+        claimed_at = self._runs_claimed_at.pop(run.id, None)
+        try:
+            executor = self._actions_executors[run.payload.integrationActionType]
+            while (
+                await executor.is_close_to_rate_limit()
+                and not self._is_shutting_down.is_set()
+            ):
+                backoff_seconds = min(
+                    RATE_LIMIT_MAX_BACKOFF_SECONDS,
+                    await executor.get_remaining_seconds_until_rate_limit(),
                 )
-                return
-            except Exception as e:
-                logger.error(
-                    "Error occurred while trying to trigger run execution",
-                    error=e,
+                logger.info(
+                    "Encountered rate limit, will attempt to re-run in {backoff_seconds} seconds",
+                    backoff_seconds=backoff_seconds,
+                )
+                await ocean.port_client.post_run_log(
+                    run.id,
+                    f"Delayed due to low remaining rate limit. Will attempt to re-run in {backoff_seconds} seconds",
                 )
-                error_summary = "Failed to trigger run execution"
+                await asyncio.sleep(backoff_seconds)
+
+            if self._is_shutting_down.is_set():
+                logger.warning("Shutting down execution manager, skipping execution")
+                return
 
+            await ocean.port_client.acknowledge_run(run.id)
+            logger.info("Run acknowledged successfully")
+        except RunAlreadyAcknowledgedError:
+            logger.warning(
+                "Run already being processed by another worker, skipping execution",
+            )
+            return
+        except Exception as e:
+            logger.error(
+                "Error occurred while trying to trigger run execution",
+                error=e,
+            )
+            error_summary = "Failed to trigger run execution"
+
+        try:
+            start_time = time.monotonic()
+            if claimed_at is not None:
+                self._report_claim_to_start_latency(run, start_time - claimed_at)
+            await executor.execute(run)
+            logger.info(
+                "Run executed successfully",
+                elapsed_ms=(time.monotonic() - start_time) * 1000,
+            )
+        except Exception as e:
+            logger.exception("Error executing run", error=e)
+            error_summary = f"Failed to execute run: {str(e)}"
+
+        if error_summary:
+            await ocean.port_client.patch_run(
+                run.id,
+                {
+                    "summary": error_summary,
+                    "status": RunStatus.FAILURE,
+                },
+                should_raise=False,
+            )
+
+    async def _extend_lease_periodically(self, run: ActionRun) -> None:
+        """
+        Extend the visibility timeout of a run before it expires, so it isn't reclaimed and
+        executed again while it waits on rate limits or its executor is still running.
+        """
+        assert self._lease_extension_interval_seconds is not None
+        action = run.payload.integrationActionType
+        while True:
+            await asyncio.sleep(self._lease_extension_interval_seconds)
             try:
-                start_time = time.monotonic()
-                await executor.execute(run)
-                logger.info(
-                    "Run executed successfully",
-                    elapsed_ms=(time.monotonic() - start_time) * 1000,
+                extended = await ocean.port_client.extend_run_visibility(
+                    run.id, self._visibility_timeout_ms
                 )
             except Exception as e:
-                logger.exception("Error executing run", error=e)
-                error_summary = f"Failed to execute run: {str(e)}"
-
-            if error_summary:
-                await ocean.port_client.patch_run(
-                    run.id,
-                    {
-                        "summary": error_summary,
-                        "status": RunStatus.FAILURE,
-                    },
-                    should_raise=False,
+                logger.warning("Failed to extend run lease", error=e)
+                extended = False
+
+            if ocean.initialized:
+                ocean.metrics.inc_metric(
+                    name=MetricType.ACTION_LEASE_EXTENSION_NAME,
+                    labels=[action, "success" if extended else "failure"],
+                    value=1,
                 )
 
+    def _report_claim_to_start_latency(
+        self, run: ActionRun, latency_seconds: float
+    ) -> None:
+        logger.debug(
+            "Starting run execution",
+            claim_to_start_latency_ms=latency_seconds * 1000,
+        )
+        if ocean.initialized:
+            ocean.metrics.set_metric(
+                name=MetricType.ACTION_CLAIM_TO_START_LATENCY_NAME,
+                labels=[run.payload.integrationActionType],
+                value=latency_seconds,
+            )
+
     async def _gracefully_cancel_task(self, task: asyncio.Task[None] | None) -> None:
         """
         Gracefully cancel a task.
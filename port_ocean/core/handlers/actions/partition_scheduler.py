@@ -0,0 +1,120 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+
+from port_ocean.core.models import ActionRun
+
+
+@dataclass(slots=True)
+class _Partition:
+    name: str
+    weight: int
+    concurrency_limit: int | None
+    runs: deque[ActionRun] = field(default_factory=deque)
+    in_flight: int = 0
+    credits: int = 0
+    scheduled: bool = False
+
+    @property
+    def is_ready(self) -> bool:
+        return bool(self.runs) and (
+            self.concurrency_limit is None or self.in_flight < self.concurrency_limit
+        )
+
+
+class PartitionScheduler:
+    """
+    Schedules queued action runs across partitions.
+
+    Partitions that have queued runs and are below their concurrency limit are kept in a ready
+    ring, and served in weighted round-robin: the partition at the front of the ring hands out
+    up to `weight` runs before it moves to the back. A partition only exists while it has
+    queued or executing runs, and is dropped once its last run is done, so every operation is
+    O(1) and memory is bounded by the runs in the buffer rather than by the number of distinct
+    partition keys ever seen.
+
+    All methods but `wait_until_ready` are synchronous, so no lock is needed when they are
+    called from tasks of the same event loop.
+    """
+
+    def __init__(self) -> None:
+        self._partitions: dict[str, _Partition] = {}
+        self._ready: deque[_Partition] = deque()
+        self._has_ready = asyncio.Event()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The number of queued runs, across all partitions"""
+        return self._size
+
+    @property
+    def partitions_count(self) -> int:
+        """The number of partitions with queued or executing runs"""
+        return len(self._partitions)
+
+    def put(
+        self,
+        partition_name: str,
+        run: ActionRun,
+        weight: int = 1,
+        concurrency_limit: int | None = 1,
+    ) -> None:
+        """
+        Queue a run in a partition, creating it with the given weight and concurrency limit
+        (None for no limit) if it doesn't exist.
+        """
+        partition = self._partitions.get(partition_name)
+        if partition is None:
+            partition = _Partition(
+                name=partition_name,
+                weight=max(1, weight),
+                concurrency_limit=concurrency_limit,
+            )
+            self._partitions[partition_name] = partition
+
+        partition.runs.append(run)
+        self._size += 1
+        self._schedule(partition)
+
+    def take(self) -> tuple[str, ActionRun] | None:
+        """
+        Take the next run to execute and the name of its partition, or None if no partition
+        is ready. `done` must be called with the partition name once the run is executed.
+        """
+        if not self._ready:
+            return None
+
+        partition = self._ready[0]
+        run = partition.runs.popleft()
+        self._size -= 1
+        partition.in_flight += 1
+        partition.credits -= 1
+        if partition.credits <= 0 or not partition.is_ready:
+            self._ready.popleft()
+            partition.scheduled = False
+            self._schedule(partition)
+        if not self._ready:
+            self._has_ready.clear()
+        return partition.name, run
+
+    def done(self, partition_name: str) -> None:
+        """Release a run taken from a partition, dropping the partition if it is idle"""
+        partition = self._partitions[partition_name]
+        partition.in_flight -= 1
+        if not partition.runs and not partition.in_flight:
+            del self._partitions[partition_name]
+            return
+        self._schedule(partition)
+
+    async def wait_until_ready(self) -> None:
+        """Wait until a run can be taken, another waiter may take it first"""
+        await self._has_ready.wait()
+
+    def _schedule(self, partition: _Partition) -> None:
+        if partition.scheduled or not partition.is_ready:
+            return
+        partition.credits = partition.weight
+        partition.scheduled = True
+        self._ready.append(partition)
+        self._has_ready.set()
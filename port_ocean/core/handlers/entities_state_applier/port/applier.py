@@ -12,6 +12,7 @@ from port_ocean.core.handlers.entities_state_applier.port.get_related_entities i
 from port_ocean.context.ocean import ocean
 from port_ocean.helpers.metric.metric import MetricType, MetricPhase
 from port_ocean.helpers.metric.utils import TimeMetric
+from port_ocean.helpers.tracing import traced
 from port_ocean.core.models import Entity
 from port_ocean.core.ocean_types import EntityDiff
 from port_ocean.core.utils.entity_topological_sorter import EntityTopologicalSorter
@@ -27,6 +28,13 @@ class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
     """
 
     @TimeMetric(MetricPhase.DELETE)
+    @traced(
+        "delete",
+        "reconcile",
+        lambda self, entities_to_delete, *args, **kwargs: {
+            "entities": len(entities_to_delete)
+        },
+    )
     async def _safe_delete(
         self,
         entities_to_delete: list[Entity],
@@ -130,6 +138,11 @@ class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
                 total_entities=len(entities),
             )
 
+    @traced(
+        "load",
+        "load",
+        lambda self, entities, *args, **kwargs: {"entities": len(entities)},
+    )
     async def upsert(
         self, entities: list[Entity], user_agent_type: UserAgentType
     ) -> list[Entity]:
@@ -140,21 +153,19 @@ class HttpEntitiesStateApplier(BaseEntitiesStateApplier):
         for entity in entities:
             blueprint_groups[entity.blueprint].append(entity)
 
-        for blueprint_entities in blueprint_groups.values():
-            upserted_entities = (
-                await self.context.port_client.upsert_entities_in_batches(
-                    blueprint_entities,
-                    event.port_app_config.get_port_request_options(),
-                    user_agent_type,
-                    should_raise=False,
-                )
-            )
+        # Blueprint groups are upserted concurrently, with their batches interleaved fairly
+        upserted_entities = await self.context.port_client.upsert_entities_by_blueprint(
+            blueprint_groups,
+            event.port_app_config.get_port_request_options(),
+            user_agent_type,
+            should_raise=False,
+        )
 
-            for is_upserted, entity in upserted_entities:
-                if is_upserted:
-                    modified_entities.append(entity)
-                else:
-                    event.entity_topological_sorter.register_entity(entity)
+        for is_upserted, entity in upserted_entities:
+            if is_upserted:
+                modified_entities.append(entity)
+            else:
+                event.entity_topological_sorter.register_entity(entity)
 
         return modified_entities
 
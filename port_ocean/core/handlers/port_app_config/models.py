@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -95,6 +97,11 @@ class PortAppConfig(BaseModel):
             mapping["entityDeletionThreshold"] = self.entity_deletion_threshold
         return mapping
 
+    def fingerprint(self) -> str:
+        """A stable hash of the mapping, used to tell whether it changed."""
+        raw_mapping = json.dumps(self.dict(), sort_keys=True, default=str)
+        return hashlib.sha256(raw_mapping.encode()).hexdigest()
+
     class Config:
         allow_population_by_field_name = True
         validate_assignment = True
@@ -0,0 +1,19 @@
+from .checkpoint import (
+    RESYNC_CHECKPOINT_ATTRIBUTE,
+    GeneratorCheckpoint,
+    ResyncCheckpoint,
+    ResyncCheckpointStore,
+    ResyncCheckpointTracker,
+    get_resume_cursor,
+    set_page_cursor,
+)
+
+__all__ = [
+    "RESYNC_CHECKPOINT_ATTRIBUTE",
+    "GeneratorCheckpoint",
+    "ResyncCheckpoint",
+    "ResyncCheckpointStore",
+    "ResyncCheckpointTracker",
+    "get_resume_cursor",
+    "set_page_cursor",
+]
@@ -0,0 +1,302 @@
+import asyncio
+import os
+import pickle
+import tempfile
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from loguru import logger
+
+from port_ocean.context.event import event
+from port_ocean.core.models import Entity
+from port_ocean.exceptions.context import EventContextNotFoundError
+
+RESYNC_CHECKPOINT_ATTRIBUTE = "resync_checkpoint"
+CHECKPOINT_FILE_NAME = "checkpoint.pkl"
+
+# (blueprint, identifier), all the reconciliation needs to keep an entity
+EntityKey = tuple[str, Any]
+
+_current_generator: ContextVar[str | None] = ContextVar(
+    "resync_checkpoint_generator", default=None
+)
+
+
+@dataclass
+class GeneratorCheckpoint:
+    """Progress of one resync async generator of a kind.
+
+    `cursor` is the cursor the integration set for the last page whose entities were
+    registered at Port, and `entities` are the keys of every entity registered from
+    the generator so far.
+    """
+
+    cursor: Any = None
+    entities: list[EntityKey] = field(default_factory=list)
+
+
+@dataclass
+class ResyncCheckpoint:
+    mapping_fingerprint: str
+    started_at: float = field(default_factory=time.time)
+    completed_kinds: dict[str, list[EntityKey]] = field(default_factory=dict)
+    generators: dict[str, GeneratorCheckpoint] = field(default_factory=dict)
+
+    def is_expired(self, max_age_hours: float) -> bool:
+        return time.time() - self.started_at > max_age_hours * 3600
+
+
+def to_entity_keys(entities: Iterable[Entity]) -> list[EntityKey]:
+    return [(entity.blueprint, entity.identifier) for entity in entities]
+
+
+def from_entity_keys(keys: Iterable[EntityKey]) -> list[Entity]:
+    return [
+        Entity(blueprint=blueprint, identifier=identifier)
+        for blueprint, identifier in keys
+    ]
+
+
+class ResyncCheckpointStore:
+    """Persists the checkpoint of the running resync to a local directory.
+
+    Checkpoints are written to a temporary file and moved into place, so a pod killed
+    in the middle of a write leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, location: str) -> None:
+        self._directory = Path(location)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._path = self._directory / CHECKPOINT_FILE_NAME
+
+    def load(self) -> ResyncCheckpoint | None:
+        if not self._path.exists():
+            return None
+        try:
+            with open(self._path, "rb") as f:
+                checkpoint = pickle.load(f)
+        except (pickle.PickleError, EOFError, OSError, AttributeError) as e:
+            logger.warning(f"Failed to read the resync checkpoint {self._path}: {e}")
+            return None
+        return checkpoint if isinstance(checkpoint, ResyncCheckpoint) else None
+
+    def save(self, checkpoint: ResyncCheckpoint) -> None:
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(checkpoint, f)
+            os.replace(temp_path, self._path)
+        except (pickle.PickleError, OSError) as e:
+            logger.warning(f"Failed to write the resync checkpoint {self._path}: {e}")
+
+    def clear(self) -> None:
+        try:
+            self._path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove the resync checkpoint {self._path}: {e}")
+
+
+class ResyncCheckpointTracker:
+    """
+    Records the progress of a resync so a restarted resync resumes where it stopped.
+
+    Kinds that finished without errors are skipped on resume and contribute the
+    entity keys they registered to the reconciliation. Only the keys are kept, and
+    checkpoints are written from a thread, so saving doesn't block the event loop. Inside a kind, async
+    generators that expose a page cursor through `set_page_cursor` and resume from
+    `get_resume_cursor` skip the pages that were already registered; the keys of the
+    entities from those pages are carried over, so the reconciliation still deletes
+    only entities that no longer exist.
+    """
+
+    def __init__(
+        self,
+        store: ResyncCheckpointStore,
+        checkpoint: ResyncCheckpoint,
+        save_interval_seconds: float,
+    ) -> None:
+        self.store = store
+        self.checkpoint = checkpoint
+        self.save_interval_seconds = save_interval_seconds
+        self._last_saved_at = 0.0
+        self._save_lock = asyncio.Lock()
+        self._previous_generators: dict[str, GeneratorCheckpoint] = {}
+        self._resumed_generators: set[str] = set()
+        self._pending_cursors: dict[str, Any] = {}
+        self._failed_generators: set[str] = set()
+
+    @classmethod
+    def start(
+        cls,
+        store: ResyncCheckpointStore,
+        mapping_fingerprint: str,
+        save_interval_seconds: float,
+        max_age_hours: float,
+    ) -> "ResyncCheckpointTracker":
+        checkpoint = store.load()
+        if (
+            checkpoint is not None
+            and checkpoint.mapping_fingerprint == mapping_fingerprint
+            and not checkpoint.is_expired(max_age_hours)
+        ):
+            logger.info(
+                "Resuming an interrupted resync from its checkpoint",
+                completed_kinds=list(checkpoint.completed_kinds),
+                resumable_generators=len(checkpoint.generators),
+            )
+        else:
+            if checkpoint is not None:
+                logger.info(
+                    "Discarding the resync checkpoint, the mapping changed or it expired"
+                )
+            checkpoint = ResyncCheckpoint(mapping_fingerprint)
+            store.save(checkpoint)
+        return cls(store, checkpoint, save_interval_seconds)
+
+    def get_completed_kind(self, kind_id: str) -> list[Entity] | None:
+        keys = self.checkpoint.completed_kinds.get(kind_id)
+        return None if keys is None else from_entity_keys(keys)
+
+    async def complete_kind(
+        self, kind_id: str, result: tuple[list[Entity], list[Exception]]
+    ) -> None:
+        entities, errors = result
+        if errors:
+            # Failed kinds run again in full, but keep their page progress
+            return
+        self.checkpoint.completed_kinds[kind_id] = to_entity_keys(entities)
+        for key in [
+            key for key in self.checkpoint.generators if key.startswith(f"{kind_id}/")
+        ]:
+            del self.checkpoint.generators[key]
+        await self.save(force=True)
+
+    def reload(self) -> None:
+        """Pick up progress saved by a resource processed in a subprocess."""
+        checkpoint = self.store.load()
+        if (
+            checkpoint is not None
+            and checkpoint.mapping_fingerprint == self.checkpoint.mapping_fingerprint
+        ):
+            self.checkpoint = checkpoint
+
+    @contextmanager
+    def track_generator(self, kind_id: str, index: int) -> Iterator[None]:
+        key = f"{kind_id}/{index}"
+        previous = self.checkpoint.generators.pop(key, None)
+        if previous is not None:
+            self._previous_generators[key] = previous
+        self.checkpoint.generators[key] = GeneratorCheckpoint()
+        token = _current_generator.set(key)
+        try:
+            yield
+        finally:
+            _current_generator.reset(token)
+
+    def get_resume_cursor(self, key: str) -> Any:
+        previous = self._previous_generators.get(key)
+        if previous is None or previous.cursor is None:
+            return None
+        current = self.checkpoint.generators[key]
+        current.cursor = previous.cursor
+        current.entities = list(previous.entities)
+        self._resumed_generators.add(key)
+        logger.info(
+            f"Resuming resync generator {key} after {len(previous.entities)} registered entities"
+        )
+        return previous.cursor
+
+    def set_page_cursor(self, key: str, cursor: Any) -> None:
+        self._pending_cursors[key] = cursor
+
+    async def commit_page(self, entities: list[Entity], failed: bool = False) -> None:
+        """
+        Record a page of the current generator once its entities were registered.
+
+        After a page fails, the generator's cursor stops advancing so a resumed resync
+        fetches that page again.
+        """
+        key = _current_generator.get()
+        if key is None:
+            return
+        generator = self.checkpoint.generators.setdefault(key, GeneratorCheckpoint())
+        generator.entities.extend(to_entity_keys(entities))
+        cursor = self._pending_cursors.pop(key, None)
+        if failed:
+            self._failed_generators.add(key)
+        elif cursor is not None and key not in self._failed_generators:
+            generator.cursor = cursor
+        await self.save()
+
+    def resumed_entities(self, kind_id: str) -> list[Entity]:
+        """Keys of the entities registered before the restart by the generators that resumed."""
+        return from_entity_keys(
+            entity_key
+            for key in self._resumed_generators
+            if key.startswith(f"{kind_id}/")
+            for entity_key in self._previous_generators[key].entities
+        )
+
+    async def save(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and (
+            now - self._last_saved_at < self.save_interval_seconds
+            or self._save_lock.locked()
+        ):
+            return
+        async with self._save_lock:
+            self._last_saved_at = now
+            await asyncio.to_thread(self.store.save, self._snapshot())
+
+    def _snapshot(self) -> ResyncCheckpoint:
+        """A copy that the event loop can keep extending while it is pickled in a thread."""
+        return ResyncCheckpoint(
+            mapping_fingerprint=self.checkpoint.mapping_fingerprint,
+            started_at=self.checkpoint.started_at,
+            completed_kinds=dict(self.checkpoint.completed_kinds),
+            generators={
+                key: GeneratorCheckpoint(generator.cursor, list(generator.entities))
+                for key, generator in self.checkpoint.generators.items()
+            },
+        )
+
+    def clear(self) -> None:
+        self.store.clear()
+
+
+def _get_tracker() -> ResyncCheckpointTracker | None:
+    try:
+        return event.attributes.get(RESYNC_CHECKPOINT_ATTRIBUTE)
+    except EventContextNotFoundError:
+        return None
+
+
+def get_resume_cursor() -> Any:
+    """
+    Return the cursor to resume the current resync generator from, if any.
+
+    Integrations call this before fetching their first page. A value is only
+    returned when an interrupted resync of the same mapping committed pages of this
+    generator, in which case fetching should continue after that cursor.
+    """
+    tracker = _get_tracker()
+    key = _current_generator.get()
+    if tracker is None or key is None:
+        return None
+    return tracker.get_resume_cursor(key)
+
+
+def set_page_cursor(cursor: Any) -> None:
+    """
+    Set the cursor to resume from once the page about to be yielded is registered.
+
+    The cursor should point after the page, e.g. the next page URL or token.
+    """
+    tracker = _get_tracker()
+    key = _current_generator.get()
+    if tracker is not None and key is not None:
+        tracker.set_page_cursor(key, cursor)
@@ -0,0 +1,5 @@
+from .coordinator import ResyncCoordinator
+
+__all__ = [
+    "ResyncCoordinator",
+]
@@ -0,0 +1,225 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine
+
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricType
+
+ResyncJob = Callable[[], Coroutine[Any, Any, bool]]
+MappingFingerprint = Callable[[], Coroutine[Any, Any, str | None]]
+
+
+class ResyncQueueState:
+    RUNNING = "running"
+    PENDING = "pending"
+    PENDING_TRIGGERS = "pending_triggers"
+    COALESCED = "coalesced"
+    RESTARTED = "restarted"
+
+
+class ResyncLatencyStage:
+    QUEUE_WAIT = "queue_wait"
+    RUN = "run"
+
+
+@dataclass
+class ResyncRequest:
+    job: ResyncJob
+    trigger: str
+    requested_at: float = field(default_factory=time.monotonic)
+    waiters: list["asyncio.Future[bool]"] = field(default_factory=list)
+
+
+class ResyncCoordinator:
+    """
+    Runs at most one full resync at a time, whatever triggered it.
+
+    Triggers that arrive while a resync is running are collapsed into a single
+    follow-up resync, which runs the job of the latest trigger once the current one
+    finishes. Every caller awaits the resync that covers its trigger and receives its
+    result. A trigger that may carry a mapping change can ask to check the mapping:
+    when it differs from the one the running resync started with, that resync is
+    cancelled and the follow-up starts right away instead of syncing a stale mapping
+    to completion.
+    """
+
+    def __init__(self, mapping_fingerprint: MappingFingerprint | None = None) -> None:
+        self._mapping_fingerprint = mapping_fingerprint
+        self._running: ResyncRequest | None = None
+        self._running_task: asyncio.Task[bool] | None = None
+        self._running_fingerprint: str | None = None
+        self._pending: ResyncRequest | None = None
+        self._driver: asyncio.Task[None] | None = None
+        self._restarting = False
+        self._stopped = False
+        self.coalesced = 0
+        self.restarted = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._running is not None
+
+    @property
+    def has_pending(self) -> bool:
+        return self._pending is not None
+
+    async def request(
+        self, job: ResyncJob, trigger: str, check_mapping: bool = False
+    ) -> bool:
+        """Request a resync and wait for the resync that covers it to finish."""
+        waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        if self._pending is None:
+            self._pending = ResyncRequest(job, trigger, waiters=[waiter])
+        else:
+            self.coalesced += 1
+            logger.info(
+                f"A resync is already pending, collapsing the {trigger} trigger into it"
+            )
+            self._pending.job = job
+            self._pending.trigger = trigger
+            self._pending.waiters.append(waiter)
+        pending = self._pending
+
+        if self._running is not None:
+            logger.info(
+                f"Resync triggered by {trigger} will run after the current resync"
+            )
+            running = self._running
+            if (
+                check_mapping
+                and await self._mapping_changed()
+                # The running resync may have finished meanwhile, and the pending one
+                # started with the new mapping
+                and self._running is running
+                and self._pending is pending
+            ):
+                self._restart_running()
+
+        if self._stopped:
+            self._cancel_waiters(pending)
+            self._pending = None
+        elif self._driver is None or self._driver.done():
+            self._driver = asyncio.create_task(self._drive())
+        self._report_queue()
+
+        # Shielded so a caller going away does not cancel a resync shared with others
+        return await asyncio.shield(waiter)
+
+    def cancel(self) -> None:
+        """Cancel the running resync and every pending one, e.g. on shutdown."""
+        self._stopped = True
+        if self._driver is not None:
+            self._driver.cancel()
+
+    async def _drive(self) -> None:
+        while self._pending is not None and not self._stopped:
+            request, self._pending = self._pending, None
+            self._running = request
+            started_at = time.monotonic()
+            self._report_latency(
+                request.trigger,
+                ResyncLatencyStage.QUEUE_WAIT,
+                started_at - request.requested_at,
+            )
+            self._running_fingerprint = None
+            self._report_queue()
+            try:
+                self._running_fingerprint = await self._get_fingerprint()
+                self._running_task = asyncio.create_task(request.job())
+                result = await self._running_task
+            except asyncio.CancelledError:
+                if self._restarting and not self._stopped:
+                    # The waiters were moved to the follow-up resync
+                    continue
+                if self._running_task is not None:
+                    self._running_task.cancel()
+                self._cancel_waiters(request)
+                if self._pending is not None:
+                    self._cancel_waiters(self._pending)
+                    self._pending = None
+                raise
+            except Exception as e:
+                for waiter in request.waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+            else:
+                for waiter in request.waiters:
+                    if not waiter.done():
+                        waiter.set_result(result)
+            finally:
+                self._report_latency(
+                    request.trigger,
+                    ResyncLatencyStage.RUN,
+                    time.monotonic() - started_at,
+                )
+                self._running = None
+                self._running_task = None
+                self._restarting = False
+                self._report_queue()
+        if self._pending is not None:
+            self._cancel_waiters(self._pending)
+            self._pending = None
+
+    def _restart_running(self) -> None:
+        if self._running is None or self._running_task is None or self._restarting:
+            return
+        assert self._pending is not None
+        logger.warning(
+            "The mapping changed while a resync was running, cancelling it and "
+            "starting a new resync"
+        )
+        self.restarted += 1
+        self._pending.waiters.extend(self._running.waiters)
+        self._running.waiters = []
+        self._pending.requested_at = min(
+            self._pending.requested_at, self._running.requested_at
+        )
+        self._restarting = True
+        self._running_task.cancel()
+
+    async def _mapping_changed(self) -> bool:
+        fingerprint = await self._get_fingerprint()
+        return (
+            fingerprint is not None
+            and self._running_fingerprint is not None
+            and fingerprint != self._running_fingerprint
+        )
+
+    async def _get_fingerprint(self) -> str | None:
+        if self._mapping_fingerprint is None:
+            return None
+        try:
+            return await self._mapping_fingerprint()
+        except Exception as e:
+            logger.warning(f"Failed to fetch the mapping to compare resyncs: {e}")
+            return None
+
+    @staticmethod
+    def _cancel_waiters(request: ResyncRequest) -> None:
+        for waiter in request.waiters:
+            waiter.cancel()
+        request.waiters = []
+
+    def _report_queue(self) -> None:
+        pending_triggers = len(self._pending.waiters) if self._pending else 0
+        for state, value in (
+            (ResyncQueueState.RUNNING, int(self.is_running)),
+            (ResyncQueueState.PENDING, int(self.has_pending)),
+            (ResyncQueueState.PENDING_TRIGGERS, pending_triggers),
+            (ResyncQueueState.COALESCED, self.coalesced),
+            (ResyncQueueState.RESTARTED, self.restarted),
+        ):
+            ocean.metrics.set_metric(
+                name=MetricType.RESYNC_QUEUE_NAME, labels=[state], value=value
+            )
+
+    @staticmethod
+    def _report_latency(trigger: str, stage: str, seconds: float) -> None:
+        ocean.metrics.set_metric(
+            name=MetricType.RESYNC_LATENCY_NAME,
+            labels=[trigger, stage],
+            value=seconds,
+        )
@@ -4,6 +4,7 @@ import uuid
 from graphlib import CycleError
 import inspect
 import typing
+from contextlib import nullcontext
 from typing import Callable, Awaitable, Any
 import multiprocessing
 import httpx
@@ -15,6 +16,11 @@ from port_ocean.context.ocean import ocean
 from port_ocean.context.resource import resource_context
 from port_ocean.context import resource
 from port_ocean.core.handlers.port_app_config.models import ResourceConfig
+from port_ocean.core.handlers.resync_checkpoint import (
+    RESYNC_CHECKPOINT_ATTRIBUTE,
+    ResyncCheckpointStore,
+    ResyncCheckpointTracker,
+)
 from port_ocean.core.integrations.mixins import HandlerMixin, EventsMixin
 from port_ocean.core.integrations.mixins.utils import (
     ProcessWrapper,
@@ -48,7 +54,9 @@ from port_ocean.helpers.metric.metric import (
     MetricType,
     MetricPhase,
 )
+from port_ocean.helpers.metric.memory import MemoryStage, memory_profiler
 from port_ocean.helpers.metric.utils import TimeMetric, TimeMetricWithResourceKind
+from port_ocean.helpers.tracing import traced, tracer
 from port_ocean.utils.ipc import FileIPC
 
 SEND_RAW_DATA_EXAMPLES_AMOUNT = 5
@@ -142,6 +150,13 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
 
         return results, errors
 
+    @traced(
+        "transform",
+        "transform",
+        lambda self, raw_diff, *args, **kwargs: {
+            "raw_items": sum(len(results) for _, results in raw_diff)
+        },
+    )
     async def _calculate_raw(
         self,
         raw_diff: list[tuple[ResourceConfig, list[RAW_ITEM]]],
@@ -182,6 +197,11 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             ],
         }
 
+    @traced(
+        "compare with port",
+        "load",
+        lambda self, entities, *args, **kwargs: {"entities": len(entities)},
+    )
     async def _map_entities_compared_with_port(
         self,
         entities: list[Entity],
@@ -325,6 +345,9 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 objects_diff[0].entity_selector_diff.passed, user_agent_type
             )
 
+        memory_profiler.sample(
+            ocean.metrics.current_resource_kind(), MemoryStage.BATCH
+        )
         return CalculationResult(
             number_of_transformed_entities=len(
                 objects_diff[0].entity_selector_diff.passed
@@ -399,34 +422,52 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 f"Finished registering change for {len(raw_results)} raw results for kind: {resource_config.kind}. {len(passed_entities)} entities were affected"
             )
 
-        for generator in async_generators:
+        checkpoint: ResyncCheckpointTracker | None = event.attributes.get(
+            RESYNC_CHECKPOINT_ATTRIBUTE
+        )
+        kind_id = f"{resource_config.kind}-{resource.resource.index}"
+        for generator_index, generator in enumerate(async_generators):
             try:
-                async for items in generator:
-                    if lakehouse_data_enabled:
-                        await ocean.port_client.post_integration_raw_data(items, event.id, resource_config.kind)
-                    number_of_raw_results += len(items)
-                    if send_raw_data_examples_amount > 0:
-                        send_raw_data_examples_amount = max(
-                            0, send_raw_data_examples_amount - len(passed_entities)
+                with (
+                    checkpoint.track_generator(kind_id, generator_index)
+                    if checkpoint
+                    else nullcontext()
+                ):
+                    async for items in generator:
+                        if lakehouse_data_enabled:
+                            await ocean.port_client.post_integration_raw_data(items, event.id, resource_config.kind)
+                        number_of_raw_results += len(items)
+                        if send_raw_data_examples_amount > 0:
+                            send_raw_data_examples_amount = max(
+                                0, send_raw_data_examples_amount - len(passed_entities)
+                            )
+
+                        calculation_result = await self._register_resource_raw(
+                            resource_config,
+                            items,
+                            user_agent_type,
+                            send_raw_data_examples_amount=send_raw_data_examples_amount,
                         )
-
-                    calculation_result = await self._register_resource_raw(
-                        resource_config,
-                        items,
-                        user_agent_type,
-                        send_raw_data_examples_amount=send_raw_data_examples_amount,
-                    )
-                    passed_entities.extend(
-                        calculation_result.entity_selector_diff.passed
-                    )
-                    errors.extend(calculation_result.errors)
-                    number_of_transformed_entities += (
-                        calculation_result.number_of_transformed_entities
-                    )
+                        passed_entities.extend(
+                            calculation_result.entity_selector_diff.passed
+                        )
+                        errors.extend(calculation_result.errors)
+                        number_of_transformed_entities += (
+                            calculation_result.number_of_transformed_entities
+                        )
+                        if checkpoint:
+                            await checkpoint.commit_page(
+                                calculation_result.entity_selector_diff.passed,
+                                failed=bool(calculation_result.errors),
+                            )
             except* OceanAbortException as error:
                 ocean.metrics.sync_state = SyncState.FAILED
                 errors.append(error)
 
+        if checkpoint:
+            passed_entities.extend(checkpoint.resumed_entities(kind_id))
+            await checkpoint.save(force=True)
+
         logger.info(
             f"Finished registering kind: {resource_config.kind}-{resource.resource.index} ,{len(passed_entities)} entities out of {number_of_raw_results} raw results"
         )
@@ -708,6 +749,8 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         )
 
         clear_http_client_context()
+        # Only keep the spans recorded in this process, the parent already has the rest
+        tracer.collect()
 
         async def process_resource_task() -> None:
             result = await self._process_resource(resource, index, user_agent_type)
@@ -715,10 +758,20 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             file_ipc_map["topological_entities"].save(
                 event.entity_topological_sorter.entities
             )
+            if "trace_spans" in file_ipc_map:
+                file_ipc_map["trace_spans"].save(tracer.collect())
 
         asyncio.run(process_resource_task())
         logger.info(f"Process finished for {resource.kind} with index {index}")
 
+    @traced(
+        "kind",
+        "resync",
+        lambda self, resource, index, *args, **kwargs: {
+            "kind": resource.kind,
+            "index": index,
+        },
+    )
     async def _process_resource(
         self, resource: ResourceConfig, index: int, user_agent_type: UserAgentType
     ) -> tuple[list[Entity], list[Exception]]:
@@ -726,24 +779,28 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         # config as we might have multiple resources in the same event
         async with resource_context(resource, index):
             resource_kind_id = f"{resource.kind}-{index}"
-            ocean.metrics.sync_state = SyncState.SYNCING
-            await ocean.metrics.report_kind_sync_metrics(
-                kind=resource_kind_id, blueprint=resource.port.entity.mappings.blueprint
-            )
-
-            task = asyncio.create_task(
-                self._register_in_batches(resource, user_agent_type)
-            )
-            event.on_abort(lambda: task.cancel())
-
+            memory_profiler.start_kind(resource_kind_id)
             try:
-                kind_results: tuple[list[Entity], list[Exception]] = await task
-                if ocean.metrics.sync_state != SyncState.FAILED:
-                    ocean.metrics.sync_state = SyncState.COMPLETED
-            except asyncio.CancelledError:
-                logger.warning(f"Resource {resource.kind} processing was aborted")
-                ocean.metrics.sync_state = SyncState.ABORTED
-                raise
+                ocean.metrics.sync_state = SyncState.SYNCING
+                await ocean.metrics.report_kind_sync_metrics(
+                    kind=resource_kind_id, blueprint=resource.port.entity.mappings.blueprint
+                )
+
+                task = asyncio.create_task(
+                    self._register_in_batches(resource, user_agent_type)
+                )
+                event.on_abort(lambda: task.cancel())
+
+                try:
+                    kind_results: tuple[list[Entity], list[Exception]] = await task
+                    if ocean.metrics.sync_state != SyncState.FAILED:
+                        ocean.metrics.sync_state = SyncState.COMPLETED
+                except asyncio.CancelledError:
+                    logger.warning(f"Resource {resource.kind} processing was aborted")
+                    ocean.metrics.sync_state = SyncState.ABORTED
+                    raise
+            finally:
+                memory_profiler.end_kind(resource_kind_id)
 
             await ocean.metrics.send_metrics_to_webhook(kind=resource_kind_id)
             await ocean.metrics.report_kind_sync_metrics(
@@ -764,6 +821,7 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
         logger.info("Resync reconciliation subprocess started successfully")
 
         clear_http_client_context()
+        tracer.collect()
 
         async def resync_reconciliation_task() -> None:
             result = await self._resync_reconciliation(
@@ -774,6 +832,8 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 silent,
             )
             file_ipc_map["resync_reconciliation"].save(result)
+            if "trace_spans" in file_ipc_map:
+                file_ipc_map["trace_spans"].save(tracer.collect())
 
         asyncio.run(resync_reconciliation_task())
         logger.info("Resync reconciliation subprocess finished")
@@ -802,6 +862,8 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                         str(id), "topological_entities", []
                     ),
                 }
+                if tracer.active:
+                    file_ipc_map["trace_spans"] = FileIPC(str(id), "trace_spans", [])
                 process = ProcessWrapper(
                     target=self.process_resource_in_subprocess,
                     args=(file_ipc_map, resource, index, user_agent_type),
@@ -812,12 +874,15 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 event.entity_topological_sorter.entities.extend(
                     file_ipc_map["topological_entities"].load()
                 )
+                if "trace_spans" in file_ipc_map:
+                    tracer.extend(file_ipc_map["trace_spans"].load())
                 return file_ipc_map["process_resource"].load()
 
             else:
                 return await self._process_resource(resource, index, user_agent_type)
 
     @TimeMetricWithResourceKind(MetricPhase.RESYNC)
+    @traced("reconciliation", "reconcile")
     async def _resync_reconciliation(
         self,
         creation_results: list[tuple[list[Entity], list[Exception]]],
@@ -844,43 +909,51 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             silent (bool): Whether to raise exceptions or handle them silently
 
         """
-        await self.sort_and_upsert_failed_entities(user_agent_type)
+        memory_profiler.start_kind(
+            MetricResourceKind.RECONCILIATION, MemoryStage.RECONCILIATION_START
+        )
+        try:
+            await self.sort_and_upsert_failed_entities(user_agent_type)
 
-        if not did_fetched_current_state:
-            logger.warning(
-                "Due to an error before the resync, the previous state of entities at Port is unknown."
-                " Skipping delete phase due to unknown initial state."
-            )
-            return False
+            if not did_fetched_current_state:
+                logger.warning(
+                    "Due to an error before the resync, the previous state of entities at Port is unknown."
+                    " Skipping delete phase due to unknown initial state."
+                )
+                return False
 
-        logger.info("Starting resync diff calculation")
-        generated_entities, errors = zip_and_sum(creation_results) or [
-            [],
-            [],
-        ]
+            logger.info("Starting resync diff calculation")
+            generated_entities, errors = zip_and_sum(creation_results) or [
+                [],
+                [],
+            ]
 
-        if errors:
-            message = f"Resync failed with {len(errors)} errors, skipping delete phase due to incomplete state"
-            error_group = ExceptionGroup(
-                message,
-                errors,
-            )
-            if not silent:
-                raise error_group
+            if errors:
+                message = f"Resync failed with {len(errors)} errors, skipping delete phase due to incomplete state"
+                error_group = ExceptionGroup(
+                    message,
+                    errors,
+                )
+                if not silent:
+                    raise error_group
 
-            logger.error(message, exc_info=error_group)
-            return False
+                logger.error(message, exc_info=error_group)
+                return False
 
-        logger.info(
-            f"Running resync diff calculation, number of entities created during sync: {len(generated_entities)}"
-        )
-        entities_at_port = await ocean.port_client.search_entities(user_agent_type)
+            logger.info(
+                f"Running resync diff calculation, number of entities created during sync: {len(generated_entities)}"
+            )
+            entities_at_port = await ocean.port_client.search_entities(user_agent_type)
 
-        await self.entities_state_applier.delete_diff(
-            {"before": entities_at_port, "after": generated_entities},
-            user_agent_type,
-            app_config.get_entity_deletion_threshold(),
-        )
+            await self.entities_state_applier.delete_diff(
+                {"before": entities_at_port, "after": generated_entities},
+                user_agent_type,
+                app_config.get_entity_deletion_threshold(),
+            )
+        finally:
+            memory_profiler.end_kind(
+                MetricResourceKind.RECONCILIATION, MemoryStage.RECONCILIATION_END
+            )
 
         logger.info("Resync finished successfully")
 
@@ -912,6 +985,8 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                     str(id), "resync_reconciliation", False
                 ),
             }
+            if tracer.active:
+                file_ipc_map["trace_spans"] = FileIPC(str(id), "trace_spans", [])
 
             process = ProcessWrapper(
                 target=self.resync_reconciliation_in_subprocess,
@@ -927,6 +1002,8 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             process.start()
             await process.join_async()
 
+            if "trace_spans" in file_ipc_map:
+                tracer.extend(file_ipc_map["trace_spans"].load())
             return file_ipc_map["resync_reconciliation"].load()
         else:
             return await self._resync_reconciliation(
@@ -937,7 +1014,28 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 silent,
             )
 
+    def _start_resync_checkpoint(
+        self, app_config: Any
+    ) -> ResyncCheckpointTracker | None:
+        settings = ocean.config.resync_checkpoint
+        if not settings.enabled:
+            return None
+        return ResyncCheckpointTracker.start(
+            ResyncCheckpointStore(settings.location),
+            app_config.fingerprint(),
+            settings.save_interval_seconds,
+            settings.max_age_hours,
+        )
+
     @TimeMetric(MetricPhase.RESYNC)
+    @traced(
+        "resync",
+        "resync",
+        lambda self, _=None, trigger_type="machine", *args, **kwargs: {
+            "trigger_type": trigger_type
+        },
+        root=True,
+    )
     async def sync_raw_all(
         self,
         _: dict[Any, Any] | None = None,
@@ -990,6 +1088,10 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
             # Clear cache
             await ocean.app.cache_provider.clear()
 
+            checkpoint = self._start_resync_checkpoint(app_config)
+            if checkpoint:
+                event.attributes[RESYNC_CHECKPOINT_ATTRIBUTE] = checkpoint
+
             # Execute resync_start hooks
             for resync_start_fn in self.event_strategy["resync_start"]:
                 await resync_start_fn()
@@ -1015,12 +1117,31 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                 multiprocessing.set_start_method("fork", True)
             try:
                 for index, resource in enumerate(app_config.resources):
+                    kind_id = f"{resource.kind}-{index}"
+                    completed_entities = (
+                        checkpoint.get_completed_kind(kind_id) if checkpoint else None
+                    )
+                    if completed_entities is not None:
+                        logger.info(
+                            f"Skipping resource {resource.kind} with index {index}, it was completed before the resync was interrupted"
+                        )
+                        creation_results.append((completed_entities, []))
+                        continue
+
                     logger.info(
                         f"Starting processing resource {resource.kind} with index {index}"
                     )
-                    creation_results.append(
-                        await self.process_resource(resource, index, user_agent_type)
+                    kind_result = await self.process_resource(
+                        resource, index, user_agent_type
                     )
+                    creation_results.append(kind_result)
+                    if checkpoint:
+                        if (
+                            ocean.app.process_execution_mode
+                            == ProcessExecutionMode.multi_process
+                        ):
+                            checkpoint.reload()
+                        await checkpoint.complete_kind(kind_id, kind_result)
             except asyncio.CancelledError as e:
                 logger.warning(
                     "Resync aborted successfully, skipping delete phase. This leads to an incomplete state"
@@ -1071,6 +1192,9 @@ class SyncRawMixin(HandlerMixin, EventsMixin):
                     await ocean.metrics.send_metrics_to_webhook(kind=MetricResourceKind.RECONCILIATION)
                     await ocean.metrics.report_sync_metrics(kinds=[MetricResourceKind.RECONCILIATION])
 
+                if checkpoint:
+                    # The resync ran to the end, the next one starts from scratch
+                    checkpoint.clear()
                 return success
             finally:
                 await ocean.app.cache_provider.clear()
@@ -29,6 +29,7 @@ from port_ocean.exceptions.core import (
     KindNotImplementedException,
 )
 from port_ocean.helpers.metric.metric import MetricType, MetricPhase
+from port_ocean.helpers.tracing import tracer
 from port_ocean.utils.async_http import _http_client
 
 def _process_path_type_items(
@@ -115,7 +116,10 @@ async def resync_generator_wrapper(
         while True:
             try:
                 with resync_error_handling():
-                    result = await anext(generator)
+                    with tracer.span("page", "extract", kind=kind) as span:
+                        result = await anext(generator)
+                        if isinstance(result, list):
+                            span.set_attribute("items", len(result))
                     if not ocean.config.yield_items_to_parse:
                         validated_result = validate_result(result)
                         processed_result = _process_path_type_items(validated_result,items_to_parse)
@@ -29,6 +29,11 @@ class CachingStorageMode(StrEnum):
     memory = "memory"
 
 
+class TraceExportFormat(StrEnum):
+    chrome = "chrome"
+    otlp = "otlp"
+
+
 class Runtime(Enum):
     Saas = "Saas"
     OnPrem = "OnPrem"
@@ -5,6 +5,7 @@ from loguru import logger
 
 from port_ocean.helpers.retry import RetryTransport, RetryConfig
 from port_ocean.helpers.stream import Stream
+from port_ocean.helpers.tracing import tracer
 
 
 class OceanAsyncClient(httpx.AsyncClient):
@@ -12,6 +13,8 @@ class OceanAsyncClient(httpx.AsyncClient):
     This class is a wrapper around httpx.AsyncClient that uses a custom transport class.
     This is done to allow passing our custom transport class to the AsyncClient constructor while still allowing
     all the default AsyncClient behavior that is changed when passing a custom transport instance.
+
+    While a resync trace is active, every request is recorded as a span of `trace_category`.
     """
 
     def __init__(
@@ -19,8 +22,10 @@ class OceanAsyncClient(httpx.AsyncClient):
         transport_class: Type[RetryTransport] = RetryTransport,
         transport_kwargs: dict[str, Any] | None = None,
         retry_config: RetryConfig | None = None,
+        trace_category: str = "http",
         **kwargs: Any,
     ):
+        self._trace_category = trace_category
         self._transport_kwargs = transport_kwargs
         self._transport_class = transport_class
         self._retry_config = retry_config
@@ -51,6 +56,19 @@ class OceanAsyncClient(httpx.AsyncClient):
             **(self._transport_kwargs or {}),
         )
 
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        if not tracer.active:
+            return await super().send(request, **kwargs)
+
+        with tracer.span(
+            f"{request.method} {request.url.path}",
+            self._trace_category,
+            **{"http.method": request.method, "http.host": request.url.host},
+        ) as span:
+            response = await super().send(request, **kwargs)
+            span.set_attribute("http.status_code", response.status_code)
+            return response
+
     async def get_stream(self, url: str, **kwargs: Any) -> Stream:
         req = self.build_request("GET", url, **kwargs)
         response = await self.send(req, stream=True)
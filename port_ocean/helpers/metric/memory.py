@@ -0,0 +1,198 @@
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from port_ocean.context.ocean import ocean
+from port_ocean.helpers.metric.metric import MetricType
+
+if TYPE_CHECKING:
+    from port_ocean.config.settings import MemoryProfilingSettings
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class MemoryStage:
+    KIND_START = "kind_start"
+    BATCH = "batch"
+    KIND_END = "kind_end"
+    RECONCILIATION_START = "reconciliation_start"
+    RECONCILIATION_END = "reconciliation_end"
+
+
+@dataclass
+class MemorySample:
+    kind: str
+    stage: str
+    pid: int
+    rss_bytes: int
+    traced_bytes: int | None = None
+    traced_peak_bytes: int | None = None
+    top_allocators: list[dict[str, Any]] = field(default_factory=list)
+
+
+def get_rss_bytes() -> int:
+    """The current resident set size, or the peak one where it can't be read"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def get_top_allocators(
+    snapshot: tracemalloc.Snapshot, limit: int
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+class MemoryProfiler:
+    """
+    Opt-in memory accounting for resyncs.
+
+    Samples are taken at the start and end of every kind, after every batch registered for it
+    and around the reconciliation, in the process doing the work, so kinds that run in a
+    subprocess are accounted for as well. The highest RSS and traced memory seen per kind and
+    stage are exported as gauges, and a snapshot is dumped when the RSS crosses the
+    configured threshold.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.trace_allocations = False
+        self.top_allocators_limit = 10
+        self.snapshot_threshold_bytes: int | None = None
+        self.snapshot_location = "/tmp/ocean/memory"
+        self._peaks: dict[tuple[str, str], tuple[int, int]] = {}
+        self._above_threshold = False
+
+    def configure(self, settings: "MemoryProfilingSettings") -> None:
+        self.enabled = settings.enabled
+        self.trace_allocations = settings.enabled and settings.trace_allocations
+        self.top_allocators_limit = settings.top_allocators_limit
+        self.snapshot_threshold_bytes = (
+            settings.snapshot_threshold_mb * 1024 * 1024
+            if settings.snapshot_threshold_mb
+            else None
+        )
+        self.snapshot_location = settings.snapshot_location
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def start_kind(self, kind: str, stage: str = MemoryStage.KIND_START) -> None:
+        """Forget the peaks of a kind's previous resync and sample its starting point"""
+        if not self.enabled:
+            return
+        for key in [key for key in self._peaks if key[0] == kind]:
+            del self._peaks[key]
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self.sample(kind, stage)
+
+    def end_kind(self, kind: str, stage: str = MemoryStage.KIND_END) -> None:
+        """Sample the end of a kind, logging its top allocators if allocations are traced"""
+        if not self.enabled:
+            return
+        sample = self.sample(kind, stage, with_top_allocators=True)
+        if sample is None:
+            return
+        message = f"Memory of {kind}: {sample.rss_bytes / 1024 / 1024:.1f}MB RSS"
+        if sample.traced_peak_bytes is not None:
+            message += (
+                f", {sample.traced_peak_bytes / 1024 / 1024:.1f}MB peak traced memory"
+            )
+        logger.info(message, top_allocators=sample.top_allocators)
+
+    def sample(
+        self, kind: str, stage: str, with_top_allocators: bool = False
+    ) -> MemorySample | None:
+        if not self.enabled:
+            return None
+
+        sample = MemorySample(
+            kind=kind, stage=stage, pid=os.getpid(), rss_bytes=get_rss_bytes()
+        )
+        snapshot: tracemalloc.Snapshot | None = None
+        if tracemalloc.is_tracing():
+            sample.traced_bytes, sample.traced_peak_bytes = (
+                tracemalloc.get_traced_memory()
+            )
+        crossed_threshold = self._update_threshold_state(sample.rss_bytes)
+        if tracemalloc.is_tracing() and (with_top_allocators or crossed_threshold):
+            snapshot = tracemalloc.take_snapshot()
+            sample.top_allocators = get_top_allocators(
+                snapshot, self.top_allocators_limit
+            )
+
+        self._report_peaks(sample)
+        if crossed_threshold:
+            self._dump_snapshot(sample, snapshot)
+        return sample
+
+    def _update_threshold_state(self, rss_bytes: int) -> bool:
+        """Whether the RSS just crossed the threshold, so a snapshot is dumped once per crossing"""
+        if self.snapshot_threshold_bytes is None:
+            return False
+        was_above_threshold = self._above_threshold
+        self._above_threshold = rss_bytes >= self.snapshot_threshold_bytes
+        return self._above_threshold and not was_above_threshold
+
+    def _report_peaks(self, sample: MemorySample) -> None:
+        key = (sample.kind, sample.stage)
+        peak_rss, peak_traced = self._peaks.get(key, (0, 0))
+        peak_rss = max(peak_rss, sample.rss_bytes)
+        peak_traced = max(peak_traced, sample.traced_peak_bytes or 0)
+        self._peaks[key] = (peak_rss, peak_traced)
+
+        if not ocean.initialized:
+            return
+        labels = [sample.kind, sample.stage]
+        ocean.metrics.set_metric(
+            name=MetricType.MEMORY_PEAK_RSS_NAME, labels=labels, value=peak_rss
+        )
+        if sample.traced_peak_bytes is not None:
+            ocean.metrics.set_metric(
+                name=MetricType.MEMORY_PEAK_TRACED_NAME,
+                labels=labels,
+                value=peak_traced,
+            )
+
+    def _dump_snapshot(
+        self, sample: MemorySample, snapshot: tracemalloc.Snapshot | None
+    ) -> None:
+        path = Path(self.snapshot_location) / (
+            f"memory-{time.strftime('%Y%m%d-%H%M%S')}-{sample.pid}-{sample.stage}"
+        )
+        logger.warning(
+            f"Memory usage of {sample.rss_bytes / 1024 / 1024:.1f}MB RSS crossed the "
+            f"threshold while processing {sample.kind} ({sample.stage}), "
+            f"dumping a snapshot to {path}.json",
+            top_allocators=sample.top_allocators,
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.with_suffix(".json").write_text(json.dumps(asdict(sample), indent=2))
+            if snapshot is not None:
+                # Load with tracemalloc.Snapshot.load to compare or group allocations offline
+                snapshot.dump(str(path.with_suffix(".tracemalloc")))
+        except OSError as error:
+            logger.warning(f"Failed to dump the memory snapshot to {path}: {error}")
+
+
+memory_profiler = MemoryProfiler()
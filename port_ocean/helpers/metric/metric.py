@@ -50,6 +50,15 @@ class MetricType:
     OBJECT_COUNT_NAME = "object_count"
     SUCCESS_NAME = "success"
     RATE_LIMIT_WAIT_NAME = "rate_limit_wait_seconds"
+    RESYNC_QUEUE_NAME = "resync_queue"
+    RESYNC_LATENCY_NAME = "resync_latency_seconds"
+    PORT_CONCURRENCY_LIMIT_NAME = "port_concurrency_limit"
+    PORT_QUEUE_WAIT_NAME = "port_queue_wait_seconds"
+    PORT_TOKEN_REFRESH_LATENCY_NAME = "port_token_refresh_latency_seconds"
+    MEMORY_PEAK_RSS_NAME = "memory_peak_rss_bytes"
+    MEMORY_PEAK_TRACED_NAME = "memory_peak_traced_bytes"
+    ACTION_CLAIM_TO_START_LATENCY_NAME = "action_claim_to_start_latency_seconds"
+    ACTION_LEASE_EXTENSION_NAME = "action_lease_extension"
 
 
 class SyncState:
@@ -88,6 +97,51 @@ _metrics_registry: Dict[str, Tuple[str, str, List[str]]] = {
         "rate_limit_wait description",
         ["kind", "phase", "endpoint"],
     ),
+    MetricType.RESYNC_QUEUE_NAME: (
+        MetricType.RESYNC_QUEUE_NAME,
+        "resync_queue description",
+        ["state"],
+    ),
+    MetricType.RESYNC_LATENCY_NAME: (
+        MetricType.RESYNC_LATENCY_NAME,
+        "resync_latency description",
+        ["trigger", "stage"],
+    ),
+    MetricType.PORT_CONCURRENCY_LIMIT_NAME: (
+        MetricType.PORT_CONCURRENCY_LIMIT_NAME,
+        "port_concurrency_limit description",
+        ["limiter"],
+    ),
+    MetricType.PORT_QUEUE_WAIT_NAME: (
+        MetricType.PORT_QUEUE_WAIT_NAME,
+        "port_queue_wait description",
+        ["limiter"],
+    ),
+    MetricType.PORT_TOKEN_REFRESH_LATENCY_NAME: (
+        MetricType.PORT_TOKEN_REFRESH_LATENCY_NAME,
+        "port_token_refresh_latency description",
+        ["trigger"],
+    ),
+    MetricType.MEMORY_PEAK_RSS_NAME: (
+        MetricType.MEMORY_PEAK_RSS_NAME,
+        "memory_peak_rss description",
+        ["kind", "stage"],
+    ),
+    MetricType.MEMORY_PEAK_TRACED_NAME: (
+        MetricType.MEMORY_PEAK_TRACED_NAME,
+        "memory_peak_traced description",
+        ["kind", "stage"],
+    ),
+    MetricType.ACTION_CLAIM_TO_START_LATENCY_NAME: (
+        MetricType.ACTION_CLAIM_TO_START_LATENCY_NAME,
+        "action_claim_to_start_latency description",
+        ["action"],
+    ),
+    MetricType.ACTION_LEASE_EXTENSION_NAME: (
+        MetricType.ACTION_LEASE_EXTENSION_NAME,
+        "action_lease_extension description",
+        ["action", "status"],
+    ),
 }
 
 
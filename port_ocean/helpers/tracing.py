@@ -0,0 +1,332 @@
+"""
+Lightweight tracing of resyncs.
+
+A trace is started for every resync, and spans are recorded for each kind, page, transform
+batch, Port lookup, load and HTTP request made through `OceanAsyncClient` while it is
+active, with parent/child links. When the trace ends, its spans are exported to a local
+file as a Chrome trace (viewable in Perfetto or chrome://tracing) or as OTLP JSON.
+
+Spans are only recorded when tracing is enabled and a trace is active, and both checks are
+done before anything is allocated, so the disabled path costs a couple of attribute reads.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+import uuid
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, ParamSpec, TypeVar
+
+from loguru import logger
+
+from port_ocean.core.models import TraceExportFormat
+
+if TYPE_CHECKING:
+    from port_ocean.config.settings import TracingSettings
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    category: str
+    span_id: int
+    parent_id: int | None
+    pid: int
+    task_id: int
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _current_task_id() -> int:
+    try:
+        return id(asyncio.current_task())
+    except RuntimeError:
+        return 0
+
+
+class _ActiveSpan:
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        category: str,
+        attributes: dict[str, Any],
+        is_root: bool,
+    ) -> None:
+        self._tracer = tracer
+        self._is_root = is_root
+        parent = _current_span.get()
+        self.span = Span(
+            name=name,
+            category=category,
+            span_id=tracer.new_span_id(),
+            parent_id=parent.span_id if parent else None,
+            pid=os.getpid(),
+            task_id=_current_task_id(),
+            start_ns=0,
+            attributes=attributes,
+        )
+        self._token: Token[Span | None] | None = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self.span)
+        self.span.start_ns = time.time_ns()
+        return self.span
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.span.end_ns = time.time_ns()
+        if exc_type is not None and not issubclass(exc_type, StopAsyncIteration):
+            self.span.error = exc_type.__name__
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self._tracer.record(self.span)
+        if self._is_root:
+            self._tracer.export_trace(self.span)
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.location = "/tmp/ocean/traces"
+        self.export_format = TraceExportFormat.chrome
+        self.max_spans = 0
+        self.service_name = "port-ocean"
+        self._spans: list[Span] = []
+        self._dropped_spans = 0
+        self._span_ids = itertools.count(1)
+
+    def configure(
+        self, settings: "TracingSettings", service_name: str = "port-ocean"
+    ) -> None:
+        self.enabled = settings.enabled
+        self.location = settings.location
+        self.export_format = settings.export_format
+        self.max_spans = settings.max_spans
+        self.service_name = service_name
+
+    @property
+    def active(self) -> bool:
+        """Whether spans opened now are recorded"""
+        return self.enabled and _current_span.get() is not None
+
+    def new_span_id(self) -> int:
+        # Spans recorded in forked subprocesses are merged back, the pid keeps their ids unique
+        return (os.getpid() << 32) | next(self._span_ids)
+
+    def trace(
+        self, name: str, category: str, **attributes: Any
+    ) -> _ActiveSpan | _NoopSpan:
+        """Start a trace with a root span, its spans are exported when it ends"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _ActiveSpan(self, name, category, attributes, is_root=True)
+
+    def span(
+        self, name: str, category: str, **attributes: Any
+    ) -> _ActiveSpan | _NoopSpan:
+        """Open a child span of the current one, if a trace is active"""
+        if not self.active:
+            return _NOOP_SPAN
+        return _ActiveSpan(self, name, category, attributes, is_root=False)
+
+    def record(self, span: Span) -> None:
+        if len(self._spans) >= self.max_spans:
+            self._dropped_spans += 1
+            return
+        self._spans.append(span)
+
+    def collect(self) -> list[Span]:
+        """Return the recorded spans and forget them"""
+        spans, self._spans = self._spans, []
+        return spans
+
+    def extend(self, spans: list[Span]) -> None:
+        """Add spans recorded in a subprocess"""
+        for span in spans:
+            self.record(span)
+
+    def export_trace(self, root: Span) -> Path | None:
+        spans = self.collect()
+        dropped_spans, self._dropped_spans = self._dropped_spans, 0
+        if dropped_spans:
+            logger.warning(
+                f"Dropped {dropped_spans} spans of the {root.name} trace, "
+                f"over the limit of {self.max_spans} spans"
+            )
+
+        export_format = self.export_format
+        path = Path(self.location) / (
+            f"{root.name}-{time.strftime('%Y%m%d-%H%M%S')}-{root.span_id:x}"
+            f".{export_format}.json"
+        )
+        content = (
+            to_chrome_trace(spans)
+            if export_format == TraceExportFormat.chrome
+            else to_otlp_json(spans, self.service_name)
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(content))
+        except OSError as error:
+            logger.warning(f"Failed to export the {root.name} trace to {path}: {error}")
+            return None
+
+        logger.info(f"Exported {len(spans)} spans of the {root.name} trace to {path}")
+        return path
+
+
+def _span_args(span: Span) -> dict[str, Any]:
+    args = dict(span.attributes)
+    if span.error:
+        args["error"] = span.error
+    return args
+
+
+def to_chrome_trace(spans: list[Span]) -> dict[str, Any]:
+    """Chrome trace event format, with a thread per asyncio task so concurrent spans don't overlap"""
+    thread_ids: dict[tuple[int, int], int] = {}
+    threads_per_pid: dict[int, int] = {}
+    events = []
+    for span in sorted(spans, key=lambda span: span.start_ns):
+        thread_id = thread_ids.get((span.pid, span.task_id))
+        if thread_id is None:
+            thread_id = threads_per_pid.get(span.pid, 0) + 1
+            threads_per_pid[span.pid] = thread_id
+            thread_ids[(span.pid, span.task_id)] = thread_id
+        events.append(
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": span.pid,
+                "tid": thread_id,
+                "args": _span_args(span),
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)} for key, value in attributes.items()
+    ]
+
+
+def to_otlp_json(spans: list[Span], service_name: str) -> dict[str, Any]:
+    """OTLP/JSON export request, as accepted by an OpenTelemetry collector"""
+    trace_id = uuid.uuid4().hex
+    otlp_spans = []
+    for span in spans:
+        otlp_span: dict[str, Any] = {
+            "traceId": trace_id,
+            "spanId": f"{span.span_id:016x}",
+            "name": span.name,
+            # SPAN_KIND_CLIENT for HTTP requests, SPAN_KIND_INTERNAL otherwise
+            "kind": 3 if "http.method" in span.attributes else 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": _otlp_attributes(
+                {"ocean.category": span.category, **span.attributes}
+            ),
+        }
+        if span.parent_id is not None:
+            otlp_span["parentSpanId"] = f"{span.parent_id:016x}"
+        if span.error:
+            otlp_span["status"] = {"code": 2, "message": span.error}
+        otlp_spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [{"scope": {"name": "port_ocean"}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+tracer = Tracer()
+
+
+def traced(
+    name: str,
+    category: str,
+    attributes: Callable[..., dict[str, Any]] | None = None,
+    root: bool = False,
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]
+]:
+    """
+    Record a span around every call of an async function. `attributes` is called with the
+    function's arguments, only when the span is recorded. A `root` span starts a new trace.
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]]
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if not (tracer.enabled if root else tracer.active):
+                return await func(*args, **kwargs)
+
+            span_attributes = attributes(*args, **kwargs) if attributes else {}
+            with (
+                tracer.trace(name, category, **span_attributes)
+                if root
+                else tracer.span(name, category, **span_attributes)
+            ):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,5 @@
 import asyncio
 import sys
-import threading
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator, Callable, Dict, Type
 
@@ -22,6 +21,7 @@ from port_ocean.context.ocean import (
     initialize_port_ocean_context,
     ocean,
 )
+from port_ocean.core.handlers.resync_coordinator import ResyncCoordinator
 from port_ocean.core.handlers.resync_state_updater import ResyncStateUpdater
 from port_ocean.core.handlers.webhook.processor_manager import (
     LiveEventsProcessorManager,
@@ -29,6 +29,8 @@ from port_ocean.core.handlers.webhook.processor_manager import (
 from port_ocean.core.handlers.actions.execution_manager import ExecutionManager
 from port_ocean.core.integrations.base import BaseIntegration
 from port_ocean.core.models import ProcessExecutionMode
+from port_ocean.helpers.metric.memory import memory_profiler
+from port_ocean.helpers.tracing import tracer
 from port_ocean.log.sensetive import sensitive_log_filter
 from port_ocean.middlewares import request_handler
 from port_ocean.utils.misc import IntegrationStateStatus
@@ -69,11 +71,17 @@ class Ocean:
             integration_type=self.config.integration.type,
             integration_version=__integration_version__,
             ingest_url=self.config.port.ingest_url,
+            token_refresh_fraction=self.config.port.token_refresh_fraction,
         )
         self.cache_provider: CacheProvider = self._get_caching_provider()
         self.process_execution_mode: ProcessExecutionMode = (
             self._get_process_execution_mode()
         )
+        tracer.configure(
+            self.config.tracing,
+            service_name=f"ocean-{self.config.integration.type}",
+        )
+        memory_profiler.configure(self.config.memory_profiling)
         self.metrics = port_ocean.helpers.metric.metric.Metrics(
             metrics_settings=self.config.metrics,
             integration_configuration=self.config.integration,
@@ -96,6 +104,9 @@ class Ocean:
             runs_buffer_high_watermark=self.config.actions_processor.runs_buffer_high_watermark,
             poll_check_interval_seconds=self.config.actions_processor.poll_check_interval_seconds,
             visibility_timeout_ms=self.config.actions_processor.visibility_timeout_ms,
+            poll_idle_backoff_initial_seconds=self.config.actions_processor.poll_idle_backoff_initial_seconds,
+            long_poll_timeout_ms=self.config.actions_processor.long_poll_timeout_ms,
+            lease_extension_interval_ms=self.config.actions_processor.lease_extension_interval_ms,
             max_wait_seconds_before_shutdown=self.config.max_wait_seconds_before_shutdown,
         )
 
@@ -106,9 +117,19 @@ class Ocean:
         self.resync_state_updater = ResyncStateUpdater(
             self.port_client, self.config.scheduled_resync_interval
         )
+        self.resync_coordinator = ResyncCoordinator(
+            mapping_fingerprint=self._get_mapping_fingerprint
+        )
         self.app_initialized = False
 
         signal_handler.register(self._report_resync_aborted, priority=100)
+        signal_handler.register(self.resync_coordinator.cancel)
+
+    async def _get_mapping_fingerprint(self) -> str:
+        app_config = await self.integration.port_app_config_handler.get_port_app_config(
+            use_cache=False
+        )
+        return app_config.fingerprint()
 
     async def _report_resync_aborted(self) -> None:
         """
@@ -161,7 +182,7 @@ class Ocean:
     async def _setup_scheduled_resync(
         self,
     ) -> None:
-        async def execute_resync_all() -> None:
+        async def execute_resync_all() -> bool:
             await self.resync_state_updater.update_before_resync()
             logger.info("Starting a new scheduled resync")
             try:
@@ -171,6 +192,7 @@ class Ocean:
                     if successed
                     else IntegrationStateStatus.Failed
                 )
+                return successed
             except asyncio.CancelledError:
                 logger.warning(
                     "resync was cancelled by the scheduled resync, updating state to aborted"
@@ -178,14 +200,26 @@ class Ocean:
                 await self.resync_state_updater.update_after_resync(
                     IntegrationStateStatus.Aborted
                 )
+                return False
             except Exception as e:
                 await self.resync_state_updater.update_after_resync(
                     IntegrationStateStatus.Failed
                 )
                 raise e
 
+        async def request_resync_all() -> None:
+            try:
+                await self.resync_coordinator.request(
+                    execute_resync_all, trigger="scheduled"
+                )
+            except Exception:
+                logger.exception("Scheduled resync failed")
+
+        async def schedule_resync_all() -> None:
+            # Not awaiting the resync keeps the schedule from drifting by its duration
+            asyncio.ensure_future(request_resync_all())
+
         interval = self.config.scheduled_resync_interval
-        loop = asyncio.get_event_loop()
         if interval is not None:
             logger.info(
                 f"Setting up scheduled resync, the integration will automatically perform a full resync every {interval} minutes)",
@@ -195,13 +229,7 @@ class Ocean:
                 seconds=interval * 60,
                 # Not running the resync immediately because the event listener should run resync on startup
                 wait_first=True,
-            )(
-                lambda: threading.Thread(
-                    target=lambda: asyncio.run_coroutine_threadsafe(
-                        execute_resync_all(), loop
-                    )
-                ).start()
-            )
+            )(schedule_resync_all)
             await repeated_function()
 
     @property
@@ -0,0 +1,40 @@
+import asyncio
+import tracemalloc
+from typing import Any, Callable, Iterator
+
+import pytest
+from loguru import logger
+
+
+@pytest.fixture
+def async_runner() -> Iterator[asyncio.Runner]:
+    """A dedicated event loop, since benchmarked callables must be synchronous"""
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture
+def track_memory(benchmark: Any) -> Callable[..., None]:
+    """
+    Run a callable once under tracemalloc and store its peak traced memory in the
+    benchmark's extra info, so it is saved and compared with the timings.
+    """
+
+    def track(function: Callable[..., Any], *args: Any) -> None:
+        tracemalloc.start()
+        try:
+            function(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["tracemalloc_peak_bytes"] = peak
+
+    return track
+
+
+@pytest.fixture(autouse=True)
+def disable_framework_logs() -> Iterator[None]:
+    """Keep log formatting and output out of the measured time"""
+    logger.disable("port_ocean")
+    yield
+    logger.enable("port_ocean")
@@ -0,0 +1,130 @@
+"""Deterministic synthetic datasets for the micro-benchmarks"""
+
+import os
+from typing import Any
+
+from port_ocean.core.handlers.port_app_config.models import ResourceConfig
+from port_ocean.core.models import Entity
+
+SERVICE_BLUEPRINT = "service"
+ITEMS_PER_PARENT = 100
+
+# Entity amounts the micro-benchmarks run with, e.g. "1000,10000,100000,1000000".
+# Only the smallest amount runs by default, so the benchmarks stay cheap in the regular suite.
+ENTITY_AMOUNTS = [
+    int(amount)
+    for amount in os.environ.get("OCEAN_BENCHMARK_ENTITY_AMOUNTS", "1000").split(",")
+]
+
+
+def entity_amounts(max_amount: int | None = None) -> list[int]:
+    """The configured entity amounts, capped for benchmarks that would not finish otherwise"""
+    return [
+        amount
+        for amount in ENTITY_AMOUNTS
+        if max_amount is None or amount <= max_amount
+    ] or [min(ENTITY_AMOUNTS)]
+
+
+def _raw_service(index: int) -> dict[str, Any]:
+    return {
+        "id": f"service-{index}",
+        "name": f"Service {index}",
+        "status": "active" if index % 3 else "archived",
+        "language": ("python", "go", "typescript")[index % 3],
+        "stars": index % 1000,
+        "isPrivate": bool(index % 2),
+        "topics": [f"topic-{index % 10}", f"topic-{index % 7}"],
+        "owner": {"team": f"team-{index % 50}", "email": f"owner-{index}@example.com"},
+        "description": f"Synthetic service number {index} used by the benchmarks",
+    }
+
+
+def raw_services(amount: int) -> list[dict[str, Any]]:
+    return [_raw_service(index) for index in range(amount)]
+
+
+def raw_service_parents(amount: int) -> list[dict[str, Any]]:
+    """Raw items that each hold `ITEMS_PER_PARENT` services, for `itemsToParse` mappings"""
+    return [
+        {
+            "id": f"parent-{parent}",
+            "region": f"region-{parent % 5}",
+            "services": [
+                _raw_service(index)
+                for index in range(
+                    parent * ITEMS_PER_PARENT,
+                    min((parent + 1) * ITEMS_PER_PARENT, amount),
+                )
+            ],
+        }
+        for parent in range(-(-amount // ITEMS_PER_PARENT))
+    ]
+
+
+def service_mapping(items_to_parse: bool = False) -> ResourceConfig:
+    item = ".item" if items_to_parse else ""
+    return ResourceConfig.parse_obj(
+        {
+            "kind": "service",
+            "selector": {"query": f'{item}.status == "active"'},
+            "port": {
+                **({"itemsToParse": ".services"} if items_to_parse else {}),
+                "entity": {
+                    "mappings": {
+                        "identifier": f"{item}.id",
+                        "title": f"{item}.name",
+                        "blueprint": f'"{SERVICE_BLUEPRINT}"',
+                        "properties": {
+                            "language": f"{item}.language",
+                            "stars": f"{item}.stars",
+                            "isPrivate": f"{item}.isPrivate",
+                            "topics": f"{item}.topics",
+                            "ownerEmail": f"{item}.owner.email",
+                            "description": f"{item}.description",
+                        },
+                        "relations": {"team": f"{item}.owner.team"},
+                    }
+                },
+            },
+        }
+    )
+
+
+def service_entity(index: int, revision: int = 0) -> Entity:
+    return Entity(
+        identifier=f"service-{index}",
+        blueprint=SERVICE_BLUEPRINT,
+        title=f"Service {index}",
+        team=[f"team-{index % 50}"],
+        properties={
+            "language": ("python", "go", "typescript")[index % 3],
+            "stars": index % 1000 + revision,
+            "isPrivate": bool(index % 2),
+            "topics": [f"topic-{index % 10}", f"topic-{index % 7}"],
+            "ownerEmail": f"owner-{index}@example.com",
+            "description": f"Synthetic service number {index} used by the benchmarks",
+            "lastDeployedAt": None,
+        },
+        relations={"team": f"team-{index % 50}", "dependsOn": None},
+    )
+
+
+def service_entities(amount: int, offset: int = 0, revision: int = 0) -> list[Entity]:
+    return [service_entity(index, revision) for index in range(offset, offset + amount)]
+
+
+def related_entities(amount: int) -> list[Entity]:
+    """Entities where each one relates to the previous one, forming dependency chains"""
+    return [
+        Entity(
+            identifier=f"service-{index}",
+            blueprint=SERVICE_BLUEPRINT,
+            properties={},
+            relations={
+                "dependsOn": f"service-{index - 1}" if index % 10 else None,
+                "team": f"team-{index % 50}",
+            },
+        )
+        for index in range(amount)
+    ]
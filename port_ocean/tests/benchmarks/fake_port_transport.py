@@ -0,0 +1,172 @@
+import asyncio
+import gzip
+import json
+import re
+from collections import Counter
+from typing import Any
+
+import httpx
+
+FAKE_ACCESS_TOKEN_EXPIRES_IN = 60 * 60 * 24
+DATASOURCE_SEARCH_PAGE_SIZE = 1000
+
+_ENTITY_PATH = re.compile(r"^/v1/blueprints/(?P<blueprint>[^/]+)/entities$")
+_BULK_PATH = re.compile(r"^/v1/blueprints/(?P<blueprint>[^/]+)/entities/bulk$")
+_DELETE_PATH = re.compile(
+    r"^/v1/blueprints/(?P<blueprint>[^/]+)/entities/(?P<identifier>[^/]+)$"
+)
+_BLUEPRINT_PATH = re.compile(r"^/v1/blueprints/(?P<blueprint>[^/]+)$")
+_INTEGRATION_PATH = re.compile(r"^/v1/integration/(?P<identifier>[^/]+)$")
+
+
+def _read_json_body(request: httpx.Request) -> Any:
+    content = request.content
+    if request.headers.get("Content-Encoding") == "gzip":
+        content = gzip.decompress(content)
+    return json.loads(content) if content else {}
+
+
+class FakePortAPI:
+    """
+    In-process stand-in for the Port API, to be used as an `httpx.MockTransport` handler.
+
+    It serves the requests a resync sends: authentication, the integration and its port app
+    config, blueprints, entity upserts (single and bulk), the datasource search used by the
+    reconciliation and entity deletion. Only the identifiers of upserted entities are kept, so
+    the stand-in adds little to the memory of the process it runs in.
+
+    `latency_seconds` delays every response, and `stale_entities_per_blueprint` seeds Port with
+    entities the integration no longer reports, so the reconciliation has entities to delete.
+    """
+
+    def __init__(
+        self,
+        integration_identifier: str,
+        resources: list[dict[str, Any]],
+        blueprints: list[dict[str, Any]],
+        latency_seconds: float = 0,
+        stale_entities_per_blueprint: int = 0,
+    ) -> None:
+        self.integration_identifier = integration_identifier
+        self.resources = resources
+        self.blueprints = {
+            blueprint["identifier"]: blueprint for blueprint in blueprints
+        }
+        self.latency_seconds = latency_seconds
+        self.request_counts: Counter[str] = Counter()
+        self.entities: set[tuple[str, str]] = set()
+        self._search_snapshot: list[tuple[str, str]] = []
+        for resource in resources:
+            blueprint = json.loads(resource["port"]["entity"]["mappings"]["blueprint"])
+            self.entities.update(
+                (blueprint, f"stale-{index}")
+                for index in range(stale_entities_per_blueprint)
+            )
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+
+        path = request.url.path
+        method = request.method
+
+        if path == "/v1/auth/access_token":
+            return self._respond(
+                request,
+                "auth",
+                {
+                    "accessToken": "benchmark-token",
+                    "expiresIn": FAKE_ACCESS_TOKEN_EXPIRES_IN,
+                    "tokenType": "Bearer",
+                },
+            )
+        if match := _BULK_PATH.match(path):
+            return self._upsert_bulk(request, match["blueprint"])
+        if method == "POST" and (match := _ENTITY_PATH.match(path)):
+            return self._upsert_entity(request, match["blueprint"])
+        if path == "/v1/blueprints/entities/datasource-entities":
+            return self._search_datasource_entities(request)
+        if path == "/v1/entities/search":
+            return self._respond(request, "search", {"ok": True, "entities": []})
+        if method == "DELETE" and (match := _DELETE_PATH.match(path)):
+            self.entities.discard((match["blueprint"], match["identifier"]))
+            return self._respond(request, "delete", {"ok": True})
+        if method == "GET" and (match := _BLUEPRINT_PATH.match(path)):
+            return self._get_blueprint(request, match["blueprint"])
+        if _INTEGRATION_PATH.match(path):
+            return self._respond(request, "integration", self._integration())
+        return self._respond(request, f"{method} other", {"ok": True})
+
+    def _respond(
+        self, request: httpx.Request, route: str, body: dict[str, Any]
+    ) -> httpx.Response:
+        self.request_counts[route] += 1
+        return httpx.Response(200, json=body, request=request)
+
+    def _get_blueprint(self, request: httpx.Request, blueprint: str) -> httpx.Response:
+        if blueprint not in self.blueprints:
+            self.request_counts["blueprint"] += 1
+            return httpx.Response(404, json={"ok": False}, request=request)
+        return self._respond(
+            request, "blueprint", {"ok": True, "blueprint": self.blueprints[blueprint]}
+        )
+
+    def _upsert_bulk(self, request: httpx.Request, blueprint: str) -> httpx.Response:
+        entities = _read_json_body(request)["entities"]
+        self.entities.update((blueprint, entity["identifier"]) for entity in entities)
+        return self._respond(
+            request,
+            "upsert bulk",
+            {
+                "ok": True,
+                "entities": [
+                    {"identifier": entity["identifier"], "index": index}
+                    for index, entity in enumerate(entities)
+                ],
+                "errors": [],
+            },
+        )
+
+    def _upsert_entity(self, request: httpx.Request, blueprint: str) -> httpx.Response:
+        entity = _read_json_body(request)
+        self.entities.add((blueprint, entity["identifier"]))
+        return self._respond(request, "upsert", {"ok": True, "entity": entity})
+
+    def _search_datasource_entities(self, request: httpx.Request) -> httpx.Response:
+        start = int(_read_json_body(request).get("from") or 0)
+        if start == 0:
+            # Pages are served from a snapshot taken when the search starts
+            self._search_snapshot = sorted(self.entities)
+        entities = self._search_snapshot[start : start + DATASOURCE_SEARCH_PAGE_SIZE]
+        next_from = start + len(entities)
+        return self._respond(
+            request,
+            "datasource search",
+            {
+                "ok": True,
+                "entities": [
+                    {"identifier": identifier, "blueprint": blueprint}
+                    for blueprint, identifier in entities
+                ],
+                "next": (
+                    str(next_from) if next_from < len(self._search_snapshot) else None
+                ),
+            },
+        )
+
+    def _integration(self) -> dict[str, Any]:
+        return {
+            "ok": True,
+            "integration": {
+                "identifier": self.integration_identifier,
+                "installationType": "OnPrem",
+                "config": {
+                    "deleteDependentEntities": True,
+                    "createMissingRelatedEntities": True,
+                    "enableMergeEntity": True,
+                    "resources": self.resources,
+                },
+                "logAttributes": {"ingestUrl": "http://ingest.port.mock/logs"},
+                "metricAttributes": {"ingestUrl": "http://ingest.port.mock/metrics"},
+            },
+        }
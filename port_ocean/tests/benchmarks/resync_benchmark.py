@@ -0,0 +1,416 @@
+"""
+Resync benchmark for the fake integration, running against an in-process Port stand-in.
+
+Run a benchmark and write its results as JSON:
+
+    python -m port_ocean.tests.benchmarks.resync_benchmark run \\
+        --entity-amount 10000 --entity-kb-size 1 --output results.json
+
+Compare results against a baseline, failing on a regression of more than 10%:
+
+    python -m port_ocean.tests.benchmarks.resync_benchmark compare \\
+        baseline.json results.json --threshold 0.1
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+import httpx
+import yaml
+from loguru import logger
+
+from port_ocean.clients.port import utils as port_client_utils
+from port_ocean.clients.port.retry_transport import TokenRetryTransport
+from port_ocean.helpers.async_client import OceanAsyncClient
+from port_ocean.helpers.retry import RetryTransport
+from port_ocean.ocean import Ocean
+from port_ocean.tests.benchmarks.fake_port_transport import FakePortAPI
+from port_ocean.tests.helpers.ocean_app import get_integration_ocean_app
+from port_ocean.utils import async_http
+
+FAKE_INTEGRATION_PATH = str(
+    Path(__file__).resolve().parents[3] / "integrations" / "fake-integration"
+)
+BENCHMARK_INTEGRATION_IDENTIFIER = "resync-benchmark"
+THIRD_PARTY_EMPLOYEES_PATH = "/integration/department/{department_id}/employees"
+
+PHASES = ("extract", "transform", "load", "reconcile")
+# Metrics compared between runs, and whether a higher value is an improvement
+COMPARED_METRICS: dict[str, bool] = {
+    **{f"phases.{phase}.objects_per_second": True for phase in PHASES},
+    "wall_seconds": False,
+    "memory.peak_rss_bytes": False,
+    "memory.allocated_blocks": False,
+    "memory.tracemalloc_peak_bytes": False,
+}
+
+
+@dataclass
+class BenchmarkParams:
+    entity_amount: int = 1000
+    entity_kb_size: int = 1
+    third_party_batch_size: int = 1000
+    third_party_latency_ms: int = 0
+    port_latency_ms: int = 0
+    upsert_batch_max_length: int = 20
+    stale_entities: int = 0
+    single_department_run: bool = False
+    trace_allocations: bool = False
+    # Export a trace of the resync to this directory, tracing is disabled when empty
+    trace_location: str = ""
+
+
+@dataclass
+class PhaseTimer:
+    """Accumulates the time spent in a phase and the number of objects it handled"""
+
+    seconds: float = 0
+    objects: int = 0
+    calls: int = 0
+
+    def add(self, seconds: float, objects: int) -> None:
+        self.seconds += seconds
+        self.objects += objects
+        self.calls += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seconds": round(self.seconds, 6),
+            "objects": self.objects,
+            "calls": self.calls,
+            "objects_per_second": (
+                round(self.objects / self.seconds, 3) if self.seconds else None
+            ),
+        }
+
+
+@dataclass
+class PhaseTimers:
+    timers: dict[str, PhaseTimer] = field(
+        default_factory=lambda: {phase: PhaseTimer() for phase in PHASES}
+    )
+
+    def __getitem__(self, phase: str) -> PhaseTimer:
+        return self.timers[phase]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {phase: timer.to_dict() for phase, timer in self.timers.items()}
+
+
+def _time_resync_generator(
+    resync_function: Callable[[str], AsyncGenerator[list[Any], None]],
+    timer: PhaseTimer,
+) -> Callable[[str], AsyncGenerator[list[Any], None]]:
+    @functools.wraps(resync_function)
+    async def wrapper(kind: str) -> AsyncGenerator[list[Any], None]:
+        generator = resync_function(kind)
+        while True:
+            started_at = time.perf_counter()
+            try:
+                batch = await generator.__anext__()
+            except StopAsyncIteration:
+                timer.add(time.perf_counter() - started_at, 0)
+                return
+            timer.add(time.perf_counter() - started_at, len(batch))
+            yield batch
+
+    return wrapper
+
+
+def _time_coroutine(
+    function: Callable[..., Awaitable[Any]],
+    timer: PhaseTimer,
+    count_objects: Callable[..., int],
+) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(function)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return await function(*args, **kwargs)
+        finally:
+            timer.add(time.perf_counter() - started_at, count_objects(*args, **kwargs))
+
+    return wrapper
+
+
+def instrument_phases(app: Ocean, timers: PhaseTimers) -> None:
+    """Wrap the integration's resync functions and handlers with phase timers"""
+    integration = app.integration
+    resync_functions = integration.event_strategy["resync"]
+    for kind, functions in resync_functions.items():
+        resync_functions[kind] = [
+            _time_resync_generator(function, timers["extract"]) for function in functions  # type: ignore[arg-type]
+        ]
+
+    entity_processor = integration.entity_processor
+    entity_processor.parse_items = _time_coroutine(  # type: ignore[method-assign, assignment]
+        entity_processor.parse_items,
+        timers["transform"],
+        lambda mapping, raw_data, *args, **kwargs: len(raw_data),
+    )
+    entities_state_applier = integration.entities_state_applier
+    entities_state_applier.upsert = _time_coroutine(  # type: ignore[method-assign, assignment]
+        entities_state_applier.upsert,
+        timers["load"],
+        lambda entities, *args, **kwargs: len(entities),
+    )
+    integration.resync_reconciliation = _time_coroutine(  # type: ignore[method-assign, assignment]
+        integration.resync_reconciliation,
+        timers["reconcile"],
+        lambda creation_results, *args, **kwargs: sum(
+            len(entities) for entities, _ in creation_results
+        ),
+    )
+
+
+class FakeThirdPartyAPI:
+    """
+    Serves the fake integration's department employees endpoint.
+
+    Persons are generated deterministically and cheaply, so the benchmark measures the
+    framework rather than the generation of fake data. Like the fake integration's own
+    router, every response is delayed by the `latency` query parameter, in milliseconds.
+    """
+
+    def __init__(self) -> None:
+        self.served_persons: dict[str, int] = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        latency_ms = int(request.url.params.get("latency", 0))
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+        department_id = request.url.path.split("/")[-2]
+        limit = int(request.url.params.get("limit", 1))
+        bio = "x" * max(int(request.url.params.get("entity_kb_size", 1)), 1) * 1024
+        offset = self.served_persons.get(department_id, 0)
+        self.served_persons[department_id] = offset + limit
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "id": f"{department_id}-{index}",
+                        "email": f"person-{index}@{department_id}.example.com",
+                        "name": f"Person {index}",
+                        "status": "WORKING" if index % 2 else "NOPE",
+                        "age": 20 + index % 80,
+                        "bio": bio,
+                    }
+                    for index in range(offset, offset + limit)
+                ]
+            },
+            request=request,
+        )
+
+
+def _load_fake_integration_resources() -> list[dict[str, Any]]:
+    with open(f"{FAKE_INTEGRATION_PATH}/.port/resources/port-app-config.yml") as file:
+        return yaml.safe_load(file)["resources"]
+
+
+def _load_fake_integration_blueprints() -> list[dict[str, Any]]:
+    with open(f"{FAKE_INTEGRATION_PATH}/.port/resources/blueprints.json") as file:
+        return json.load(file)
+
+
+def _get_peak_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+async def _run_resync(params: BenchmarkParams) -> dict[str, Any]:
+    app = get_integration_ocean_app(
+        FAKE_INTEGRATION_PATH,
+        {
+            "integration": {
+                "identifier": BENCHMARK_INTEGRATION_IDENTIFIER,
+                "type": "fake-integration",
+                "config": {
+                    "entity_amount": params.entity_amount,
+                    "entity_kb_size": params.entity_kb_size,
+                    "third_party_batch_size": params.third_party_batch_size,
+                    "third_party_latency_ms": params.third_party_latency_ms,
+                    "single_department_run": params.single_department_run,
+                },
+            },
+            "process_execution_mode": "single_process",
+            "upsert_entities_batch_max_length": params.upsert_batch_max_length,
+            "tracing": {
+                "enabled": bool(params.trace_location),
+                "location": params.trace_location or "/tmp/ocean/traces",
+            },
+        },
+    )
+    port_api = FakePortAPI(
+        BENCHMARK_INTEGRATION_IDENTIFIER,
+        _load_fake_integration_resources(),
+        _load_fake_integration_blueprints(),
+        latency_seconds=params.port_latency_ms / 1000,
+        stale_entities_per_blueprint=params.stale_entities,
+    )
+    third_party_api = FakeThirdPartyAPI()
+
+    # The clients keep the framework's retry transports, only the network is replaced
+    port_http_client = OceanAsyncClient(
+        transport=TokenRetryTransport(
+            port_client=app.port_client,
+            wrapped_transport=httpx.MockTransport(port_api),
+            logger=logger,
+        ),
+        trace_category="port",
+    )
+    third_party_http_client = OceanAsyncClient(
+        transport=RetryTransport(
+            wrapped_transport=httpx.MockTransport(third_party_api), logger=logger
+        ),
+        trace_category="third_party",
+    )
+    port_client_utils._http_client.push(port_http_client)
+    async_http._http_client.push(third_party_http_client)
+    try:
+        await app.integration.initialize_handlers()
+        timers = PhaseTimers()
+        instrument_phases(app, timers)
+
+        started_at = time.perf_counter()
+        success = await app.integration.sync_raw_all(silent=False)
+        wall_seconds = time.perf_counter() - started_at
+    finally:
+        port_client_utils._http_client.pop()
+        async_http._http_client.pop()
+        await port_http_client.aclose()
+        await third_party_http_client.aclose()
+
+    return {
+        "success": success,
+        "wall_seconds": round(wall_seconds, 6),
+        "phases": timers.to_dict(),
+        "port_requests": dict(sorted(port_api.request_counts.items())),
+        "entities_in_port": len(port_api.entities),
+    }
+
+
+def run_benchmark(params: BenchmarkParams) -> dict[str, Any]:
+    """Run a full resync of the fake integration and return its results"""
+    if params.trace_allocations:
+        tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    try:
+        results = asyncio.run(_run_resync(params))
+        allocated_blocks = sys.getallocatedblocks() - blocks_before
+        tracemalloc_peak_bytes = (
+            tracemalloc.get_traced_memory()[1] if params.trace_allocations else None
+        )
+    finally:
+        if params.trace_allocations:
+            tracemalloc.stop()
+
+    results["params"] = asdict(params)
+    results["memory"] = {
+        "peak_rss_bytes": _get_peak_rss_bytes(),
+        "allocated_blocks": allocated_blocks,
+        "tracemalloc_peak_bytes": tracemalloc_peak_bytes,
+    }
+    return results
+
+
+def _get_metric(results: dict[str, Any], path: str) -> float | None:
+    value: Any = results
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value if isinstance(value, (int, float)) else None
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Return a description of every compared metric that regressed by more than `threshold`
+    (a fraction of the baseline value). Metrics missing from either side are skipped.
+    """
+    regressions = []
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        baseline_value = _get_metric(baseline, metric)
+        current_value = _get_metric(current, metric)
+        if not baseline_value or current_value is None:
+            continue
+
+        change = (current_value - baseline_value) / baseline_value
+        if (higher_is_better and change < -threshold) or (
+            not higher_is_better and change > threshold
+        ):
+            regressions.append(
+                f"{metric}: {baseline_value} -> {current_value} ({change:+.1%})"
+            )
+    return regressions
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the resync benchmark")
+    defaults = BenchmarkParams()
+    for name, value in asdict(defaults).items():
+        option = f"--{name.replace('_', '-')}"
+        if isinstance(value, bool):
+            run_parser.add_argument(option, action="store_true")
+        else:
+            run_parser.add_argument(option, type=type(value), default=value)
+    run_parser.add_argument("--output", help="Write the results to this JSON file")
+    run_parser.add_argument("--log-level", default="WARNING")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Fail if results regressed against a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed regression, as a fraction of the baseline (default: 0.1)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.command == "compare":
+        baseline = json.loads(Path(args.baseline).read_text())
+        current = json.loads(Path(args.current).read_text())
+        regressions = compare_results(baseline, current, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if not regressions:
+            print(f"No regression above {args.threshold:.0%}")
+        return 1 if regressions else 0
+
+    # Logs go to stderr, so the results printed to stdout stay valid JSON
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+    params = BenchmarkParams(
+        **{name: getattr(args, name) for name in asdict(BenchmarkParams())}
+    )
+    results = json.dumps(run_benchmark(params), indent=2)
+    if args.output:
+        Path(args.output).write_text(results)
+    print(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
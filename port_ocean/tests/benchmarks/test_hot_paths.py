@@ -0,0 +1,210 @@
+"""
+Micro-benchmarks for the framework's CPU hot paths.
+
+In the default suite they run once, as regular tests. To measure, save a baseline and
+compare against it (see the `benchmark/micro` targets in the Makefile), e.g.:
+
+    OCEAN_BENCHMARK_ENTITY_AMOUNTS=1000,10000,100000,1000000 make benchmark/micro/compare
+"""
+
+import asyncio
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from port_ocean.clients.port.mixins.entities import EntityClientMixin
+from port_ocean.context.ocean import PortOceanContext
+from port_ocean.core.handlers.entity_processor.jq_entity_processor import (
+    JQEntityProcessor,
+)
+from port_ocean.core.handlers.queue.group_queue import GroupQueue
+from port_ocean.core.utils.entity_topological_sorter import EntityTopologicalSorter
+from port_ocean.core.utils.utils import (
+    are_entities_different,
+    get_port_diff,
+    resolve_entities_diff,
+)
+from port_ocean.tests.benchmarks.datasets import (
+    entity_amounts,
+    raw_service_parents,
+    raw_services,
+    related_entities,
+    service_entities,
+    service_mapping,
+)
+from port_ocean.utils.queue_utils import process_in_queue
+
+
+@pytest.fixture
+def mock_ocean_app(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    app = MagicMock()
+    app.config.allow_environment_variables_jq_access = False
+    app.config.yield_items_to_parse = False
+    app.config.upsert_entities_batch_max_length = 20
+    app.config.upsert_entities_batch_max_size_in_bytes = 1024 * 1024
+    monkeypatch.setattr(PortOceanContext, "app", app)
+    return app
+
+
+# Mapping with jq is slow enough that a million entities would take minutes per round
+@pytest.mark.parametrize("entity_amount", entity_amounts(max_amount=100_000))
+@pytest.mark.parametrize("items_to_parse", [False, True])
+def test_jq_parse_items(
+    benchmark: Any,
+    track_memory: Callable[..., None],
+    async_runner: asyncio.Runner,
+    mock_ocean_app: MagicMock,
+    entity_amount: int,
+    items_to_parse: bool,
+) -> None:
+    processor = JQEntityProcessor(mock_ocean_app)
+    mapping = service_mapping(items_to_parse)
+    raw_results = (
+        raw_service_parents(entity_amount)
+        if items_to_parse
+        else raw_services(entity_amount)
+    )
+
+    def parse_items() -> Any:
+        return async_runner.run(processor._parse_items(mapping, raw_results))
+
+    track_memory(parse_items)
+    result = benchmark(parse_items)
+
+    # Every third service is archived and filtered out by the selector
+    assert len(result.entity_selector_diff.passed) == entity_amount - (
+        -(-entity_amount // 3)
+    )
+    assert not result.errors
+
+
+@pytest.mark.parametrize("entity_amount", entity_amounts())
+def test_get_port_diff(
+    benchmark: Any, track_memory: Callable[..., None], entity_amount: int
+) -> None:
+    # Half of the entities are kept, a quarter is created and a quarter is deleted
+    before = service_entities(entity_amount)
+    after = service_entities(entity_amount, offset=entity_amount // 4, revision=1)
+
+    track_memory(get_port_diff, before, after)
+    diff = benchmark(get_port_diff, before, after)
+
+    assert len(diff.modified) == entity_amount - entity_amount // 4
+
+
+@pytest.mark.parametrize("entity_amount", entity_amounts())
+def test_resolve_entities_diff(
+    benchmark: Any, track_memory: Callable[..., None], entity_amount: int
+) -> None:
+    # Every tenth entity changed, so most entities go through the full comparison
+    source = service_entities(entity_amount)
+    target = [
+        entity.copy(update={"title": "changed"}) if index % 10 == 0 else entity
+        for index, entity in enumerate(service_entities(entity_amount))
+    ]
+
+    track_memory(resolve_entities_diff, source, target)
+    changed = benchmark(resolve_entities_diff, source, target)
+
+    assert len(changed) == -(-entity_amount // 10)
+
+
+@pytest.mark.parametrize("entity_amount", entity_amounts())
+def test_are_entities_different(
+    benchmark: Any, track_memory: Callable[..., None], entity_amount: int
+) -> None:
+    pairs = list(zip(service_entities(entity_amount), service_entities(entity_amount)))
+
+    def compare_all() -> int:
+        return sum(are_entities_different(first, second) for first, second in pairs)
+
+    track_memory(compare_all)
+    assert benchmark(compare_all) == 0
+
+
+# The ordering is quadratic in the number of entities
+@pytest.mark.parametrize("entity_amount", entity_amounts(max_amount=10_000))
+def test_order_by_entities_dependencies(
+    benchmark: Any, track_memory: Callable[..., None], entity_amount: int
+) -> None:
+    entities = related_entities(entity_amount)
+
+    track_memory(EntityTopologicalSorter.order_by_entities_dependencies, entities)
+    ordered = benchmark(
+        EntityTopologicalSorter.order_by_entities_dependencies, entities
+    )
+
+    assert len(ordered) == entity_amount
+
+
+@pytest.mark.parametrize("entity_amount", entity_amounts())
+def test_process_in_queue(
+    benchmark: Any,
+    track_memory: Callable[..., None],
+    async_runner: asyncio.Runner,
+    entity_amount: int,
+) -> None:
+    objects = list(range(entity_amount))
+
+    async def increment(number: int, increment_by: int) -> int:
+        return number + increment_by
+
+    def process() -> list[int]:
+        return async_runner.run(process_in_queue(objects, increment, 1))
+
+    track_memory(process)
+    assert len(benchmark(process)) == entity_amount
+
+
+@pytest.mark.parametrize("group_amount", entity_amounts())
+def test_group_queue_get_with_many_groups(
+    benchmark: Any, async_runner: asyncio.Runner, group_amount: int
+) -> None:
+    """A get while half of the groups are locked by items that are still being processed"""
+
+    class Item:
+        def __init__(self, group_id: str) -> None:
+            self.group_id = group_id
+
+    queues: list[GroupQueue[Item]] = []
+
+    async def fill_queue() -> GroupQueue[Item]:
+        queue: GroupQueue[Item] = GroupQueue(group_key="group_id")
+        for group in range(group_amount):
+            await queue.put(Item(f"group-{group}"))
+        for _ in range(group_amount // 2):
+            await queue.get()
+        return queue
+
+    def setup() -> tuple[tuple[GroupQueue[Item]], dict[str, Any]]:
+        queue = async_runner.run(fill_queue())
+        queues.append(queue)
+        return (queue,), {}
+
+    def get(queue: GroupQueue[Item]) -> Item:
+        return async_runner.run(queue.get())
+
+    item = benchmark.pedantic(get, setup=setup, rounds=20)
+
+    assert item.group_id == f"group-{group_amount // 2}"
+    for queue in queues:
+        async_runner.run(queue.force_unlock_all())
+        if queue._timeout_task:
+            queue._timeout_task.cancel()
+
+
+@pytest.mark.parametrize("entity_amount", entity_amounts())
+def test_calculate_entities_batch_size(
+    benchmark: Any,
+    track_memory: Callable[..., None],
+    mock_ocean_app: MagicMock,
+    entity_amount: int,
+) -> None:
+    entity_client = EntityClientMixin(auth=MagicMock(), client=MagicMock())
+    entities = service_entities(entity_amount)
+
+    track_memory(entity_client.calculate_entities_batch_size, entities)
+    batch_size = benchmark(entity_client.calculate_entities_batch_size, entities)
+
+    assert batch_size == min(20, entity_amount)
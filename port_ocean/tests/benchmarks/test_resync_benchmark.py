@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from port_ocean.tests.benchmarks.resync_benchmark import (
+    BenchmarkParams,
+    compare_results,
+    main,
+    run_benchmark,
+)
+
+
+def _results(objects_per_second: float, peak_rss_bytes: int) -> dict[str, Any]:
+    return {
+        "wall_seconds": 1.0,
+        "phases": {"load": {"objects_per_second": objects_per_second}},
+        "memory": {"peak_rss_bytes": peak_rss_bytes, "tracemalloc_peak_bytes": None},
+    }
+
+
+def test_compare_results_reports_regressions_above_threshold() -> None:
+    baseline = _results(objects_per_second=1000, peak_rss_bytes=100)
+
+    regressions = compare_results(
+        baseline, _results(objects_per_second=800, peak_rss_bytes=105), 0.1
+    )
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("phases.load.objects_per_second")
+
+
+def test_compare_results_ignores_improvements_and_missing_metrics() -> None:
+    baseline = _results(objects_per_second=1000, peak_rss_bytes=100)
+
+    assert (
+        compare_results(
+            baseline, _results(objects_per_second=2000, peak_rss_bytes=50), 0.1
+        )
+        == []
+    )
+
+
+def test_compare_exit_code(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_results(1000, 100)))
+    current.write_text(json.dumps(_results(500, 100)))
+
+    assert main(["compare", str(baseline), str(current), "--threshold", "0.6"]) == 0
+    assert main(["compare", str(baseline), str(current), "--threshold", "0.1"]) == 1
+
+
+def test_run_benchmark_resyncs_and_reconciles() -> None:
+    results = run_benchmark(
+        BenchmarkParams(entity_amount=50, single_department_run=True, stale_entities=3)
+    )
+
+    assert results["success"] is True
+    # 50 persons and their department, with the stale entities deleted
+    assert results["entities_in_port"] == 51
+    assert results["port_requests"]["delete"] == 6
+    for phase in ("extract", "transform", "load", "reconcile"):
+        assert results["phases"][phase]["objects"] == 51
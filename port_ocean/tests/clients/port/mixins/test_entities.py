@@ -1,9 +1,12 @@
+import gzip
+import json
 from typing import Any, Generator, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from httpx import ReadTimeout
+from httpx import ReadTimeout, Request, Response
 
+from port_ocean.clients.port.bulk_encoder import build_bulk_body, encode_entity
 from port_ocean.clients.port.mixins.entities import EntityClientMixin
 from port_ocean.core.models import Entity
 
@@ -174,6 +177,42 @@ async def test_batch_upsert_entities_read_timeout_should_raise_true(
             )
 
 
+async def test_upsert_entities_by_blueprint_interleaves_bulks(
+    entity_client: EntityClientMixin,
+    mock_ocean: MagicMock,
+) -> None:
+    """Test that bulks of every blueprint are scheduled round-robin"""
+    mock_ocean.config.upsert_entities_batch_max_length = 2
+    entities_by_blueprint = {
+        "service": [Entity(identifier=f"s{i}", blueprint="service") for i in range(6)],
+        "user": [Entity(identifier=f"u{i}", blueprint="user") for i in range(2)],
+        "team": [Entity(identifier=f"t{i}", blueprint="team") for i in range(3)],
+    }
+
+    result_entities = await entity_client.upsert_entities_by_blueprint(
+        entities_by_blueprint, request_options=MagicMock(), should_raise=False
+    )
+
+    scheduled_bulks = [
+        [entity.identifier for entity in call.args[1]]
+        for call in entity_client.upsert_entities_bulk.call_args_list  # type: ignore[attr-defined]
+    ]
+    assert scheduled_bulks == [
+        ["s0", "s1"],
+        ["u0", "u1"],
+        ["t0", "t1"],
+        ["s2", "s3"],
+        ["t2"],
+        ["s4", "s5"],
+    ]
+    assert [
+        call.args[0]
+        for call in entity_client.upsert_entities_bulk.call_args_list  # type: ignore[attr-defined]
+    ] == ["service", "user", "team", "service", "team", "service"]
+    assert len(result_entities) == 11
+    assert all(status for status, _ in result_entities)
+
+
 async def test_search_entities_uses_datasource_route_when_query_is_none(
     entity_client: EntityClientMixin,
 ) -> None:
@@ -279,3 +318,68 @@ async def test_search_entities_uses_datasource_route_when_query_is_none_two_page
     second_sent_json = second_call_args[1]["json"]
     assert second_sent_json["datasource_prefix"] == "port-ocean/test-integration/"
     assert second_sent_json["datasource_suffix"] == "/test-identifier/sync"
+
+
+def test_pack_entities_in_bulks_respects_exact_body_size(
+    entity_client: EntityClientMixin, mock_ocean: MagicMock
+) -> None:
+    """Test that greedy packing fills bulks up to the exact request body size"""
+    entities = [
+        Entity(identifier=f"entity_{i}", blueprint="test", properties={"x": "y" * 100})
+        for i in range(10)
+    ]
+    encoded_entities = [encode_entity(entity) for entity in entities]
+    # Room for exactly three entities in a single request body
+    mock_ocean.config.upsert_entities_batch_max_size_in_bytes = len(
+        build_bulk_body(encoded_entities[:3])
+    )
+
+    bulks = entity_client._pack_entities_in_bulks(entities)
+
+    assert [len(bulk) for bulk, _ in bulks] == [3, 3, 3, 1]
+    assert [entity for bulk, _ in bulks for entity in bulk] == entities
+    for bulk, encoded_bulk in bulks:
+        body = build_bulk_body(encoded_bulk)
+        assert len(body) <= mock_ocean.config.upsert_entities_batch_max_size_in_bytes
+        assert json.loads(body) == {
+            "entities": [
+                entity.dict(exclude_unset=True, by_alias=True) for entity in bulk
+            ]
+        }
+
+
+async def test_upsert_entities_bulk_sends_encoded_body(mock_ocean: MagicMock) -> None:
+    """Test that the bulk request body is the pre-encoded entities, gzipped when large enough"""
+    mock_ocean.config.upsert_entities_batch_gzip_min_size_in_bytes = 100
+    client = MagicMock()
+    client.post = AsyncMock(
+        return_value=Response(
+            207,
+            json={"entities": [{"index": 0, "identifier": "a"}], "errors": []},
+            request=Request("POST", "https://api.getport.io/v1/blueprints/test"),
+        )
+    )
+    auth = MagicMock()
+    auth.headers = AsyncMock(return_value={"Authorization": "token"})
+    entity_client = EntityClientMixin(auth=auth, client=client)
+    entity = Entity(identifier="a", blueprint="test", properties={"x": "y" * 200})
+
+    result = await entity_client.upsert_entities_bulk(
+        "test",
+        [entity],
+        {
+            "merge": True,
+            "create_missing_related_entities": True,
+            "validation_only": False,
+            "delete_dependent_entities": False,
+        },
+        encoded_entities=[encode_entity(entity)],
+    )
+
+    request_kwargs = client.post.call_args.kwargs
+    assert request_kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert request_kwargs["headers"]["Authorization"] == "token"
+    assert json.loads(gzip.decompress(request_kwargs["content"])) == {
+        "entities": [entity.dict(exclude_unset=True, by_alias=True)]
+    }
+    assert isinstance(result, list) and result[0][0] is True
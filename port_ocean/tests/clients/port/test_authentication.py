@@ -0,0 +1,205 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from port_ocean.clients.port.authentication import PortAuthentication, TokenResponse
+from port_ocean.clients.port.retry_transport import TokenRetryTransport
+
+API_URL = "https://api.getport.io/v1"
+
+
+@pytest.fixture(autouse=True)
+def no_on_retry_callback(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Other tests may leave a global on-retry callback that rewrites the auth header
+    monkeypatch.setattr("port_ocean.helpers.retry._ON_RETRY_CALLBACK", None)
+
+
+class FakeAuthEndpoint:
+    """Issues numbered tokens, slowly enough for concurrent callers to overlap"""
+
+    def __init__(self, expires_in: int = 100) -> None:
+        self.expires_in = expires_in
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        token_number = self.calls
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200,
+            json={
+                "accessToken": f"token-{token_number}",
+                "expiresIn": self.expires_in,
+                "tokenType": "Bearer",
+            },
+            request=request,
+        )
+
+
+def _create_auth(
+    auth_endpoint: FakeAuthEndpoint, token_refresh_fraction: float = 0.8
+) -> PortAuthentication:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(auth_endpoint))
+    return PortAuthentication(
+        client,
+        "client-id",
+        "client-secret",
+        API_URL,
+        "integration",
+        "test",
+        "0.1.0",
+        "https://ingest.getport.io",
+        token_refresh_fraction=token_refresh_fraction,
+    )
+
+
+def _set_token(auth: PortAuthentication, access_token: str, retrieved_at: int) -> None:
+    with patch(
+        "port_ocean.clients.port.authentication.get_time", return_value=retrieved_at
+    ):
+        auth.last_token_object = TokenResponse(
+            accessToken=access_token, expiresIn=100, tokenType="Bearer"
+        )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_a_single_token_fetch() -> None:
+    auth_endpoint = FakeAuthEndpoint()
+    auth = _create_auth(auth_endpoint)
+
+    tokens = await asyncio.gather(*(auth.token for _ in range(20)))
+
+    assert auth_endpoint.calls == 1
+    assert set(tokens) == {"Bearer token-1"}
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_fetched_once() -> None:
+    auth_endpoint = FakeAuthEndpoint()
+    auth = _create_auth(auth_endpoint)
+    _set_token(auth, "old", retrieved_at=0)
+
+    with patch("port_ocean.clients.port.authentication.get_time", return_value=200):
+        tokens = await asyncio.gather(*(auth.token for _ in range(20)))
+
+    assert auth_endpoint.calls == 1
+    assert set(tokens) == {"Bearer token-1"}
+
+
+@pytest.mark.asyncio
+async def test_token_is_refreshed_in_the_background() -> None:
+    auth_endpoint = FakeAuthEndpoint()
+    auth = _create_auth(auth_endpoint, token_refresh_fraction=0.5)
+    _set_token(auth, "old", retrieved_at=0)
+
+    with patch("port_ocean.clients.port.authentication.get_time", return_value=60):
+        # Past the refresh point but not expired: the current token is returned at once
+        tokens = await asyncio.gather(*(auth.token for _ in range(5)))
+        assert set(tokens) == {"Bearer old"}
+
+        assert auth._background_refresh_task is not None
+        await auth._background_refresh_task
+
+    assert auth_endpoint.calls == 1
+    assert auth.last_token_object is not None
+    assert auth.last_token_object.full_token == "Bearer token-1"
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_the_current_token() -> None:
+    auth = _create_auth(FakeAuthEndpoint())
+    _set_token(auth, "old", retrieved_at=0)
+
+    with (
+        patch("port_ocean.clients.port.authentication.get_time", return_value=90),
+        patch.object(auth, "_get_token", side_effect=httpx.ConnectError("down")),
+    ):
+        assert await auth.token == "Bearer old"
+        assert auth._background_refresh_task is not None
+        await auth._background_refresh_task
+
+    assert auth.last_token_object is not None
+    assert auth.last_token_object.full_token == "Bearer old"
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_is_refreshed_once() -> None:
+    auth_endpoint = FakeAuthEndpoint()
+    auth = _create_auth(auth_endpoint)
+    await auth.token
+
+    tokens = await asyncio.gather(
+        *(auth.refresh_rejected_token("Bearer token-1") for _ in range(10))
+    )
+
+    assert auth_endpoint.calls == 2
+    assert set(tokens) == {"Bearer token-2"}
+
+
+@pytest.mark.asyncio
+async def test_token_retry_transport_retries_401_with_a_new_token() -> None:
+    auth_endpoint = FakeAuthEndpoint()
+    auth = _create_auth(auth_endpoint)
+    await auth.token
+    sent_tokens: list[str] = []
+
+    def port_api(request: httpx.Request) -> httpx.Response:
+        sent_tokens.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer token-1":
+            return httpx.Response(401, request=request)
+        return httpx.Response(200, json={"ok": True}, request=request)
+
+    port_client: Any = MagicMock()
+    port_client.auth = auth
+    transport = TokenRetryTransport(
+        port_client=port_client,
+        wrapped_transport=httpx.MockTransport(port_api),
+        base_delay=0,
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.post(
+            f"{API_URL}/blueprints/service/entities",
+            headers=await auth.headers(),
+            extensions={"retryable": True},
+        )
+
+    assert response.status_code == 200
+    assert sent_tokens == ["Bearer token-1", "Bearer token-2"]
+
+
+@pytest.mark.asyncio
+async def test_token_retry_transport_refreshes_token_once_per_request() -> None:
+    auth_endpoint = FakeAuthEndpoint()
+    auth = _create_auth(auth_endpoint)
+    await auth.token
+    attempts = 0
+
+    def port_api(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(401, request=request)
+
+    port_client: Any = MagicMock()
+    port_client.auth = auth
+    transport = TokenRetryTransport(
+        port_client=port_client,
+        wrapped_transport=httpx.MockTransport(port_api),
+        max_attempts=3,
+        base_delay=0,
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.post(
+            f"{API_URL}/blueprints/service/entities",
+            headers=await auth.headers(),
+            extensions={"retryable": True},
+        )
+
+    assert response.status_code == 401
+    assert attempts == 4
+    # A token that keeps being rejected is not fetched again on every attempt
+    assert auth_endpoint.calls == 2
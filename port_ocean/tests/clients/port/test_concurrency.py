@@ -0,0 +1,141 @@
+import asyncio
+from typing import Any, Callable, Coroutine
+
+import httpx
+import pytest
+
+from port_ocean.clients.port.concurrency import AdaptiveConcurrencyLimiter
+
+
+def _create_limiter(**kwargs: Any) -> AdaptiveConcurrencyLimiter:
+    options: dict[str, Any] = {
+        "name": "test",
+        "initial_limit": 4,
+        "min_limit": 1,
+        "max_limit": 10,
+        "latency_threshold_seconds": 1,
+        "window_size": 4,
+    }
+    options.update(kwargs)
+    return AdaptiveConcurrencyLimiter(**options)
+
+
+def _respond(
+    status_code: int, delay: float = 0
+) -> Callable[[], Coroutine[Any, Any, httpx.Response]]:
+    async def send_request() -> httpx.Response:
+        await asyncio.sleep(delay)
+        return httpx.Response(status_code)
+
+    return send_request
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_requests() -> None:
+    limiter = _create_limiter(initial_limit=3, window_size=100)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def send_request() -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    await asyncio.gather(*(limiter.run(send_request) for _ in range(10)))
+
+    assert max_in_flight == 3
+    assert limiter.in_flight == 0
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_grows_limit_while_saturated_and_healthy() -> None:
+    limiter = _create_limiter(initial_limit=2)
+
+    await asyncio.gather(*(limiter.run(_respond(200, 0.001)) for _ in range(8)))
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_does_not_grow_limit_without_queueing() -> None:
+    limiter = _create_limiter(initial_limit=2)
+
+    for _ in range(8):
+        await limiter.run(_respond(200))
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_backs_off_once_per_overloaded_period() -> None:
+    limiter = _create_limiter(initial_limit=8)
+
+    responses = await asyncio.gather(
+        *(limiter.run(_respond(429, 0.01)) for _ in range(8))
+    )
+
+    assert all(response.status_code == 429 for response in responses)
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_backs_off_on_transport_errors_and_reraises() -> None:
+    limiter = _create_limiter(initial_limit=4)
+
+    async def send_request() -> httpx.Response:
+        raise httpx.ConnectError("boom")
+
+    with pytest.raises(httpx.ConnectError):
+        await limiter.run(send_request)
+
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_backs_off_when_p95_latency_exceeds_threshold() -> None:
+    limiter = _create_limiter(initial_limit=4, latency_threshold_seconds=0.005)
+
+    for _ in range(4):
+        await limiter.run(_respond(200, 0.01))
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_never_goes_below_min_limit() -> None:
+    limiter = _create_limiter(initial_limit=2, min_limit=1)
+
+    for _ in range(5):
+        await limiter.run(_respond(503))
+
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    limiter = _create_limiter(initial_limit=1)
+    release = asyncio.Event()
+
+    async def blocking_request() -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200)
+
+    holder = asyncio.create_task(limiter.run(blocking_request))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(limiter.run(_respond(200)))
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    await holder
+
+    assert limiter.in_flight == 0
+    assert (await limiter.run(_respond(200))).status_code == 200
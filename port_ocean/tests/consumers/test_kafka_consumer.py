@@ -0,0 +1,124 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from port_ocean.consumers.kafka_consumer import (
+    KafkaConsumer,
+    KafkaConsumerConfig,
+    OffsetTracker,
+)
+
+
+def _message(offset: int, key: bytes | None = None, partition: int = 0) -> MagicMock:
+    msg = MagicMock()
+    msg.topic.return_value = "org.change.log"
+    msg.partition.return_value = partition
+    msg.offset.return_value = offset
+    msg.key.return_value = key
+    msg.error.return_value = None
+    return msg
+
+
+@pytest.fixture
+def consumer_config() -> KafkaConsumerConfig:
+    return KafkaConsumerConfig(
+        brokers="localhost:9092",
+        security_protocol="PLAINTEXT",
+        authentication_mechanism="PLAIN",
+        kafka_security_enabled=False,
+        consumer_poll_timeout=1,
+        consumer_max_concurrency=2,
+        consumer_commit_interval=0,
+    )
+
+
+def _create_consumer(
+    config: KafkaConsumerConfig, handler: Any
+) -> tuple[KafkaConsumer, MagicMock]:
+    with patch("port_ocean.consumers.kafka_consumer.Consumer") as consumer_class:
+        consumer = KafkaConsumer(msg_process=handler, config=config, org_id="org")
+    return consumer, consumer_class.return_value
+
+
+def test_offset_tracker_commits_lowest_offset_in_flight() -> None:
+    tracker = OffsetTracker()
+    first, second, third = _message(0), _message(1), _message(2)
+    for msg in (first, second, third):
+        tracker.add(msg)
+
+    tracker.done(second)
+    tracker.done(third)
+    assert [tp.offset for tp in tracker.pop_commit_positions()] == [0]
+    assert tracker.pop_commit_positions() == []
+
+    tracker.done(first)
+    assert [tp.offset for tp in tracker.pop_commit_positions()] == [3]
+
+
+async def test_messages_with_the_same_key_are_handled_in_order(
+    consumer_config: KafkaConsumerConfig,
+) -> None:
+    handled: list[int] = []
+
+    async def handler(msg: Any) -> None:
+        # Earlier messages sleep longer, so only key ordering keeps them in order
+        await asyncio.sleep(0.01 * (3 - msg.offset()))
+        handled.append(msg.offset())
+
+    consumer, _ = _create_consumer(consumer_config, handler)
+    for offset in range(3):
+        consumer._dispatch(_message(offset, key=b"integration"))
+    await asyncio.gather(*consumer._key_tails.values())
+    await asyncio.sleep(0)
+
+    assert handled == [0, 1, 2]
+    assert consumer._key_tails == {}
+
+
+async def test_offsets_are_committed_after_handlers_finish(
+    consumer_config: KafkaConsumerConfig,
+) -> None:
+    release = asyncio.Event()
+
+    async def handler(msg: Any) -> None:
+        await release.wait()
+
+    consumer, kafka_consumer = _create_consumer(consumer_config, handler)
+    consumer._dispatch(_message(0, key=b"a"))
+    consumer._dispatch(_message(1, key=b"b"))
+    await asyncio.sleep(0)
+
+    consumer._commit_if_due()
+    kafka_consumer.commit.assert_called_once()
+    assert kafka_consumer.commit.call_args.kwargs["offsets"][0].offset == 0
+
+    release.set()
+    await asyncio.gather(*consumer._key_tails.values())
+    consumer._commit_if_due()
+
+    assert kafka_consumer.commit.call_args.kwargs["offsets"][0].offset == 2
+    assert kafka_consumer.commit.call_args.kwargs["asynchronous"] is True
+
+
+async def test_failed_messages_are_committed_as_handled(
+    consumer_config: KafkaConsumerConfig,
+) -> None:
+    handled: list[int] = []
+
+    async def handler(msg: Any) -> None:
+        if msg.offset() == 0:
+            raise ValueError("Cannot decode message")
+        handled.append(msg.offset())
+
+    consumer, kafka_consumer = _create_consumer(consumer_config, handler)
+    consumer._dispatch(_message(0, key=b"integration"))
+    consumer._dispatch(_message(1, key=b"integration"))
+    await asyncio.gather(*consumer._key_tails.values())
+    consumer._commit_if_due()
+
+    # The failure neither stops the next message nor holds back the partition
+    assert handled == [1]
+    assert consumer._offsets.in_flight == 0
+    assert kafka_consumer.commit.call_args.kwargs["offsets"][0].offset == 2
@@ -1,3 +1,5 @@
+import gzip
+import json
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -7,7 +9,11 @@ from httpx import Response
 
 from port_ocean.cache.memory import InMemoryCacheProvider
 from port_ocean.clients.port.client import PortClient
-from port_ocean.config.settings import IntegrationSettings, MetricsSettings
+from port_ocean.config.settings import (
+    IntegrationSettings,
+    MetricsSettings,
+    ResyncCheckpointSettings,
+)
 from port_ocean.context.event import EventContext
 from port_ocean.context.ocean import PortOceanContext, ocean
 from port_ocean.core.handlers.entities_state_applier.port.applier import (
@@ -29,6 +35,16 @@ from port_ocean.helpers.metric.metric import Metrics
 from port_ocean.ocean import Ocean
 
 
+def get_request_json(request_kwargs: dict[str, Any]) -> Any:
+    """The JSON body of a mocked request, sent either as `json=` or as pre-encoded `content=`"""
+    if "content" in request_kwargs:
+        content = request_kwargs["content"]
+        if request_kwargs.get("headers", {}).get("Content-Encoding") == "gzip":
+            content = gzip.decompress(content)
+        return json.loads(content)
+    return request_kwargs.get("json", {})
+
+
 @pytest.fixture
 def mock_http_client() -> MagicMock:
     mock_http_client = MagicMock()
@@ -38,7 +54,7 @@ def mock_http_client() -> MagicMock:
         if "/bulk" in url:
             success_entities = []
             failed_entities = []
-            entities_body = kwargs.get("json", {})
+            entities_body = get_request_json(kwargs)
             entities = entities_body.get("entities", [])
             for index, entity in enumerate(entities):
                 if entity.get("properties", {}).get("mock_is_to_fail", False):
@@ -127,6 +143,8 @@ def mock_ocean(mock_port_client: PortClient) -> Ocean:
         ocean_mock.config = MagicMock()
         ocean_mock.config.port = MagicMock()
         ocean_mock.config.port.port_app_config_cache_ttl = 60
+        ocean_mock.config.resync_checkpoint = ResyncCheckpointSettings()
+        ocean_mock.config.upsert_entities_batch_gzip_min_size_in_bytes = None
         ocean_mock.port_client = mock_port_client
         ocean_mock.process_execution_mode = ProcessExecutionMode.single_process
         ocean_mock.cache_provider = InMemoryCacheProvider()
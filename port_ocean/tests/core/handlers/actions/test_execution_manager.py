@@ -4,7 +4,6 @@ import uuid
 from datetime import datetime, timedelta
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from fastapi import APIRouter, FastAPI
-from loguru import logger
 from pydantic import BaseModel
 import pytest
 import httpx
@@ -28,6 +27,7 @@ from port_ocean.core.models import (
     IntegrationFeatureFlag,
     RunStatus,
 )
+from port_ocean.helpers.metric.metric import MetricType
 from port_ocean.exceptions.execution_manager import (
     DuplicateActionExecutorError,
     RunAlreadyAcknowledgedError,
@@ -62,6 +62,7 @@ def mock_port_client() -> MagicMock:
     mock_port_client.get_run_by_external_id = AsyncMock()
     mock_port_client.patch_run = AsyncMock()
     mock_port_client.post_run_log = AsyncMock()
+    mock_port_client.extend_run_visibility = AsyncMock(return_value=True)
     mock_port_client.get_organization_feature_flags = AsyncMock(
         return_value=[IntegrationFeatureFlag.OCEAN_ACTIONS_PROCESSING_ENABLED]
     )
@@ -75,6 +76,7 @@ def mock_ocean(mock_port_client: PortClient) -> Ocean:
     ocean_mock = MagicMock(spec=Ocean)
     ocean_mock.config = MagicMock()
     ocean_mock.port_client = mock_port_client
+    ocean_mock.metrics = MagicMock()
     ocean_mock.integration_router = APIRouter()
     ocean_mock.fast_api_app = FastAPI()
     return ocean_mock
@@ -112,6 +114,8 @@ def mock_test_executor() -> MagicMock:
     mock_executor.execute = AsyncMock(return_value=None)
     mock_executor.is_close_to_rate_limit = AsyncMock(return_value=False)
     mock_executor.get_remaining_seconds_until_rate_limit = AsyncMock(return_value=0.0)
+    mock_executor.PARTITION_WEIGHT = 1
+    mock_executor.PARTITION_CONCURRENCY = 1
     return mock_executor
 
 
@@ -129,6 +133,8 @@ def mock_test_partition_executor() -> MagicMock:
     mock_executor.execute = AsyncMock(return_value=None)
     mock_executor.is_close_to_rate_limit = AsyncMock(return_value=False)
     mock_executor.get_remaining_seconds_until_rate_limit = AsyncMock(return_value=0.0)
+    mock_executor.PARTITION_WEIGHT = 1
+    mock_executor.PARTITION_CONCURRENCY = 1
     return mock_executor
 
 
@@ -275,57 +281,37 @@ class TestExecutionManager:
         )
 
     @pytest.mark.asyncio
-    async def test_get_queues_size_with_global_and_partition_queues(
+    async def test_queues_size_with_global_and_partition_queues(
         self, execution_manager: ExecutionManager
     ) -> None:
         # Arrange
-        await execution_manager._global_queue.put(generate_mock_action_run())
-        await execution_manager._global_queue.put(generate_mock_action_run())
-
-        execution_manager._partition_queues["partition1"] = (
-            execution_manager._global_queue.__class__()
-        )
-        await execution_manager._partition_queues["partition1"].put(
-            generate_mock_action_run()
+        execution_manager._add_run_to_queue(generate_mock_action_run(), GLOBAL_SOURCE)
+        execution_manager._add_run_to_queue(generate_mock_action_run(), GLOBAL_SOURCE)
+        execution_manager._add_run_to_queue(
+            generate_mock_action_run(), "test_action:partition1"
         )
 
         # Act
-        size = await execution_manager._get_queues_size()
+        size = execution_manager._scheduler.size
 
         # Assert
         assert size == 3
 
     @pytest.mark.asyncio
-    async def test_add_run_to_queue_should_add_source_to_active_when_empty(
+    async def test_add_run_to_queue_should_schedule_run_and_deduplicate(
         self, execution_manager: ExecutionManager
     ) -> None:
         # Arrange
         run = generate_mock_action_run()
 
         # Act
-        await execution_manager._add_run_to_queue(run, GLOBAL_SOURCE)
+        execution_manager._add_run_to_queue(run, GLOBAL_SOURCE)
 
         # Assert
-        assert await execution_manager._global_queue.size() == 1
-        active_source = await execution_manager._active_sources.get()
-        assert active_source == GLOBAL_SOURCE
+        assert execution_manager._scheduler.size == 1
+        assert execution_manager._scheduler.take() == (GLOBAL_SOURCE, run)
         assert run.id in execution_manager._deduplication_set
 
-    @pytest.mark.asyncio
-    async def test_add_run_to_queue_should_not_add_source_when_queue_has_items(
-        self, execution_manager: ExecutionManager
-    ) -> None:
-        # Arrange
-        run1 = generate_mock_action_run()
-        run2 = generate_mock_action_run()
-
-        # Act & Assert
-        await execution_manager._add_run_to_queue(run1, GLOBAL_SOURCE)
-
-        with patch.object(execution_manager._active_sources, "put") as mock_add_source:
-            await execution_manager._add_run_to_queue(run2, GLOBAL_SOURCE)
-            mock_add_source.assert_not_called()
-
     @pytest.mark.asyncio
     async def test_add_run_to_queue_should_create_queue_if_not_exists(
         self, execution_manager: ExecutionManager
@@ -335,22 +321,21 @@ class TestExecutionManager:
         run = generate_mock_action_run()
 
         # Act
-        await execution_manager._add_run_to_queue(run, queue_name)
+        execution_manager._add_run_to_queue(run, queue_name)
 
         # Assert
-        assert queue_name in execution_manager._partition_queues
-        assert queue_name in execution_manager._queues_locks
-        assert await execution_manager._partition_queues[queue_name].size() == 1
+        assert execution_manager._scheduler.partitions_count == 1
+        assert execution_manager._scheduler.take() == (queue_name, run)
 
     @pytest.mark.asyncio
-    async def test_handle_global_queue_once_should_process_run_and_remove_dedup(
+    async def test_process_next_run_should_process_global_run_and_remove_dedup(
         self,
         execution_manager: ExecutionManager,
         mock_port_client: MagicMock,
     ) -> None:
         # Arrange
         run = generate_mock_action_run()
-        await execution_manager._add_run_to_queue(
+        execution_manager._add_run_to_queue(
             run,
             GLOBAL_SOURCE,
         )
@@ -359,14 +344,14 @@ class TestExecutionManager:
         with patch.object(
             execution_manager._actions_executors["test_action"], "execute"
         ) as mock_execute:
-            await execution_manager._handle_global_queue_once()
+            assert await execution_manager._process_next_run()
 
             assert run.id not in execution_manager._deduplication_set
             mock_port_client.acknowledge_run.assert_called_once_with(run.id)
             mock_execute.assert_called_once_with(run)
 
     @pytest.mark.asyncio
-    async def test_handle_partition_queue_once_should_process_run(
+    async def test_process_next_run_should_process_partition_run_and_drop_idle_partition(
         self,
         execution_manager: ExecutionManager,
         mock_port_client: MagicMock,
@@ -374,7 +359,7 @@ class TestExecutionManager:
         # Arrange
         partition_name = "test_action:partition1"
         run = generate_mock_action_run()
-        await execution_manager._add_run_to_queue(
+        execution_manager._add_run_to_queue(
             run,
             partition_name,
         )
@@ -383,11 +368,33 @@ class TestExecutionManager:
         with patch.object(
             execution_manager._actions_executors["test_action"], "execute"
         ) as mock_execute:
-            await execution_manager._handle_partition_queue_once(partition_name)
+            assert await execution_manager._process_next_run()
 
             assert run.id not in execution_manager._deduplication_set
             mock_port_client.acknowledge_run.assert_called_once_with(run.id)
             mock_execute.assert_called_once_with(run)
+            assert execution_manager._scheduler.partitions_count == 0
+            assert not await execution_manager._process_next_run()
+
+    @pytest.mark.asyncio
+    async def test_poll_action_runs_should_skip_runs_being_processed(
+        self, execution_manager: ExecutionManager, mock_port_client: MagicMock
+    ) -> None:
+        # Arrange
+        run = generate_mock_action_run()
+        execution_manager._add_run_to_queue(run, GLOBAL_SOURCE)
+        execution_manager._scheduler.take()
+        mock_port_client.claim_pending_runs.return_value = [run]
+
+        # Act
+        polling_task: asyncio.Task[None] = asyncio.create_task(
+            execution_manager._poll_action_runs()
+        )
+        await asyncio.sleep(0.05)
+        await execution_manager._gracefully_cancel_task(polling_task)
+
+        # Assert
+        assert execution_manager._scheduler.size == 0
 
     @pytest.mark.asyncio
     async def test_poll_action_runs_should_respect_high_watermark(
@@ -396,7 +403,9 @@ class TestExecutionManager:
         # Arrange
         execution_manager._high_watermark = 2
         for _ in range(3):
-            await execution_manager._global_queue.put(generate_mock_action_run())
+            execution_manager._add_run_to_queue(
+                generate_mock_action_run(), GLOBAL_SOURCE
+            )
 
         mock_port_client.claim_pending_runs.return_value = []
 
@@ -432,10 +441,7 @@ class TestExecutionManager:
 
         # Assert
         mock_port_client.claim_pending_runs.assert_called()
-        assert (
-            await execution_manager._global_queue.size()
-            == execution_manager._high_watermark
-        )
+        assert execution_manager._scheduler.size == execution_manager._high_watermark
 
     @pytest.mark.asyncio
     async def test_poll_action_runs_should_skip_unregistered_actions(
@@ -458,7 +464,7 @@ class TestExecutionManager:
         await execution_manager._gracefully_cancel_task(polling_task)
 
         # Assert
-        assert await execution_manager._get_queues_size() == 0
+        assert execution_manager._scheduler.size == 0
 
     @pytest.mark.asyncio
     async def test_shutdown_should_cancel_polling_and_waits_for_workers(
@@ -536,10 +542,23 @@ class TestExecutionManager:
         execution_manager_without_executors._poll_check_interval_seconds = 0
         execution_manager_without_executors._max_wait_seconds_before_shutdown = 1.0
 
+        def get_queue_name(run: ActionRun) -> str:
+            partition_name = run.payload.integrationActionExecutionProperties.get(
+                "partition_name"
+            )
+            if partition_name is None:
+                return GLOBAL_SOURCE
+            return f"{mock_test_partition_executor.ACTION_NAME}:{partition_name}"
+
+        # Record execution timings for measurement
         async def mock_execute(
             run: ActionRun,
         ) -> None:
+            start_time = datetime.now()
             await asyncio.sleep(0.1)
+            run_measurements[get_queue_name(run)].append(
+                RunMeasurement(start_time=start_time, end_time=datetime.now())
+            )
             return None
 
         mock_test_executor.execute.side_effect = mock_execute
@@ -548,45 +567,6 @@ class TestExecutionManager:
         execution_manager_without_executors.register_executor(
             mock_test_partition_executor
         )
-
-        # Patch the relevant methods to record execution timings for measurement
-        original_handle_global_queue_once = (
-            execution_manager_without_executors._handle_global_queue_once
-        )
-        original_handle_partition_queue_once = (
-            execution_manager_without_executors._handle_partition_queue_once
-        )
-
-        async def wrapped_handle_global_queue_once() -> None:
-            start_time = datetime.now()
-            await original_handle_global_queue_once()
-            try:
-                run_measurements[GLOBAL_SOURCE].append(
-                    RunMeasurement(start_time=start_time, end_time=datetime.now())
-                )
-            except Exception as e:
-                logger.error(f"Error recording run measurement: {e}")
-
-        async def wrapped_handle_partition_queue_once(partition_name: str) -> None:
-            start_time = datetime.now()
-            await original_handle_partition_queue_once(partition_name)
-            try:
-                run_measurements[partition_name].append(
-                    RunMeasurement(start_time=start_time, end_time=datetime.now())
-                )
-            except Exception as e:
-                logger.error(f"Error recording run measurement: {e}")
-
-        setattr(
-            execution_manager_without_executors,
-            "_handle_global_queue_once",
-            wrapped_handle_global_queue_once,
-        )
-        setattr(
-            execution_manager_without_executors,
-            "_handle_partition_queue_once",
-            wrapped_handle_partition_queue_once,
-        )
         mock_port_client.claim_pending_runs.side_effect = (
             lambda limit, visibility_timeout_ms: [
                 *[
@@ -736,7 +716,7 @@ class TestExecutionManager:
         assert poll_count >= 4
         assert mock_port_client.claim_pending_runs.call_count >= 4
         # Should have successfully processed runs from successful polls
-        assert await execution_manager._get_queues_size() > 0
+        assert execution_manager._scheduler.size > 0
 
     @pytest.mark.asyncio
     async def test_process_actions_runs_handles_exceptions_gracefully(
@@ -761,7 +741,7 @@ class TestExecutionManager:
         mock_port_client.patch_run.side_effect = patch_error
 
         # Add run to queue
-        await execution_manager._add_run_to_queue(run, GLOBAL_SOURCE)
+        execution_manager._add_run_to_queue(run, GLOBAL_SOURCE)
 
         # Act
         # Start worker loop which should handle exceptions gracefully
@@ -834,4 +814,197 @@ class TestExecutionManager:
         # Should have attempted to poll multiple times, handling the error gracefully
         assert mock_port_client.claim_pending_runs.call_count >= 2
         # Should have successfully added runs from successful polls
-        assert await execution_manager._get_queues_size() > 0
+        assert execution_manager._scheduler.size > 0
+
+    def test_idle_backoff_grows_exponentially_up_to_poll_check_interval(
+        self, execution_manager: ExecutionManager
+    ) -> None:
+        execution_manager._poll_idle_backoff_initial_seconds = 0.5
+        execution_manager._poll_check_interval_seconds = 5
+
+        backoffs = [
+            execution_manager._get_idle_backoff_seconds(idle_polls)
+            for idle_polls in (1, 2, 3, 4, 5, 1000)
+        ]
+
+        assert backoffs == [0.5, 1, 2, 4, 5, 5]
+
+    @pytest.mark.asyncio
+    async def test_poll_action_runs_backs_off_when_idle(
+        self, execution_manager: ExecutionManager, mock_port_client: MagicMock
+    ) -> None:
+        # Arrange
+        execution_manager._poll_idle_backoff_initial_seconds = 0.05
+        mock_port_client.claim_pending_runs.return_value = []
+
+        # Act
+        polling_task: asyncio.Task[None] = asyncio.create_task(
+            execution_manager._poll_action_runs()
+        )
+        await asyncio.sleep(0.2)
+        await execution_manager._gracefully_cancel_task(polling_task)
+
+        # Assert
+        # Polls at 0, 0.05 and 0.15 seconds, the next one is due at 0.35 seconds
+        assert mock_port_client.claim_pending_runs.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_poll_action_runs_uses_long_poll_when_enabled(
+        self, execution_manager: ExecutionManager, mock_port_client: MagicMock
+    ) -> None:
+        # Arrange
+        execution_manager._long_poll_timeout_ms = 20000
+        mock_port_client.claim_pending_runs.return_value = []
+
+        # Act
+        polling_task: asyncio.Task[None] = asyncio.create_task(
+            execution_manager._poll_action_runs()
+        )
+        await asyncio.sleep(0.05)
+        await execution_manager._gracefully_cancel_task(polling_task)
+
+        # Assert
+        mock_port_client.claim_pending_runs.assert_called_with(
+            limit=execution_manager._high_watermark,
+            visibility_timeout_ms=execution_manager._visibility_timeout_ms,
+            wait_time_ms=20000,
+        )
+
+    @pytest.mark.asyncio
+    async def test_poll_action_runs_re_polls_once_a_worker_frees_capacity(
+        self, execution_manager: ExecutionManager, mock_port_client: MagicMock
+    ) -> None:
+        # Arrange
+        execution_manager._high_watermark = 1
+        execution_manager._add_run_to_queue(generate_mock_action_run(), GLOBAL_SOURCE)
+        mock_port_client.claim_pending_runs.return_value = []
+        polling_task: asyncio.Task[None] = asyncio.create_task(
+            execution_manager._poll_action_runs()
+        )
+        await asyncio.sleep(0.05)
+        mock_port_client.claim_pending_runs.assert_not_called()
+
+        # Act
+        await execution_manager._process_next_run()
+        await asyncio.sleep(0.05)
+        await execution_manager._gracefully_cancel_task(polling_task)
+
+        # Assert
+        # Well before the poll check interval has passed
+        mock_port_client.claim_pending_runs.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_run_extends_lease_while_executing(
+        self,
+        execution_manager: ExecutionManager,
+        mock_port_client: MagicMock,
+        mock_test_executor: MagicMock,
+        mock_ocean: MagicMock,
+    ) -> None:
+        # Arrange
+        run = generate_mock_action_run()
+        execution_manager._lease_extension_interval_seconds = 0
+        lease_extended_three_times = asyncio.Event()
+
+        async def extend_run_visibility(
+            run_id: str, visibility_timeout_ms: int
+        ) -> bool:
+            if mock_port_client.extend_run_visibility.call_count >= 3:
+                lease_extended_three_times.set()
+            return True
+
+        async def long_execution(run: ActionRun) -> None:
+            await lease_extended_three_times.wait()
+
+        mock_port_client.extend_run_visibility.side_effect = extend_run_visibility
+        mock_test_executor.execute.side_effect = long_execution
+
+        # Act
+        await asyncio.wait_for(execution_manager._execute_run(run), timeout=5)
+        extensions_count = mock_port_client.extend_run_visibility.call_count
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        # Assert
+        assert extensions_count >= 3
+        # Extensions stop once the executor is done
+        assert mock_port_client.extend_run_visibility.call_count == extensions_count
+        mock_port_client.extend_run_visibility.assert_called_with(
+            run.id, execution_manager._visibility_timeout_ms
+        )
+        mock_ocean.metrics.inc_metric.assert_called_with(
+            name=MetricType.ACTION_LEASE_EXTENSION_NAME,
+            labels=["test_action", "success"],
+            value=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_run_extends_lease_while_rate_limited(
+        self,
+        execution_manager: ExecutionManager,
+        mock_port_client: MagicMock,
+        mock_test_executor: MagicMock,
+    ) -> None:
+        # Arrange
+        run = generate_mock_action_run()
+        execution_manager._lease_extension_interval_seconds = 0
+
+        async def is_close_to_rate_limit() -> bool:
+            return mock_port_client.extend_run_visibility.call_count < 2
+
+        mock_test_executor.is_close_to_rate_limit.side_effect = is_close_to_rate_limit
+
+        # Act
+        await asyncio.wait_for(execution_manager._execute_run(run), timeout=5)
+
+        # Assert
+        assert mock_port_client.extend_run_visibility.call_count >= 2
+        mock_port_client.acknowledge_run.assert_called_once_with(run.id)
+        mock_test_executor.execute.assert_called_once_with(run)
+
+    @pytest.mark.asyncio
+    async def test_execute_run_does_not_extend_lease_by_default(
+        self,
+        execution_manager: ExecutionManager,
+        mock_port_client: MagicMock,
+        mock_test_executor: MagicMock,
+    ) -> None:
+        # Arrange
+        run = generate_mock_action_run()
+
+        # Act
+        await execution_manager._execute_run(run)
+
+        # Assert
+        assert execution_manager._lease_extension_interval_seconds is None
+        mock_test_executor.execute.assert_called_once_with(run)
+        mock_port_client.extend_run_visibility.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_run_reports_claim_to_start_latency(
+        self,
+        execution_manager: ExecutionManager,
+        mock_port_client: MagicMock,
+        mock_ocean: MagicMock,
+    ) -> None:
+        # Arrange
+        execution_manager._high_watermark = 1
+        run = generate_mock_action_run()
+        mock_port_client.claim_pending_runs.return_value = [run]
+        polling_task: asyncio.Task[None] = asyncio.create_task(
+            execution_manager._poll_action_runs()
+        )
+        await asyncio.sleep(0.05)
+        await execution_manager._gracefully_cancel_task(polling_task)
+
+        # Act
+        await execution_manager._process_next_run()
+
+        # Assert
+        assert run.id not in execution_manager._runs_claimed_at
+        mock_ocean.metrics.set_metric.assert_called_once_with(
+            name=MetricType.ACTION_CLAIM_TO_START_LATENCY_NAME,
+            labels=["test_action"],
+            value=ANY,
+        )
+        assert mock_ocean.metrics.set_metric.call_args.kwargs["value"] >= 0.05
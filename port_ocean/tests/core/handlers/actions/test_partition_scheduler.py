@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from port_ocean.core.handlers.actions.partition_scheduler import PartitionScheduler
+from port_ocean.core.models import (
+    ActionRun,
+    IntegrationActionInvocationPayload,
+    RunStatus,
+)
+
+
+def generate_action_run(run_id: str) -> ActionRun:
+    return ActionRun(
+        id=run_id,
+        status=RunStatus.IN_PROGRESS,
+        payload=IntegrationActionInvocationPayload(
+            type="INTEGRATION_ACTION",
+            installationId="test-installation-id",
+            integrationActionType="test_action",
+            integrationActionExecutionProperties={},
+        ),
+    )
+
+
+def take_all(scheduler: PartitionScheduler) -> list[str]:
+    """Take runs until none is ready, releasing each one at once"""
+    taken = []
+    while (scheduled := scheduler.take()) is not None:
+        partition_name, run = scheduled
+        taken.append(run.id)
+        scheduler.done(partition_name)
+    return taken
+
+
+def test_partitions_are_served_in_weighted_round_robin() -> None:
+    scheduler = PartitionScheduler()
+    for index in range(4):
+        scheduler.put(
+            "heavy",
+            generate_action_run(f"heavy-{index}"),
+            weight=2,
+            concurrency_limit=None,
+        )
+        scheduler.put("light", generate_action_run(f"light-{index}"), weight=1)
+
+    assert take_all(scheduler) == [
+        "heavy-0",
+        "heavy-1",
+        "light-0",
+        "heavy-2",
+        "heavy-3",
+        "light-1",
+        "light-2",
+        "light-3",
+    ]
+
+
+def test_partition_concurrency_limit_is_enforced() -> None:
+    scheduler = PartitionScheduler()
+    for index in range(3):
+        scheduler.put(
+            "partition", generate_action_run(f"run-{index}"), concurrency_limit=2
+        )
+
+    first = scheduler.take()
+    second = scheduler.take()
+    assert first is not None and second is not None
+    assert scheduler.take() is None
+
+    scheduler.done("partition")
+    third = scheduler.take()
+    assert third is not None
+    assert third[1].id == "run-2"
+
+
+def test_idle_partitions_are_dropped_and_size_is_tracked() -> None:
+    scheduler = PartitionScheduler()
+    scheduler.put("partition", generate_action_run("run-0"))
+    scheduler.put("partition", generate_action_run("run-1"))
+    assert scheduler.size == 2
+
+    scheduled = scheduler.take()
+    assert scheduled is not None
+    assert scheduler.size == 1
+    # The partition is still executing a run, and has another queued
+    scheduler.done("partition")
+    assert scheduler.partitions_count == 1
+
+    scheduled = scheduler.take()
+    assert scheduled is not None
+    assert scheduler.size == 0
+    assert scheduler.partitions_count == 1
+    scheduler.done("partition")
+    assert scheduler.partitions_count == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_wakes_when_a_run_is_queued() -> None:
+    scheduler = PartitionScheduler()
+    waiter = asyncio.create_task(scheduler.wait_until_ready())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    scheduler.put("partition", generate_action_run("run-0"))
+
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+def test_scheduling_many_partitions() -> None:
+    partitions_count = 100_000
+    scheduler = PartitionScheduler()
+    run = generate_action_run("run")
+
+    for index in range(partitions_count):
+        scheduler.put(f"test_action:repo-{index}", run)
+    assert scheduler.size == partitions_count
+    assert scheduler.partitions_count == partitions_count
+
+    taken = take_all(scheduler)
+
+    assert len(taken) == partitions_count
+    assert scheduler.size == 0
+    assert scheduler.partitions_count == 0
+    assert scheduler.take() is None
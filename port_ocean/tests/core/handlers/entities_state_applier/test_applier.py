@@ -236,7 +236,7 @@ async def test_upsert_groups_entities_by_blueprint(
     mock_context: PortOceanContext,
     mock_port_app_config: PortAppConfig,
 ) -> None:
-    """Test that upsert groups entities by blueprint and calls upsert_entities_in_batches separately for each group."""
+    """Test that upsert groups entities by blueprint and upserts every group in a single scheduled call."""
     applier = HttpEntitiesStateApplier(mock_context)
 
     # Create entities with different blueprints
@@ -253,30 +253,25 @@ async def test_upsert_groups_entities_by_blueprint(
         mock_ocean.config.upsert_entities_batch_max_length = 100
         mock_ocean.config.upsert_entities_batch_max_size_in_bytes = 1000
 
-        # Mock the upsert_entities_in_batches method to track calls
+        # Mock the upsert_entities_by_blueprint method to track calls
         mock_upsert = AsyncMock()
-        mock_upsert.side_effect = [
-            [
-                (True, service_entity_1),
-                (True, service_entity_2),
-            ],  # First call for "service" blueprint
-            [(True, deployment_entity)],  # Second call for "deployment" blueprint
-            [(True, user_entity)],  # Third call for "user" blueprint
+        mock_upsert.return_value = [
+            (True, service_entity_1),
+            (True, deployment_entity),
+            (True, service_entity_2),
+            (False, user_entity),
         ]
-        setattr(mock_ocean.port_client, "upsert_entities_in_batches", mock_upsert)
+        setattr(mock_ocean.port_client, "upsert_entities_by_blueprint", mock_upsert)
 
         result = await applier.upsert(entities, UserAgentType.exporter)
 
-        assert mock_upsert.call_count == 3
-
-        assert len(result) == 4
-
-        calls = mock_upsert.call_args_list
+        mock_upsert.assert_called_once()
+        assert result == [service_entity_1, deployment_entity, service_entity_2]
+        assert event.entity_topological_sorter.entities == [user_entity]
 
-        called_entities_groups = [call[0][0] for call in calls]
+        blueprint_groups = mock_upsert.call_args[0][0]
         blueprint_counts = {}
-        for entities_group in called_entities_groups:
-            blueprint = entities_group[0].blueprint
+        for blueprint, entities_group in blueprint_groups.items():
             for entity in entities_group:
                 assert entity.blueprint == blueprint
             blueprint_counts[blueprint] = len(entities_group)
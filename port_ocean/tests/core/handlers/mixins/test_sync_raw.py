@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from graphlib import CycleError
 from typing import Any, AsyncGenerator
 
@@ -23,7 +24,11 @@ from port_ocean.context.event import event_context, EventType
 from port_ocean.clients.port.types import UserAgentType
 from dataclasses import dataclass
 from typing import List, Optional
-from port_ocean.tests.core.conftest import create_entity, no_op_event_context
+from port_ocean.tests.core.conftest import (
+    create_entity,
+    get_request_json,
+    no_op_event_context,
+)
 
 
 @pytest.fixture
@@ -442,7 +447,7 @@ async def test_sync_raw_mixin_dependency(
                 assert "-".join(
                     [
                         entity.get("identifier")
-                        for entity in result_bulk[1].get("json").get("entities")
+                        for entity in get_request_json(result_bulk[1]).get("entities")
                     ]
                 ) == "-".join([entity.identifier for entity in entities])
                 assert "-".join(
@@ -1084,3 +1089,29 @@ async def test_on_resync_start_hook_error_prevents_resync(
     assert (
         not resync_complete_called
     ), "on_resync_complete hook should not have been called after error"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "did_fetched_current_state, creation_results",
+    [(False, []), (True, [([], [Exception("Failed to register")])])],
+)
+async def test_reconciliation_memory_is_sampled_when_it_stops_early(
+    mock_sync_raw_mixin: SyncRawMixin,
+    did_fetched_current_state: bool,
+    creation_results: list[tuple[list[Entity], list[Exception]]],
+) -> None:
+    mock_sync_raw_mixin.sort_and_upsert_failed_entities = AsyncMock()  # type: ignore
+    with patch(
+        "port_ocean.core.integrations.mixins.sync_raw.memory_profiler"
+    ) as memory_profiler:
+        with pytest.raises(ExceptionGroup) if creation_results else nullcontext():
+            await mock_sync_raw_mixin._resync_reconciliation(
+                creation_results,
+                did_fetched_current_state,
+                UserAgentType.exporter,
+                MagicMock(),
+                silent=False,
+            )
+
+    memory_profiler.end_kind.assert_called_once()
@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from port_ocean.core.handlers.resync_checkpoint import (
+    RESYNC_CHECKPOINT_ATTRIBUTE,
+    ResyncCheckpointStore,
+    ResyncCheckpointTracker,
+    get_resume_cursor,
+    set_page_cursor,
+)
+from port_ocean.core.models import Entity
+
+
+def _entity(identifier: str) -> Entity:
+    return Entity(identifier=identifier, blueprint="service")
+
+
+def _start(
+    store: ResyncCheckpointStore, fingerprint: str = "mapping"
+) -> ResyncCheckpointTracker:
+    return ResyncCheckpointTracker.start(
+        store, fingerprint, save_interval_seconds=0, max_age_hours=24
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ResyncCheckpointStore:
+    return ResyncCheckpointStore(str(tmp_path))
+
+
+@pytest.fixture
+def event_attributes() -> Iterator[dict[str, ResyncCheckpointTracker]]:
+    attributes: dict[str, ResyncCheckpointTracker] = {}
+    with patch(
+        "port_ocean.core.handlers.resync_checkpoint.checkpoint.event",
+        new=MagicMock(attributes=attributes),
+    ):
+        yield attributes
+
+
+@pytest.mark.asyncio
+async def test_completed_kinds_are_kept_for_the_same_mapping(
+    store: ResyncCheckpointStore,
+) -> None:
+    tracker = _start(store)
+    await tracker.complete_kind("service-0", ([_entity("a")], []))
+    await tracker.complete_kind("team-1", ([_entity("b")], [Exception("failed")]))
+
+    resumed = _start(store)
+    completed = resumed.get_completed_kind("service-0")
+    assert completed is not None
+    assert [entity.identifier for entity in completed] == ["a"]
+    assert resumed.get_completed_kind("team-1") is None
+
+    assert _start(store, fingerprint="changed").get_completed_kind("service-0") is None
+
+
+@pytest.mark.asyncio
+async def test_generator_resumes_after_the_last_committed_page(
+    store: ResyncCheckpointStore, event_attributes: dict[str, ResyncCheckpointTracker]
+) -> None:
+    tracker = _start(store)
+    event_attributes[RESYNC_CHECKPOINT_ATTRIBUTE] = tracker
+    with tracker.track_generator("service-0", 0):
+        assert get_resume_cursor() is None
+        set_page_cursor("page-2")
+        await tracker.commit_page([_entity("a")])
+        set_page_cursor("page-3")
+        await tracker.commit_page([_entity("b")])
+        set_page_cursor("page-4")
+        # The pod is killed before the third page is registered
+
+    resumed = _start(store)
+    event_attributes[RESYNC_CHECKPOINT_ATTRIBUTE] = resumed
+    with resumed.track_generator("service-0", 0):
+        assert get_resume_cursor() == "page-3"
+        await resumed.commit_page([_entity("c")])
+
+    assert [e.identifier for e in resumed.resumed_entities("service-0")] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_failed_page_stops_the_cursor(
+    store: ResyncCheckpointStore, event_attributes: dict[str, ResyncCheckpointTracker]
+) -> None:
+    tracker = _start(store)
+    event_attributes[RESYNC_CHECKPOINT_ATTRIBUTE] = tracker
+    with tracker.track_generator("service-0", 0):
+        set_page_cursor("page-2")
+        await tracker.commit_page([_entity("a")])
+        set_page_cursor("page-3")
+        await tracker.commit_page([], failed=True)
+        set_page_cursor("page-4")
+        await tracker.commit_page([_entity("c")])
+
+    resumed = _start(store)
+    event_attributes[RESYNC_CHECKPOINT_ATTRIBUTE] = resumed
+    with resumed.track_generator("service-0", 0):
+        assert get_resume_cursor() == "page-2"
+
+
+@pytest.mark.asyncio
+async def test_generators_without_cursor_start_over(
+    store: ResyncCheckpointStore, event_attributes: dict[str, ResyncCheckpointTracker]
+) -> None:
+    tracker = _start(store)
+    event_attributes[RESYNC_CHECKPOINT_ATTRIBUTE] = tracker
+    with tracker.track_generator("service-0", 0):
+        await tracker.commit_page([_entity("a")])
+
+    resumed = _start(store)
+    event_attributes[RESYNC_CHECKPOINT_ATTRIBUTE] = resumed
+    with resumed.track_generator("service-0", 0):
+        assert get_resume_cursor() is None
+
+    assert resumed.resumed_entities("service-0") == []
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_keeps_only_entity_keys(
+    store: ResyncCheckpointStore, event_attributes: dict[str, ResyncCheckpointTracker]
+) -> None:
+    tracker = _start(store)
+    event_attributes[RESYNC_CHECKPOINT_ATTRIBUTE] = tracker
+    entity = Entity(
+        identifier="a",
+        blueprint="service",
+        properties={"readme": "x" * 1000},
+        relations={"team": "platform"},
+    )
+    with tracker.track_generator("service-0", 0):
+        set_page_cursor("page-2")
+        await tracker.commit_page([entity])
+    await tracker.complete_kind("team-1", ([entity], []))
+
+    saved = store.load()
+    assert saved is not None
+    assert saved.generators["service-0/0"].entities == [("service", "a")]
+    assert saved.completed_kinds["team-1"] == [("service", "a")]
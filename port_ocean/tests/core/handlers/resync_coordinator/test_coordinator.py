@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from port_ocean.core.handlers.resync_coordinator import ResyncCoordinator
+
+
+@pytest.fixture(autouse=True)
+def mock_ocean_metrics(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    mock_ocean = MagicMock()
+    monkeypatch.setattr(
+        "port_ocean.core.handlers.resync_coordinator.coordinator.ocean", mock_ocean
+    )
+    return mock_ocean
+
+
+class BlockingResync:
+    def __init__(self) -> None:
+        self.started = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> bool:
+        self.started += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return True
+
+
+async def test_triggers_during_a_resync_collapse_into_one_follow_up() -> None:
+    coordinator = ResyncCoordinator()
+    first_job = BlockingResync()
+    follow_up_job = AsyncMock(return_value=True)
+
+    first = asyncio.create_task(coordinator.request(first_job, trigger="http"))
+    await asyncio.sleep(0.01)
+    assert coordinator.is_running
+
+    follow_ups = [
+        asyncio.create_task(coordinator.request(follow_up_job, trigger="polling"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert coordinator.coalesced == 2
+
+    first_job.release.set()
+    assert await first is True
+    assert await asyncio.gather(*follow_ups) == [True, True, True]
+    assert first_job.started == 1
+    follow_up_job.assert_awaited_once()
+    assert not coordinator.is_running
+
+
+async def test_mapping_change_restarts_the_running_resync() -> None:
+    fingerprints = iter(["old-mapping", "new-mapping", "new-mapping"])
+    coordinator = ResyncCoordinator(
+        mapping_fingerprint=AsyncMock(side_effect=lambda: next(fingerprints))
+    )
+    outdated_job = BlockingResync()
+    restarted_job = AsyncMock(return_value=True)
+
+    outdated = asyncio.create_task(coordinator.request(outdated_job, trigger="http"))
+    await asyncio.sleep(0.01)
+    restarted = asyncio.create_task(
+        coordinator.request(restarted_job, trigger="kafka", check_mapping=True)
+    )
+
+    assert await asyncio.wait_for(outdated, timeout=1) is True
+    assert await restarted is True
+    assert outdated_job.cancelled == 1
+    restarted_job.assert_awaited_once()
+    assert coordinator.restarted == 1
+
+
+async def test_resync_finishing_during_the_mapping_check_is_not_restarted() -> None:
+    check_mapping = asyncio.Event()
+    fingerprint_calls = 0
+
+    async def mapping_fingerprint() -> str:
+        nonlocal fingerprint_calls
+        fingerprint_calls += 1
+        if fingerprint_calls == 1:
+            return "old-mapping"
+        if fingerprint_calls == 2:
+            # Checked for the follow-up trigger, differs from every resync's mapping
+            await check_mapping.wait()
+            return "newer-mapping"
+        return "new-mapping"
+
+    coordinator = ResyncCoordinator(mapping_fingerprint=mapping_fingerprint)
+    outdated_job = BlockingResync()
+    follow_up_job = BlockingResync()
+
+    outdated = asyncio.create_task(coordinator.request(outdated_job, trigger="http"))
+    await asyncio.sleep(0.01)
+    follow_up = asyncio.create_task(
+        coordinator.request(follow_up_job, trigger="kafka", check_mapping=True)
+    )
+    await asyncio.sleep(0.01)
+    # The outdated resync finishes while the mapping is being checked, and the
+    # follow-up starts with the new mapping
+    outdated_job.release.set()
+    assert await asyncio.wait_for(outdated, timeout=1) is True
+    await asyncio.sleep(0.01)
+    assert follow_up_job.started == 1
+
+    check_mapping.set()
+    await asyncio.sleep(0.01)
+    follow_up_job.release.set()
+
+    assert await asyncio.wait_for(follow_up, timeout=1) is True
+    assert follow_up_job.cancelled == 0
+    assert coordinator.restarted == 0
+
+
+async def test_failed_resync_is_reported_to_every_waiter() -> None:
+    coordinator = ResyncCoordinator()
+    job = AsyncMock(side_effect=RuntimeError("resync failed"))
+
+    with pytest.raises(RuntimeError, match="resync failed"):
+        await coordinator.request(job, trigger="scheduled")
+
+    # A failed resync does not block the next one
+    assert await coordinator.request(AsyncMock(return_value=True), "http") is True
@@ -0,0 +1,108 @@
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from port_ocean.config.settings import MemoryProfilingSettings
+from port_ocean.helpers.metric.memory import MemoryProfiler, MemoryStage
+from port_ocean.helpers.metric.metric import MetricType
+
+
+@pytest.fixture
+def mock_ocean() -> Iterator[MagicMock]:
+    with patch("port_ocean.helpers.metric.memory.ocean") as mock_ocean:
+        mock_ocean.initialized = True
+        mock_ocean.metrics = MagicMock()
+        yield mock_ocean
+
+
+@pytest.fixture
+def stop_tracemalloc() -> Iterator[None]:
+    yield
+    tracemalloc.stop()
+
+
+def _reported_peaks(mock_ocean: MagicMock, name: str) -> dict[tuple[str, ...], float]:
+    return {
+        tuple(call.kwargs["labels"]): call.kwargs["value"]
+        for call in mock_ocean.metrics.set_metric.call_args_list
+        if call.kwargs["name"] == name
+    }
+
+
+def test_disabled_profiler_does_not_sample(mock_ocean: MagicMock) -> None:
+    profiler = MemoryProfiler()
+    profiler.configure(MemoryProfilingSettings(enabled=False))
+
+    profiler.start_kind("kind-0")
+
+    assert profiler.sample("kind-0", MemoryStage.BATCH) is None
+    mock_ocean.metrics.set_metric.assert_not_called()
+
+
+def test_peaks_are_reported_per_kind_and_stage(mock_ocean: MagicMock) -> None:
+    profiler = MemoryProfiler()
+    profiler.configure(MemoryProfilingSettings(enabled=True))
+
+    with patch(
+        "port_ocean.helpers.metric.memory.get_rss_bytes", side_effect=[100, 300, 200]
+    ):
+        profiler.start_kind("kind-0")
+        profiler.sample("kind-0", MemoryStage.BATCH)
+        profiler.sample("kind-0", MemoryStage.BATCH)
+
+    peaks = _reported_peaks(mock_ocean, MetricType.MEMORY_PEAK_RSS_NAME)
+    assert peaks == {
+        ("kind-0", MemoryStage.KIND_START): 100,
+        ("kind-0", MemoryStage.BATCH): 300,
+    }
+
+
+def test_starting_a_kind_forgets_its_previous_peaks(mock_ocean: MagicMock) -> None:
+    profiler = MemoryProfiler()
+    profiler.configure(MemoryProfilingSettings(enabled=True))
+
+    with patch(
+        "port_ocean.helpers.metric.memory.get_rss_bytes",
+        side_effect=[100, 500, 100, 200],
+    ):
+        profiler.start_kind("kind-0")
+        profiler.sample("kind-0", MemoryStage.BATCH)
+        profiler.start_kind("kind-0")
+        profiler.sample("kind-0", MemoryStage.BATCH)
+
+    assert mock_ocean.metrics.set_metric.call_args.kwargs["value"] == 200
+
+
+def test_snapshot_is_dumped_once_per_threshold_crossing(
+    mock_ocean: MagicMock, tmp_path: Path, stop_tracemalloc: None
+) -> None:
+    profiler = MemoryProfiler()
+    profiler.configure(
+        MemoryProfilingSettings(
+            enabled=True,
+            trace_allocations=True,
+            snapshot_threshold_mb=1,
+            snapshot_location=str(tmp_path),
+        )
+    )
+    megabyte = 1024 * 1024
+
+    with patch(
+        "port_ocean.helpers.metric.memory.get_rss_bytes",
+        side_effect=[megabyte // 2, 2 * megabyte, 3 * megabyte],
+    ):
+        profiler.start_kind("kind-0")
+        profiler.sample("kind-0", MemoryStage.BATCH)
+        profiler.sample("kind-0", MemoryStage.BATCH)
+
+    (dump,) = tmp_path.glob("*.json")
+    assert len(list(tmp_path.glob("*.tracemalloc"))) == 1
+    sample = json.loads(dump.read_text())
+    assert sample["kind"] == "kind-0"
+    assert sample["rss_bytes"] == 2 * megabyte
+    assert sample["top_allocators"]
+    assert _reported_peaks(mock_ocean, MetricType.MEMORY_PEAK_TRACED_NAME)
@@ -0,0 +1,146 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+from port_ocean.config.settings import TracingSettings
+from port_ocean.core.models import TraceExportFormat
+from port_ocean.helpers.async_client import OceanAsyncClient
+from port_ocean.helpers.tracing import Tracer, traced, tracer
+
+
+@pytest.fixture
+def enabled_tracer(tmp_path: Path) -> Iterator[Tracer]:
+    tracer.configure(TracingSettings(enabled=True, location=str(tmp_path)))
+    yield tracer
+    tracer.configure(TracingSettings())
+    tracer.collect()
+
+
+def _load_trace(tmp_path: Path) -> dict[str, Any]:
+    (trace_file,) = tmp_path.glob("*.json")
+    return json.loads(trace_file.read_text())
+
+
+@traced("child", "test", lambda amount: {"amount": amount})
+async def _child(amount: int) -> int:
+    await asyncio.sleep(0)
+    return amount
+
+
+@traced("root", "test", root=True)
+async def _root() -> list[int]:
+    with tracer.span("inline", "test"):
+        pass
+    return list(await asyncio.gather(_child(1), _child(2)))
+
+
+async def test_disabled_tracer_records_nothing(tmp_path: Path) -> None:
+    tracer.configure(TracingSettings(enabled=False, location=str(tmp_path)))
+
+    assert await _root() == [1, 2]
+
+    assert tracer.collect() == []
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_spans_outside_of_a_trace_are_not_recorded(
+    enabled_tracer: Tracer,
+) -> None:
+    assert await _child(1) == 1
+    with tracer.span("orphan", "test"):
+        pass
+
+    assert enabled_tracer.collect() == []
+
+
+async def test_trace_is_exported_as_chrome_trace(
+    enabled_tracer: Tracer, tmp_path: Path
+) -> None:
+    assert await _root() == [1, 2]
+
+    events = {event["name"]: event for event in _load_trace(tmp_path)["traceEvents"]}
+    assert set(events) == {"root", "inline", "child"}
+    assert all(event["ph"] == "X" for event in events.values())
+    # Spans of concurrent tasks are put on different threads
+    child_events = [
+        event
+        for event in _load_trace(tmp_path)["traceEvents"]
+        if event["name"] == "child"
+    ]
+    assert len({event["tid"] for event in child_events}) == 2
+    assert enabled_tracer.collect() == []
+
+
+async def test_trace_is_exported_as_otlp_json(tmp_path: Path) -> None:
+    tracer.configure(
+        TracingSettings(
+            enabled=True,
+            location=str(tmp_path),
+            export_format=TraceExportFormat.otlp,
+        )
+    )
+    try:
+        await _root()
+    finally:
+        tracer.configure(TracingSettings())
+
+    (scope_spans,) = _load_trace(tmp_path)["resourceSpans"][0]["scopeSpans"]
+    spans = {span["name"]: span for span in scope_spans["spans"]}
+    root_id = spans["root"]["spanId"]
+    assert "parentSpanId" not in spans["root"]
+    assert spans["inline"]["parentSpanId"] == root_id
+    child_spans = [span for span in scope_spans["spans"] if span["name"] == "child"]
+    assert [span["parentSpanId"] for span in child_spans] == [root_id, root_id]
+    assert {
+        attribute["value"]["intValue"]
+        for span in child_spans
+        for attribute in span["attributes"]
+        if attribute["key"] == "amount"
+    } == {"1", "2"}
+    assert len({span["traceId"] for span in scope_spans["spans"]}) == 1
+
+
+async def test_spans_over_the_limit_are_dropped(tmp_path: Path) -> None:
+    tracer.configure(TracingSettings(enabled=True, location=str(tmp_path), max_spans=2))
+    try:
+        await _root()
+    finally:
+        tracer.configure(TracingSettings())
+
+    assert len(_load_trace(tmp_path)["traceEvents"]) == 2
+
+
+async def test_ocean_async_client_records_request_spans(
+    enabled_tracer: Tracer,
+) -> None:
+    client = OceanAsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(204)),
+        trace_category="third_party",
+    )
+
+    with tracer.trace("root", "test"):
+        await client.get("https://api.example.com/items")
+        spans = list(enabled_tracer._spans)
+
+    (span,) = spans
+    assert span.name == "GET /items"
+    assert span.category == "third_party"
+    assert span.attributes["http.status_code"] == 204
+    assert span.parent_id is not None
+
+
+def test_failed_spans_record_their_error(
+    enabled_tracer: Tracer, tmp_path: Path
+) -> None:
+    with pytest.raises(ValueError):
+        with tracer.trace("root", "test"):
+            with tracer.span("failing", "test"):
+                raise ValueError("boom")
+
+    events = {event["name"]: event for event in _load_trace(tmp_path)["traceEvents"]}
+    assert events["failing"]["args"]["error"] == "ValueError"
+    assert events["root"]["args"]["error"] == "ValueError"
@@ -14,6 +14,7 @@ def _get_http_client_context() -> httpx.AsyncClient:
         client = OceanAsyncClient(
             RetryTransport,
             timeout=ocean.config.client_timeout,
+            trace_category="third_party",
         )
         _http_client.push(client)
 